@@ -0,0 +1,277 @@
+"""Bitmap indexes over the codes of a store
+
+Dashboard filters intersect the same code sets over and over: a chapter, a
+block, the codes with a keyword in their name, a band of deaths. The
+BitmapIndex numbers the codes of a store densely in code order (their
+ordinals), and keeps every such set as a Python int with the bits of its
+codes set. Codes added to the store later get the next free ordinals, so
+the bitmaps a caller holds keep meaning the same codes. Combining filters
+is then a bitwise and (&), or (|) or difference (& ~) of two ints, done a
+machine word at a time, and the deaths of the result are summed over its
+set bits, vectorized by NumPy when it is installed.
+
+E.g.: index.sum_deaths(index.chapter(9) & index.keyword('heart')
+                       & index.deaths_between(100, 10 ** 9))
+"""
+from collections import OrderedDict
+
+from columnar import np
+from icd import block_of, chapter_of
+
+
+def _bitmap(ordinals, size):
+    """Return the int with the bits of the ordinals set"""
+    bits = bytearray((size + 7) // 8)
+    for ordinal in ordinals:
+        bits[ordinal >> 3] |= 1 << (ordinal & 7)
+    return int.from_bytes(bits, 'little')
+
+
+class BitmapIndex:
+    """Chapter, block, keyword and deaths bitmaps of a store's codes"""
+
+    def __init__(self, store, maxsize=256):
+        """Number the codes of a store and build the chapter and block bitmaps
+
+        Parameters:
+            store: the store to index, e.g. a MortalityStore
+            maxsize (int): the number of keyword bitmaps kept, 0 to keep
+                none
+
+        The deaths are read again when the store's version number changes
+        (see MortalityStore.apply_batch), and new codes are numbered then.
+        """
+        self.store = store
+        self.maxsize = maxsize
+        self.ordinal_codes = []
+        self.ordinals = {}
+        self.size = 0
+        self.all = 0
+        self.chapters = {}
+        self.blocks = {}
+        self.keywords = OrderedDict()
+        self.version = None
+        self._refresh(force=True)
+
+    def _number(self, codes):
+        """Give new codes the next ordinals and add them to the bitmaps"""
+        chapters = {}
+        blocks = {}
+        for code in codes:
+            index = self.size
+            self.ordinal_codes.append(code)
+            self.ordinals[code] = index
+            self.size += 1
+            chapter = chapter_of(code)
+            if chapter is not None:
+                chapters.setdefault(chapter, []).append(index)
+            block = block_of(code)
+            if block is not None:
+                blocks.setdefault(block, []).append(index)
+        self.all = (1 << self.size) - 1
+        for chapter, ordinals in chapters.items():
+            self.chapters[chapter] = (self.chapters.get(chapter, 0) |
+                                      _bitmap(ordinals, self.size))
+        for block, ordinals in blocks.items():
+            self.blocks[block] = (self.blocks.get(block, 0) |
+                                  _bitmap(ordinals, self.size))
+
+    def _refresh(self, force=False):
+        """Read the deaths again and number new codes if the store changed
+
+        Codes keep their ordinals, the keyword bitmaps are dropped if new
+        codes were numbered, as these may match the keywords too.
+        """
+        version = getattr(self.store, 'version', None)
+        if not force and version == self.version:
+            return
+        deaths = dict(self.store)
+        new = sorted(code for code in deaths if code not in self.ordinals)
+        if new:
+            self._number(new)
+            self.keywords.clear()
+        self.ordinal_deaths = [deaths.get(code, 0)
+                               for code in self.ordinal_codes]
+        self._deaths_array = None
+        self.version = version
+
+    def bitmap(self, codes):
+        """Return the bitmap of ICD-10 codes, codes not in the store ignored"""
+        self._refresh()
+        return _bitmap((self.ordinals[code] for code in codes
+                        if code in self.ordinals), self.size)
+
+    def chapter(self, chapter):
+        """Return the bitmap of the codes of an ICD-10 chapter, e.g.: 9"""
+        self._refresh()
+        return self.chapters.get(chapter, 0)
+
+    def block(self, block):
+        """Return the bitmap of the codes of a block, e.g.: 'I20-I25'"""
+        self._refresh()
+        return self.blocks.get(block, 0)
+
+    def keyword(self, query):
+        """Return the bitmap of the codes whose name contains query
+
+        The bitmaps of the most recently used keywords are kept.
+        """
+        self._refresh()
+        key = query.lower()
+        bitmap = self.keywords.get(key)
+        if bitmap is not None:
+            self.keywords.move_to_end(key)
+            return bitmap
+        index = getattr(self.store, 'text_index', None)
+        if index is None:
+            index = self.store.search_index
+        bitmap = self.bitmap(index.search(query))
+        self.keywords[key] = bitmap
+        while len(self.keywords) > self.maxsize:
+            self.keywords.popitem(last=False)
+        return bitmap
+
+    def deaths_between(self, low, high):
+        """Return the bitmap of the codes with low <= deaths < high"""
+        return self.bitmap(self.store.codes_between(low, high))
+
+    def ordinals_of(self, bitmap):
+        """Generate the ordinals of the set bits of a bitmap"""
+        data = (bitmap & self.all).to_bytes((self.size + 7) // 8, 'little')
+        for position, byte in enumerate(data):
+            while byte:
+                low = byte & -byte
+                yield (position << 3) + low.bit_length() - 1
+                byte ^= low
+
+    def codes(self, bitmap):
+        """Return the ICD-10 codes of a bitmap in code order"""
+        self._refresh()
+        return sorted(self.ordinal_codes[index]
+                      for index in self.ordinals_of(bitmap))
+
+    def count(self, bitmap):
+        """Return the number of codes of a bitmap"""
+        self._refresh()
+        return bin(bitmap & self.all).count('1')
+
+    def sum_deaths(self, bitmap):
+        """Return the aggregated number of deaths of the codes of a bitmap.
+
+        With NumPy the bitmap is unpacked into a boolean mask over the deaths
+        array, otherwise the set bits are walked a byte at a time.
+        """
+        self._refresh()
+        bitmap &= self.all
+        if np is None:
+            return sum(self.ordinal_deaths[index]
+                       for index in self.ordinals_of(bitmap))
+        if self._deaths_array is None:
+            self._deaths_array = np.array(self.ordinal_deaths, dtype=np.int64)
+        mask = np.unpackbits(
+            np.frombuffer(bitmap.to_bytes((self.size + 7) // 8, 'little'),
+                          dtype=np.uint8),
+            count=self.size, bitorder='little').astype(bool)
+        return int(self._deaths_array[mask].sum())
+
+    def select(self, bitmap):
+        """Return the [code, number_of_deaths] pairs of a bitmap, by code"""
+        self._refresh()
+        return sorted([self.ordinal_codes[index], self.ordinal_deaths[index]]
+                      for index in self.ordinals_of(bitmap))
+
+
+###############################################################################
+# TEST functions
+
+def test_bitmap_index():
+    """Test BitmapIndex bitmaps and set algebra"""
+    from mortality import MortalityStore
+    store = MortalityStore([['I25.1', 50], ['I21.9', 40], ['I50.0', 5],
+                            ['J18.9', 70], ['C34.9', 60], ['I10', 1]],
+                           {'I25.1': 'Atherosclerotic heart disease',
+                            'I50.0': 'Congestive heart failure',
+                            'J18.9': 'Pneumonia, unspecified'})
+    index = BitmapIndex(store)
+    assert index.codes(index.all) == ['C34.9', 'I10', 'I21.9', 'I25.1',
+                                      'I50.0', 'J18.9']
+    assert index.chapter(9) == 0b11110
+    assert index.block('I20-I25') == 0b01100
+    assert index.chapter(99) == 0 and index.block('I25') == 0
+    heart = index.keyword('HEART')
+    assert index.codes(heart) == ['I25.1', 'I50.0']
+    assert index.keyword('heart') is heart and len(index.keywords) == 1
+    assert index.sum_deaths(index.chapter(9) & heart) == 55
+    assert index.sum_deaths(index.chapter(9) & ~heart) == 41
+    assert index.count(index.chapter(9) | index.chapter(10)) == 5
+    assert index.count(~heart) == 4
+    band = index.deaths_between(10, 60)
+    assert index.select(band & index.chapter(9)) == [['I21.9', 40],
+                                                     ['I25.1', 50]]
+    assert index.bitmap(['J18.9', 'K00']) == 0b100000
+    assert index.sum_deaths(0) == 0 and index.codes(0) == []
+    store.add_deaths('I10', 100)
+    assert index.sum_deaths(index.chapter(9)) == 196
+    assert index.codes(index.deaths_between(100, 200)) == ['I10']
+    store.add_deaths('A00.0', 7)
+    assert index.codes(heart) == ['I25.1', 'I50.0']
+    assert index.sum_deaths(heart) == 55
+    assert index.codes(index.chapter(1) | heart) == ['A00.0', 'I25.1',
+                                                     'I50.0']
+    assert index.count(index.all) == 7
+    assert index.codes(index.bitmap(['I10', 'A00.0'])) == ['A00.0', 'I10']
+    small = BitmapIndex(store, maxsize=1)
+    small.keyword('heart')
+    small.keyword('pneumonia')
+    assert list(small.keywords) == ['pneumonia']
+    recent = BitmapIndex(store, maxsize=2)
+    for query in ('heart', 'pneumonia', 'heart', 'failure'):
+        recent.keyword(query)
+    assert list(recent.keywords) == ['heart', 'failure']
+    uncached = BitmapIndex(store, maxsize=0)
+    assert uncached.codes(uncached.keyword('heart')) == ['I25.1', 'I50.0']
+    assert len(uncached.keywords) == 0
+
+
+def test_bitmap_index_cdc():
+    """Test BitmapIndex filters against set operations on the CDC data"""
+    import cdc
+    from cdc import db
+    from mortality import MortalityStore
+    from packed import PackedStore
+    for store in (MortalityStore(db, cdc.code_names),
+                  PackedStore(db, cdc.code_names)):
+        index = BitmapIndex(store)
+        deaths = dict(db)
+        for chapter in range(1, 23):
+            assert (index.sum_deaths(index.chapter(chapter)) ==
+                    store.sum_deaths_by_chapter(chapter))
+        assert index.sum_deaths(index.block('I20-I25')) == (
+            store.sum_deaths_by_block('I20-I25'))
+        bitmap = ((index.keyword('heart') | index.keyword('lung')) &
+                  ~index.chapter(2) & index.deaths_between(100, 10 ** 9))
+        expected = sorted(
+            code for code in set(store.text_index.search('heart')) |
+            set(store.text_index.search('lung'))
+            if code in deaths and chapter_of(code) != 2 and
+            deaths[code] >= 100)
+        assert index.codes(bitmap) == expected
+        assert index.count(bitmap) == len(expected)
+        assert index.sum_deaths(bitmap) == sum(deaths[code]
+                                               for code in expected)
+
+
+if __name__ == '__main__':
+    import sys
+    import traceback
+
+    for test in (test_bitmap_index,
+                 test_bitmap_index_cdc):
+        try:
+            print(test.__doc__, '... ', end='', flush=True)
+            test()
+            print('PASSED')
+        except:
+            print('FAILED')
+            exc_info = sys.exc_info()
+            traceback.print_exception(*exc_info)
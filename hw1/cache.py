@@ -0,0 +1,160 @@
+"""Result cache for mortality queries
+
+The same text, threshold and chapter queries are asked over and over. The
+ResultCache remembers the answers of a store's query methods in a bounded
+least recently used (LRU) order, optionally for a limited time (TTL).
+
+The cache belongs to one store at a time: when it is asked about another
+store object (a reload), or the store's version number changed since the
+answers were computed (an update), all entries are dropped first, so it
+never returns stale answers.
+"""
+import time
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple('CacheInfo', 'hits misses maxsize currsize')
+
+
+def _copy(value):
+    """Return a copy of nested lists, so callers can not alter the cache"""
+    if isinstance(value, list):
+        return [_copy(item) for item in value]
+    return value
+
+
+class ResultCache:
+    """Bounded LRU/TTL cache of store query results"""
+
+    def __init__(self, maxsize=1024, ttl=None, clock=time.monotonic):
+        """Create an empty cache
+
+        Parameters:
+            maxsize (int): the maximum number of results kept
+            ttl (float): optional number of seconds a result is valid for
+            clock (function): returns the current time in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.entries = OrderedDict()
+        self._store = None
+        self._version = None
+
+    def __len__(self):
+        return len(self.entries)
+
+    def info(self):
+        """Return the hit and miss counters and the size of the cache"""
+        return CacheInfo(self.hits, self.misses, self.maxsize,
+                         len(self.entries))
+
+    def clear(self):
+        """Drop all results, the counters are kept"""
+        self.entries.clear()
+        self._store = None
+        self._version = None
+
+    def lookup(self, store, method, *args):
+        """Return the result of a store query, computed only on a miss
+
+        Parameters:
+            store: the store to ask, e.g. a MortalityStore
+            method (string): the name of the query method, e.g.: 'codes_above'
+            args: the hashable arguments of the query, e.g.: 1000
+
+        E.g.: cache.lookup(store, 'sum_deaths_by_query', 'heart')
+        """
+        version = getattr(store, 'version', None)
+        if store is not self._store or version != self._version:
+            self.clear()
+            self._store = store
+            self._version = version
+        key = (method,) + args
+        now = self.clock()
+        entry = self.entries.get(key)
+        if entry is not None and (entry[0] is None or now < entry[0]):
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return _copy(entry[1])
+        self.misses += 1
+        value = getattr(store, method)(*args)
+        expires = None if self.ttl is None else now + self.ttl
+        self.entries[key] = (expires, _copy(value))
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+        return value
+
+
+###############################################################################
+# TEST functions
+
+class _CountingStore:
+    """Store stub counting the queries it answers"""
+
+    def __init__(self):
+        self.version = 0
+        self.calls = 0
+
+    def codes_above(self, threshold):
+        self.calls += 1
+        return ['I25.1'] if threshold < 10 else []
+
+
+def test_result_cache_lru():
+    """Test ResultCache hits, misses and LRU eviction"""
+    store = _CountingStore()
+    cache = ResultCache(maxsize=2)
+    assert cache.lookup(store, 'codes_above', 1) == ['I25.1']
+    assert cache.lookup(store, 'codes_above', 1) == ['I25.1']
+    assert store.calls == 1
+    cache.lookup(store, 'codes_above', 1).append('changed')
+    assert cache.lookup(store, 'codes_above', 1) == ['I25.1']
+    cache.lookup(store, 'codes_above', 20)
+    cache.lookup(store, 'codes_above', 30)
+    assert len(cache) == 2
+    assert store.calls == 3
+    cache.lookup(store, 'codes_above', 1)
+    assert store.calls == 4
+    assert cache.info() == CacheInfo(hits=3, misses=4, maxsize=2, currsize=2)
+
+
+def test_result_cache_invalidation():
+    """Test ResultCache expiry and invalidation"""
+    now = [0.0]
+    store = _CountingStore()
+    cache = ResultCache(ttl=10, clock=lambda: now[0])
+    cache.lookup(store, 'codes_above', 1)
+    now[0] = 9.5
+    cache.lookup(store, 'codes_above', 1)
+    assert store.calls == 1
+    now[0] = 10.0
+    cache.lookup(store, 'codes_above', 1)
+    assert store.calls == 2
+    store.version += 1
+    cache.lookup(store, 'codes_above', 1)
+    assert store.calls == 3
+    other = _CountingStore()
+    cache.lookup(other, 'codes_above', 1)
+    assert other.calls == 1
+    assert len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0
+
+
+if __name__ == '__main__':
+    import sys
+    import traceback
+
+    for test in (test_result_cache_lru,
+                 test_result_cache_invalidation):
+        try:
+            print(test.__doc__, '... ', end='', flush=True)
+            test()
+            print('PASSED')
+        except:
+            print('FAILED')
+            exc_info = sys.exc_info()
+            traceback.print_exception(*exc_info)
@@ -0,0 +1,3563 @@
+"""ICD-10 category names for the CDC Mortality Statistics
+
+Loaded lazily as cdc.code_names, see cdc.py
+"""
+
+code_names = {'M31.9': 'Necrotizing vasculopathy, unspecified',
+              'P23.9': 'Congenital pneumonia, unspecified',
+              'W37': 'Explosion and rupture of pressurized tyre, pipe or hose',
+              'G61.0': 'Guillain-Barre syndrome',
+              'I11.9': 'Hypertensive heart disease without (congestive) heart failure',
+              'O26.8': 'Other specified pregnancy-related conditions',
+              'B02.9': 'Zoster without complication',
+              'V86.1': 'Passenger of all-terrain or other off-road motor vehicle injured in traffic accident',
+              'V15.4': 'Pedal cyclist injured in collision with railway train or railway vehicle, driver injured in traffic accident',
+              'V42.9': 'Car occupant injured in collision with two- or three-wheeled motor vehicle, unspecified car occupant injured in traffic accident',
+              'V90.6': 'Accident to watercraft causing drowning and submersion, inflatable craft (nonpowered)',
+              'C67.7': 'Urachus - Malignant neoplasms',
+              'D36.1': 'Peripheral nerves and autonomic nervous system - Benign neoplasms',
+              'F05.9': 'Delirium, unspecified',
+              'Q81.1': 'Epidermolysis bullosa letalis',
+              'A40.8': 'Other streptococcal septicaemia',
+              'C05.9': 'Palate, unspecified - Malignant neoplasms',
+              'K62.1': 'Rectal polyp', 'R04.1': 'Haemorrhage from throat',
+              'Y09': 'Assault by unspecified means',
+              'I49.0': 'Ventricular fibrillation and flutter',
+              'D57.1': 'Sickle-cell anaemia without crisis',
+              'G95.8': 'Other specified diseases of spinal cord',
+              'V23.9': 'Motorcycle rider injured in collision with car, pick-up truck or van, unspecified motorcycle rider injured in traffic accident',
+              'E72.9': 'Disorder of amino-acid metabolism, unspecified',
+              'K57.3': 'Diverticular disease of large intestine without perforation or abscess',
+              'C96.2': 'Malignant mast cell tumour - Malignant neoplasms',
+              'E10.4': 'Insulin-dependent diabetes mellitus, with neurological complications',
+              'N45.9': 'Orchitis, epididymitis and epididymo-orchitis without abscess',
+              'Y57.9': 'Drug or medicament, unspecified',
+              'Q92.8': 'Other specified trisomies and partial trisomies of autosomes',
+              'C69.1': 'Cornea - Malignant neoplasms',
+              'C74.9': 'Adrenal gland, unspecified - Malignant neoplasms',
+              'C34.8': 'Overlapping lesion of bronchus and lung - Malignant neoplasms',
+              'Y05': 'Sexual assault by bodily force',
+              'A02.2': 'Localized salmonella infections',
+              'V21.4': 'Motorcycle rider injured in collision with pedal cycle, driver injured in traffic accident',
+              'R68.8': 'Other specified general symptoms and signs',
+              'C76.8': 'Overlapping lesion of other and ill-defined sites - Malignant neoplasms',
+              'J40': 'Bronchitis, not specified as acute or chronic',
+              'C49.2': 'Connective and soft tissue of lower limb, including hip - Malignant neoplasms',
+              'D32.1': 'Spinal meninges - Benign neoplasms',
+              'Y28': 'Contact with sharp object, undetermined intent',
+              'A40.1': 'Septicaemia due to streptococcus, group B',
+              'L10.8': 'Other pemphigus',
+              'Q22.1': 'Congenital pulmonary valve stenosis',
+              'K61.2': 'Anorectal abscess',
+              'V95.9': 'Unspecified aircraft accident injuring occupant',
+              'Q92.3': 'Minor partial trisomy',
+              'C71.2': 'Temporal lobe - Malignant neoplasms',
+              'M53.8': 'Other specified dorsopathies',
+              'D75.9': 'Disease of blood and blood-forming organs, unspecified',
+              'C91.1': 'Chronic lymphocytic leukaemia - Malignant neoplasms',
+              'F99': 'Mental disorder, not otherwise specified',
+              'B38.1': 'Chronic pulmonary coccidioidomycosis',
+              'D48.7': 'Other specified sites - Uncertain neoplasms',
+              'R43.2': 'Parageusia',
+              'V28.5': 'Motorcycle rider injured in noncollision transport accident, passenger injured in traffic accident',
+              'V85.9': 'Unspecified occupant of special construction vehicle injured in nontraffic accident',
+              'Q78.8': 'Other specified osteochondrodysplasias',
+              'B67.9': 'Echinococcosis, other and unspecified',
+              'Q79.8': 'Other congenital malformations of musculoskeletal system',
+              'O72.3': 'Postpartum coagulation defects',
+              'Q43.7': 'Persistent cloaca',
+              'P01.4': 'Newborn affected by ectopic pregnancy',
+              'V48.3': 'Car occupant injured in noncollision transport accident, unspecified car occupant injured in nontraffic accident',
+              'X36': 'Victim of avalanche, landslide and other earth movements',
+              'B16.9': 'Acute hepatitis B without delta-agent and without hepatic coma',
+              'I40.9': 'Acute myocarditis, unspecified',
+              'E27.1': 'Primary adrenocortical insufficiency',
+              'Q79.2': 'Exomphalos',
+              'M06.9': 'Rheumatoid arthritis, unspecified',
+              'R41.3': 'Other amnesia',
+              'I69.1': 'Sequelae of intracerebral haemorrhage',
+              'Q31.8': 'Other congenital malformations of larynx',
+              'C79.8': 'Secondary malignant neoplasm of other specified sites - Malignant neoplasms',
+              'C12': 'Malignant neoplasm of pyriform sinus',
+              'Q61.9': 'Cystic kidney disease, unspecified',
+              'M65.8': 'Other synovitis and tenosynovitis',
+              'Y14': 'Poisoning by and exposure to other and unspecified drugs, medicaments and biological substances, undetermined intent',
+              'J38.1': 'Polyp of vocal cord and larynx',
+              'C44.0': 'Skin of lip - Malignant neoplasms',
+              'E14.5': 'Unspecified diabetes mellitus, with peripheral circulatory complications',
+              'P12.8': 'Other birth injuries to scalp',
+              'M35.9': 'Systemic involvement of connective tissue, unspecified',
+              'V65.1': 'Occupant of heavy transport vehicle injured in collision with railway train or railway vehicle, passenger injured in nontraffic accident',
+              'W74': 'Unspecified drowning and submersion',
+              'C69.3': 'Choroid - Malignant neoplasms',
+              'C65': 'Malignant neoplasm of renal pelvis',
+              'F10.1': 'Mental and behavioural disorders due to use of alcohol, harmful use',
+              'E27.4': 'Other and unspecified adrenocortical insufficiency',
+              'A48.8': 'Other specified bacterial diseases',
+              'P02.6': 'Newborn affected by other and unspecified conditions of umbilical cord',
+              'B20.9': 'HIV disease resulting in unspecified infectious or parasitic disease',
+              'C95.7': 'Other leukaemia of unspecified cell type - Malignant neoplasms',
+              'V96.2': 'Glider (nonpowered) accident injuring occupant',
+              'F45.0': 'Somatization disorder', 'A02.0': 'Salmonella enteritis',
+              'L03.1': 'Cellulitis of other parts of limb',
+              'O20.9': 'Haemorrhage in early pregnancy, unspecified',
+              'E70.1': 'Other hyperphenylalaninaemias',
+              'Q27.4': 'Congenital phlebectasia',
+              'A52.1': 'Symptomatic neurosyphilis',
+              'D39.0': 'Uterus - Uncertain neoplasms',
+              'R52.2': 'Other chronic pain',
+              'D11.0': 'Parotid gland - Benign neoplasms',
+              'R27.8': 'Other and unspecified lack of coordination',
+              'R11': 'Nausea and vomiting',
+              'Q76.4': 'Other congenital malformations of spine, not associated with scoliosis',
+              'Y59.0': 'Viral vaccines',
+              'L92.9': 'Granulomatous disorder of skin and subcutaneous tissue, unspecified',
+              'G41.9': 'Status epilepticus, unspecified',
+              'V80.4': 'Rider or occupant injured in collision with car, pick-up truck, van, heavy transport vehicle or bus',
+              'B57.2': "Chagas' disease", 'J12.8': 'Other viral pneumonia',
+              'A17.0': 'Tuberculous meningitis',
+              'F06.9': 'Unspecified mental disorder due to brain damage and dysfunction and to physical disease',
+              'Y26': 'Exposure to smoke, fire and flames, undetermined intent',
+              'A43.8': 'Other forms of nocardiosis', 'G25.5': 'Other chorea',
+              'K27.4': 'Peptic ulcer, site unspecified, chronic or unspecified with haemorrhage',
+              'B02.0': 'Zoster encephalitis',
+              'N87.9': 'Dysplasia of cervix uteri, unspecified',
+              'I15.0': 'Renovascular hypertension',
+              'G96.0': 'Cerebrospinal fluid leak',
+              'C94.1': 'Chronic erythraemia - Malignant neoplasms',
+              'G93.9': 'Disorder of brain, unspecified',
+              'M94.2': 'Chondromalacia',
+              'I08.3': 'Combined disorders of mitral, aortic and tricuspid valves',
+              'P26.9': 'Unspecified pulmonary haemorrhage originating in the perinatal period',
+              'A81.2': 'Progressive multifocal leukoencephalopathy',
+              'E88.8': 'Other specified metabolic disorders',
+              'F19.1': 'Mental and behavioural disorders due to multiple drug use and use of other psychoactive substances, harmful use',
+              'X58': 'Exposure to other specified factors',
+              'D74.9': 'Methaemoglobinaemia, unspecified',
+              'D58.2': 'Other haemoglobinopathies',
+              'C56': 'Malignant neoplasm of ovary',
+              'Q26.2': 'Total anomalous pulmonary venous connection',
+              'W24': 'Contact with lifting and transmission devices, not elsewhere classified',
+              'V12.9': 'Pedal cyclist injured in collision with two- or three-wheeled motor vehicle, unspecified pedal cyclist injured in traffic accident',
+              'C67.5': 'Bladder neck - Malignant neoplasms',
+              'D33.2': 'Brain, unspecified - Benign neoplasms',
+              'R96.0': 'Instantaneous death',
+              'J44.0': 'Chronic obstructive pulmonary disease with acute lower respiratory infection',
+              'K29.7': 'Gastritis, unspecified',
+              'V53.5': 'Occupant of pick-up truck or van injured in collision with car, pick-up truck or van, driver injured in traffic accident',
+              'K05.1': 'Chronic gingivitis',
+              'K26.6': 'Duodenal ulcer, chronic or unspecified with both haemorrhage and perforation',
+              'Q82.3': 'Incontinentia pigmenti',
+              'F14.9': 'Mental and behavioural disorders due to use of cocaine, unspecified mental and behavioural disorder',
+              'V06.1': 'Pedestrian injured in collision with other nonmotor vehicle, traffic accident',
+              'X44': 'Accidental poisoning by and exposure to other and unspecified drugs, medicaments and biological substances',
+              'N49.2': 'Inflammatory disorders of scrotum',
+              'I51.3': 'Intracardiac thrombosis, not elsewhere classified',
+              'K40.2': 'Bilateral inguinal hernia, without obstruction or gangrene',
+              'J34.1': 'Cyst and mucocele of nasal sinus',
+              'I40.1': 'Isolated myocarditis',
+              'K52.2': 'Allergic and dietetic gastroenteritis and colitis',
+              'A42.7': 'Actinomycotic septicaemia',
+              'V13.4': 'Pedal cyclist injured in collision with car, pick-up truck or van, driver injured in traffic accident',
+              'N76.8': 'Other specified inflammation of vagina and vulva',
+              'V58.9': 'Occupant of pick-up truck or van injured in noncollision transport accident, unspecified occupant of pick-up truck or van injured in traffic accident',
+              'V64.2': 'Occupant of heavy transport vehicle injured in collision with heavy transport vehicle or bus, person on outside of vehicle injured in nontraffic accident',
+              'A86': 'Unspecified viral encephalitis',
+              'B46.5': 'Mucormycosis, unspecified',
+              'D67': 'Hereditary factor IX deficiency',
+              'E29.1': 'Testicular hypofunction',
+              'J01.9': 'Acute sinusitis, unspecified',
+              'Y08': 'Assault by other specified means',
+              'P23.6': 'Congenital pneumonia due to other bacterial agents',
+              'P35.9': 'Congenital viral disease, unspecified',
+              'Q76.1': 'Klippel-Feil syndrome',
+              'L89.9': 'Decubitus ulcer and pressure area, unspecified',
+              'W28': 'Contact with powered lawnmower',
+              'Q64.7': 'Other congenital malformations of bladder and urethra',
+              'A06.6': 'Amoebic brain abscess',
+              'F91.9': 'Conduct disorder, unspecified',
+              'F10.7': 'Mental and behavioural disorders due to use of alcohol, residual and late-onset psychotic disorder',
+              'P61.3': 'Congenital anaemia from fetal blood loss',
+              'Y52.2': 'Other antidysrhythmic drugs, not elsewhere classified',
+              'Q34.9': 'Congenital malformation of respiratory system, unspecified',
+              'P54.3': 'Other neonatal gastrointestinal haemorrhage',
+              'I10': 'Essential (primary) hypertension',
+              'X66': 'Intentional self-poisoning by and exposure to organic solvents and halogenated hydrocarbons and their vapours',
+              'M95.4': 'Acquired deformity of chest and rib',
+              'Q68.8': 'Other specified congenital musculoskeletal deformities',
+              'W02': 'Fall involving ice-skates, skis, roller-skates or skateboards',
+              'Q99.8': 'Other specified chromosome abnormalities',
+              'Q01.8': 'Encephalocele of other sites',
+              'I44.2': 'Atrioventricular block, complete',
+              'V93.3': 'Accident on board watercraft without accident to watercraft, not causing drowning and submersion, other powered watercraft, hovercraft (on open water), or jet skis',
+              'J44.9': 'Chronic obstructive pulmonary disease, unspecified',
+              'C25.1': 'Body of pancreas - Malignant neoplasms',
+              'E71.1': 'Other disorders of branched-chain amino-acid metabolism',
+              'D73.2': 'Chronic congestive splenomegaly',
+              'K29.0': 'Acute haemorrhagic gastritis',
+              'E44.1': 'Mild protein-energy malnutrition',
+              'M10.0': 'Idiopathic gout', 'L88': 'Pyoderma gangrenosum',
+              'H10.9': 'Conjunctivitis, unspecified', 'M25.7': 'Osteophyte',
+              'C96.9': 'Malignant neoplasm of lymphoid, haematopoietic and related tissue, unspecified - Malignant neoplasms',
+              'V86.7': 'Person on outside of all-terrain or other off-road motor vehicle injured in nontraffic accident',
+              'V84.3': 'Unspecified occupant of special agricultural vehicle injured in traffic accident',
+              'O98.8': 'Other maternal infectious and parasitic diseases complicating pregnancy, childbirth and the puerperium',
+              'I09.1': 'Rheumatic diseases of endocardium, valve unspecified',
+              'P01.5': 'Newborn affected by multiple pregnancy',
+              'G72.0': 'Drug-induced myopathy',
+              'V91.9': 'Accident to watercraft causing other injury, unspecified watercraft, boat NOS, ship NOS, or watercraft NOS',
+              'V96.1': 'Hang-glider accident injuring occupant',
+              'E74.4': 'Disorders of pyruvate metabolism and gluconeogenesis',
+              'C18.5': 'Splenic flexure - Malignant neoplasms',
+              'Y12': 'Poisoning by and exposure to narcotics and psychodysleptics [hallucinogens], not elsewhere classified, undetermined intent',
+              'V06.0': 'Pedestrian injured in collision with other nonmotor vehicle, nontraffic accident',
+              'I08.1': 'Disorders of both mitral and tricuspid valves',
+              'Q74.9': 'Unspecified congenital malformation of limb(s)',
+              'A89': 'Unspecified viral infection of central nervous system',
+              'I42.4': 'Endocardial fibroelastosis',
+              'C75.1': 'Pituitary gland - Malignant neoplasms',
+              'A49.1': 'Streptococcal infection, unspecified',
+              'V84.7': 'Person on outside of special agricultural vehicle injured in nontraffic accident',
+              'Q45.9': 'Congenital malformation of digestive system, unspecified',
+              'C25.7': 'Other parts of pancreas - Malignant neoplasms',
+              'D37.4': 'Colon - Uncertain neoplasms',
+              'C31.1': 'Ethmoidal sinus - Malignant neoplasms',
+              'A18.0': 'Tuberculosis of bones and joints',
+              'Y69': 'Unspecified misadventure during surgical and medical care',
+              'G92': 'Toxic encephalopathy',
+              'X96': 'Assault by explosive material',
+              'B40.2': 'Pulmonary blastomycosis, unspecified',
+              'V87.9': 'Person injured in other specified (collision)(noncollision) transport accidents involving nonmotor vehicle (traffic)',
+              'D37.2': 'Small intestine - Uncertain neoplasms',
+              'R22.2': 'Localized swelling, mass and lump, trunk',
+              'R63.8': 'Other symptoms and signs concerning food and fluid intake',
+              'A49.8': 'Other bacterial infections of unspecified site',
+              'E04.2': 'Nontoxic multinodular goitre',
+              'I36.1': 'Nonrheumatic tricuspid (valve) insufficiency',
+              'N28.8': 'Other specified disorders of kidney and ureter',
+              'M48.8': 'Other specified spondylopathies',
+              'C15.0': 'Cervical part of oesophagus - Malignant neoplasms',
+              'G31.0': 'Circumscribed brain atrophy',
+              'C20': 'Malignant neoplasm of rectum',
+              'C40.9': 'Bone and articular cartilage of limb, unspecified - Malignant neoplasms',
+              'G03.9': 'Meningitis, unspecified',
+              'G91.2': 'Normal-pressure hydrocephalus',
+              'Q07.9': 'Congenital malformation of nervous system, unspecified',
+              'N12': 'Tubulo-interstitial nephritis, not specified as acute or chronic',
+              'C63.0': 'Epididymis - Malignant neoplasms',
+              'Y84.2': 'Radiological procedure and radiotherapy',
+              'C46.7': "Kaposi's sarcoma of other sites - Malignant neoplasms",
+              'C15.9': 'Oesophagus, unspecified - Malignant neoplasms',
+              'C18.9': 'Colon, unspecified - Malignant neoplasms',
+              'J43.8': 'Other emphysema',
+              'D75.8': 'Other specified diseases of blood and blood-forming organs',
+              'K75.9': 'Inflammatory liver disease, unspecified',
+              'A78': 'Q fever',
+              'I88.9': 'Nonspecific lymphadenitis, unspecified',
+              'C30.1': 'Middle ear - Malignant neoplasms',
+              'J43.0': "MacLeod's syndrome",
+              'J38.3': 'Other diseases of vocal cords',
+              'B43.1': 'Phaeomycotic brain abscess',
+              'E78.4': 'Other hyperlipidaemia',
+              'X78': 'Intentional self-harm by sharp object',
+              'F17.1': 'Mental and behavioural disorders due to use of tobacco, harmful use',
+              'C06.9': 'Mouth, unspecified - Malignant neoplasms',
+              'F39': 'Unspecified mood [affective] disorder',
+              'V57.9': 'Occupant of pick-up truck or van injured in collision with fixed or stationary object, unspecified occupant of pick-up truck or van injured in traffic accident',
+              'Q69.9': 'Polydactyly, unspecified', 'M54.3': 'Sciatica',
+              'M62.3': 'Immobility syndrome (paraplegic)',
+              'E83.1': 'Disorders of iron metabolism',
+              'V83.0': 'Driver of special industrial vehicle injured in traffic accident',
+              'C16.8': 'Overlapping lesion of stomach - Malignant neoplasms',
+              'V90.9': 'Accident to watercraft causing drowning and submersion, unspecified watercraft, boat NOS, ship NOS, or watercraft NOS',
+              'C88.0': "Waldenstrom's macroglobulinaemia - Malignant neoplasms",
+              'X89': 'Assault by other specified chemicals and noxious substances',
+              'C79.1': 'Secondary malignant neoplasm of bladder and other and unspecified urinary organs - Malignant neoplasms',
+              'R00.1': 'Bradycardia, unspecified',
+              'F10.3': 'Mental and behavioural disorders due to use of alcohol, withdrawal state',
+              'D38.2': 'Pleura - Uncertain neoplasms',
+              'V11.4': 'Pedal cyclist injured in collision with other pedal cycle, driver injured in traffic accident',
+              'A02.9': 'Salmonella infection, unspecified',
+              'Y89.1': 'Sequelae of war operations',
+              'J18.8': 'Other pneumonia, organism unspecified',
+              'K26.5': 'Duodenal ulcer, chronic or unspecified with perforation',
+              'C82.1': 'Mixed small cleaved and large cell, follicular - Malignant neoplasms',
+              'M60.9': 'Myositis, unspecified',
+              'C76.7': 'Other ill-defined sites - Malignant neoplasms',
+              'Q22.0': 'Pulmonary valve atresia',
+              'J98.6': 'Disorders of diaphragm',
+              'P26.8': 'Other pulmonary haemorrhages originating in the perinatal period',
+              'M81.8': 'Other osteoporosis',
+              'Q79.5': 'Other congenital malformations of abdominal wall',
+              'Q37.9': 'Unspecified cleft palate with cleft lip, unilateral',
+              'W38': 'Explosion and rupture of other specified pressurized devices',
+              'N85.9': 'Noninflammatory disorder of uterus, unspecified',
+              'A92.0': 'Chikungunya virus disease',
+              'Y44.5': 'Thrombolytic drugs',
+              'C83.9': "Diffuse non-Hodgkin's lymphoma, unspecified - Malignant neoplasms",
+              'J18.1': 'Lobar pneumonia, unspecified',
+              'G82.5': 'Tetraplegia, unspecified',
+              'I69.2': 'Sequelae of other nontraumatic intracranial haemorrhage',
+              'G95.2': 'Cord compression, unspecified',
+              'V78.6': 'Bus occupant injured in noncollision transport accident, passenger injured in traffic accident',
+              'B34.4': 'Papovavirus infection, unspecified',
+              'K56.0': 'Paralytic ileus', 'M05.2': 'Rheumatoid vasculitis',
+              'C43.9': 'Malignant melanoma of skin, unspecified - Malignant neoplasms',
+              'J12.0': 'Adenoviral pneumonia',
+              'Q64.2': 'Congenital posterior urethral valves',
+              'Q43.0': "Meckel's diverticulum",
+              'J90': 'Pleural effusion, not elsewhere classified',
+              'A79.9': 'Rickettsiosis, unspecified',
+              'I09.9': 'Rheumatic heart disease, unspecified',
+              'B90.9': 'Sequelae of respiratory and unspecified tuberculosis',
+              'C90.0': 'Multiple myeloma - Malignant neoplasms',
+              'N05.5': 'Unspecified nephritic syndrome, diffuse mesangiocapillary glomerulonephritis',
+              'C22.2': 'Hepatoblastoma - Malignant neoplasms',
+              'E72.1': 'Disorders of sulfur-bearing amino-acid metabolism',
+              'E53.8': 'Deficiency of other specified B group vitamins',
+              'Y83.1': 'Surgical operation with implant of artificial internal device',
+              'Y87.0': 'Sequelae of intentional self-harm',
+              'K31.5': 'Obstruction of duodenum', 'G93.0': 'Cerebral cysts',
+              'K25.9': 'Gastric ulcer, unspecified as acute or chronic, without haemorrhage or perforation',
+              'D75.2': 'Essential thrombocytosis', 'Q38.2': 'Macroglossia',
+              'C24.1': 'Ampulla of Vater - Malignant neoplasms',
+              'C70.9': 'Meninges, unspecified - Malignant neoplasms',
+              'V20.4': 'Motorcycle rider injured in collision with pedestrian or animal, driver injured in traffic accident',
+              'V27.5': 'Motorcycle rider injured in collision with fixed or stationary object, passenger injured in traffic accident',
+              'O24.9': 'Diabetes mellitus in pregnancy, unspecified',
+              'V43.1': 'Car occupant injured in collision with car, pick-up truck or van, passenger injured in nontraffic accident',
+              'N83.9': 'Noninflammatory disorder of ovary, fallopian tube and broad ligament, unspecified',
+              'J68.0': 'Bronchitis and pneumonitis due to chemicals, gases, fumes and vapours',
+              'J03.9': 'Acute tonsillitis, unspecified',
+              'D51.0': 'Vitamin B12 deficiency anaemia due to intrinsic factor deficiency',
+              'M71.1': 'Other infective bursitis',
+              'E84.0': 'Cystic fibrosis with pulmonary manifestations',
+              'A49.3': 'Mycoplasma infection, unspecified',
+              'Y84.1': 'Kidney dialysis',
+              'B57.3': "Chagas' disease (chronic) with digestive system involvement",
+              'V92.5': 'Water-transport-related drowning and submersion without accident to watercraft, canoe or kayak',
+              'E84.8': 'Cystic fibrosis with other manifestations',
+              'B01.1': 'Varicella encephalitis',
+              'B23.8': 'HIV disease resulting in other specified conditions',
+              'A35': 'Other tetanus',
+              'D43.4': 'Spinal cord - Uncertain neoplasms',
+              'V64.6': 'Occupant of heavy transport vehicle injured in collision with heavy transport vehicle or bus, passenger injured in traffic accident',
+              'K85.9': 'Acute pancreatitis, unspecified',
+              'V86.0': 'Driver of all-terrain or other off-road motor vehicle injured in traffic accident',
+              'J33.9': 'Nasal polyp, unspecified',
+              'C82.2': 'Large cell, follicular - Malignant neoplasms',
+              'Q60.0': 'Renal agenesis, unilateral',
+              'A06.4': 'Amoebic liver abscess', 'K31.4': 'Gastric diverticulum',
+              'I33.0': 'Acute and subacute infective endocarditis',
+              'Y44.3': 'Anticoagulant antagonists, vitamin K and other coagulants',
+              'X83': 'Intentional self-harm by other specified means',
+              'O05.9': 'Other abortion, complete or unspecified, without complication',
+              'E78.1': 'Pure hyperglyceridaemia',
+              'M94.9': 'Disorder of cartilage, unspecified',
+              'C22.7': 'Other specified carcinomas of liver - Malignant neoplasms',
+              'A39.8': 'Other meningococcal infections',
+              'K22.1': 'Ulcer of oesophagus',
+              'W73': 'Other specified drowning and submersion',
+              'P25.0': 'Interstitial emphysema originating in the perinatal period',
+              'Y83.8': 'Other surgical procedures',
+              'E78.2': 'Mixed hyperlipidaemia',
+              'X72': 'Intentional self-harm by handgun discharge',
+              'V88.2': 'Person injured in collision between car and pick-up truck or van, nontraffic',
+              'E21.5': 'Disorder of parathyroid gland, unspecified',
+              'N64.9': 'Disorder of breast, unspecified',
+              'W36': 'Explosion and rupture of gas cylinder',
+              'B25.0': 'Cytomegaloviral pneumonitis',
+              'B76.9': 'Hookworm disease, unspecified',
+              'I72.5': 'Aneurysm and dissection of other precerebral arteries',
+              'E13.7': 'Other specified diabetes mellitus, with multiple complications',
+              'M62.6': 'Muscle strain',
+              'I61.0': 'Intracerebral haemorrhage in hemisphere, subcortical',
+              'F03': 'Unspecified dementia',
+              'D51.9': 'Vitamin B12 deficiency anaemia, unspecified',
+              'B19.9': 'Unspecified viral hepatitis without hepatic coma',
+              'I40.8': 'Other acute myocarditis',
+              'I61.4': 'Intracerebral haemorrhage in cerebellum',
+              'D14.3': 'Bronchus and lung - Benign neoplasms',
+              'K56.4': 'Other impaction of intestine',
+              'I80.3': 'Phlebitis and thrombophlebitis of lower extremities, unspecified',
+              'L30.9': 'Dermatitis, unspecified',
+              'Y83.2': 'Surgical operation with anastomosis, bypass or graft',
+              'G82.2': 'Paraplegia, unspecified',
+              'Y63.9': 'Failure in dosage during unspecified surgical and medical care',
+              'D46.4': 'Refractory anaemia, unspecified - Uncertain neoplasms',
+              'H49.8': 'Other paralytic strabismus',
+              'X57': 'Unspecified privation',
+              'B45.0': 'Pulmonary cryptococcosis',
+              'I61.1': 'Intracerebral haemorrhage in hemisphere, cortical',
+              'M31.0': 'Hypersensitivity angiitis', 'K60.4': 'Rectal fistula',
+              'V02.1': 'Pedestrian injured in collision with two- or three-wheeled motor vehicle, traffic accident',
+              'I35.0': 'Aortic (valve) stenosis',
+              'J32.9': 'Chronic sinusitis, unspecified',
+              'C76.4': 'Upper limb - Malignant neoplasms',
+              'B44.1': 'Other pulmonary aspergillosis',
+              'D89.2': 'Hypergammaglobulinaemia, unspecified',
+              'E63.9': 'Nutritional deficiency, unspecified',
+              'C21.0': 'Anus, unspecified - Malignant neoplasms',
+              'B44.7': 'Disseminated aspergillosis',
+              'G00.0': 'Haemophilus meningitis',
+              'B87.9': 'Myiasis, unspecified',
+              'K22.4': 'Dyskinesia of oesophagus',
+              'A04.6': 'Enteritis due to Yersinia enterocolitica',
+              'C52': 'Malignant neoplasm of vagina', 'W14': 'Fall from tree',
+              'O71.3': 'Obstetric laceration of cervix',
+              'C25.0': 'Head of pancreas - Malignant neoplasms',
+              'O00.1': 'Tubal pregnancy',
+              'E10.1': 'Insulin-dependent diabetes mellitus, with ketoacidosis',
+              'G35': 'Multiple sclerosis',
+              'P24.1': 'Neonatal aspiration of amniotic fluid and mucus',
+              'Y16': 'Poisoning by and exposure to organic solvents and halogenated hydrocarbons and their vapours, undetermined intent',
+              'V59.5': 'Passenger injured in collision with other and unspecified motor vehicles in traffic accident',
+              'P03.9': 'Newborn affected by complication of labour and delivery, unspecified',
+              'Q78.1': 'Polyostotic fibrous dysplasia',
+              'V84.9': 'Unspecified occupant of special agricultural vehicle injured in nontraffic accident',
+              'V91.3': 'Accident to watercraft causing other injury, other powered watercraft, hovercraft (on open water), or jet skis',
+              'Q93.9': 'Deletion from autosomes, unspecified',
+              'I34.0': 'Mitral (valve) insufficiency',
+              'C16.1': 'Fundus of stomach - Malignant neoplasms',
+              'K27.7': 'Peptic ulcer, site unspecified, chronic without haemorrhage or perforation',
+              'O72.1': 'Other immediate postpartum haemorrhage',
+              'A49.9': 'Bacterial infection, unspecified',
+              'O96.1': 'Death from indirect obstetric cause occurring more than 42 days but less than one year after delivery',
+              'B18.2': 'Chronic viral hepatitis C',
+              'Y85.0': 'Sequelae of motor-vehicle accident',
+              'I70.1': 'Atherosclerosis of renal artery',
+              'I42.1': 'Obstructive hypertrophic cardiomyopathy',
+              'C92.3': 'Myeloid sarcoma - Malignant neoplasms',
+              'V84.0': 'Driver of special agricultural vehicle injured in traffic accident',
+              'Q21.9': 'Congenital malformation of cardiac septum, unspecified',
+              'V54.9': 'Occupant of pick-up truck or van injured in collision with heavy transport vehicle or bus, unspecified occupant of pick-up truck or van injured in traffic accident',
+              'N42.9': 'Disorder of prostate, unspecified',
+              'Q89.3': 'Situs inversus',
+              'R94.3': 'Abnormal results of cardiovascular function studies',
+              'V92.3': 'Water-transport-related drowning and submersion without accident to watercraft, other powered watercraft, hovercraft (on open water), or jet skis',
+              'C51.0': 'Labium majus - Malignant neoplasms',
+              'J21.8': 'Acute bronchiolitis due to other specified organisms',
+              'D33.3': 'Cranial nerves - Benign neoplasms',
+              'Q82.1': 'Xeroderma pigmentosum',
+              'C88.2': 'Gamma heavy chain disease - Malignant neoplasms',
+              'N48.9': 'Disorder of penis, unspecified',
+              'C34.3': 'Lower lobe, bronchus or lung - Malignant neoplasms',
+              'E87.8': 'Other disorders of electrolyte and fluid balance, not elsewhere classified',
+              'Y40.8': 'Other systemic antibiotics',
+              'F11.1': 'Mental and behavioural disorders due to use of opioids, harmful use',
+              'B20.4': 'HIV disease resulting in candidiasis',
+              'P22.0': 'Respiratory distress syndrome of newborn',
+              'V88.8': 'Person injured in other specified noncollision transport accidents involving motor vehicle, nontraffic',
+              'K86.2': 'Cyst of pancreas',
+              'X64': 'Intentional self-poisoning by and exposure to other and unspecified drugs, medicaments and biological substances',
+              'D70': 'Agranulocytosis', 'V99': 'Unspecified transport accident',
+              'A43.9': 'Nocardiosis, unspecified',
+              'V85.5': 'Driver of special construction vehicle injured in nontraffic accident',
+              'F15.2': 'Mental and behavioural disorders due to use of other stimulants, including caffeine, dependence syndrome',
+              'G40.4': 'Other generalized epilepsy and epileptic syndromes',
+              'K74.6': 'Other and unspecified cirrhosis of liver',
+              'C11.1': 'Posterior wall of nasopharynx - Malignant neoplasms',
+              'D82.1': "Di George's syndrome",
+              'G62.2': 'Polyneuropathy due to other toxic agents',
+              'D38.5': 'Other respiratory organs - Uncertain neoplasms',
+              'I67.3': 'Progressive vascular leukoencephalopathy',
+              'R52.0': 'Acute pain', 'L98.3': 'Eosinophilic cellulitis [Wells]',
+              'D38.0': 'Larynx - Uncertain neoplasms',
+              'G21.8': 'Other secondary parkinsonism',
+              'C76.2': 'Abdomen - Malignant neoplasms',
+              'Q44.5': 'Other congenital malformations of bile ducts',
+              'C50.9': 'Breast, unspecified - Malignant neoplasms',
+              'H05.9': 'Disorder of orbit, unspecified',
+              'M85.8': 'Other specified disorders of bone density and structure',
+              'D25.9': 'Leiomyoma of uterus, unspecified - Benign neoplasms',
+              'M86.9': 'Osteomyelitis, unspecified',
+              'M46.0': 'Spinal enthesopathy',
+              'C75.2': 'Craniopharyngeal duct - Malignant neoplasms',
+              'W78': 'Inhalation of gastric contents',
+              'W00': 'Fall on same level involving ice and snow',
+              'V63.6': 'Occupant of heavy transport vehicle injured in collision with car, pick-up truck or van, passenger injured in traffic accident',
+              'L40.1': 'Generalized pustular psoriasis',
+              'J85.1': 'Abscess of lung with pneumonia',
+              'A52.3': 'Neurosyphilis, unspecified',
+              'V19.6': 'Unspecified pedal cyclist injured in collision with other and unspecified motor vehicles in traffic accident',
+              'P08.2': 'Post-term infant, not heavy for gestational age',
+              'F88': 'Other disorders of psychological development',
+              'B47.9': 'Mycetoma, unspecified',
+              'B43.9': 'Chromomycosis, unspecified',
+              'G83.1': 'Monoplegia of lower limb',
+              'Q20.8': 'Other congenital malformations of cardiac chambers and connections',
+              'M53.3': 'Sacrococcygeal disorders, not elsewhere classified',
+              'E11.3': 'Non-insulin-dependent diabetes mellitus, with ophthalmic complications',
+              'D19.9': 'Mesothelial tissue, unspecified - Benign neoplasms',
+              'B54': 'Unspecified malaria', 'E03.5': 'Myxoedema coma',
+              'V53.4': 'Occupant of pick-up truck or van injured in collision with car, pick-up truck or van, person injured while boarding or alighting',
+              'C43.3': 'Malignant melanoma of other and unspecified parts of face - Malignant neoplasms',
+              'K70.4': 'Alcoholic hepatic failure',
+              'Q38.8': 'Other congenital malformations of pharynx',
+              'I27.1': 'Kyphoscoliotic heart disease',
+              'K92.8': 'Other specified diseases of digestive system',
+              'Q87.2': 'Congenital malformation syndromes predominantly involving limbs',
+              'X59.9': 'Exposure to unspecified factor causing other and unspecified injury',
+              'F25.9': 'Schizoaffective disorder, unspecified',
+              'Q77.4': 'Achondroplasia',
+              'D72.9': 'Disorder of white blood cells, unspecified',
+              'M47.1': 'Other spondylosis with myelopathy',
+              'I44.4': 'Left anterior fascicular block',
+              'D07.4': 'Penis - In situ neoplasms',
+              'V91.4': 'Accident to watercraft causing other injury, sailboat or yacht',
+              'G36.1': 'Acute and subacute haemorrhagic leukoencephalitis [Hurst]',
+              'D47.3': 'Essential (haemorrhagic) thrombocythaemia - Uncertain neoplasms',
+              'D64.3': 'Other sideroblastic anaemias',
+              'J84.0': 'Alveolar and parietoalveolar conditions',
+              'N15.1': 'Renal and perinephric abscess',
+              'V47.4': 'Car occupant injured in collision with fixed or stationary object, person injured while boarding or alighting',
+              'Q42.3': 'Congenital absence, atresia and stenosis of anus without fistula',
+              'Q04.9': 'Congenital malformation of brain, unspecified',
+              'J43.1': 'Panlobular emphysema',
+              'C63.7': 'Other specified male genital organs - Malignant neoplasms',
+              'C22.9': 'Liver, unspecified - Malignant neoplasms',
+              'I78.8': 'Other diseases of capillaries',
+              'K25.6': 'Gastric ulcer, chronic or unspecified with both haemorrhage and perforation',
+              'K46.1': 'Unspecified abdominal hernia with gangrene',
+              'K83.3': 'Fistula of bile duct',
+              'I67.4': 'Hypertensive encephalopathy',
+              'F79': 'Unspecified mental retardation',
+              'X62': 'Intentional self-poisoning by and exposure to narcotics and psychodysleptics [hallucinogens], not elsewhere classified',
+              'L51.1': 'Bullous erythema multiforme',
+              'L11.1': 'Transient acantholytic dermatosis [Grover]',
+              'D68.8': 'Other specified coagulation defects',
+              'P36.4': 'Sepsis of newborn due to Escherichia coli',
+              'P54.9': 'Neonatal haemorrhage, unspecified',
+              'V55.5': 'Occupant of pick-up truck or van injured in collision with railway train or railway vehicle, driver injured in traffic accident',
+              'E84.1': 'Cystic fibrosis with intestinal manifestations',
+              'Q92.9': 'Trisomy and partial trisomy of autosomes, unspecified',
+              'I88.0': 'Nonspecific mesenteric lymphadenitis',
+              'Q41.0': 'Congenital absence, atresia and stenosis of duodenum',
+              'I44.3': 'Other and unspecified atrioventricular block',
+              'D13.4': 'Liver - Benign neoplasms',
+              'Q98.9': 'Sex chromosome abnormality, male phenotype, unspecified',
+              'J94.2': 'Haemothorax',
+              'V59.4': 'Driver injured in collision with other and unspecified motor vehicles in traffic accident',
+              'O10.1': 'Pre-existing hypertensive heart disease complicating pregnancy, childbirth and the puerperium',
+              'L93.0': 'Discoid lupus erythematosus',
+              'P28.8': 'Other specified respiratory conditions of newborn',
+              'P55.8': 'Other haemolytic diseases of newborn',
+              'Y48.4': 'Anaesthetic, unspecified',
+              'V48.2': 'Car occupant injured in noncollision transport accident, person on outside of vehicle injured in nontraffic accident',
+              'R06.8': 'Other and unspecified abnormalities of breathing',
+              'C03.0': 'Upper gum - Malignant neoplasms',
+              'N32.1': 'Vesicointestinal fistula',
+              'J70.4': 'Drug-induced interstitial lung disorders, unspecified',
+              'X76': 'Intentional self-harm by smoke, fire and flames',
+              'V45.0': 'Car occupant injured in collision with railway train or railway vehicle, driver injured in nontraffic accident',
+              'F19.3': 'Mental and behavioural disorders due to multiple drug use and use of other psychoactive substances, withdrawal state',
+              'O03.5': 'Spontaneous abortion, complete or unspecified, complicated by genital tract and pelvic infection',
+              'N48.1': 'Balanoposthitis',
+              'F11.2': 'Mental and behavioural disorders due to use of opioids, dependence syndrome',
+              'J84.9': 'Interstitial pulmonary disease, unspecified',
+              'Q04.6': 'Congenital cerebral cysts',
+              'V18.4': 'Pedal cyclist injured in noncollision transport accident, driver injured in traffic accident',
+              'C54.9': 'Corpus uteri, unspecified - Malignant neoplasms',
+              'Q60.5': 'Renal hypoplasia, unspecified',
+              'E11.2': 'Non-insulin-dependent diabetes mellitus, with renal complications',
+              'V49.6': 'Unspecified car occupant injured in collision with other and unspecified motor vehicles in traffic accident',
+              'V86.5': 'Driver of all-terrain or other off-road motor vehicle injured in nontraffic accident',
+              'N41.3': 'Prostatocystitis',
+              'E27.9': 'Disorder of adrenal gland, unspecified',
+              'K81.0': 'Acute cholecystitis',
+              'C51.9': 'Vulva, unspecified - Malignant neoplasms',
+              'G31.2': 'Degeneration of nervous system due to alcohol',
+              'N50.8': 'Other specified disorders of male genital organs',
+              'B37.6': 'Candidal endocarditis', 'A48.3': 'Toxic shock syndrome',
+              'L73.9': 'Follicular disorder, unspecified',
+              'Q25.3': 'Stenosis of aorta',
+              'G91.0': 'Communicating hydrocephalus',
+              'E34.8': 'Other specified endocrine disorders',
+              'D44.3': 'Pituitary gland - Uncertain neoplasms',
+              'J38.7': 'Other diseases of larynx',
+              'C38.0': 'Heart - Malignant neoplasms',
+              'G31.8': 'Other specified degenerative diseases of nervous system',
+              'Q87.8': 'Other specified congenital malformation syndromes, not elsewhere classified',
+              'B38.9': 'Coccidioidomycosis, unspecified',
+              'V47.6': 'Car occupant injured in collision with fixed or stationary object, passenger injured in traffic accident',
+              'V27.0': 'Motorcycle rider injured in collision with fixed or stationary object, driver injured in nontraffic accident',
+              'A17.8': 'Other tuberculosis of nervous system',
+              'G21.3': 'Postencephalitic parkinsonism',
+              'I45.3': 'Trifascicular block',
+              'C16.6': 'Greater curvature of stomach, unspecified - Malignant neoplasms',
+              'C71.7': 'Brain stem - Malignant neoplasms',
+              'F84.3': 'Other childhood disintegrative disorder',
+              'Q41.9': 'Congenital absence, atresia and stenosis of small intestine, part unspecified',
+              'L02.1': 'Cutaneous abscess, furuncle and carbuncle of neck',
+              'J16.8': 'Pneumonia due to other specified infectious organisms',
+              'D09.9': 'Carcinoma in situ, unspecified - In situ neoplasms',
+              'P55.9': 'Haemolytic disease of newborn, unspecified',
+              'B58.8': 'Toxoplasmosis with other organ involvement',
+              'K55.8': 'Other vascular disorders of intestine',
+              'L08.8': 'Other specified local infections of skin and subcutaneous tissue',
+              'D56.9': 'Thalassaemia, unspecified',
+              'F01.0': 'Vascular dementia of acute onset',
+              'W34': 'Discharge from other and unspecified firearms',
+              'Y41.0': 'Sulfonamides',
+              'X34.9': 'Victim of unspecified effect of earthquake',
+              'K46.0': 'Unspecified abdominal hernia with obstruction, without gangrene',
+              'F20.3': 'Undifferentiated schizophrenia',
+              'E85.9': 'Amyloidosis, unspecified',
+              'L94.8': 'Other specified localized connective tissue disorders',
+              'N89.9': 'Noninflammatory disorder of vagina, unspecified',
+              'D14.2': 'Trachea - Benign neoplasms', 'R00.2': 'Palpitations',
+              'P37.8': 'Other specified congenital infectious and parasitic diseases',
+              'X23': 'Contact with hornets, wasps and bees',
+              'G52.7': 'Disorders of multiple cranial nerves',
+              'F21': 'Schizotypal disorder',
+              'R70.1': 'Abnormal plasma viscosity',
+              'O89.8': 'Other complications of anaesthesia during the puerperium',
+              'W87': 'Exposure to unspecified electric current',
+              'K63.2': 'Fistula of intestine',
+              'B34.1': 'Enterovirus infection, unspecified',
+              'E77.0': 'Defects in post-translational modification of lysosomal enzymes',
+              'P76.9': 'Intestinal obstruction of newborn, unspecified',
+              'G24.1': 'Idiopathic familial dystonia',
+              'A52.0': 'Cardiovascular syphilis',
+              'B34.0': 'Adenovirus infection, unspecified',
+              'R46.1': 'Bizarre personal appearance',
+              'C02.2': 'Ventral surface of tongue - Malignant neoplasms',
+              'F06.8': 'Other specified mental disorders due to brain damage and dysfunction and to physical disease',
+              'O99.5': 'Diseases of the respiratory system complicating pregnancy, childbirth and the puerperium',
+              'X68': 'Intentional self-poisoning by and exposure to pesticides',
+              'V24.4': 'Motorcycle rider injured in collision with heavy transport vehicle or bus, driver injured in traffic accident',
+              'Y45.2': 'Propionic acid derivatives',
+              'I24.9': 'Acute ischaemic heart disease, unspecified',
+              'E75.1': 'Other gangliosidosis',
+              'K58.0': 'Irritable bowel syndrome with diarrhoea',
+              'X39': 'Exposure to other and unspecified forces of nature',
+              'O46.9': 'Antepartum haemorrhage, unspecified',
+              'C49.0': 'Connective and soft tissue of head, face and neck - Malignant neoplasms',
+              'C18.2': 'Ascending colon - Malignant neoplasms',
+              'E14.0': 'Unspecified diabetes mellitus, with coma',
+              'N30.0': 'Acute cystitis',
+              'V85.0': 'Driver of special construction vehicle injured in traffic accident',
+              'P01.1': 'Newborn affected by premature rupture of membranes',
+              'P39.3': 'Neonatal urinary tract infection',
+              'G06.0': 'Intracranial abscess and granuloma',
+              'Q64.4': 'Malformation of urachus',
+              'L25.9': 'Unspecified contact dermatitis, unspecified cause',
+              'C47.9': 'Peripheral nerves and autonomic nervous system, unspecified - Malignant neoplasms',
+              'K05.2': 'Acute periodontitis',
+              'B34.3': 'Parvovirus infection, unspecified',
+              'D56.0': 'Alpha thalassaemia', 'E16.1': 'Other hypoglycaemia',
+              'P36.5': 'Sepsis of newborn due to anaerobes',
+              'E78.0': 'Pure hypercholesterolaemia',
+              'I83.2': 'Varicose veins of lower extremities with both ulcer and inflammation',
+              'I42.6': 'Alcoholic cardiomyopathy',
+              'A98.5': 'Haemorrhagic fever with renal syndrome',
+              'Q45.3': 'Other congenital malformations of pancreas and pancreatic duct',
+              'C76.1': 'Thorax - Malignant neoplasms',
+              'W69': 'Drowning and submersion while in natural water',
+              'I31.3': 'Pericardial effusion (noninflammatory)',
+              'C41.4': 'Pelvic bones, sacrum and coccyx - Malignant neoplasms',
+              'E10.2': 'Insulin-dependent diabetes mellitus, with renal complications',
+              'C02.9': 'Tongue, unspecified - Malignant neoplasms',
+              'L23.7': 'Allergic contact dermatitis due to plants, except food',
+              'V69.2': 'Unspecified occupant of heavy transport vehicle injured in collision with other and unspecified motor vehicles in nontraffic accident',
+              'R68.0': 'Hypothermia, not associated with low environmental temperature',
+              'D69.8': 'Other specified haemorrhagic conditions',
+              'I87.2': 'Venous insufficiency (chronic)(peripheral)',
+              'F32.3': 'Severe depressive episode with psychotic symptoms',
+              'P35.1': 'Congenital cytomegalovirus infection',
+              'A04.8': 'Other specified bacterial intestinal infections',
+              'W15': 'Fall from cliff',
+              'C83.6': 'Undifferentiated (diffuse) - Malignant neoplasms',
+              'I31.0': 'Chronic adhesive pericarditis',
+              'N05.1': 'Unspecified nephritic syndrome, focal and segmental glomerular lesions',
+              'V77.6': 'Bus occupant injured in collision with fixed or stationary object, passenger injured in traffic accident',
+              'B15.0': 'Hepatitis A with hepatic coma', 'N13.4': 'Hydroureter',
+              'C43.0': 'Malignant melanoma of lip - Malignant neoplasms',
+              'J62.8': 'Pneumoconiosis due to other dust containing silica',
+              'I31.2': 'Haemopericardium, not elsewhere classified',
+              'P96.8': 'Other specified conditions originating in the perinatal period',
+              'I89.1': 'Lymphangitis',
+              'K25.7': 'Gastric ulcer, chronic without haemorrhage or perforation',
+              'V38.6': 'Occupant of three-wheeled motor vehicle injured in noncollision transport accident, passenger injured in traffic accident',
+              'C71.0': 'Cerebrum, except lobes and ventricles - Malignant neoplasms',
+              'Q20.4': 'Double inlet ventricle',
+              'N49.9': 'Inflammatory disorder of unspecified male genital organ',
+              'N15.9': 'Renal tubulo-interstitial disease, unspecified',
+              'C08.9': 'Major salivary gland, unspecified - Malignant neoplasms',
+              'C26.0': 'Intestinal tract, part unspecified - Malignant neoplasms',
+              'W83': 'Other specified threats to breathing',
+              'Y45.0': 'Opioids and related analgesics',
+              'K35.8': 'Acute appendicitis, other and unspecified',
+              'D43.2': 'Brain, unspecified - Uncertain neoplasms',
+              'V63.5': 'Occupant of heavy transport vehicle injured in collision with car, pick-up truck or van, driver injured in traffic accident',
+              'P03.4': 'Newborn affected by caesarean delivery',
+              'B46.0': 'Pulmonary mucormycosis',
+              'I09.8': 'Other specified rheumatic heart diseases',
+              'M79.1': 'Myalgia',
+              'J98.8': 'Other specified respiratory disorders',
+              'E68': 'Sequelae of hyperalimentation',
+              'E27.2': 'Addisonian crisis',
+              'P01.7': 'Newborn affected by malpresentation before labour',
+              'O26.6': 'Liver disorders in pregnancy, childbirth and the puerperium',
+              'F10.2': 'Mental and behavioural disorders due to use of alcohol, dependence syndrome',
+              'Q22.6': 'Hypoplastic right heart syndrome',
+              'P29.3': 'Persistent fetal circulation',
+              'V28.2': 'Motorcycle rider injured in noncollision transport accident, unspecified motorcycle rider injured in nontraffic accident',
+              'M41.2': 'Other idiopathic scoliosis',
+              'F10.9': 'Mental and behavioural disorders due to use of alcohol, unspecified mental and behavioural disorder',
+              'M25.5': 'Pain in joint',
+              'J20.5': 'Acute bronchitis due to respiratory syncytial virus',
+              'V81.4': 'Person injured while boarding or alighting from railway train or railway vehicle',
+              'Y88.3': 'Sequelae of surgical and medical procedures as the cause of abnormal reaction of the patient, or of later complication, without mention of misadventure at the time of the procedure',
+              'G83.4': 'Cauda equina syndrome',
+              'R41.0': 'Disorientation, unspecified',
+              'J16.0': 'Chlamydial pneumonia',
+              'J84.8': 'Other specified interstitial pulmonary diseases',
+              'B16.2': 'Acute hepatitis B without delta-agent with hepatic coma',
+              'Q89.4': 'Conjoined twins',
+              'W33': 'Rifle, shotgun and larger firearm discharge',
+              'F48.8': 'Other specified neurotic disorders',
+              'E23.3': 'Hypothalamic dysfunction, not elsewhere classified',
+              'K85.0': 'Idiopathic acute pancreatitis',
+              'M54.1': 'Radiculopathy',
+              'A16.9': 'Respiratory tuberculosis unspecified, without mention of bacteriological or histological confirmation',
+              'E80.0': 'Hereditary erythropoietic porphyria',
+              'Q25.4': 'Other congenital malformations of aorta',
+              'M54.9': 'Dorsalgia, unspecified',
+              'V56.5': 'Occupant of pick-up truck or van injured in collision with other nonmotor vehicle, driver injured in traffic accident',
+              'B45.1': 'Cerebral cryptococcosis',
+              'Y20': 'Hanging, strangulation and suffocation, undetermined intent',
+              'V69.6': 'Unspecified occupant of heavy transport vehicle injured in collision with other and unspecified motor vehicles in traffic accident',
+              'L89.2': 'Stage III decubitus ulcer',
+              'D39.7': 'Other female genital organs - Uncertain neoplasms',
+              'I51.8': 'Other ill-defined heart diseases',
+              'Q23.3': 'Congenital mitral insufficiency',
+              'N42.1': 'Congestion and haemorrhage of prostate',
+              'J10.0': 'Influenza with pneumonia, influenza virus identified',
+              'I74.2': 'Embolism and thrombosis of arteries of upper extremities',
+              'Q25.1': 'Coarctation of aorta',
+              'B33.3': 'Retrovirus infections, not elsewhere classified',
+              'V52.9': 'Occupant of pick-up truck or van injured in collision with two- or three-wheeled motor vehicle, unspecified occupant of pick-up truck or van injured in traffic accident',
+              'D69.4': 'Other primary thrombocytopenia',
+              'I60.9': 'Subarachnoid haemorrhage, unspecified',
+              'K85.2': 'Alcohol-induced acute pancreatitis',
+              'V87.2': 'Person injured in collision between car and pick-up truck or van (traffic)',
+              'K66.8': 'Other specified disorders of peritoneum',
+              'G11.4': 'Hereditary spastic paraplegia',
+              'V48.6': 'Car occupant injured in noncollision transport accident, passenger injured in traffic accident',
+              'P01.9': 'Newborn affected by maternal complication of pregnancy, unspecified',
+              'N49.8': 'Inflammatory disorders of other specified male genital organs',
+              'K60.2': 'Anal fissure, unspecified',
+              'G21.1': 'Other drug-induced secondary parkinsonism',
+              'D84.9': 'Immunodeficiency, unspecified',
+              'K04.7': 'Periapical abscess without sinus',
+              'C83.8': "Other types of diffuse non-Hodgkin's lymphoma - Malignant neoplasms",
+              'Q28.1': 'Other malformations of precerebral vessels',
+              'E34.9': 'Endocrine disorder, unspecified',
+              'E71.3': 'Disorders of fatty-acid metabolism',
+              'A40.2': 'Septicaemia due to streptococcus, group D',
+              'C63.2': 'Scrotum - Malignant neoplasms',
+              'R62.9': 'Lack of expected normal physiological development, unspecified',
+              'V44.0': 'Car occupant injured in collision with heavy transport vehicle or bus, driver injured in nontraffic accident',
+              'Y45.3': 'Other nonsteroidal anti-inflammatory drugs [NSAID]',
+              'K82.9': 'Disease of gallbladder, unspecified',
+              'V94.9': 'Other and unspecified water transport accidents, unspecified watercraft, boat NOS, ship NOS, or watercraft NOS',
+              'C10.0': 'Vallecula - Malignant neoplasms',
+              'C81.9': "Hodgkin's disease, unspecified - Malignant neoplasms",
+              'B22.7': 'HIV disease resulting in multiple diseases classified elsewhere',
+              'M84.1': 'Nonunion of fracture [pseudarthrosis]',
+              'F19.7': 'Mental and behavioural disorders due to multiple drug use and use of other psychoactive substances, residual and late-onset psychotic disorder',
+              'O04.8': 'Medical abortion, complete or unspecified, with other and unspecified complications',
+              'Y83.3': 'Surgical operation with formation of external stoma',
+              'V18.2': 'Pedal cyclist injured in noncollision transport accident, unspecified pedal cyclist injured in nontraffic accident',
+              'R17': 'Unspecified jaundice', 'P92.0': 'Vomiting in newborn',
+              'B66.4': 'Paragonimiasis',
+              'K76.1': 'Chronic passive congestion of liver',
+              'Q23.4': 'Hypoplastic left heart syndrome',
+              'D61.9': 'Aplastic anaemia, unspecified',
+              'F19.9': 'Mental and behavioural disorders due to multiple drug use and use of other psychoactive substances, unspecified mental and behavioural disorder',
+              'D43.3': 'Cranial nerves - Uncertain neoplasms',
+              'D69.5': 'Secondary thrombocytopenia',
+              'K63.0': 'Abscess of intestine',
+              'K26.1': 'Duodenal ulcer, acute with perforation',
+              'P28.1': 'Other and unspecified atelectasis of newborn',
+              'K27.0': 'Peptic ulcer, site unspecified, acute with haemorrhage',
+              'M13.1': 'Monoarthritis, not elsewhere classified',
+              'G10': "Huntington's disease",
+              'Y29': 'Contact with blunt object, undetermined intent',
+              'J32.4': 'Chronic pansinusitis',
+              'E78.6': 'Lipoprotein deficiency',
+              'Y49.5': 'Other antipsychotics and neuroleptics',
+              'P02.3': 'Newborn affected by placental transfusion syndromes',
+              'J36': 'Peritonsillar abscess',
+              'N85.8': 'Other specified noninflammatory disorders of uterus',
+              'G03.1': 'Chronic meningitis',
+              'Q40.3': 'Congenital malformation of stomach, unspecified',
+              'C77.0': 'Lymph nodes of head, face and neck - Malignant neoplasms',
+              'P28.0': 'Primary atelectasis of newborn',
+              'N39.0': 'Urinary tract infection, site not specified',
+              'G71.9': 'Primary disorder of muscle, unspecified',
+              'G40.6': 'Grand mal seizures, unspecified (with or without petit mal)',
+              'A87.0': 'Enteroviral meningitis',
+              'D36.9': 'Benign neoplasm of unspecified site - Benign neoplasms',
+              'I51.6': 'Cardiovascular disease, unspecified',
+              'Q65.8': 'Other congenital deformities of hip',
+              'M34.9': 'Systemic sclerosis, unspecified',
+              'I13.2': 'Hypertensive heart and renal disease with both (congestive) heart failure and renal failure',
+              'M79.9': 'Soft tissue disorder, unspecified',
+              'J44.1': 'Chronic obstructive pulmonary disease with acute exacerbation, unspecified',
+              'I28.1': 'Aneurysm of pulmonary artery',
+              'J98.5': 'Diseases of mediastinum, not elsewhere classified',
+              'C75.4': 'Carotid body - Malignant neoplasms',
+              'P04.2': 'Newborn affected by maternal use of tobacco',
+              'P01.2': 'Newborn affected by oligohydramnios',
+              'X61': 'Intentional self-poisoning by and exposure to antiepileptic, sedative-hypnotic, antiparkinsonism and psychotropic drugs, not elsewhere classified',
+              'C91.7': 'Other lymphoid leukaemia - Malignant neoplasms',
+              'C18.3': 'Hepatic flexure - Malignant neoplasms',
+              'Y41.1': 'Antimycobacterial drugs',
+              'Q28.9': 'Congenital malformation of circulatory system, unspecified',
+              'Q82.8': 'Other specified congenital malformations of skin',
+              'V92.4': 'Water-transport-related drowning and submersion without accident to watercraft, sailboat or yacht',
+              'R90.0': 'Intracranial space-occupying lesion',
+              'M35.8': 'Other specified systemic involvement of connective tissue',
+              'J69.0': 'Pneumonitis due to food and vomit',
+              'I06.8': 'Other rheumatic aortic valve diseases',
+              'I42.2': 'Other hypertrophic cardiomyopathy',
+              'D82.3': 'Immunodeficiency following hereditary defective response to',
+              'N70.9': 'Salpingitis and oophoritis, unspecified',
+              'N32.2': 'Vesical fistula, not elsewhere classified',
+              'Y47.1': 'Benzodiazepines',
+              'M94.8': 'Other specified disorders of cartilage',
+              'P80.9': 'Hypothermia of newborn, unspecified',
+              'J94.0': 'Chylous effusion',
+              'P52.6': 'Cerebellar (nontraumatic) and posterior fossa haemorrhage of newborn',
+              'Q76.6': 'Other congenital malformations of ribs',
+              'I15.9': 'Secondary hypertension, unspecified',
+              'I34.8': 'Other nonrheumatic mitral valve disorders',
+              'Y19': 'Poisoning by and exposure to other and unspecified chemicals and noxious substances, undetermined intent',
+              'K80.2': 'Calculus of gallbladder without cholecystitis',
+              'A85.1': 'Adenoviral encephalitis',
+              'B37.7': 'Candidal septicaemia',
+              'B94.1': 'Sequelae of viral encephalitis',
+              'C54.0': 'Isthmus uteri - Malignant neoplasms',
+              'W26': 'Contact with knife, sword or dagger',
+              'W03': 'Other fall on same level due to collision with, or pushing by, another person',
+              'K40.0': 'Bilateral inguinal hernia, with obstruction, without gangrene',
+              'B78.7': 'Disseminated strongyloidiasis',
+              'E75.5': 'Other lipid storage disorders',
+              'R60.1': 'Generalized oedema',
+              'X45': 'Accidental poisoning by and exposure to alcohol',
+              'W77': 'Threat to breathing due to cave-in, falling earth and other substances',
+              'B81.2': 'Trichostrongyliasis', 'Q20.0': 'Common arterial trunk',
+              'Q82.0': 'Hereditary lymphoedema',
+              'X95': 'Assault by other and unspecified firearm discharge',
+              'C46.9': "Kaposi's sarcoma, unspecified - Malignant neoplasms",
+              'I26.9': 'Pulmonary embolism without mention of acute cor pulmonale',
+              'Q81.9': 'Epidermolysis bullosa, unspecified',
+              'B21.3': 'HIV disease resulting in other malignant neoplasms of lymphoid, haematopoietic and related tissue',
+              'A69.2': 'Lyme disease',
+              'I67.9': 'Cerebrovascular disease, unspecified',
+              'C96.1': 'Malignant histiocytosis - Malignant neoplasms',
+              'I74.9': 'Embolism and thrombosis of unspecified artery',
+              'K80.0': 'Calculus of gallbladder with acute cholecystitis',
+              'V41.9': 'Car occupant injured in collision with pedal cycle, unspecified car occupant injured in traffic accident',
+              'R78.8': 'Finding of other specified substances, not normally found in blood',
+              'M31.7': 'Microscopic polyangiitis',
+              'E83.4': 'Disorders of magnesium metabolism',
+              'V28.4': 'Motorcycle rider injured in noncollision transport accident, driver injured in traffic accident',
+              'M80.8': 'Other osteoporosis with pathological fracture',
+              'C93.0': 'Acute monocytic leukaemia - Malignant neoplasms',
+              'G70.1': 'Toxic myoneural disorders',
+              'I69.4': 'Sequelae of stroke, not specified as haemorrhage or infarction',
+              'C22.3': 'Angiosarcoma of liver - Malignant neoplasms',
+              'C13.9': 'Hypopharynx, unspecified - Malignant neoplasms',
+              'A42.0': 'Pulmonary actinomycosis',
+              'X71': 'Intentional self-harm by drowning and submersion',
+              'G50.0': 'Trigeminal neuralgia',
+              'D59.9': 'Acquired haemolytic anaemia, unspecified',
+              'N13.5': 'Kinking and stricture of ureter without hydronephrosis',
+              'I51.9': 'Heart disease, unspecified',
+              'W57': 'Bitten or stung by nonvenomous insect and other nonvenomous arthropods',
+              'M43.2': 'Other fusion of spine',
+              'G12.9': 'Spinal muscular atrophy, unspecified',
+              'D64.8': 'Other specified anaemias',
+              'I42.9': 'Cardiomyopathy, unspecified',
+              'D69.1': 'Qualitative platelet defects',
+              'I72.9': 'Aneurysm of unspecified site', 'R04.0': 'Epistaxis',
+              'J15.0': 'Pneumonia due to Klebsiella pneumoniae',
+              'M33.1': 'Other dermatomyositis',
+              'V49.2': 'Unspecified car occupant injured in collision with other and unspecified motor vehicles in nontraffic accident',
+              'G31.9': 'Degenerative disease of nervous system, unspecified',
+              'D39.1': 'Ovary - Uncertain neoplasms',
+              'V93.2': 'Accident on board watercraft without accident to watercraft, not causing drowning and submersion, fishing boat',
+              'W17': 'Other fall from one level to another',
+              'E14.6': 'Unspecified diabetes mellitus, with other specified complications',
+              'K29.8': 'Duodenitis',
+              'V88.6': 'Person injured in collision between railway train or railway vehicle and car, nontraffic',
+              'O11': 'Pre-existing hypertensive disorder with superimposed proteinuria',
+              'M35.6': 'Relapsing panniculitis [Weber-Christian]',
+              'E77.8': 'Other disorders of glycoprotein metabolism',
+              'G80.1': 'Spastic diplegia',
+              'Q04.3': 'Other reduction deformities of brain',
+              'I71.9': 'Aortic aneurysm of unspecified site, without mention of rupture',
+              'Q77.8': 'Other osteochondrodysplasia with defects of growth of tubular bones and spine',
+              'C46.0': "Kaposi's sarcoma of skin - Malignant neoplasms",
+              'I69.8': 'Sequelae of other and unspecified cerebrovascular diseases',
+              'D13.2': 'Duodenum - Benign neoplasms',
+              'Q21.2': 'Atrioventricular septal defect',
+              'Q04.4': 'Septo-optic dysplasia', 'K63.4': 'Enteroptosis',
+              'C31.2': 'Frontal sinus - Malignant neoplasms',
+              'E24.0': "Pituitary-dependent Cushing's disease",
+              'N81.4': 'Uterovaginal prolapse, unspecified',
+              'A16.4': 'Tuberculosis of larynx, trachea and bronchus, without mention of bacteriological or histological confirmation',
+              'V25.4': 'Motorcycle rider injured in collision with railway train or railway vehicle, driver injured in traffic accident',
+              'F50.2': 'Bulimia nervosa', 'G90.2': "Horner's syndrome",
+              'B91': 'Sequelae of poliomyelitis',
+              'I60.6': 'Subarachnoid haemorrhage from other intracranial arteries',
+              'E22.2': 'Syndrome of inappropriate secretion of antidiuretic hormone',
+              'D01.2': 'Rectum - In situ neoplasms',
+              'L03.9': 'Cellulitis, unspecified',
+              'E88.1': 'Lipodystrophy, not elsewhere classified',
+              'W81': 'Confined to or trapped in a low-oxygen environment',
+              'C21.8': 'Overlapping lesion of rectum, anus and anal canal - Malignant neoplasms',
+              'P37.0': 'Congenital tuberculosis',
+              'F11.3': 'Mental and behavioural disorders due to use of opioids, withdrawal state',
+              'R09.0': 'Asphyxia', 'K56.3': 'Gallstone ileus',
+              'Q25.8': 'Other congenital malformations of great arteries',
+              'V68.6': 'Occupant of heavy transport vehicle injured in noncollision transport accident, passenger injured in traffic accident',
+              'Y35.0': 'Legal intervention involving firearm discharge',
+              'P50.4': 'Haemorrhage into maternal circulation',
+              'I51.1': 'Rupture of chordae tendineae, not elsewhere classified',
+              'E88.0': 'Disorders of plasma-protein metabolism, not elsewhere classified',
+              'B17.8': 'Other specified acute viral hepatitis',
+              'G30.9': "Alzheimer's disease, unspecified",
+              'C03.1': 'Lower gum - Malignant neoplasms',
+              'D81.3': 'Adenosine deaminase [ADA] deficiency',
+              'V40.9': 'Car occupant injured in collision with pedestrian or animal, unspecified car occupant injured in traffic accident',
+              'A85.8': 'Other specified viral encephalitis',
+              'Y02': 'Assault by pushing or placing victim before moving object',
+              'I06.9': 'Rheumatic aortic valve disease, unspecified',
+              'D37.6': 'Liver, gallbladder and bile ducts - Uncertain neoplasms',
+              'K80.4': 'Calculus of bile duct with cholecystitis',
+              'E21.3': 'Hyperparathyroidism, unspecified',
+              'D89.8': 'Other specified disorders involving the immune mechanism, not elsewhere classified',
+              'M79.8': 'Other specified soft tissue disorders',
+              'L02.2': 'Cutaneous abscess, furuncle and carbuncle of trunk',
+              'K26.9': 'Duodenal ulcer, unspecified as acute or chronic, without haemorrhage or perforation',
+              'I74.3': 'Embolism and thrombosis of arteries of lower extremities',
+              'V14.0': 'Pedal cyclist injured in collision with heavy transport vehicle or bus, driver injured in nontraffic accident',
+              'G91.1': 'Obstructive hydrocephalus',
+              'G80.3': 'Dyskinetic cerebral palsy',
+              'A39.4': 'Meningococcaemia, unspecified',
+              'K40.3': 'Unilateral or unspecified inguinal hernia, with obstruction, without gangrene',
+              'H60.1': 'Cellulitis of external ear',
+              'Q79.9': 'Congenital malformation of musculoskeletal system, unspecified',
+              'V49.3': 'Car occupant [any] injured in unspecified nontraffic accident',
+              'P05.9': 'Slow fetal growth, unspecified',
+              'O99.1': 'Other diseases of the blood and blood-forming organs and certain disorders involving the immune mechanism complicating pregnancy, childbirth and the puerperium',
+              'P07.2': 'Extreme immaturity',
+              'X73': 'Intentional self-harm by rifle, shotgun and larger firearm discharge',
+              'B33.8': 'Other specified viral diseases',
+              'V91.6': 'Accident to watercraft causing other injury, inflatable craft (nonpowered)',
+              'E66.2': 'Extreme obesity with alveolar hypoventilation',
+              'V96.0': 'Balloon accident injuring occupant',
+              'V45.9': 'Car occupant injured in collision with railway train or railway vehicle, unspecified car occupant injured in traffic accident',
+              'D60.9': 'Acquired pure red cell aplasia, unspecified',
+              'L55.9': 'Sunburn, unspecified', 'E85.8': 'Other amyloidosis',
+              'G93.5': 'Compression of brain',
+              'N61': 'Inflammatory disorders of breast',
+              'F90.0': 'Disturbance of activity and attention',
+              'E46': 'Unspecified protein-energy malnutrition',
+              'B02.2': 'Zoster with other nervous system involvement',
+              'G41.2': 'Complex partial status epilepticus',
+              'V19.8': 'Pedal cyclist [any] injured in other specified transport accidents',
+              'C60.2': 'Body of penis - Malignant neoplasms',
+              'Y00': 'Assault by blunt object',
+              'I25.1': 'Atherosclerotic heart disease',
+              'C19': 'Malignant neoplasm of rectosigmoid junction',
+              'K57.2': 'Diverticular disease of large intestine with perforation and abscess',
+              'B00.2': 'Herpesviral gingivostomatitis and pharyngotonsillitis',
+              'X03': 'Exposure to controlled fire, not in building or structure',
+              'G04.2': 'Bacterial meningoencephalitis and meningomyelitis, not elsewhere classified',
+              'P07.0': 'Extremely low birth weight',
+              'G04.8': 'Other encephalitis, myelitis and encephalomyelitis',
+              'R53': 'Malaise and fatigue',
+              'K22.3': 'Perforation of oesophagus',
+              'I36.9': 'Nonrheumatic tricuspid valve disorder, unspecified',
+              'O43.2': 'Morbidly adherent placenta',
+              'C75.3': 'Pineal gland - Malignant neoplasms',
+              'Q20.3': 'Discordant ventriculoarterial connection',
+              'I13.0': 'Hypertensive heart and renal disease with (congestive) heart failure',
+              'J39.0': 'Retropharyngeal and parapharyngeal abscess',
+              'D43.0': 'Brain, supratentorial - Uncertain neoplasms',
+              'I25.3': 'Aneurysm of heart', 'W39': 'Discharge of firework',
+              'P53': 'Haemorrhagic disease of newborn', 'G51.0': "Bell's palsy",
+              'E77.1': 'Defects in glycoprotein degradation',
+              'Q74.8': 'Other specified congenital malformations of limb(s)',
+              'K44.9': 'Diaphragmatic hernia without obstruction or gangrene',
+              'G70.8': 'Other specified myoneural disorders',
+              'A08.3': 'Other viral enteritis',
+              'K75.1': 'Phlebitis of portal vein',
+              'C41.0': 'Bones of skull and face - Malignant neoplasms',
+              'I45.5': 'Other specified heart block',
+              'N11.9': 'Chronic tubulo-interstitial nephritis, unspecified',
+              'Q22.4': 'Congenital tricuspid stenosis', 'E87.3': 'Alkalosis',
+              'N41.1': 'Chronic prostatitis',
+              'C00.9': 'Lip, unspecified - Malignant neoplasms',
+              'B42.0': 'Pulmonary sporotrichosis',
+              'K25.0': 'Gastric ulcer, acute with haemorrhage',
+              'B38.2': 'Pulmonary coccidioidomycosis, unspecified',
+              'P39.9': 'Infection specific to the perinatal period, unspecified',
+              'P91.6': 'Hypoxic ischemic encephalopathy of newborn',
+              'Q21.0': 'Ventricular septal defect',
+              'I21.4': 'Acute subendocardial myocardial infarction',
+              'W25': 'Contact with sharp glass',
+              'I45.8': 'Other specified conduction disorders',
+              'N36.9': 'Urethral disorder, unspecified',
+              'I42.5': 'Other restrictive cardiomyopathy',
+              'A41.8': 'Other specified septicaemia',
+              'N94.8': 'Other specified conditions associated with female genital organs and menstrual cycle',
+              'K45.0': 'Other specified abdominal hernia with obstruction, without gangrene',
+              'K05.6': 'Periodontal disease, unspecified',
+              'P70.1': 'Syndrome of infant of a diabetic mother',
+              'I05.1': 'Rheumatic mitral insufficiency',
+              'P11.2': 'Unspecified brain damage due to birth injury',
+              'C77.4': 'Inguinal and lower limb lymph nodes - Malignant neoplasms',
+              'R57.8': 'Other shock', 'M89.9': 'Disorder of bone, unspecified',
+              'I71.3': 'Abdominal aortic aneurysm, ruptured',
+              'B46.3': 'Cutaneous mucormycosis',
+              'V18.0': 'Pedal cyclist injured in noncollision transport accident, driver injured in nontraffic accident',
+              'Y17': 'Poisoning by and exposure to other gases and vapours, undetermined intent',
+              'K56.6': 'Other and unspecified intestinal obstruction',
+              'Y60.6': 'During aspiration, puncture and other catheterization',
+              'M46.5': 'Other infective spondylopathies',
+              'F84.0': 'Childhood autism',
+              'V40.6': 'Car occupant injured in collision with pedestrian or animal, passenger injured in traffic accident',
+              'P50.1': 'Fetal blood loss from ruptured cord',
+              'I61.9': 'Intracerebral haemorrhage, unspecified',
+              'O98.0': 'Tuberculosis complicating pregnancy, childbirth and the puerperium',
+              'L02.9': 'Cutaneous abscess, furuncle and carbuncle, unspecified',
+              'E23.6': 'Other disorders of pituitary gland',
+              'J04.0': 'Acute laryngitis',
+              'I67.7': 'Cerebral arteritis, not elsewhere classified',
+              'I25.9': 'Chronic ischaemic heart disease, unspecified',
+              'L40.8': 'Other psoriasis',
+              'F41.0': 'Panic disorder [episodic paroxysmal anxiety]',
+              'W86': 'Exposure to other specified electric current',
+              'N76.4': 'Abscess of vulva',
+              'J62.0': 'Pneumoconiosis due to talc dust',
+              'B02.3': 'Zoster ocular disease',
+              'E45': 'Retarded development following protein-energy malnutrition',
+              'C09.0': 'Tonsillar fossa - Malignant neoplasms',
+              'A05.9': 'Bacterial foodborne intoxication, unspecified',
+              'W32': 'Handgun discharge',
+              'D09.0': 'Bladder - In situ neoplasms',
+              'K44.1': 'Diaphragmatic hernia with gangrene',
+              'F17.9': 'Mental and behavioural disorders due to use of tobacco, unspecified mental and behavioural disorder',
+              'V46.6': 'Car occupant injured in collision with other nonmotor vehicle, passenger injured in traffic accident',
+              'C41.1': 'Mandible - Malignant neoplasms',
+              'O13': 'Gestational [pregnancy-induced] hypertension without significant proteinuria',
+              'C68.9': 'Urinary organ, unspecified - Malignant neoplasms',
+              'N70.1': 'Chronic salpingitis and oophoritis',
+              'D32.9': 'Meninges, unspecified - Benign neoplasms',
+              'C71.3': 'Parietal lobe - Malignant neoplasms',
+              'G80.2': 'Infantile hemiplegia',
+              'I35.2': 'Aortic (valve) stenosis with insufficiency',
+              'M50.1': 'Cervical disc disorder with radiculopathy',
+              'F41.2': 'Mixed anxiety and depressive disorder',
+              'D14.4': 'Respiratory system, unspecified - Benign neoplasms',
+              'R57.1': 'Hypovolaemic shock',
+              'C94.2': 'Acute megakaryoblastic leukaemia - Malignant neoplasms',
+              'I84.9': 'Unspecified haemorrhoids without complication',
+              'C60.1': 'Glans penis - Malignant neoplasms',
+              'J39.2': 'Other diseases of pharynx',
+              'N15.0': 'Balkan nephropathy',
+              'C00.5': 'Lip, unspecified, inner aspect - Malignant neoplasms',
+              'E70.2': 'Disorders of tyrosine metabolism',
+              'E79.1': 'Lesch-Nyhan syndrome',
+              'K55.9': 'Vascular disorder of intestine, unspecified',
+              'V87.6': 'Person injured in collision between railway train or railway vehicle and car (traffic)',
+              'E76.1': 'Mucopolysaccharidosis, type II',
+              'C32.0': 'Glottis - Malignant neoplasms',
+              'G37.2': 'Central pontine myelinolysis',
+              'L95.9': 'Vasculitis limited to skin, unspecified',
+              'F14.1': 'Mental and behavioural disorders due to use of cocaine, harmful use',
+              'D56.1': 'Beta thalassaemia',
+              'V78.4': 'Bus occupant injured in noncollision transport accident, person injured while boarding or alighting',
+              'G98': 'Other disorders of nervous system, not elsewhere classified',
+              'D07.2': 'Vagina - In situ neoplasms',
+              'D31.3': 'Choroid - Benign neoplasms', 'I05.0': 'Mitral stenosis',
+              'C91.0': 'Acute lymphoblastic leukaemia - Malignant neoplasms',
+              'I25.8': 'Other forms of chronic ischaemic heart disease',
+              'Q61.1': 'Polycystic kidney, infantile type',
+              'C15.8': 'Overlapping lesion of oesophagus - Malignant neoplasms',
+              'C43.1': 'Malignant melanoma of eyelid, including canthus - Malignant neoplasms',
+              'J13': 'Pneumonia due to Streptococcus pneumoniae',
+              'I20.1': 'Angina pectoris with documented spasm',
+              'N90.9': 'Noninflammatory disorder of vulva and perineum, unspecified',
+              'J18.9': 'Pneumonia, unspecified',
+              'D80.9': 'Immunodeficiency with predominantly antibody defects, unspecified',
+              'E05.2': 'Thyrotoxicosis with toxic multinodular goitre',
+              'M50.0': 'Cervical disc disorder with myelopathy',
+              'G24.8': 'Other dystonia', 'R73.9': 'Hyperglycaemia, unspecified',
+              'K50.0': "Crohn's disease of small intestine",
+              'P70.0': 'Syndrome of infant of mother with gestational diabetes',
+              'C92.1': 'Chronic myeloid leukaemia - Malignant neoplasms',
+              'V04.1': 'Pedestrian injured in collision with heavy transport vehicle or bus, traffic accident',
+              'P00.0': 'Newborn affected by maternal hypertensive disorders',
+              'E26.9': 'Hyperaldosteronism, unspecified',
+              'C69.2': 'Retina - Malignant neoplasms',
+              'V94.3': 'Other and unspecified water transport accidents, other powered watercraft, hovercraft (on open water), or jet skis',
+              'V16.9': 'Pedal cyclist injured in collision with other nonmotor vehicle, unspecified pedal cyclist injured in traffic accident',
+              'D13.7': 'Endocrine pancreas - Benign neoplasms',
+              'C76.5': 'Lower limb - Malignant neoplasms',
+              'K40.1': 'Bilateral inguinal hernia, with gangrene',
+              'A90': 'Dengue fever [classical dengue]',
+              'A04.4': 'Other intestinal Escherichia coli infections',
+              'G90.4': 'Autonomic dysreflexia',
+              'N95.9': 'Menopausal and perimenopausal disorder, unspecified',
+              'N13.6': 'Pyonephrosis', 'I06.0': 'Rheumatic aortic stenosis',
+              'J09': 'Influenza due to identified avian influenza virus',
+              'Y24': 'Other and unspecified firearm discharge, undetermined intent',
+              'M13.0': 'Polyarthritis, unspecified', 'R06.1': 'Stridor',
+              'C23': 'Malignant neoplasm of gallbladder',
+              'I85.0': 'Oesophageal varices with bleeding',
+              'D73.0': 'Hyposplenism',
+              'B20.2': 'HIV disease resulting in cytomegaloviral disease',
+              'N14.4': 'Toxic nephropathy, not elsewhere classified',
+              'F43.2': 'Adjustment disorders',
+              'I67.0': 'Dissection of cerebral arteries, nonruptured',
+              'I72.4': 'Aneurysm of artery of lower extremity',
+              'Y03': 'Assault by crashing of motor vehicle',
+              'R22.9': 'Localized swelling, mass and lump, unspecified',
+              'A04.5': 'Campylobacter enteritis',
+              'L43.9': 'Lichen planus, unspecified',
+              'F41.1': 'Generalized anxiety disorder',
+              'I25.0': 'Atherosclerotic cardiovascular disease, so described',
+              'A16.5': 'Tuberculous pleurisy, without mention of bacteriological or histological confirmation',
+              'J05.1': 'Acute epiglottitis',
+              'Y35.7': 'Legal intervention, means unspecified',
+              'Q21.1': 'Atrial septal defect',
+              'I07.2': 'Tricuspid stenosis with insufficiency',
+              'V77.5': 'Bus occupant injured in collision with fixed or stationary object, driver injured in traffic accident',
+              'R22.1': 'Localized swelling, mass and lump, neck',
+              'J92.0': 'Pleural plaque with presence of asbestos',
+              'X17': 'Contact with hot engines, machinery and tools',
+              'E72.5': 'Disorders of glycine metabolism',
+              'P23.4': 'Congenital pneumonia due to Escherichia coli',
+              'B94.8': 'Sequelae of other specified infectious and parasitic diseases',
+              'C26.1': 'Spleen - Malignant neoplasms',
+              'H91.3': 'Deaf mutism, not elsewhere classified',
+              'I11.0': 'Hypertensive heart disease with (congestive) heart failure',
+              'G90.1': 'Familial dysautonomia [Riley-Day]',
+              'N25.1': 'Nephrogenic diabetes insipidus', 'K83.0': 'Cholangitis',
+              'C78.0': 'Secondary malignant neoplasm of lung - Malignant neoplasms',
+              'J35.1': 'Hypertrophy of tonsils',
+              'N47': 'Redundant prepuce, phimosis and paraphimosis',
+              'I84.1': 'Internal haemorrhoids with other complications',
+              'P58.8': 'Neonatal jaundice due to other specified excessive haemolysis',
+              'N20.0': 'Calculus of kidney',
+              'N39.9': 'Disorder of urinary system, unspecified',
+              'O99.0': 'Anaemia complicating pregnancy, childbirth and the puerperium',
+              'Q39.8': 'Other congenital malformations of oesophagus',
+              'C78.4': 'Secondary malignant neoplasm of small intestine - Malignant neoplasms',
+              'G04.9': 'Encephalitis, myelitis and encephalomyelitis, unspecified',
+              'I08.9': 'Multiple valve disease, unspecified',
+              'A07.1': 'Giardiasis [lambliasis]',
+              'I72.2': 'Aneurysm of renal artery',
+              'G62.9': 'Polyneuropathy, unspecified',
+              'I62.1': 'Nontraumatic extradural haemorrhage',
+              'Q27.8': 'Other specified congenital malformations of peripheral vascular system',
+              'D12.0': 'Caecum - Benign neoplasms',
+              'G95.1': 'Vascular myelopathies',
+              'Y83.6': 'Removal of other organ (partial) (total)',
+              'D80.3': 'Selective deficiency of immunoglobulin G [IgG] subclasses',
+              'B37.5': 'Candidal meningitis',
+              'I45.6': 'Pre-excitation syndrome',
+              'E67.8': 'Other specified hyperalimentation',
+              'B15.9': 'Hepatitis A without hepatic coma',
+              'J68.8': 'Other respiratory conditions due to chemicals, gases, fumes and vapours',
+              'C92.2': 'Subacute myeloid leukaemia - Malignant neoplasms',
+              'D89.9': 'Disorder involving the immune mechanism, unspecified',
+              'V90.3': 'Accident to watercraft causing drowning and submersion, other powered watercraft, hovercraft (on open water), or jet skis',
+              'A37.9': 'Whooping cough, unspecified',
+              'W44': 'Foreign body entering into or through eye or natural orifice',
+              'Y54.6': 'Electrolytic, caloric and water-balance agents',
+              'P27.9': 'Unspecified chronic respiratory disease originating in the perinatal period',
+              'F11.9': 'Mental and behavioural disorders due to use of opioids, unspecified mental and behavioural disorder',
+              'I34.2': 'Nonrheumatic mitral (valve) stenosis',
+              'Q79.4': 'Prune belly syndrome',
+              'K80.3': 'Calculus of bile duct with cholangitis',
+              'L02.8': 'Cutaneous abscess, furuncle and carbuncle of other sites',
+              'D68.1': 'Hereditary factor XI deficiency',
+              'D66': 'Hereditary factor VIII deficiency',
+              'C90.2': 'Plasmacytoma, extramedullary - Malignant neoplasms',
+              'V45.6': 'Car occupant injured in collision with railway train or railway vehicle, passenger injured in traffic accident',
+              'J45.9': 'Asthma, unspecified',
+              'Q30.1': 'Agenesis and underdevelopment of nose',
+              'E87.7': 'Fluid overload', 'J39.1': 'Other abscess of pharynx',
+              'I80.9': 'Phlebitis and thrombophlebitis of unspecified site',
+              'R52.9': 'Pain, unspecified',
+              'E04.1': 'Nontoxic single thyroid nodule',
+              'F22.0': 'Delusional disorder', 'K92.1': 'Melaena',
+              'E75.6': 'Lipid storage disorder, unspecified',
+              'G04.0': 'Acute disseminated encephalitis',
+              'I74.0': 'Embolism and thrombosis of abdominal aorta',
+              'M40.2': 'Other and unspecified kyphosis',
+              'Q31.1': 'Congenital subglottic stenosis',
+              'I67.2': 'Cerebral atherosclerosis',
+              'N14.2': 'Nephropathy induced by unspecified drug, medicament or biological substance',
+              'Q64.5': 'Congenital absence of bladder and urethra',
+              'G82.3': 'Flaccid tetraplegia', 'K74.1': 'Hepatic sclerosis',
+              'D19.0': 'Mesothelial tissue of pleura - Benign neoplasms',
+              'Q43.8': 'Other specified congenital malformations of intestine',
+              'V47.2': 'Car occupant injured in collision with fixed or stationary object, person on outside of vehicle injured in nontraffic accident',
+              'F19.2': 'Mental and behavioural disorders due to multiple drug use and use of other psychoactive substances, dependence syndrome',
+              'L98.8': 'Other specified disorders of skin and subcutaneous tissue',
+              'I01.9': 'Acute rheumatic heart disease, unspecified',
+              'I13.9': 'Hypertensive heart and renal disease, unspecified',
+              'M50.9': 'Cervical disc disorder, unspecified',
+              'I89.0': 'Lymphoedema, not elsewhere classified',
+              'E78.9': 'Disorder of lipoprotein metabolism, unspecified',
+              'I64': 'Stroke, not specified as haemorrhage or infarction',
+              'K14.9': 'Disease of tongue, unspecified',
+              'E41': 'Nutritional marasmus',
+              'N95.2': 'Postmenopausal atrophic vaginitis',
+              'W09': 'Fall involving playground equipment',
+              'Y60.1': 'During infusion or transfusion',
+              'E55.0': 'Rickets, active',
+              'V28.0': 'Motorcycle rider injured in noncollision transport accident, driver injured in nontraffic accident',
+              'L98.2': 'Febrile neutrophilic dermatosis [Sweet]',
+              'A05.1': 'Botulism', 'M05.1': 'Rheumatoid lung disease (J99.0*)',
+              'I63.8': 'Other cerebral infarction',
+              'M33.9': 'Dermatopolymyositis, unspecified',
+              'R22.0': 'Localized swelling, mass and lump, head',
+              'R29.8': 'Other and unspecified symptoms and signs involving the nervous and musculoskeletal systems',
+              'G71.8': 'Other primary disorders of muscles',
+              'E11.1': 'Non-insulin-dependent diabetes mellitus, with ketoacidosis',
+              'X99': 'Assault by sharp object',
+              'B88.9': 'Infestation, unspecified',
+              'E72.2': 'Disorders of urea cycle metabolism',
+              'F78': 'Other mental retardation',
+              'B94.9': 'Sequelae of unspecified infectious or parasitic disease',
+              'M77.9': 'Enthesopathy, unspecified',
+              'I83.9': 'Varicose veins of lower extremities without ulcer or inflammation',
+              'A49.0': 'Staphylococcal infection, unspecified',
+              'Q31.5': 'Congenital laryngomalacia',
+              'C83.4': 'Immunoblastic (diffuse) - Malignant neoplasms',
+              'K81.9': 'Cholecystitis, unspecified',
+              'F13.7': 'Mental and behavioural disorders due to use of sedatives or hypnotics, residual and late-onset psychotic disorder',
+              'K90.8': 'Other intestinal malabsorption', 'E40': 'Kwashiorkor',
+              'C91.3': 'Prolymphocytic leukaemia - Malignant neoplasms',
+              'K40.9': 'Unilateral or unspecified inguinal hernia, without obstruction or gangrene',
+              'N36.8': 'Other specified disorders of urethra',
+              'G31.1': 'Senile degeneration of brain, not elsewhere classified',
+              'K22.2': 'Oesophageal obstruction',
+              'C02.1': 'Border of tongue - Malignant neoplasms',
+              'K90.1': 'Tropical sprue',
+              'K73.9': 'Chronic hepatitis, unspecified',
+              'J12.9': 'Viral pneumonia, unspecified', 'B60.2': 'Naegleriasis',
+              'C82.9': "Follicular non-Hodgkin's lymphoma, unspecified - Malignant neoplasms",
+              'J98.2': 'Interstitial emphysema',
+              'I34.1': 'Mitral (valve) prolapse',
+              'V38.5': 'Occupant of three-wheeled motor vehicle injured in noncollision transport accident, driver injured in traffic accident',
+              'E85.3': 'Secondary systemic amyloidosis',
+              'C45.1': 'Mesothelioma of peritoneum - Malignant neoplasms',
+              'V87.5': 'Person injured in collision between heavy transport vehicle and bus (traffic)',
+              'Y51.5': 'Predominantly beta-adrenoreceptor agonists, not elsewhere classified',
+              'J92.9': 'Pleural plaque without asbestos',
+              'V88.7': 'Person injured in collision between other specified motor vehicles, nontraffic',
+              'J10.1': 'Influenza with other respiratory manifestations, influenza virus identified',
+              'G00.2': 'Streptococcal meningitis',
+              'G24.4': 'Idiopathic orofacial dystonia',
+              'O71.1': 'Rupture of uterus during labour',
+              'V06.9': 'Unspecified whether traffic or nontraffic accident',
+              'H70.0': 'Acute mastoiditis',
+              'M34.0': 'Progressive systemic sclerosis', 'J66.0': 'Byssinosis',
+              'I01.8': 'Other acute rheumatic heart disease',
+              'C74.1': 'Medulla of adrenal gland - Malignant neoplasms',
+              'I49.1': 'Atrial premature depolarization',
+              'C26.9': 'Ill-defined sites within the digestive system - Malignant neoplasms',
+              'V48.7': 'Car occupant injured in noncollision transport accident, person on outside of vehicle injured in traffic accident',
+              'P94.2': 'Congenital hypotonia',
+              'V59.9': 'Occupant [any] of pick-up truck or van injured in unspecified traffic accident',
+              'F54': 'Psychological and behavioural factors associated with disorders or diseases classified elsewhere',
+              'H35.5': 'Hereditary retinal dystrophy',
+              'H05.0': 'Acute inflammation of orbit', 'Y40.0': 'Penicillins',
+              'N13.0': 'Hydronephrosis with ureteropelvic junction obstruction',
+              'I51.0': 'Cardiac septal defect, acquired',
+              'X93': 'Assault by handgun discharge',
+              'A83.9': 'Mosquito-borne viral encephalitis, unspecified',
+              'Q23.8': 'Other congenital malformations of aortic and mitral valves',
+              'G95.0': 'Syringomyelia and syringobulbia',
+              'B00.1': 'Herpesviral vesicular dermatitis',
+              'I70.9': 'Generalized and unspecified atherosclerosis',
+              'P03.6': 'Newborn affected by abnormal uterine contractions',
+              'I71.0': 'Dissection of aorta [any part]',
+              'I44.0': 'Atrioventricular block, first degree',
+              'B90.2': 'Sequelae of tuberculosis of bones and joints',
+              'I73.8': 'Other specified peripheral vascular diseases',
+              'F20.9': 'Schizophrenia, unspecified', 'E61.1': 'Iron deficiency',
+              'C79.5': 'Secondary malignant neoplasm of bone and bone marrow - Malignant neoplasms',
+              'A19.9': 'Miliary tuberculosis, unspecified',
+              'V14.4': 'Pedal cyclist injured in collision with heavy transport vehicle or bus, driver injured in traffic accident',
+              'E85.4': 'Organ-limited amyloidosis',
+              'K50.9': "Crohn's disease, unspecified",
+              'X21': 'Contact with venomous spiders',
+              'K71.9': 'Toxic liver disease, unspecified',
+              'Y30': 'Falling, jumping or pushed from a high place, undetermined intent',
+              'G71.1': 'Myotonic disorders',
+              'D37.1': 'Stomach - Uncertain neoplasms',
+              'P02.5': 'Newborn affected by other compression of umbilical cord',
+              'F01.3': 'Mixed cortical and subcortical vascular dementia',
+              'M31.1': 'Thrombotic microangiopathy',
+              'O75.4': 'Other complications of obstetric surgery and procedures',
+              'P36.8': 'Other bacterial sepsis of newborn',
+              'V94.4': 'Other and unspecified water transport accidents, sailboat or yacht',
+              'V01.0': 'Pedestrian injured in collision with pedal cycle, nontraffic accident',
+              'W66': 'Drowning and submersion following fall into bath-tub',
+              'E03.9': 'Hypothyroidism, unspecified',
+              'N04.8': 'Nephrotic syndrome, other',
+              'X69': 'Intentional self-poisoning by and exposure to other and unspecified chemicals and noxious substances',
+              'Q61.0': 'Congenital single renal cyst',
+              'Q20.1': 'Double outlet right ventricle',
+              'Q39.4': 'Oesophageal web',
+              'Y40.1': 'Cefalosporins and other beta-lactam antibiotics',
+              'Q80.3': 'Congenital bullous ichthyosiform erythroderma',
+              'M67.8': 'Other specified disorders of synovium and tendon',
+              'H52.1': 'Myopia',
+              'D06.9': 'Cervix, unspecified - In situ neoplasms',
+              'E24.9': "Cushing's syndrome, unspecified",
+              'Q91.1': 'Trisomy 18, mosaicism (mitotic nondisjunction)',
+              'D69.6': 'Thrombocytopenia, unspecified',
+              'M84.0': 'Malunion of fracture', 'D68.5': 'Primary thrombophilia',
+              'I73.0': "Raynaud's syndrome",
+              'V95.3': 'Accident to commercial fixed-wing aircraft, injuring occupant',
+              'J15.8': 'Other bacterial pneumonia',
+              'G54.5': 'Neuralgic amyotrophy',
+              'Q60.2': 'Renal agenesis, unspecified',
+              'Q87.3': 'Congenital malformation syndromes involving early overgrowth',
+              'O23.0': 'Infections of kidney in pregnancy',
+              'C77.2': 'Intra-abdominal lymph nodes - Malignant neoplasms',
+              'J35.3': 'Hypertrophy of tonsils with hypertrophy of adenoids',
+              'V47.5': 'Car occupant injured in collision with fixed or stationary object, driver injured in traffic accident',
+              'N82.4': 'Other female intestinal-genital tract fistulae',
+              'R59.1': 'Generalized enlarged lymph nodes',
+              'K12.2': 'Cellulitis and abscess of mouth',
+              'K66.0': 'Peritoneal adhesions',
+              'V04.9': 'Unspecified whether traffic or nontraffic accident',
+              'K31.9': 'Disease of stomach and duodenum, unspecified',
+              'C71.8': 'Overlapping lesion of brain - Malignant neoplasms',
+              'M89.8': 'Other specified disorders of bone',
+              'O98.7': 'Human immunodeficiency [HIV] disease complicating pregnancy, childbirth and the puerperium',
+              'V56.6': 'Occupant of pick-up truck or van injured in collision with other nonmotor vehicle, passenger injured in traffic accident',
+              'C17.1': 'Jejunum - Malignant neoplasms',
+              'V29.2': 'Unspecified motorcycle rider injured in collision with other and unspecified motor vehicles in nontraffic accident',
+              'D21.9': 'Connective and other soft tissue, unspecified - Benign neoplasms',
+              'K56.7': 'Ileus, unspecified',
+              'D40.0': 'Prostate - Uncertain neoplasms',
+              'E03.8': 'Other specified hypothyroidism',
+              'B33.2': 'Viral carditis',
+              'X14': 'Contact with hot air and gases',
+              'X79': 'Intentional self-harm by blunt object',
+              'C38.3': 'Mediastinum, part unspecified - Malignant neoplasms',
+              'J43.9': 'Emphysema, unspecified',
+              'V53.6': 'Occupant of pick-up truck or van injured in collision with car, pick-up truck or van, passenger injured in traffic accident',
+              'I45.9': 'Conduction disorder, unspecified',
+              'A63.0': 'Anogenital (venereal) warts',
+              'C04.9': 'Floor of mouth, unspecified - Malignant neoplasms',
+              'N70.0': 'Acute salpingitis and oophoritis',
+              'O15.0': 'Eclampsia in pregnancy', 'A28.0': 'Pasteurellosis',
+              'R59.9': 'Enlarged lymph nodes, unspecified',
+              'L12.9': 'Pemphigoid, unspecified',
+              'A32.7': 'Listerial septicaemia',
+              'L94.9': 'Localized connective tissue disorder, unspecified',
+              'I21.0': 'Acute transmural myocardial infarction of anterior wall',
+              'N92.6': 'Irregular menstruation, unspecified',
+              'C97': 'Malignant neoplasms of independent (primary) multiple sites',
+              'V09.2': 'Pedestrian injured in traffic accident involving other and unspecified motor vehicles',
+              'Q44.4': 'Choledochal cyst',
+              'C25.2': 'Tail of pancreas - Malignant neoplasms',
+              'D15.0': 'Thymus - Benign neoplasms',
+              'J96.0': 'Acute respiratory failure',
+              'D15.7': 'Other specified intrathoracic organs - Benign neoplasms',
+              'D38.3': 'Mediastinum - Uncertain neoplasms',
+              'M08.0': 'Juvenile rheumatoid arthritis',
+              'P29.1': 'Neonatal cardiac dysrhythmia',
+              'V89.0': 'Person injured in unspecified motor-vehicle accident, nontraffic',
+              'I28.9': 'Disease of pulmonary vessels, unspecified',
+              'P36.9': 'Bacterial sepsis of newborn, unspecified',
+              'K70.9': 'Alcoholic liver disease, unspecified',
+              'K52.1': 'Toxic gastroenteritis and colitis',
+              'Q21.3': 'Tetralogy of Fallot',
+              'O10.0': 'Pre-existing essential hypertension complicating pregnancy, childbirth and the puerperium',
+              'M51.2': 'Other specified intervertebral disc displacement',
+              'X38': 'Victim of flood',
+              'D12.3': 'Transverse colon - Benign neoplasms',
+              'M00.2': 'Other streptococcal arthritis and polyarthritis',
+              'C01': 'Malignant neoplasm of base of tongue',
+              'K63.5': 'Polyp of colon',
+              'D69.9': 'Haemorrhagic condition, unspecified',
+              'P28.3': 'Primary sleep apnoea of newborn',
+              'R09.2': 'Respiratory arrest',
+              'B44.8': 'Other forms of aspergillosis',
+              'D62': 'Acute posthaemorrhagic anaemia',
+              'P01.6': 'Newborn affected by maternal death',
+              'B00.7': 'Disseminated herpesviral disease',
+              'N41.8': 'Other inflammatory diseases of prostate',
+              'G03.0': 'Nonpyogenic meningitis',
+              'V48.0': 'Car occupant injured in noncollision transport accident, driver injured in nontraffic accident',
+              'I95.8': 'Other hypotension', 'K76.6': 'Portal hypertension',
+              'G30.1': "Alzheimer's disease with late onset",
+              'D35.0': 'Adrenal gland - Benign neoplasms',
+              'D10.9': 'Pharynx, unspecified - Benign neoplasms',
+              'L00': 'Staphylococcal scalded skin syndrome',
+              'O96.9': 'Death from unspecified obstetric cause occurring more than 42 days but less than one year after delivery',
+              'Y44.9': 'Other and unspecified agents affecting blood constituents',
+              'B46.1': 'Rhinocerebral mucormycosis',
+              'K83.2': 'Perforation of bile duct',
+              'I70.8': 'Atherosclerosis of other arteries',
+              'N95.0': 'Postmenopausal bleeding',
+              'K75.3': 'Granulomatous hepatitis, not elsewhere classified',
+              'C83.1': 'Small cleaved cell (diffuse) - Malignant neoplasms',
+              'V81.6': 'Occupant of railway train or railway vehicle injured by fall from railway train or railway vehicle',
+              'D50.9': 'Iron deficiency anaemia, unspecified',
+              'R63.4': 'Abnormal weight loss',
+              'V83.5': 'Driver of special industrial vehicle injured in nontraffic accident',
+              'I78.0': 'Hereditary haemorrhagic telangiectasia',
+              'V92.2': 'Water-transport-related drowning and submersion without accident to watercraft, fishing boat',
+              'I50.1': 'Left ventricular failure',
+              'W12': 'Fall on and from scaffolding',
+              'F82': 'Specific developmental disorder of motor function',
+              'Y04': 'Assault by bodily force', 'L43.8': 'Other lichen planus',
+              'W01': 'Fall on same level from slipping, tripping and stumbling',
+              'V87.1': 'Person injured in collision between other motor vehicle and two- or three-wheeled motor vehicle (traffic)',
+              'Q80.4': 'Harlequin fetus', 'M94.1': 'Relapsing polychondritis',
+              'L89.1': 'Stage II decubitus ulcer',
+              'P29.8': 'Other cardiovascular disorders originating in the perinatal period',
+              'R06.0': 'Dyspnoea',
+              'V87.8': 'Person injured in other specified noncollision transport accidents involving motor vehicle (traffic)',
+              'X47': 'Accidental poisoning by and exposure to other gases and vapours',
+              'C22.4': 'Other sarcomas of liver - Malignant neoplasms',
+              'K75.0': 'Abscess of liver',
+              'O15.9': 'Eclampsia, unspecified as to time period',
+              'Y60.0': 'During surgical operation',
+              'D46.3': 'Refractory anaemia with excess of blasts with transformation - Uncertain neoplasms',
+              'C78.7': 'Secondary malignant neoplasm of liver - Malignant neoplasms',
+              'O90.4': 'Postpartum acute renal failure',
+              'I01.1': 'Acute rheumatic endocarditis',
+              'I69.3': 'Sequelae of cerebral infarction',
+              'I78.9': 'Disease of capillaries, unspecified',
+              'P15.9': 'Birth injury, unspecified',
+              'C22.0': 'Liver cell carcinoma - Malignant neoplasms',
+              'W05': 'Fall involving wheelchair',
+              'Q93.5': 'Other deletions of part of a chromosome',
+              'Q78.2': 'Osteopetrosis',
+              'D00.1': 'Oesophagus - In situ neoplasms',
+              'P01.3': 'Newborn affected by polyhydramnios',
+              'C91.9': 'Lymphoid leukaemia, unspecified - Malignant neoplasms',
+              'I63.0': 'Cerebral infarction due to thrombosis of precerebral arteries',
+              'L10.2': 'Pemphigus foliaceus', 'Q33.3': 'Agenesis of lung',
+              'E21.1': 'Secondary hyperparathyroidism, not elsewhere classified',
+              'Q00.0': 'Anencephaly',
+              'I27.2': 'Other secondary pulmonary hypertension',
+              'Q87.4': "Marfan's syndrome", 'G24.9': 'Dystonia, unspecified',
+              'A52.9': 'Late syphilis, unspecified',
+              'V54.6': 'Occupant of pick-up truck or van injured in collision with heavy transport vehicle or bus, passenger injured in traffic accident',
+              'D35.1': 'Parathyroid gland - Benign neoplasms',
+              'K56.1': 'Intussusception', 'G00.8': 'Other bacterial meningitis',
+              'V95.1': 'Ultralight, microlight or powered-glider accident injuring occupant',
+              'E14.7': 'Unspecified diabetes mellitus, with multiple complications',
+              'K27.5': 'Peptic ulcer, site unspecified, chronic or unspecified with perforation',
+              'Y57.6': 'Other diagnostic agents',
+              'D07.5': 'Prostate - In situ neoplasms',
+              'N80.0': 'Endometriosis of uterus',
+              'K31.2': 'Hourglass stricture and stenosis of stomach',
+              'C69.5': 'Lacrimal gland and duct - Malignant neoplasms',
+              'V58.0': 'Occupant of pick-up truck or van injured in noncollision transport accident, driver injured in nontraffic accident',
+              'Y13': 'Poisoning by and exposure to other drugs acting on the autonomic nervous system, undetermined intent',
+              'I67.5': 'Moyamoya disease', 'L73.2': 'Hidradenitis suppurativa',
+              'G80.0': 'Spastic cerebral palsy',
+              'G12.1': 'Other inherited spinal muscular atrophy',
+              'Q24.4': 'Congenital subaortic stenosis',
+              'P07.3': 'Other preterm infants',
+              'W85': 'Exposure to electric transmission lines',
+              'K82.1': 'Hydrops of gallbladder',
+              'M46.4': 'Discitis, unspecified',
+              'L13.1': 'Subcorneal pustular dermatitis',
+              'N20.2': 'Calculus of kidney with calculus of ureter',
+              'N30.9': 'Cystitis, unspecified',
+              'Q92.1': 'Whole chromosome trisomy, mosaicism (mitotic nondisjunction)',
+              'E14.2': 'Unspecified diabetes mellitus, with renal complications',
+              'I24.1': "Dressler's syndrome",
+              'R01.1': 'Cardiac murmur, unspecified',
+              'K52.0': 'Gastroenteritis and colitis due to radiation',
+              'Y43.0': 'Antiallergic and antiemetic drugs',
+              'Q25.5': 'Atresia of pulmonary artery',
+              'C44.9': 'Malignant neoplasm of skin, unspecified - Malignant neoplasms',
+              'I95.1': 'Orthostatic hypotension',
+              'X43': 'Accidental poisoning by and exposure to other drugs acting on the autonomic nervous system',
+              'B94.2': 'Sequelae of viral hepatitis',
+              'N32.0': 'Bladder-neck obstruction',
+              'V89.3': 'Person injured in unspecified nonmotor-vehicle accident, traffic',
+              'F73': 'Profound mental retardation',
+              'K11.7': 'Disturbances of salivary secretion',
+              'C30.0': 'Nasal cavity - Malignant neoplasms',
+              'C02.0': 'Dorsal surface of tongue - Malignant neoplasms',
+              'M47.9': 'Spondylosis, unspecified',
+              'O99.7': 'Diseases of the skin and subcutaneous tissue complicating pregnancy, childbirth and the puerperium',
+              'E67.1': 'Hypercarotenaemia',
+              'K29.5': 'Chronic gastritis, unspecified',
+              'L72.0': 'Epidermal cyst',
+              'I45.1': 'Other and unspecified right bundle-branch block',
+              'L51.2': 'Toxic epidermal necrolysis [Lyell]',
+              'J15.3': 'Pneumonia due to streptococcus, group B',
+              'O06.8': 'Unspecified abortion, complete or unspecified, with other and unspecified complications',
+              'D30.0': 'Kidney - Benign neoplasms',
+              'X75': 'Intentional self-harm by explosive material',
+              'Q23.2': 'Congenital mitral stenosis', 'K61.1': 'Rectal abscess',
+              'M54.6': 'Pain in thoracic spine',
+              'O44.1': 'Placenta praevia with haemorrhage',
+              'I37.1': 'Pulmonary valve insufficiency',
+              'Q67.6': 'Pectus excavatum',
+              'G70.9': 'Myoneural disorder, unspecified',
+              'C15.1': 'Thoracic part of oesophagus - Malignant neoplasms',
+              'D22.9': 'Melanocytic naevi, unspecified - Benign neoplasms',
+              'W31': 'Contact with other and unspecified machinery',
+              'R33': 'Retention of urine', 'G12.2': 'Motor neuron disease',
+              'P03.5': 'Newborn affected by precipitate delivery',
+              'N13.9': 'Obstructive and reflux uropathy, unspecified',
+              'A77.0': 'Spotted fever due to Rickettsia rickettsii',
+              'C72.5': 'Other and unspecified cranial nerves - Malignant neoplasms',
+              'Q61.2': 'Polycystic kidney, adult type',
+              'Q77.0': 'Achondrogenesis',
+              'V09.1': 'Pedestrian injured in unspecified nontraffic accident',
+              'K73.2': 'Chronic active hepatitis, not elsewhere classified',
+              'P91.8': 'Other specified disturbances of cerebral status of newborn',
+              'J22': 'Unspecified acute lower respiratory infection',
+              'V94.8': 'Other and unspecified water transport accidents, other unpowered watercraft, surf-board, or windsurfer',
+              'P15.8': 'Other specified birth injuries',
+              'J11.0': 'Influenza with pneumonia, virus not identified',
+              'F84.9': 'Pervasive developmental disorder, unspecified',
+              'O99.4': 'Diseases of the circulatory system complicating pregnancy, childbirth and the puerperium',
+              'M34.8': 'Other forms of systemic sclerosis',
+              'P59.2': 'Neonatal jaundice from other and unspecified hepatocellular damage',
+              'J21.0': 'Acute bronchiolitis due to respiratory syncytial virus',
+              'C48.1': 'Specified parts of peritoneum - Malignant neoplasms',
+              'K72.0': 'Acute and subacute hepatic failure',
+              'D71': 'Functional disorders of polymorphonuclear neutrophils',
+              'O02.0': 'Blighted ovum and nonhydatidiform mole',
+              'J94.1': 'Fibrothorax',
+              'E74.3': 'Other disorders of intestinal carbohydrate absorption',
+              'C83.3': 'Large cell (diffuse) - Malignant neoplasms',
+              'X65': 'Intentional self-poisoning by and exposure to alcohol',
+              'Q33.4': 'Congenital bronchiectasis',
+              'B39.9': 'Histoplasmosis, unspecified',
+              'V26.4': 'Motorcycle rider injured in collision with other nonmotor vehicle, driver injured in traffic accident',
+              'J01.0': 'Acute maxillary sinusitis',
+              'W04': 'Fall while being carried or supported by other persons',
+              'M53.1': 'Cervicobrachial syndrome',
+              'K80.8': 'Other cholelithiasis',
+              'D50.0': 'Iron deficiency anaemia secondary to blood loss (chronic)',
+              'C10.8': 'Overlapping lesion of oropharynx - Malignant neoplasms',
+              'G36.9': 'Acute disseminated demyelination, unspecified',
+              'G82.1': 'Spastic paraplegia',
+              'Q75.9': 'Congenital malformation of skull and face bones, unspecified',
+              'F43.1': 'Post-traumatic stress disorder',
+              'O26.9': 'Pregnancy-related condition, unspecified',
+              'E14.1': 'Unspecified diabetes mellitus, with ketoacidosis',
+              'M32.1': 'Systemic lupus erythematosus with organ or system involvement',
+              'W54': 'Bitten or struck by dog', 'D72.1': 'Eosinophilia',
+              'K66.1': 'Haemoperitoneum', 'O14.2': 'HELLP syndrome',
+              'Y54.5': 'Other diuretics',
+              'C16.9': 'Stomach, unspecified - Malignant neoplasms',
+              'K25.4': 'Gastric ulcer, chronic or unspecified with haemorrhage',
+              'K11.1': 'Hypertrophy of salivary gland',
+              'R45.6': 'Physical violence', 'K14.8': 'Other diseases of tongue',
+              'A39.9': 'Meningococcal infection, unspecified',
+              'M32.9': 'Systemic lupus erythematosus, unspecified',
+              'V22.5': 'Motorcycle rider injured in collision with two- or three-wheeled motor vehicle, passenger injured in traffic accident',
+              'K07.0': 'Major anomalies of jaw size',
+              'N81.8': 'Other female genital prolapse',
+              'Q07.0': 'Arnold-Chiari syndrome',
+              'Y84.0': 'Cardiac catheterization',
+              'L51.9': 'Erythema multiforme, unspecified',
+              'W50': 'Hit, struck, kicked, twisted, bitten or scratched by another person',
+              'K43.9': 'Ventral hernia without obstruction or gangrene',
+              'V58.6': 'Occupant of pick-up truck or van injured in noncollision transport accident, passenger injured in traffic accident',
+              'E16.0': 'Drug-induced hypoglycaemia without coma',
+              'K29.9': 'Gastroduodenitis, unspecified',
+              'C25.9': 'Pancreas, unspecified - Malignant neoplasms',
+              'X54': 'Lack of water',
+              'M00.0': 'Staphylococcal arthritis and polyarthritis',
+              'J15.5': 'Pneumonia due to Escherichia coli',
+              'Q74.3': 'Arthrogryposis multiplex congenita',
+              'P61.4': 'Other congenital anaemias, not elsewhere classified',
+              'E14.9': 'Unspecified diabetes mellitus, without complications',
+              'P96.9': 'Condition originating in the perinatal period, unspecified',
+              'D39.2': 'Placenta - Uncertain neoplasms',
+              'N17.0': 'Acute renal failure with tubular necrosis',
+              'V58.2': 'Occupant of pick-up truck or van injured in noncollision transport accident, person on outside of vehicle injured in nontraffic accident',
+              'C49.3': 'Connective and soft tissue of thorax - Malignant neoplasms',
+              'P37.1': 'Congenital toxoplasmosis',
+              'B27.0': 'Gammaherpesviral mononucleosis',
+              'M51.3': 'Other specified intervertebral disc degeneration',
+              'H54.0': 'Blindness, both eyes', 'K75.4': 'Autoimmune hepatitis',
+              'Q75.8': 'Other specified congenital malformations of skull and face bones',
+              'K31.6': 'Fistula of stomach and duodenum',
+              'V84.6': 'Passenger of special agricultural vehicle injured in nontraffic accident',
+              'J67.9': 'Hypersensitivity pneumonitis due to unspecified organic dust',
+              'J85.3': 'Abscess of mediastinum',
+              'K57.1': 'Diverticular disease of small intestine without perforation or abscess',
+              'V29.0': 'Driver injured in collision with other and unspecified motor vehicles in nontraffic accident',
+              'E23.7': 'Disorder of pituitary gland, unspecified',
+              'C85.0': 'Lymphosarcoma - Malignant neoplasms',
+              'J86.0': 'Pyothorax with fistula',
+              'D04.7': 'Skin of lower limb, including hip - In situ neoplasms',
+              'E11.0': 'Non-insulin-dependent diabetes mellitus, with coma',
+              'K72.1': 'Chronic hepatic failure',
+              'V15.9': 'Pedal cyclist injured in collision with railway train or railway vehicle, unspecified pedal cyclist injured in traffic accident',
+              'N10': 'Acute tubulo-interstitial nephritis',
+              'V46.9': 'Car occupant injured in collision with other nonmotor vehicle, unspecified car occupant injured in traffic accident',
+              'A81.9': 'Slow virus infection of central nervous system, unspecified',
+              'L01.0': 'Impetigo [any organism] [any site]',
+              'C07': 'Malignant neoplasm of parotid gland',
+              'C93.7': 'Other monocytic leukaemia - Malignant neoplasms',
+              'K29.4': 'Chronic atrophic gastritis',
+              'I46.9': 'Cardiac arrest, unspecified',
+              'M31.8': 'Other specified necrotizing vasculopathies',
+              'N17.9': 'Acute renal failure, unspecified',
+              'J11.8': 'Influenza with other manifestations, virus not identified',
+              'C92.0': 'Acute myeloid leukaemia - Malignant neoplasms',
+              'I63.4': 'Cerebral infarction due to embolism of cerebral arteries',
+              'G40.7': 'Petit mal, unspecified, without grand mal seizures',
+              'M71.9': 'Bursopathy, unspecified',
+              'L26': 'Exfoliative dermatitis',
+              'K26.0': 'Duodenal ulcer, acute with haemorrhage',
+              'Q03.9': 'Congenital hydrocephalus, unspecified',
+              'R90.8': 'Other abnormal findings on diagnostic imaging of central nervous system',
+              'Q61.3': 'Polycystic kidney, unspecified', 'B86': 'Scabies',
+              'K82.8': 'Other specified diseases of gallbladder',
+              'P23.5': 'Congenital pneumonia due to Pseudomonas',
+              'P24.0': 'Neonatal aspiration of meconium',
+              'M46.3': 'Infection of intervertebral disc (pyogenic)',
+              'R16.0': 'Hepatomegaly, not elsewhere classified',
+              'A08.1': 'Acute gastroenteropathy due to Norwalk agent',
+              'K08.9': 'Disorder of teeth and supporting structures, unspecified',
+              'C31.0': 'Maxillary sinus - Malignant neoplasms',
+              'G62.1': 'Alcoholic polyneuropathy',
+              'C44.8': 'Overlapping lesion of skin - Malignant neoplasms',
+              'G72.1': 'Alcoholic myopathy',
+              'C57.8': 'Overlapping lesion of female genital organs - Malignant neoplasms',
+              'V49.9': 'Car occupant [any] injured in unspecified traffic accident',
+              'G11.1': 'Early-onset cerebellar ataxia',
+              'G93.6': 'Cerebral oedema', 'J98.4': 'Other disorders of lung',
+              'M30.1': 'Polyarteritis with lung involvement [Churg-Strauss]',
+              'M86.1': 'Other acute osteomyelitis',
+              'J20.9': 'Acute bronchitis, unspecified',
+              'N43.3': 'Hydrocele, unspecified',
+              'I42.8': 'Other cardiomyopathies',
+              'C63.1': 'Spermatic cord - Malignant neoplasms',
+              'B36.9': 'Superficial mycosis, unspecified',
+              'Y06.9': 'By unspecified person',
+              'V82.9': 'Occupant of streetcar injured in unspecified traffic accident',
+              'M80.2': 'Osteoporosis of disuse with pathological fracture',
+              'P36.3': 'Sepsis of newborn due to other and unspecified staphylococci',
+              'G58.9': 'Mononeuropathy, unspecified',
+              'O03.8': 'Spontaneous abortion, complete or unspecified, with other and unspecified complications',
+              'N88.2': 'Stricture and stenosis of cervix uteri',
+              'F45.3': 'Somatoform autonomic dysfunction',
+              'M51.0': 'Lumbar and other intervertebral disc disorders with myelopathy',
+              'D02.2': 'Bronchus and lung - In situ neoplasms',
+              'N20.9': 'Urinary calculus, unspecified', 'R05': 'Cough',
+              'Y60.2': 'During kidney dialysis or other perfusion',
+              'X12': 'Contact with other hot fluids',
+              'K80.5': 'Calculus of bile duct without cholangitis or cholecystitis',
+              'Q01.9': 'Encephalocele, unspecified',
+              'G37.8': 'Other specified demyelinating diseases of central nervous system',
+              'V11.9': 'Pedal cyclist injured in collision with other pedal cycle, unspecified pedal cyclist injured in traffic accident',
+              'G11.9': 'Hereditary ataxia, unspecified',
+              'M25.9': 'Joint disorder, unspecified',
+              'B01.2': 'Varicella pneumonia',
+              'I72.0': 'Aneurysm of carotid artery',
+              'L02.0': 'Cutaneous abscess, furuncle and carbuncle of face',
+              'R13': 'Dysphagia', 'M93.9': 'Osteochondropathy, unspecified',
+              'G58.7': 'Mononeuritis multiplex',
+              'W23': 'Caught, crushed, jammed or pinched in or between objects',
+              'P00.3': 'Newborn affected by other maternal circulatory and respiratory diseases',
+              'G37.1': 'Central demyelination of corpus callosum',
+              'I06.2': 'Rheumatic aortic stenosis with insufficiency',
+              'M61.5': 'Other ossification of muscle',
+              'N93.9': 'Abnormal uterine and vaginal bleeding, unspecified',
+              'B39.2': 'Pulmonary histoplasmosis capsulati, unspecified',
+              'J38.4': 'Oedema of larynx',
+              'K55.1': 'Chronic vascular disorders of intestine',
+              'B45.7': 'Disseminated cryptococcosis',
+              'X49': 'Accidental poisoning by and exposure to other and unspecified chemicals and noxious substances',
+              'V19.4': 'Driver injured in collision with other and unspecified motor vehicles in traffic accident',
+              'O99.3': 'Mental disorders and diseases of the nervous system complicating pregnancy, childbirth and the puerperium',
+              'V95.0': 'Helicopter accident injuring occupant',
+              'G43.9': 'Migraine, unspecified',
+              'I06.1': 'Rheumatic aortic insufficiency',
+              'K83.8': 'Other specified diseases of biliary tract',
+              'I67.6': 'Nonpyogenic thrombosis of intracranial venous system',
+              'A50.9': 'Congenital syphilis, unspecified',
+              'E20.9': 'Hypoparathyroidism, unspecified',
+              'N41.2': 'Abscess of prostate', 'M85.5': 'Aneurysmal bone cyst',
+              'P52.5': 'Subarachnoid (nontraumatic) haemorrhage of newborn',
+              'G91.8': 'Other hydrocephalus',
+              'V69.4': 'Driver injured in collision with other and unspecified motor vehicles in traffic accident',
+              'E22.0': 'Acromegaly and pituitary gigantism',
+              'J98.0': 'Diseases of bronchus, not elsewhere classified',
+              'V63.9': 'Occupant of heavy transport vehicle injured in collision with car, pick-up truck or van, unspecified occupant of heavy transport vehicle injured in traffic accident',
+              'I12.9': 'Hypertensive renal disease without renal failure',
+              'D47.2': 'Monoclonal gammopathy - Uncertain neoplasms',
+              'M46.1': 'Sacroiliitis, not elsewhere classified',
+              'A42.8': 'Other forms of actinomycosis',
+              'V90.2': 'Accident to watercraft causing drowning and submersion, fishing boat',
+              'N21.1': 'Calculus in urethra',
+              'K57.9': 'Diverticular disease of intestine, part unspecified, without perforation or abscess',
+              'B27.9': 'Infectious mononucleosis, unspecified',
+              'O14.9': 'Pre-eclampsia, unspecified',
+              'G20': "Parkinson's disease", 'J47': 'Bronchiectasis',
+              'D12.1': 'Appendix - Benign neoplasms',
+              'D80.0': 'Hereditary hypogammaglobulinaemia',
+              'X84': 'Intentional self-harm by unspecified means',
+              'M51.9': 'Intervertebral disc disorder, unspecified',
+              'M24.5': 'Contracture of joint',
+              'K62.9': 'Disease of anus and rectum, unspecified',
+              'I89.9': 'Noninfective disorder of lymphatic vessels and lymph nodes, unspecified',
+              'D31.6': 'Orbit, unspecified - Benign neoplasms',
+              'O25': 'Malnutrition in pregnancy', 'X33': 'Victim of lightning',
+              'J60': "Coalworker's pneumoconiosis",
+              'K44.0': 'Diaphragmatic hernia with obstruction, without gangrene',
+              'K30': 'Dyspepsia',
+              'L53.9': 'Erythematous condition, unspecified',
+              'W07': 'Fall involving chair',
+              'P56.0': 'Hydrops fetalis due to isoimmunization',
+              'M70.2': 'Olecranon bursitis',
+              'K65.9': 'Peritonitis, unspecified',
+              'M48.9': 'Spondylopathy, unspecified',
+              'I60.5': 'Subarachnoid haemorrhage from vertebral artery',
+              'Q89.2': 'Congenital malformations of other endocrine glands',
+              'C41.9': 'Bone and articular cartilage, unspecified - Malignant neoplasms',
+              'W19': 'Unspecified fall', 'J67.2': "Bird fancier's lung",
+              'C72.1': 'Cauda equina - Malignant neoplasms',
+              'J42': 'Unspecified chronic bronchitis',
+              'N13.1': 'Hydronephrosis with ureteral stricture, not elsewhere classified',
+              'Y07.9': 'By unspecified person',
+              'I12.0': 'Hypertensive renal disease with renal failure',
+              'I35.9': 'Aortic valve disorder, unspecified',
+              'I84.8': 'Unspecified haemorrhoids with other complications',
+              'Q40.0': 'Congenital hypertrophic pyloric stenosis',
+              'A39.2': 'Acute meningococcaemia',
+              'V49.8': 'Car occupant [any] injured in other specified transport accidents',
+              'N40': 'Hyperplasia of prostate',
+              'N03.9': 'Chronic nephritic syndrome, unspecified',
+              'O87.9': 'Venous complication in the puerperium, unspecified',
+              'L03.0': 'Cellulitis of finger and toe',
+              'O07.8': 'Other and unspecified failed attempted abortion, with other and unspecified complications',
+              'R10.1': 'Pain localized to upper abdomen',
+              'I82.8': 'Embolism and thrombosis of other specified veins',
+              'C95.0': 'Acute leukaemia of unspecified cell type - Malignant neoplasms',
+              'P04.3': 'Newborn affected by maternal use of alcohol',
+              'C48.2': 'Peritoneum, unspecified - Malignant neoplasms',
+              'D73.5': 'Infarction of spleen', 'K81.1': 'Chronic cholecystitis',
+              'D21.2': 'Connective and other soft tissue of lower limb, including hip - Benign neoplasms',
+              'F44.8': 'Other dissociative [conversion] disorders',
+              'J00': 'Acute nasopharyngitis [common cold]',
+              'M17.9': 'Gonarthrosis, unspecified',
+              'P25.3': 'Pneumopericardium originating in the perinatal period',
+              'D68.6': 'Other thrombophilia',
+              'V57.6': 'Occupant of pick-up truck or van injured in collision with fixed or stationary object, passenger injured in traffic accident',
+              'V47.9': 'Car occupant injured in collision with fixed or stationary object, unspecified car occupant injured in traffic accident',
+              'D18.0': 'Haemangioma, any site - Benign neoplasms',
+              'P78.1': 'Other neonatal peritonitis',
+              'I63.3': 'Cerebral infarction due to thrombosis of cerebral arteries',
+              'N13.2': 'Hydronephrosis with renal and ureteral calculous obstruction',
+              'C75.0': 'Parathyroid gland - Malignant neoplasms',
+              'V67.5': 'Occupant of heavy transport vehicle injured in collision with fixed or stationary object, driver injured in traffic accident',
+              'N17.8': 'Other acute renal failure',
+              'D47.1': 'Chronic myeloproliferative disease - Uncertain neoplasms',
+              'C81.1': 'Nodular sclerosis - Malignant neoplasms',
+              'M43.6': 'Torticollis',
+              'P20.1': 'Intrauterine hypoxia first noted during labour and delivery',
+              'E66.9': 'Obesity, unspecified',
+              'V86.3': 'Unspecified occupant of all-terrain or other off-road motor vehicle injured in traffic accident',
+              'C25.4': 'Endocrine pancreas - Malignant neoplasms',
+              'I35.1': 'Aortic (valve) insufficiency',
+              'B22.2': 'HIV disease resulting in wasting syndrome',
+              'J12.3': 'Human metapneumovirus pneumonia',
+              'D04.9': 'Skin, unspecified - In situ neoplasms',
+              'N19': 'Unspecified renal failure',
+              'X09': 'Exposure to unspecified smoke, fire and flames',
+              'K42.9': 'Umbilical hernia without obstruction or gangrene',
+              'I47.9': 'Paroxysmal tachycardia, unspecified',
+              'H93.1': 'Tinnitus', 'B17.1': 'Acute hepatitis C',
+              'L13.9': 'Bullous disorder, unspecified',
+              'C05.2': 'Uvula - Malignant neoplasms',
+              'J21.9': 'Acute bronchiolitis, unspecified',
+              'P35.2': 'Congenital herpesviral [herpes simplex] infection',
+              'A98.4': 'Ebola virus disease', 'J67.0': "Farmer's lung",
+              'V18.1': 'Pedal cyclist injured in noncollision transport accident, passenger injured in nontraffic accident',
+              'D34': 'Benign neoplasm of thyroid gland',
+              'P78.0': 'Perinatal intestinal perforation',
+              'I07.8': 'Other tricuspid valve diseases',
+              'P15.0': 'Birth injury to liver',
+              'M13.8': 'Other specified arthritis',
+              'F55': 'Abuse of non-dependence-producing substances',
+              'E61.0': 'Copper deficiency',
+              'C49.4': 'Connective and soft tissue of abdomen - Malignant neoplasms',
+              'E88.2': 'Lipomatosis, not elsewhere classified',
+              'R04.9': 'Haemorrhage from respiratory passages, unspecified',
+              'K22.5': 'Diverticulum of oesophagus, acquired',
+              'F30.8': 'Other manic episodes',
+              'X48': 'Accidental poisoning by and exposure to pesticides',
+              'C45.2': 'Mesothelioma of pericardium - Malignant neoplasms',
+              'A40.9': 'Streptococcal septicaemia, unspecified',
+              'B38.7': 'Disseminated coccidioidomycosis',
+              'R09.8': 'Other specified symptoms and signs involving the circulatory and respiratory systems',
+              'R31': 'Unspecified haematuria',
+              'K51.2': 'Ulcerative (chronic) proctitis',
+              'B24': 'Unspecified human immunodeficiency virus [HIV] disease',
+              'I86.4': 'Gastric varices',
+              'B20.5': 'HIV disease resulting in other mycoses',
+              'A07.2': 'Cryptosporidiosis',
+              'F31.9': 'Bipolar affective disorder, unspecified',
+              'E51.2': "Wernicke's encephalopathy",
+              'M43.9': 'Deforming dorsopathy, unspecified',
+              'O24.3': 'Pre-existing diabetes mellitus, unspecified',
+              'F23.9': 'Acute and transient psychotic disorder, unspecified',
+              'C78.3': 'Secondary malignant neoplasm of other and unspecified respiratory organs - Malignant neoplasms',
+              'B22.0': 'HIV disease resulting in encephalopathy',
+              'C55': 'Malignant neoplasm of uterus, part unspecified',
+              'Q61.4': 'Renal dysplasia',
+              'D50.8': 'Other iron deficiency anaemias',
+              'I08.2': 'Disorders of both aortic and tricuspid valves',
+              'L40.9': 'Psoriasis, unspecified',
+              'Q76.2': 'Congenital spondylolisthesis',
+              'C08.0': 'Submandibular gland - Malignant neoplasms',
+              'J15.1': 'Pneumonia due to Pseudomonas',
+              'A18.3': 'Tuberculosis of intestines, peritoneum and mesenteric glands',
+              'J32.3': 'Chronic sphenoidal sinusitis',
+              'M91.0': 'Juvenile osteochondrosis of pelvis',
+              'Q44.7': 'Other congenital malformations of liver',
+              'D10.3': 'Other and unspecified parts of mouth - Benign neoplasms',
+              'N88.9': 'Noninflammatory disorder of cervix uteri, unspecified',
+              'D17.7': 'Benign lipomatous neoplasm of other sites - Benign neoplasms',
+              'D44.1': 'Adrenal gland - Uncertain neoplasms',
+              'P60': 'Disseminated intravascular coagulation of newborn',
+              'P00.1': 'Newborn affected by maternal renal and urinary tract diseases',
+              'I49.8': 'Other specified cardiac arrhythmias',
+              'K76.9': 'Liver disease, unspecified',
+              'G83.0': 'Diplegia of upper limbs',
+              'Q22.2': 'Congenital pulmonary valve insufficiency',
+              'M48.0': 'Spinal stenosis',
+              'V93.0': 'Accident on board watercraft without accident to watercraft, not causing drowning and submersion, merchant ship',
+              'I47.2': 'Ventricular tachycardia',
+              'A39.0': 'Meningococcal meningitis',
+              'X82': 'Intentional self-harm by crashing of motor vehicle',
+              'B19.0': 'Unspecified viral hepatitis hepatic with coma',
+              'D86.9': 'Sarcoidosis, unspecified',
+              'K86.1': 'Other chronic pancreatitis',
+              'N42.8': 'Other specified disorders of prostate',
+              'P77': 'Necrotizing enterocolitis of newborn',
+              'F50.0': 'Anorexia nervosa',
+              'C50.6': 'Axillary tail of breast - Malignant neoplasms',
+              'D36.7': 'Other specified sites - Benign neoplasms',
+              'K31.8': 'Other specified diseases of stomach and duodenum',
+              'K74.4': 'Secondary biliary cirrhosis',
+              'V92.8': 'Water-transport-related drowning and submersion without accident to watercraft, other unpowered watercraft, surf-board, or windsurfer',
+              'B38.0': 'Acute pulmonary coccidioidomycosis',
+              'C49.5': 'Connective and soft tissue of pelvis - Malignant neoplasms',
+              'V73.5': 'Bus occupant injured in collision with car, pick-up truck or van, driver injured in traffic accident',
+              'Y57.5': 'X-ray contrast media',
+              'V69.5': 'Passenger injured in collision with other and unspecified motor vehicles in traffic accident',
+              'J93.8': 'Other pneumothorax',
+              'P27.8': 'Other chronic respiratory diseases originating in the perinatal period',
+              'P58.4': 'Neonatal jaundice due to drugs or toxins transmitted from mother or given to newborn',
+              'I21.3': 'Acute transmural myocardial infarction of unspecified site',
+              'N81.6': 'Rectocele', 'X97': 'Assault by smoke, fire and flames',
+              'G37.0': 'Diffuse sclerosis',
+              'C94.7': 'Other specified leukaemias - Malignant neoplasms',
+              'B59': 'Pneumocystosis',
+              'V28.1': 'Motorcycle rider injured in noncollision transport accident, passenger injured in nontraffic accident',
+              'E28.2': 'Polycystic ovarian syndrome',
+              'C44.6': 'Skin of upper limb, including shoulder - Malignant neoplasms',
+              'H52.0': 'Hypermetropia',
+              'E44.0': 'Moderate protein-energy malnutrition',
+              'F10.4': 'Mental and behavioural disorders due to use of alcohol, withdrawal state with delirium',
+              'V49.5': 'Passenger injured in collision with other and unspecified motor vehicles in traffic accident',
+              'X08': 'Exposure to other specified smoke, fire and flames',
+              'M86.3': 'Chronic multifocal osteomyelitis',
+              'Q39.0': 'Atresia of oesophagus without fistula',
+              'C83.2': 'Mixed small and large cell (diffuse) - Malignant neoplasms',
+              'G37.9': 'Demyelinating disease of central nervous system, unspecified',
+              'F44.2': 'Dissociative stupor',
+              'K28.3': 'Gastrojejunal ulcer, acute without haemorrhage or perforation',
+              'Y60.4': 'During endoscopic examination',
+              'V19.9': 'Pedal cyclist [any] injured in unspecified traffic accident',
+              'C79.4': 'Secondary malignant neoplasm of other and unspecified parts of nervous system - Malignant neoplasms',
+              'C17.2': 'Ileum - Malignant neoplasms',
+              'Q01.2': 'Occipital encephalocele',
+              'E21.0': 'Primary hyperparathyroidism',
+              'X80': 'Intentional self-harm by jumping from a high place',
+              'Q91.3': "Edwards' syndrome, unspecified",
+              'I60.2': 'Subarachnoid haemorrhage from anterior communicating artery',
+              'G21.0': 'Malignant neuroleptic syndrome',
+              'D64.9': 'Anaemia, unspecified',
+              'C53.9': 'Cervix uteri, unspecified - Malignant neoplasms',
+              'D33.4': 'Spinal cord - Benign neoplasms',
+              'J39.9': 'Disease of upper respiratory tract, unspecified',
+              'P54.6': 'Neonatal vaginal haemorrhage',
+              'V23.1': 'Motorcycle rider injured in collision with car, pick-up truck or van, passenger injured in nontraffic accident',
+              'C06.2': 'Retromolar area - Malignant neoplasms',
+              'K11.6': 'Mucocele of salivary gland',
+              'V20.9': 'Motorcycle rider injured in collision with pedestrian or animal, unspecified motorcycle rider injured in traffic accident',
+              'D46.2': 'Refractory anaemia with excess of blasts - Uncertain neoplasms',
+              'C32.1': 'Supraglottis - Malignant neoplasms',
+              'Y84.8': 'Other medical procedures', 'L98.5': 'Mucinosis of skin',
+              'C72.0': 'Spinal cord - Malignant neoplasms',
+              'C06.0': 'Cheek mucosa - Malignant neoplasms',
+              'E12.2': 'Malnutrition-related diabetes mellitus, with renal complications',
+              'I24.8': 'Other forms of acute ischaemic heart disease',
+              'E04.9': 'Nontoxic goitre, unspecified',
+              'O88.1': 'Amniotic fluid embolism',
+              'V13.9': 'Pedal cyclist injured in collision with car, pick-up truck or van, unspecified pedal cyclist injured in traffic accident',
+              'V29.8': 'Motorcycle rider [any] injured in other specified transport accidents',
+              'D46.1': 'Refractory anaemia with sideroblasts - Uncertain neoplasms',
+              'D86.0': 'Sarcoidosis of lung',
+              'N18.2': 'Chronic kidney disease, stage 2',
+              'F15.9': 'Mental and behavioural disorders due to use of other stimulants, including caffeine, unspecified mental and behavioural disorder',
+              'J10.8': 'Influenza with other manifestations, influenza virus identified',
+              'L98.4': 'Chronic ulcer of skin, not elsewhere classified',
+              'A40.3': 'Septicaemia due to Streptococcus pneumoniae',
+              'N05.9': 'Unspecified nephritic syndrome, unspecified',
+              'K12.1': 'Other forms of stomatitis',
+              'C51.2': 'Clitoris - Malignant neoplasms',
+              'V23.5': 'Motorcycle rider injured in collision with car, pick-up truck or van, passenger injured in traffic accident',
+              'Q05.7': 'Lumbar spina bifida without hydrocephalus',
+              'V44.9': 'Car occupant injured in collision with heavy transport vehicle or bus, unspecified car occupant injured in traffic accident',
+              'M62.1': 'Other rupture of muscle (nontraumatic)',
+              'V90.4': 'Accident to watercraft causing drowning and submersion, sailboat or yacht',
+              'X20': 'Contact with venomous snakes and lizards',
+              'N26': 'Unspecified contracted kidney',
+              'E07.9': 'Disorder of thyroid, unspecified',
+              'Q89.9': 'Congenital malformation, unspecified',
+              'C43.7': 'Malignant melanoma of lower limb, including hip - Malignant neoplasms',
+              'G70.2': 'Congenital and developmental myasthenia',
+              'N81.0': 'Female urethrocele', 'G25.3': 'Myoclonus',
+              'E34.0': 'Carcinoid syndrome',
+              'P02.1': 'Newborn affected by other forms of placental separation and haemorrhage',
+              'C18.7': 'Sigmoid colon - Malignant neoplasms',
+              'V51.9': 'Occupant of pick-up truck or van injured in collision with pedal cycle, unspecified occupant of pick-up truck or van injured in traffic accident',
+              'V64.5': 'Occupant of heavy transport vehicle injured in collision with heavy transport vehicle or bus, driver injured in traffic accident',
+              'B37.0': 'Candidal stomatitis', 'E23.0': 'Hypopituitarism',
+              'Y46.4': 'Iminostilbenes',
+              'C78.8': 'Secondary malignant neoplasm of other and unspecified digestive organs - Malignant neoplasms',
+              'D38.4': 'Thymus - Uncertain neoplasms',
+              'F25.2': 'Schizoaffective disorder, mixed type',
+              'G23.8': 'Other specified degenerative diseases of basal ganglia',
+              'A41.2': 'Septicaemia due to unspecified staphylococcus',
+              'D48.4': 'Peritoneum - Uncertain neoplasms',
+              'Q75.4': 'Mandibulofacial dysostosis',
+              'B50.0': 'Plasmodium falciparum malaria with cerebral complications',
+              'G36.0': 'Neuromyelitis optica [Devic]',
+              'V05.1': 'Pedestrian injured in collision with railway train or railway vehicle, traffic accident',
+              'G00.3': 'Staphylococcal meningitis',
+              'R63.3': 'Feeding difficulties and mismanagement',
+              'Y83.9': 'Surgical procedure, unspecified',
+              'I71.5': 'Thoracoabdominal aortic aneurysm, ruptured',
+              'D09.3': 'Thyroid and other endocrine glands - In situ neoplasms',
+              'P26.1': 'Massive pulmonary haemorrhage originating in the perinatal period',
+              'P00.4': 'Newborn affected by maternal nutritional disorders',
+              'E31.0': 'Autoimmune polyglandular failure',
+              'M34.1': 'CR(E)ST syndrome',
+              'A09.9': 'Gastroenteritis and colitis of unspecified origin',
+              'C71.9': 'Brain, unspecified - Malignant neoplasms',
+              'C77.3': 'Axillary and upper limb lymph nodes - Malignant neoplasms',
+              'D81.9': 'Combined immunodeficiency, unspecified',
+              'B99': 'Other and unspecified infectious diseases',
+              'K26.4': 'Duodenal ulcer, chronic or unspecified with haemorrhage',
+              'K11.2': 'Sialoadenitis', 'D15.1': 'Heart - Benign neoplasms',
+              'V22.4': 'Motorcycle rider injured in collision with two- or three-wheeled motor vehicle, driver injured in traffic accident',
+              'D52.9': 'Folate deficiency anaemia, unspecified',
+              'V89.9': 'Person injured in unspecified vehicle accident',
+              'A32.9': 'Listeriosis, unspecified',
+              'V19.2': 'Unspecified pedal cyclist injured in collision with other and unspecified motor vehicles in nontraffic accident',
+              'I63.5': 'Cerebral infarction due to unspecified occlusion or stenosis of cerebral arteries',
+              'V81.8': 'Occupant of railway train or railway vehicle injured in other specified railway accidents',
+              'V58.5': 'Occupant of pick-up truck or van injured in noncollision transport accident, driver injured in traffic accident',
+              'X50': 'Overexertion and strenuous or repetitive movements',
+              'D68.4': 'Acquired coagulation factor deficiency',
+              'A41.3': 'Septicaemia due to Haemophilus influenzae',
+              'O46.0': 'Antepartum haemorrhage with coagulation defect',
+              'D43.1': 'Brain, infratentorial - Uncertain neoplasms',
+              'X30': 'Exposure to excessive natural heat',
+              'I84.2': 'Internal haemorrhoids without complication',
+              'C03.9': 'Gum, unspecified - Malignant neoplasms',
+              'B00.3': 'Herpesviral meningitis',
+              'Q78.0': 'Osteogenesis imperfecta',
+              'V55.9': 'Occupant of pick-up truck or van injured in collision with railway train or railway vehicle, unspecified occupant of pick-up truck or van injured in traffic accident',
+              'A31.0': 'Pulmonary mycobacterial infection',
+              'W80': 'Inhalation and ingestion of other objects causing obstruction of respiratory tract',
+              'N01.9': 'Rapidly progressive nephritic syndrome, unspecified',
+              'J63.4': 'Siderosis',
+              'O99.2': 'Endocrine, nutritional and metabolic diseases complicating pregnancy, childbirth and the puerperium',
+              'V86.6': 'Passenger of all-terrain or other off-road motor vehicle injured in nontraffic accident',
+              'V87.4': 'Person injured in collision between car and heavy transport vehicle (traffic)',
+              'E86': 'Volume depletion',
+              'I83.1': 'Varicose veins of lower extremities with inflammation',
+              'R19.0': 'Intra-abdominal and pelvic swelling, mass and lump',
+              'R26.3': 'Immobility',
+              'Y10': 'Poisoning by and exposure to nonopioid analgesics, antipyretics and antirheumatics, undetermined intent',
+              'K60.3': 'Anal fistula', 'L03.2': 'Cellulitis of face',
+              'V95.8': 'Other aircraft accidents injuring occupant',
+              'E11.7': 'Non-insulin-dependent diabetes mellitus, with multiple complications',
+              'G93.1': 'Anoxic brain damage, not elsewhere classified',
+              'J81': 'Pulmonary oedema',
+              'E79.8': 'Other disorders of purine and pyrimidine metabolism',
+              'N18.3': 'Chronic kidney disease, stage 3',
+              'I51.5': 'Myocardial degeneration',
+              'N88.3': 'Incompetence of cervix uteri',
+              'R41.8': 'Other and unspecified symptoms and signs involving cognitive functions and awareness',
+              'K59.0': 'Constipation',
+              'L02.4': 'Cutaneous abscess, furuncle and carbuncle of limb',
+              'O10.3': 'Pre-existing hypertensive heart and renal disease complicating pregnancy, childbirth and the puerperium',
+              'C44.3': 'Skin of other and unspecified parts of face - Malignant neoplasms',
+              'Q86.0': 'Fetal alcohol syndrome (dysmorphic)',
+              'G93.7': "Reye's syndrome",
+              'K59.9': 'Functional intestinal disorder, unspecified',
+              'D37.0': 'Lip, oral cavity and pharynx - Uncertain neoplasms',
+              'B00.9': 'Herpesviral infection, unspecified',
+              'M08.2': 'Juvenile arthritis with systemic onset',
+              'D40.7': 'Other male genital organs - Uncertain neoplasms',
+              'M62.2': 'Ischaemic infarction of muscle',
+              'D69.3': 'Idiopathic thrombocytopenic purpura',
+              'K62.8': 'Other specified diseases of anus and rectum',
+              'V48.1': 'Car occupant injured in noncollision transport accident, passenger injured in nontraffic accident',
+              'B50.9': 'Plasmodium falciparum malaria, unspecified',
+              'D68.2': 'Hereditary deficiency of other clotting factors',
+              'Q79.3': 'Gastroschisis', 'K29.1': 'Other acute gastritis',
+              'V43.6': 'Car occupant injured in collision with car, pick-up truck or van, passenger injured in traffic accident',
+              'Y43.3': 'Other antineoplastic drugs',
+              'G23.0': 'Hallervorden-Spatz disease',
+              'G81.9': 'Hemiplegia, unspecified', 'Q30.0': 'Choanal atresia',
+              'C62.9': 'Testis, unspecified - Malignant neoplasms',
+              'W30': 'Contact with agricultural machinery',
+              'Y07.1': 'By parent', 'B44.0': 'Invasive pulmonary aspergillosis',
+              'W70': 'Drowning and submersion following fall into natural water',
+              'E80.1': 'Porphyria cutanea tarda',
+              'J70.9': 'Respiratory conditions due to unspecified external agent',
+              'C77.9': 'Lymph node, unspecified - Malignant neoplasms',
+              'E85.0': 'Non-neuropathic heredofamilial amyloidosis',
+              'I80.8': 'Phlebitis and thrombophlebitis of other sites',
+              'I87.9': 'Disorder of vein, unspecified',
+              'X11': 'Contact with hot tap-water',
+              'K28.4': 'Gastrojejunal ulcer, chronic or unspecified with haemorrhage',
+              'I74.8': 'Embolism and thrombosis of other arteries',
+              'J18.2': 'Hypostatic pneumonia, unspecified',
+              'F07.0': 'Organic personality disorder',
+              'D00.0': 'Lip, oral cavity and pharynx - In situ neoplasms',
+              'R00.8': 'Other and unspecified abnormalities of heart beat',
+              'D69.0': 'Allergic purpura', 'K85.8': 'Other acute pancreatitis',
+              'Q33.6': 'Hypoplasia and dysplasia of lung',
+              'C44.1': 'Skin of eyelid, including canthus - Malignant neoplasms',
+              'V87.7': 'Person injured in collision between other specified motor vehicles (traffic)',
+              'E73.0': 'Congenital lactase deficiency',
+              'V55.6': 'Occupant of pick-up truck or van injured in collision with railway train or railway vehicle, passenger injured in traffic accident',
+              'A81.0': 'Creutzfeldt-Jakob disease - CJD',
+              'I72.8': 'Aneurysm of other specified arteries',
+              'C67.9': 'Bladder, unspecified - Malignant neoplasms',
+              'D48.3': 'Retroperitoneum - Uncertain neoplasms',
+              'I37.8': 'Other pulmonary valve disorders',
+              'X29': 'Contact with unspecified venomous animal or plant',
+              'R57.0': 'Cardiogenic shock',
+              'N17.1': 'Acute renal failure with acute cortical necrosis',
+              'K55.2': 'Angiodysplasia of colon',
+              'I60.4': 'Subarachnoid haemorrhage from basilar artery',
+              'V02.9': 'Unspecified whether traffic or nontraffic accident',
+              'X70': 'Intentional self-harm by hanging, strangulation and suffocation',
+              'D58.0': 'Hereditary spherocytosis',
+              'E43': 'Unspecified severe protein-energy malnutrition',
+              'C68.0': 'Urethra - Malignant neoplasms',
+              'W29': 'Contact with other powered hand tools and household machinery',
+              'I71.8': 'Aortic aneurysm of unspecified site, ruptured',
+              'V93.4': 'Accident on board watercraft without accident to watercraft, not causing drowning and submersion, sailboat or yacht',
+              'G30.0': "Alzheimer's disease with early onset",
+              'E28.3': 'Primary ovarian failure',
+              'Y33': 'Other specified events, undetermined intent',
+              'C25.3': 'Pancreatic duct - Malignant neoplasms',
+              'D48.5': 'Skin - Uncertain neoplasms',
+              'N13.8': 'Other obstructive and reflux uropathy',
+              'M31.4': 'Aortic arch syndrome [Takayasu]',
+              'K90.4': 'Malabsorption due to intolerance, not elsewhere classified',
+              'W21': 'Striking against or struck by sports equipment',
+              'M13.9': 'Arthritis, unspecified', 'M10.9': 'Gout, unspecified',
+              'K74.3': 'Primary biliary cirrhosis',
+              'K57.8': 'Diverticular disease of intestine, part unspecified, with perforation and abscess',
+              'A41.4': 'Septicaemia due to anaerobes',
+              'D45': 'Polycythaemia vera',
+              'V81.3': 'Occupant of railway train or railway vehicle injured in collision with other object',
+              'G91.9': 'Hydrocephalus, unspecified',
+              'B25.9': 'Cytomegaloviral disease, unspecified',
+              'Y84.4': 'Aspiration of fluid',
+              'Q60.1': 'Renal agenesis, bilateral',
+              'C13.1': 'Aryepiglottic fold, hypopharyngeal aspect - Malignant neoplasms',
+              'D13.1': 'Stomach - Benign neoplasms',
+              'Q86.8': 'Other congenital malformation syndromes due to known exogenous causes',
+              'X10': 'Contact with hot drinks, food, fats and cooking oils',
+              'B34.9': 'Viral infection, unspecified',
+              'I77.2': 'Rupture of artery',
+              'A42.9': 'Actinomycosis, unspecified',
+              'D84.1': 'Defects in the complement system',
+              'I80.2': 'Phlebitis and thrombophlebitis of other deep vessels of lower extremities',
+              'C40.0': 'Scapula and long bones of upper limb - Malignant neoplasms',
+              'X98': 'Assault by steam, hot vapours and hot objects',
+              'D27': 'Benign neoplasm of ovary',
+              'I13.1': 'Hypertensive heart and renal disease with renal failure',
+              'D41.9': 'Urinary organ, unspecified - Uncertain neoplasms',
+              'Q42.9': 'Congenital absence, atresia and stenosis of large intestine, part unspecified',
+              'V68.0': 'Occupant of heavy transport vehicle injured in noncollision transport accident, driver injured in nontraffic accident',
+              'O03.1': 'Spontaneous abortion, incomplete, complicated by delayed or excessive haemorrhage',
+              'P52.2': 'Intraventricular (nontraumatic) haemorrhage, grade 3, of newborn',
+              'V48.9': 'Car occupant injured in noncollision transport accident, unspecified car occupant injured in traffic accident',
+              'K40.4': 'Unilateral or unspecified inguinal hernia, with gangrene',
+              'B21.2': "HIV disease resulting in other types of non-Hodgkin's lymphoma",
+              'Y44.2': 'Anticoagulants',
+              'X00': 'Exposure to uncontrolled fire in building or structure',
+              'G62.8': 'Other specified polyneuropathies',
+              'Y43.4': 'Immunosuppressive agents',
+              'D14.1': 'Larynx - Benign neoplasms',
+              'E80.3': 'Defects of catalase and peroxidase',
+              'N76.2': 'Acute vulvitis',
+              'D14.0': 'Middle ear, nasal cavity and accessory sinuses - Benign neoplasms',
+              'I62.9': 'Intracranial haemorrhage (nontraumatic), unspecified',
+              'B20.0': 'HIV disease resulting in mycobacterial infection',
+              'D02.0': 'Larynx - In situ neoplasms',
+              'Q04.8': 'Other specified congenital malformations of brain',
+              'I87.8': 'Other specified disorders of veins',
+              'C75.9': 'Endocrine gland, unspecified - Malignant neoplasms',
+              'Y44.0': 'Iron preparations and other anti-hypochromic-anaemia preparations',
+              'I07.1': 'Tricuspid insufficiency',
+              'V42.6': 'Car occupant injured in collision with two- or three-wheeled motor vehicle, passenger injured in traffic accident',
+              'C66': 'Malignant neoplasm of ureter',
+              'H44.0': 'Purulent endophthalmitis', 'A07.3': 'Isosporiasis',
+              'M87.9': 'Osteonecrosis, unspecified',
+              'N25.0': 'Renal osteodystrophy',
+              'D69.2': 'Other nonthrombocytopenic purpura',
+              'C43.6': 'Malignant melanoma of upper limb, including shoulder - Malignant neoplasms',
+              'I30.0': 'Acute nonspecific idiopathic pericarditis',
+              'K92.2': 'Gastrointestinal haemorrhage, unspecified',
+              'I36.8': 'Other nonrheumatic tricuspid valve disorders',
+              'V65.9': 'Occupant of heavy transport vehicle injured in collision with railway train or railway vehicle, unspecified occupant of heavy transport vehicle injured in traffic accident',
+              'F51.9': 'Nonorganic sleep disorder, unspecified',
+              'P11.1': 'Other specified brain damage due to birth injury',
+              'P04.4': 'Newborn affected by maternal use of drugs of addiction',
+              'N14.1': 'Nephropathy induced by other drugs, medicaments and biological substances',
+              'V89.1': 'Person injured in unspecified nonmotor-vehicle accident, nontraffic',
+              'Y35.6': 'Legal intervention involving other specified means',
+              'E34.3': 'Short stature, not elsewhere classified',
+              'D89.0': 'Polyclonal hypergammaglobulinaemia',
+              'P12.9': 'Birth injury to scalp, unspecified',
+              'C85.7': "Other specified types of non-Hodgkin's lymphoma - Malignant neoplasms",
+              'J82': 'Pulmonary eosinophilia, not elsewhere classified',
+              'P52.4': 'Intracerebral (nontraumatic) haemorrhage of newborn',
+              'M72.6': 'Necrotizing fasciitis',
+              'E75.2': 'Other sphingolipidosis', 'M05.0': "Felty's syndrome",
+              'A16.2': 'Tuberculosis of lung, without mention of bacteriological or histological confirmation',
+              'Q96.9': "Turner's syndrome, unspecified",
+              'N82.1': 'Other female urinary-genital tract fistulae',
+              'C15.4': 'Middle third of oesophagus - Malignant neoplasms',
+              'V09.0': 'Pedestrian injured in nontraffic accident involving other and unspecified motor vehicles',
+              'A37.0': 'Whooping cough due to Bordetella pertussis',
+              'E88.3': 'Tumor lysis syndrome',
+              'Y88.0': 'Sequelae of adverse effects caused by drugs, medicaments and biological substances in therapeutic use',
+              'E00.9': 'Congenital iodine-deficiency syndrome, unspecified',
+              'P70.2': 'Neonatal diabetes mellitus',
+              'A04.7': 'Enterocolitis due to Clostridium difficile',
+              'M33.2': 'Polymyositis',
+              'R02': 'Gangrene, not elsewhere classified',
+              'D76.1': 'Haemophagocytic lymphohistiocytosis',
+              'L41.9': 'Parapsoriasis, unspecified',
+              'G30.8': "Other Alzheimer's disease",
+              'B33.4': 'Hantavirus (cardio)-pulmonary syndrome [HPS][HCPS]',
+              'L94.0': 'Localized scleroderma [morphea]',
+              'G90.0': 'Idiopathic peripheral autonomic neuropathy',
+              'W67': 'Drowning and submersion while in swimming-pool',
+              'O14.1': 'Severe pre-eclampsia',
+              'C43.5': 'Malignant melanoma of trunk - Malignant neoplasms',
+              'G71.0': 'Muscular dystrophy', 'Q77.2': 'Short rib syndrome',
+              'M35.0': 'Sicca syndrome [Sjogren]',
+              'W41': 'Exposure to high-pressure jet',
+              'D48.6': 'Breast - Uncertain neoplasms',
+              'I82.2': 'Embolism and thrombosis of vena cava',
+              'C84.1': "Sezary's disease - Malignant neoplasms",
+              'C78.6': 'Secondary malignant neoplasm of retroperitoneum and peritoneum - Malignant neoplasms',
+              'G25.2': 'Other specified forms of tremor',
+              'P00.9': 'Newborn affected by unspecified maternal condition',
+              'Q81.8': 'Other epidermolysis bullosa',
+              'V68.3': 'Occupant of heavy transport vehicle injured in noncollision transport accident, unspecified occupant of heavy transport vehicle injured in nontraffic accident',
+              'V15.2': 'Pedal cyclist injured in collision with railway train or railway vehicle, unspecified pedal cyclist injured in nontraffic accident',
+              'Q62.1': 'Atresia and stenosis of ureter',
+              'V57.4': 'Occupant of pick-up truck or van injured in collision with fixed or stationary object, person injured while boarding or alighting',
+              'L28.0': 'Lichen simplex chronicus',
+              'I77.8': 'Other specified disorders of arteries and arterioles',
+              'X46': 'Accidental poisoning by and exposure to organic solvents and halogenated hydrocarbons and their vapours',
+              'V45.1': 'Car occupant injured in collision with railway train or railway vehicle, passenger injured in nontraffic accident',
+              'K27.6': 'Peptic ulcer, site unspecified, chronic or unspecified with both haemorrhage and perforation',
+              'K59.2': 'Neurogenic bowel, not elsewhere classified',
+              'K63.3': 'Ulcer of intestine',
+              'M83.8': 'Other adult osteomalacia',
+              'C91.5': 'Adult T-cell leukaemia - Malignant neoplasms',
+              'Q21.8': 'Other congenital malformations of cardiac septa',
+              'M43.1': 'Spondylolisthesis',
+              'F44.4': 'Dissociative motor disorders',
+              'W11': 'Fall on and from ladder',
+              'K10.8': 'Other specified diseases of jaws',
+              'M60.8': 'Other myositis', 'K11.3': 'Abscess of salivary gland',
+              'F84.2': "Rett's syndrome", 'B49': 'Unspecified mycosis',
+              'X40': 'Accidental poisoning by and exposure to nonopioid analgesics, antipyretics and antirheumatics',
+              'Q79.1': 'Other congenital malformations of diaphragm',
+              'B58.9': 'Toxoplasmosis, unspecified',
+              'C45.0': 'Mesothelioma of pleura - Malignant neoplasms',
+              'I30.8': 'Other forms of acute pericarditis',
+              'Y87.2': 'Sequelae of events of undetermined intent',
+              'Q20.5': 'Discordant atrioventricular connection',
+              'E12.5': 'Malnutrition-related diabetes mellitus, with peripheral circulatory complications',
+              'W93': 'Exposure to excessive cold of man-made origin',
+              'M47.8': 'Other spondylosis', 'N81.1': 'Cystocele',
+              'Y31': 'Falling, lying or running before or into moving object, undetermined intent',
+              'K76.8': 'Other specified diseases of liver',
+              'C41.2': 'Vertebral column - Malignant neoplasms',
+              'F32.2': 'Severe depressive episode without psychotic symptoms',
+              'W68': 'Drowning and submersion following fall into swimming-pool',
+              'Q24.8': 'Other specified congenital malformations of heart',
+              'E87.1': 'Hypo-osmolality and hyponatraemia',
+              'C05.0': 'Hard palate - Malignant neoplasms',
+              'E05.0': 'Thyrotoxicosis with diffuse goitre',
+              'F50.9': 'Eating disorder, unspecified',
+              'G06.1': 'Intraspinal abscess and granuloma',
+              'G90.9': 'Disorder of autonomic nervous system, unspecified',
+              'I70.0': 'Atherosclerosis of aorta',
+              'B18.9': 'Chronic viral hepatitis, unspecified',
+              'F20.4': 'Post-schizophrenic depression',
+              'V22.0': 'Motorcycle rider injured in collision with two- or three-wheeled motor vehicle, driver injured in nontraffic accident',
+              'K92.9': 'Disease of digestive system, unspecified',
+              'Q62.7': 'Congenital vesico-uretero-renal reflux',
+              'K86.9': 'Disease of pancreas, unspecified',
+              'O46.8': 'Other antepartum haemorrhage',
+              'C33': 'Malignant neoplasm of trachea',
+              'I27.9': 'Pulmonary heart disease, unspecified',
+              'I48': 'Atrial fibrillation and flutter',
+              'V80.5': 'Rider or occupant injured in collision with other specified motor vehicle',
+              'D47.7': 'Other specified neoplasms of uncertain or unknown behaviour of lymphoid, haematopoietic and related tissue - Uncertain neoplasms',
+              'C15.3': 'Upper third of oesophagus - Malignant neoplasms',
+              'P03.8': 'Newborn affected by other specified complications of labour and delivery',
+              'E55.9': 'Vitamin D deficiency, unspecified',
+              'W35': 'Explosion and rupture of boiler',
+              'I40.0': 'Infective myocarditis',
+              'H60.4': 'Cholesteatoma of external ear',
+              'G61.8': 'Other inflammatory polyneuropathies',
+              'J70.0': 'Acute pulmonary manifestations due to radiation',
+              'N32.8': 'Other specified disorders of bladder',
+              'V04.0': 'Pedestrian injured in collision with heavy transport vehicle or bus, nontraffic accident',
+              'Y84.9': 'Medical procedure, unspecified',
+              'F13.1': 'Mental and behavioural disorders due to use of sedatives or hypnotics, harmful use',
+              'G60.0': 'Hereditary motor and sensory neuropathy',
+              'J68.4': 'Chronic respiratory conditions due to chemicals, gases, fumes and vapours',
+              'C82.0': 'Small cleaved cell, follicular - Malignant neoplasms',
+              'J98.3': 'Compensatory emphysema',
+              'Q28.8': 'Other specified congenital malformations of circulatory system',
+              'M81.5': 'Idiopathic osteoporosis',
+              'Q64.3': 'Other atresia and stenosis of urethra and bladder neck',
+              'V92.6': 'Water-transport-related drowning and submersion without accident to watercraft, inflatable craft (nonpowered)',
+              'G90.3': 'Multi-system degeneration',
+              'I63.6': 'Cerebral infarction due to cerebral venous thrombosis, nonpyogenic',
+              'I77.4': 'Coeliac artery compression syndrome',
+              'L57.0': 'Actinic keratosis',
+              'A64': 'Unspecified sexually transmitted disease',
+              'Q92.7': 'Triploidy and polyploidy',
+              'B78.9': 'Strongyloidiasis, unspecified',
+              'D41.2': 'Ureter - Uncertain neoplasms',
+              'G71.3': 'Mitochondrial myopathy, not elsewhere classified',
+              'X94': 'Assault by rifle, shotgun and larger firearm discharge',
+              'F15.1': 'Mental and behavioural disorders due to use of other stimulants, including caffeine, harmful use',
+              'X63': 'Intentional self-poisoning by and exposure to other drugs acting on the autonomic nervous system',
+              'B40.8': 'Other forms of blastomycosis',
+              'G93.2': 'Benign intracranial hypertension',
+              'Y53.5': 'Digestants', 'G47.9': 'Sleep disorder, unspecified',
+              'D55.2': 'Anaemia due to disorders of glycolytic enzymes',
+              'N63': 'Unspecified lump in breast',
+              'G08': 'Intracranial and intraspinal phlebitis and thrombophlebitis',
+              'C95.9': 'Leukaemia, unspecified - Malignant neoplasms',
+              'K63.8': 'Other specified diseases of intestine',
+              'N50.1': 'Vascular disorders of male genital organs',
+              'B18.1': 'Chronic viral hepatitis B without delta-agent',
+              'K22.8': 'Other specified diseases of oesophagus',
+              'P20.9': 'Intrauterine hypoxia, unspecified',
+              'Q66.8': 'Other congenital deformities of feet',
+              'C02.4': 'Lingual tonsil - Malignant neoplasms',
+              'C34.9': 'Bronchus or lung, unspecified - Malignant neoplasms',
+              'J02.9': 'Acute pharyngitis, unspecified',
+              'Y57.8': 'Other drugs and medicaments',
+              'I46.1': 'Sudden cardiac death, so described',
+              'D37.5': 'Rectum - Uncertain neoplasms',
+              'J93.1': 'Other spontaneous pneumothorax',
+              'F33.8': 'Other recurrent depressive disorders',
+              'O30.0': 'Twin pregnancy', 'I49.5': 'Sick sinus syndrome',
+              'J84.1': 'Other interstitial pulmonary diseases with fibrosis',
+              'D53.1': 'Other megaloblastic anaemias, not elsewhere classified',
+              'L50.6': 'Contact urticaria', 'P37.5': 'Neonatal candidiasis',
+              'N50.9': 'Disorder of male genital organs, unspecified',
+              'G71.2': 'Congenital myopathies',
+              'J05.0': 'Acute obstructive laryngitis [croup]',
+              'I83.0': 'Varicose veins of lower extremities with ulcer',
+              'D68.0': "Von Willebrand's disease",
+              'Y42.0': 'Glucocorticoids and synthetic analogues',
+              'V69.3': 'Occupant [any] of heavy transport vehicle injured in unspecified nontraffic accident',
+              'E61.5': 'Molybdenum deficiency',
+              'V96.8': 'Other nonpowered-aircraft accidents injuring occupant',
+              'P03.1': 'Newborn affected by other malpresentation, malposition and disproportion during labour and delivery',
+              'V05.9': 'Unspecified whether traffic or nontraffic accident',
+              'Y06.1': 'By parent',
+              'M88.9': "Paget's disease of bone, unspecified",
+              'F29': 'Unspecified nonorganic psychosis',
+              'C84.4': 'Peripheral T-cell lymphoma - Malignant neoplasms',
+              'D57.2': 'Double heterozygous sickling disorders',
+              'Q33.9': 'Congenital malformation of lung, unspecified',
+              'V42.4': 'Car occupant injured in collision with two- or three-wheeled motor vehicle, person injured while boarding or alighting',
+              'I08.0': 'Disorders of both mitral and aortic valves',
+              'K42.0': 'Umbilical hernia with obstruction, without gangrene',
+              'D47.9': 'Neoplasm of uncertain or unknown behaviour of lymphoid, haematopoietic and related tissue, unspecified - Uncertain neoplasms',
+              'V17.0': 'Pedal cyclist injured in collision with fixed or stationary object, driver injured in nontraffic accident',
+              'O00.9': 'Ectopic pregnancy, unspecified',
+              'W13': 'Fall from, out of or through building or structure',
+              'F09': 'Unspecified organic or symptomatic mental disorder',
+              'F41.9': 'Anxiety disorder, unspecified',
+              'X41': 'Accidental poisoning by and exposure to antiepileptic, sedative-hypnotic, antiparkinsonism and psychotropic drugs, not elsewhere classified',
+              'B34.8': 'Other viral infections of unspecified site',
+              'M86.6': 'Other chronic osteomyelitis',
+              'J15.6': 'Pneumonia due to other aerobic Gram-negative bacteria',
+              'G60.9': 'Hereditary and idiopathic neuropathy, unspecified',
+              'M19.2': 'Other secondary arthrosis',
+              'N82.3': 'Fistula of vagina to large intestine',
+              'C69.6': 'Orbit - Malignant neoplasms',
+              'J34.8': 'Other specified disorders of nose and nasal sinuses',
+              'N35.9': 'Urethral stricture, unspecified',
+              'M25.0': 'Haemarthrosis',
+              'C31.9': 'Accessory sinus, unspecified - Malignant neoplasms',
+              'Q22.5': "Ebstein's anomaly",
+              'I45.4': 'Nonspecific intraventricular block',
+              'K63.9': 'Disease of intestine, unspecified',
+              'E74.8': 'Other specified disorders of carbohydrate metabolism',
+              'D21.0': 'Connective and other soft tissue of head, face and neck - Benign neoplasms',
+              'F01.8': 'Other vascular dementia',
+              'J69.1': 'Pneumonitis due to oils and essences',
+              'I20.9': 'Angina pectoris, unspecified',
+              'M30.3': 'Mucocutaneous lymph node syndrome [Kawasaki]',
+              'E56.9': 'Vitamin deficiency, unspecified',
+              'C92.5': 'Acute myelomonocytic leukaemia - Malignant neoplasms',
+              'N41.0': 'Acute prostatitis', 'R54': 'Senility',
+              'M91.1': 'Juvenile osteochondrosis of head of femur [Legg-Calve-Perthes]',
+              'E06.5': 'Other chronic thyroiditis',
+              'M80.9': 'Unspecified osteoporosis with pathological fracture',
+              'D57.0': 'Sickle-cell anaemia with crisis',
+              'J46': 'Status asthmaticus',
+              'G83.8': 'Other specified paralytic syndromes',
+              'F05.1': 'Delirium superimposed on dementia',
+              'N18.1': 'Chronic kidney disease, stage 1',
+              'G93.8': 'Other specified disorders of brain',
+              'K86.3': 'Pseudocyst of pancreas',
+              'D41.0': 'Kidney - Uncertain neoplasms',
+              'K22.7': "Barrett's esophagus",
+              'P96.4': 'Termination of pregnancy, newborn',
+              'Q87.1': 'Congenital malformation syndromes predominantly associated with short stature',
+              'Q81.2': 'Epidermolysis bullosa dystrophica',
+              'V20.5': 'Motorcycle rider injured in collision with pedestrian or animal, passenger injured in traffic accident',
+              'C61': 'Malignant neoplasm of prostate',
+              'C50.1': 'Central portion of breast - Malignant neoplasms',
+              'R10.0': 'Acute abdomen', 'N36.0': 'Urethral fistula',
+              'P35.8': 'Other congenital viral diseases',
+              'E11.9': 'Non-insulin-dependent diabetes mellitus, without complications',
+              'A08.4': 'Viral intestinal infection, unspecified',
+              'Y34': 'Unspecified event, undetermined intent',
+              'Q22.3': 'Other congenital malformations of pulmonary valve',
+              'H70.9': 'Mastoiditis, unspecified',
+              'N18.5': 'Chronic kidney disease, stage 5',
+              'H71': 'Cholesteatoma of middle ear',
+              'C64': 'Malignant neoplasm of kidney, except renal pelvis',
+              'E10.9': 'Insulin-dependent diabetes mellitus, without complications',
+              'J86.9': 'Pyothorax without fistula',
+              'Y89.0': 'Sequelae of legal intervention',
+              'V27.9': 'Motorcycle rider injured in collision with fixed or stationary object, unspecified motorcycle rider injured in traffic accident',
+              'C21.1': 'Anal canal - Malignant neoplasms',
+              'W76': 'Other accidental hanging and strangulation',
+              'G40.8': 'Other epilepsy',
+              'Q18.9': 'Congenital malformation of face and neck, unspecified',
+              'P36.1': 'Sepsis of newborn due to other and unspecified streptococci',
+              'D80.1': 'Nonfamilial hypogammaglobulinaemia',
+              'I86.8': 'Varicose veins of other specified sites',
+              'Q05.6': 'Thoracic spina bifida without hydrocephalus',
+              'Q62.3': 'Other obstructive defects of renal pelvis and ureter',
+              'C74.0': 'Cortex of adrenal gland - Malignant neoplasms',
+              'K00.7': 'Teething syndrome',
+              'I71.6': 'Thoracoabdominal aortic aneurysm, without mention of rupture',
+              'V58.1': 'Occupant of pick-up truck or van injured in noncollision transport accident, passenger injured in nontraffic accident',
+              'K43.1': 'Ventral hernia with gangrene',
+              'V68.9': 'Occupant of heavy transport vehicle injured in noncollision transport accident, unspecified occupant of heavy transport vehicle injured in traffic accident',
+              'A31.9': 'Mycobacterial infection, unspecified',
+              'C49.1': 'Connective and soft tissue of upper limb, including shoulder - Malignant neoplasms',
+              'E72.4': 'Disorders of ornithine metabolism',
+              'C44.7': 'Skin of lower limb, including hip - Malignant neoplasms',
+              'M15.3': 'Secondary multiple arthrosis',
+              'I62.0': 'Subdural haemorrhage (acute)(nontraumatic)',
+              'V47.1': 'Car occupant injured in collision with fixed or stationary object, passenger injured in nontraffic accident',
+              'C85.9': "Non-Hodgkin's lymphoma, unspecified type - Malignant neoplasms",
+              'C47.1': 'Peripheral nerves of upper limb, including shoulder - Malignant neoplasms',
+              'C13.0': 'Postcricoid region - Malignant neoplasms',
+              'J85.2': 'Abscess of lung without pneumonia',
+              'A39.1': 'Waterhouse-Friderichsen syndrome',
+              'C80': 'Malignant neoplasm without specification of site',
+              'V43.5': 'Car occupant injured in collision with car, pick-up truck or van, driver injured in traffic accident',
+              'Q39.9': 'Congenital malformation of oesophagus, unspecified',
+              'H49.4': 'Progressive external ophthalmoplegia',
+              'Y22': 'Handgun discharge, undetermined intent',
+              'Y48.2': 'Other and unspecified general anaesthetics',
+              'Q18.0': 'Sinus, fistula and cyst of branchial cleft',
+              'X60': 'Intentional self-poisoning by and exposure to nonopioid analgesics, antipyretics and antirheumatics',
+              'P35.0': 'Congenital rubella syndrome',
+              'Y48.0': 'Inhaled anaesthetics',
+              'D33.0': 'Brain, supratentorial - Benign neoplasms',
+              'P03.0': 'Newborn affected by breech delivery and extraction',
+              'Q44.2': 'Atresia of bile ducts', 'B02.1': 'Zoster meningitis',
+              'B17.9': 'Acute viral hepatitis, unspecified',
+              'E79.0': 'Hyperuricaemia without signs of inflammatory arthritis and tophaceous disease',
+              'J38.5': 'Laryngeal spasm',
+              'V97.2': 'Parachutist injured in air transport accident',
+              'R14': 'Flatulence and related conditions',
+              'E88.9': 'Metabolic disorder, unspecified',
+              'D12.6': 'Colon, unspecified - Benign neoplasms',
+              'I80.1': 'Phlebitis and thrombophlebitis of femoral vein',
+              'F42.9': 'Obsessive-compulsive disorder, unspecified',
+              'Q32.3': 'Congenital stenosis of bronchus',
+              'A50.4': 'Late congenital neurosyphilis [juvenile neurosyphilis]',
+              'V58.7': 'Occupant of pick-up truck or van injured in noncollision transport accident, person on outside of vehicle injured in traffic accident',
+              'N30.2': 'Other chronic cystitis',
+              'E83.3': 'Disorders of phosphorus metabolism',
+              'N30.4': 'Irradiation cystitis',
+              'V29.4': 'Driver injured in collision with other and unspecified motor vehicles in traffic accident',
+              'E13.2': 'Other specified diabetes mellitus, with renal complications',
+              'F20.1': 'Hebephrenic schizophrenia',
+              'M62.5': 'Muscle wasting and atrophy, not elsewhere classified',
+              'V01.1': 'Pedestrian injured in collision with pedal cycle, traffic accident',
+              'M15.9': 'Polyarthrosis, unspecified',
+              'A53.0': 'Latent syphilis, unspecified as early or late',
+              'C31.3': 'Sphenoidal sinus - Malignant neoplasms',
+              'I78.1': 'Naevus, non-neoplastic',
+              'K02.9': 'Dental caries, unspecified',
+              'Q26.4': 'Anomalous pulmonary venous connection, unspecified',
+              'P51.9': 'Umbilical haemorrhage of newborn, unspecified',
+              'D23.9': 'Skin, unspecified - Benign neoplasms',
+              'J70.1': 'Chronic and other pulmonary manifestations due to radiation',
+              'C58': 'Malignant neoplasm of placenta', 'E66.8': 'Other obesity',
+              'M48.1': 'Ankylosing hyperostosis [Forestier]',
+              'F13.2': 'Mental and behavioural disorders due to use of sedatives or hypnotics, dependence syndrome',
+              'V18.5': 'Pedal cyclist injured in noncollision transport accident, passenger injured in traffic accident',
+              'C24.8': 'Overlapping lesion of biliary tract - Malignant neoplasms',
+              'J39.8': 'Other specified diseases of upper respiratory tract',
+              'H60.2': 'Malignant otitis externa',
+              'L30.3': 'Infective dermatitis',
+              'C15.5': 'Lower third of oesophagus - Malignant neoplasms',
+              'V65.5': 'Occupant of heavy transport vehicle injured in collision with railway train or railway vehicle, driver injured in traffic accident',
+              'G41.8': 'Other status epilepticus',
+              'X15': 'Contact with hot household appliances',
+              'L40.5': 'Arthropathic psoriasis',
+              'N13.7': 'Vesicoureteral-reflux-associated uropathy',
+              'K90.9': 'Intestinal malabsorption, unspecified',
+              'I72.3': 'Aneurysm of iliac artery', 'E70.3': 'Albinism',
+              'E85.1': 'Neuropathic heredofamilial amyloidosis',
+              'O41.1': 'Infection of amniotic sac and membranes',
+              'C73': 'Malignant neoplasm of thyroid gland',
+              'I95.9': 'Hypotension, unspecified',
+              'M62.8': 'Other specified disorders of muscle',
+              'C49.6': 'Connective and soft tissue of trunk, unspecified - Malignant neoplasms',
+              'D43.9': 'Central nervous system, unspecified - Uncertain neoplasms',
+              'C47.5': 'Peripheral nerves of pelvis - Malignant neoplasms',
+              'D33.1': 'Brain, infratentorial - Benign neoplasms',
+              'R95': 'Sudden infant death syndrome - SIDS',
+              'V59.1': 'Passenger injured in collision with other and unspecified motor vehicles in nontraffic accident',
+              'K65.8': 'Other peritonitis',
+              'K28.0': 'Gastrojejunal ulcer, acute with haemorrhage',
+              'E83.5': 'Disorders of calcium metabolism',
+              'C83.5': 'Lymphoblastic (diffuse) - Malignant neoplasms',
+              'I30.9': 'Acute pericarditis, unspecified',
+              'K57.0': 'Diverticular disease of small intestine with perforation and abscess',
+              'V90.5': 'Accident to watercraft causing drowning and submersion, canoe or kayak',
+              'C16.0': 'Cardia - Malignant neoplasms',
+              'K12.3': 'Oral mucositis (ulcerative)',
+              'C00.1': 'External lower lip - Malignant neoplasms',
+              'E27.8': 'Other specified disorders of adrenal gland',
+              'I31.9': 'Disease of pericardium, unspecified',
+              'K22.0': 'Achalasia of cardia',
+              'Q77.1': 'Thanatophoric short stature',
+              'F18.1': 'Mental and behavioural disorders due to use of volatile solvents, harmful use',
+              'V49.0': 'Driver injured in collision with other and unspecified motor vehicles in nontraffic accident',
+              'Y48.3': 'Local anaesthetics',
+              'V11.2': 'Pedal cyclist injured in collision with other pedal cycle, unspecified pedal cyclist injured in nontraffic accident',
+              'D44.9': 'Endocrine gland, unspecified - Uncertain neoplasms',
+              'I45.2': 'Bifascicular block', 'I87.1': 'Compression of vein',
+              'P02.4': 'Newborn affected by prolapsed cord',
+              'G96.9': 'Disorder of central nervous system, unspecified',
+              'M45': 'Ankylosing spondylitis',
+              'I60.7': 'Subarachnoid haemorrhage from intracranial artery, unspecified',
+              'K52.9': 'Noninfective gastroenteritis and colitis, unspecified',
+              'D76.3': 'Other histiocytosis syndromes',
+              'C70.0': 'Cerebral meninges - Malignant neoplasms',
+              'A04.9': 'Bacterial intestinal infection, unspecified',
+              'C71.5': 'Cerebral ventricle - Malignant neoplasms',
+              'I69.0': 'Sequelae of subarachnoid haemorrhage',
+              'K26.3': 'Duodenal ulcer, acute without haemorrhage or perforation',
+              'X25': 'Contact with other specified venomous arthropods',
+              'Q79.6': 'Ehlers-Danlos syndrome',
+              'C72.9': 'Central nervous system, unspecified - Malignant neoplasms',
+              'V23.4': 'Motorcycle rider injured in collision with car, pick-up truck or van, driver injured in traffic accident',
+              'Q26.8': 'Other congenital malformations of great veins',
+              'B48.8': 'Other specified mycoses',
+              'K42.1': 'Umbilical hernia with gangrene',
+              'D59.3': 'Haemolytic-uraemic syndrome',
+              'Y84.6': 'Urinary catheterization',
+              'A41.5': 'Septicaemia due to other Gram-negative organisms',
+              'N73.9': 'Female pelvic inflammatory disease, unspecified',
+              'P27.1': 'Bronchopulmonary dysplasia originating in the perinatal period',
+              'Q60.4': 'Renal hypoplasia, bilateral',
+              'D30.9': 'Urinary organ, unspecified - Benign neoplasms',
+              'B20.1': 'HIV disease resulting in other bacterial infections',
+              'G47.1': 'Disorders of excessive somnolence [hypersomnias]',
+              'N18.4': 'Chronic kidney disease, stage 4',
+              'J04.1': 'Acute tracheitis',
+              'A17.9': 'Tuberculosis of nervous system, unspecified',
+              'E05.5': 'Thyroid crisis or storm',
+              'E76.3': 'Mucopolysaccharidosis, unspecified',
+              'V29.9': 'Motorcycle rider [any] injured in unspecified traffic accident',
+              'Q27.9': 'Congenital malformation of peripheral vascular system, unspecified',
+              'I74.1': 'Embolism and thrombosis of other and unspecified parts of aorta',
+              'D68.9': 'Coagulation defect, unspecified',
+              'X81': 'Intentional self-harm by jumping or lying before moving object',
+              'W55': 'Bitten or struck by other mammals',
+              'D38.1': 'Trachea, bronchus and lung - Uncertain neoplasms',
+              'Q91.7': "Patau's syndrome, unspecified",
+              'P12.0': 'Cephalhaematoma due to birth injury',
+              'E11.5': 'Non-insulin-dependent diabetes mellitus, with peripheral circulatory complications',
+              'G72.4': 'Inflammatory myopathy, not elsewhere classified',
+              'K29.6': 'Other gastritis',
+              'E12.7': 'Malnutrition-related diabetes mellitus, with multiple complications',
+              'Y64.8': 'Contaminated medical or biological substance administered by other means',
+              'L27.0': 'Generalized skin eruption due to drugs and medicaments',
+              'Y21': 'Drowning and submersion, undetermined intent',
+              'I49.9': 'Cardiac arrhythmia, unspecified',
+              'V44.5': 'Car occupant injured in collision with heavy transport vehicle or bus, driver injured in traffic accident',
+              'G21.9': 'Secondary parkinsonism, unspecified',
+              'J02.8': 'Acute pharyngitis due to other specified organisms',
+              'E12.9': 'Malnutrition-related diabetes mellitus, without complications',
+              'M75.1': 'Rotator cuff syndrome',
+              'F81.9': 'Developmental disorder of scholastic skills, unspecified',
+              'C77.1': 'Intrathoracic lymph nodes - Malignant neoplasms',
+              'C57.7': 'Other specified female genital organs - Malignant neoplasms',
+              'M50.3': 'Other cervical disc degeneration',
+              'K70.3': 'Alcoholic cirrhosis of liver',
+              'G82.4': 'Spastic tetraplegia',
+              'I82.9': 'Embolism and thrombosis of unspecified vein',
+              'B46.9': 'Zygomycosis, unspecified',
+              'D65': 'Disseminated intravascular coagulation [defibrination syndrome]',
+              'X01': 'Exposure to uncontrolled fire, not in building or structure',
+              'Q64.8': 'Other specified congenital malformations of urinary system',
+              'C39.9': 'Ill-defined sites within the respiratory system - Malignant neoplasms',
+              'G54.2': 'Cervical root disorders, not elsewhere classified',
+              'E83.0': 'Disorders of copper metabolism',
+              'O75.1': 'Shock during or following labour and delivery',
+              'C49.9': 'Connective and soft tissue, unspecified - Malignant neoplasms',
+              'W08': 'Fall involving other furniture',
+              'C40.1': 'Short bones of upper limb - Malignant neoplasms',
+              'N73.0': 'Acute parametritis and pelvic cellulitis',
+              'D73.9': 'Disease of spleen, unspecified',
+              'Y42.6': 'Antigonadotrophins, antiestrogens, antiandrogens, not elsewhere classified',
+              'B67.8': 'Echinococcosis, unspecified, of liver',
+              'V45.5': 'Car occupant injured in collision with railway train or railway vehicle, driver injured in traffic accident',
+              'D53.0': 'Protein deficiency anaemia',
+              'K28.6': 'Gastrojejunal ulcer, chronic or unspecified with both haemorrhage and perforation',
+              'A02.1': 'Salmonella septicaemia', 'A92.3': 'West Nile fever',
+              'N05.2': 'Unspecified nephritic syndrome, diffuse membranous glomerulonephritis',
+              'C40.3': 'Short bones of lower limb - Malignant neoplasms',
+              'F20.5': 'Residual schizophrenia',
+              'V95.2': 'Accident to other private fixed-wing aircraft, injuring occupant',
+              'G96.1': 'Disorders of meninges, not elsewhere classified',
+              'L90.5': 'Scar conditions and fibrosis of skin',
+              'C14.0': 'Pharynx, unspecified - Malignant neoplasms',
+              'V48.4': 'Car occupant injured in noncollision transport accident, person injured while boarding or alighting',
+              'F06.7': 'Mild cognitive disorder',
+              'P39.2': 'Intra-amniotic infection of fetus, not elsewhere classified',
+              'Q55.9': 'Congenital malformation of male genital organ, unspecified',
+              'W10': 'Fall on and from stairs and steps',
+              'C79.0': 'Secondary malignant neoplasm of kidney and renal pelvis - Malignant neoplasms',
+              'C50.0': 'Nipple and areola - Malignant neoplasms',
+              'G58.8': 'Other specified mononeuropathies',
+              'O99.6': 'Diseases of the digestive system complicating pregnancy, childbirth and the puerperium',
+              'D48.9': 'Neoplasm of uncertain or unknown behaviour, unspecified - Uncertain neoplasms',
+              'F13.3': 'Mental and behavioural disorders due to use of sedatives or hypnotics, withdrawal state',
+              'I71.1': 'Thoracic aortic aneurysm, ruptured',
+              'W94': 'Exposure to high and low air pressure and changes in air pressure',
+              'F20.2': 'Catatonic schizophrenia',
+              'E85.2': 'Heredofamilial amyloidosis, unspecified',
+              'D59.4': 'Other nonautoimmune haemolytic anaemias',
+              'Y55.2': 'Other and unspecified agents primarily acting on muscles',
+              'E76.2': 'Other mucopolysaccharidoses',
+              'C60.9': 'Penis, unspecified - Malignant neoplasms',
+              'R16.1': 'Splenomegaly, not elsewhere classified',
+              'X90': 'Assault by unspecified chemical or noxious substance',
+              'V03.1': 'Pedestrian injured in collision with car, pick-up truck or van, traffic accident',
+              'J12.2': 'Parainfluenza virus pneumonia',
+              'P28.5': 'Respiratory failure of newborn',
+              'K62.5': 'Haemorrhage of anus and rectum',
+              'B37.4': 'Candidiasis of other urogenital sites',
+              'Q61.5': 'Medullary cystic kidney',
+              'Q23.0': 'Congenital stenosis of aortic valve',
+              'Y45.4': 'Antirheumatics', 'B02.7': 'Disseminated zoster',
+              'F17.2': 'Mental and behavioural disorders due to use of tobacco, dependence syndrome',
+              'C96.7': 'Other specified malignant neoplasms of lymphoid, haematopoietic and related tissue - Malignant neoplasms',
+              'R64': 'Cachexia', 'G40.9': 'Epilepsy, unspecified',
+              'V53.9': 'Occupant of pick-up truck or van injured in collision with car, pick-up truck or van, unspecified occupant of pick-up truck or van injured in traffic accident',
+              'G25.0': 'Essential tremor',
+              'V29.3': 'Motorcycle rider [any] injured in unspecified nontraffic accident',
+              'D73.3': 'Abscess of spleen',
+              'Q26.3': 'Partial anomalous pulmonary venous connection',
+              'O36.4': 'Maternal care for intrauterine death',
+              'I73.9': 'Peripheral vascular disease, unspecified',
+              'I00': 'Rheumatic fever without mention of heart involvement',
+              'Y32': 'Crashing of motor vehicle, undetermined intent',
+              'V05.0': 'Pedestrian injured in collision with railway train or railway vehicle, nontraffic accident',
+              'E27.3': 'Drug-induced adrenocortical insufficiency',
+              'C93.9': 'Monocytic leukaemia, unspecified - Malignant neoplasms',
+              'V19.1': 'Passenger injured in collision with other and unspecified motor vehicles in nontraffic accident',
+              'I05.9': 'Mitral valve disease, unspecified',
+              'F33.2': 'Recurrent depressive disorder, current episode severe without psychotic symptoms',
+              'K70.0': 'Alcoholic fatty liver',
+              'I82.3': 'Embolism and thrombosis of renal vein',
+              'V74.6': 'Bus occupant injured in collision with heavy transport vehicle or bus, passenger injured in traffic accident',
+              'V89.2': 'Person injured in unspecified motor-vehicle accident, traffic',
+              'I61.3': 'Intracerebral haemorrhage in brain stem',
+              'I05.2': 'Mitral stenosis with insufficiency',
+              'K82.3': 'Fistula of gallbladder',
+              'M35.1': 'Other overlap syndromes',
+              'Q93.4': 'Deletion of short arm of chromosome 5',
+              'Q03.0': 'Malformations of aqueduct of Sylvius',
+              'D40.1': 'Testis - Uncertain neoplasms',
+              'D61.0': 'Constitutional aplastic anaemia',
+              'Q67.5': 'Congenital deformity of spine',
+              'C25.8': 'Overlapping lesion of pancreas - Malignant neoplasms',
+              'E80.4': "Gilbert's syndrome",
+              'P21.9': 'Birth asphyxia, unspecified',
+              'C38.4': 'Pleura - Malignant neoplasms',
+              'J61': 'Pneumoconiosis due to asbestos and other mineral fibres',
+              'I77.6': 'Arteritis, unspecified',
+              'D61.3': 'Idiopathic aplastic anaemia',
+              'M33.0': 'Juvenile dermatomyositis',
+              'E06.3': 'Autoimmune thyroiditis',
+              'D39.9': 'Female genital organ, unspecified - Uncertain neoplasms',
+              'G25.9': 'Extrapyramidal and movement disorder, unspecified',
+              'J11.1': 'Influenza with other respiratory manifestations, virus not identified',
+              'I61.8': 'Other intracerebral haemorrhage',
+              'J02.0': 'Streptococcal pharyngitis',
+              'V44.6': 'Car occupant injured in collision with heavy transport vehicle or bus, passenger injured in traffic accident',
+              'M11.2': 'Other chondrocalcinosis',
+              'J18.0': 'Bronchopneumonia, unspecified',
+              'E66.1': 'Drug-induced obesity', 'Q11.2': 'Microphthalmos',
+              'N82.9': 'Female genital tract fistula, unspecified',
+              'K83.1': 'Obstruction of bile duct',
+              'Q39.6': 'Diverticulum of oesophagus',
+              'Q34.8': 'Other specified congenital malformations of respiratory system',
+              'E14.4': 'Unspecified diabetes mellitus, with neurological complications',
+              'B25.1': 'Cytomegaloviral hepatitis',
+              'K56.5': 'Intestinal adhesions [bands] with obstruction',
+              'R18': 'Ascites',
+              'I28.8': 'Other specified diseases of pulmonary vessels',
+              'P38': 'Omphalitis of newborn with or without mild haemorrhage',
+              'B21.7': 'HIV disease resulting in multiple malignant neoplasms',
+              'D82.0': 'Wiskott-Aldrich syndrome',
+              'X13': 'Contact with steam and hot vapours',
+              'P54.8': 'Other specified neonatal haemorrhages',
+              'D72.8': 'Other specified disorders of white blood cells',
+              'D25.1': 'Intramural leiomyoma of uterus - Benign neoplasms',
+              'E06.9': 'Thyroiditis, unspecified',
+              'D47.0': 'Histiocytic and mast cell tumours of uncertain and unknown behaviour - Uncertain neoplasms',
+              'C16.2': 'Body of stomach - Malignant neoplasms',
+              'X32': 'Exposure to sunlight',
+              'C79.2': 'Secondary malignant neoplasm of skin - Malignant neoplasms',
+              'V46.5': 'Car occupant injured in collision with other nonmotor vehicle, driver injured in traffic accident',
+              'X16': 'Contact with hot heating appliances, radiators and pipes',
+              'I51.2': 'Rupture of papillary muscle, not elsewhere classified',
+              'Q89.0': 'Congenital malformations of spleen',
+              'K31.7': 'Polyp of stomach and duodenum',
+              'P90': 'Convulsions of newborn',
+              'A31.8': 'Other mycobacterial infections',
+              'Y61.6': 'During aspiration, puncture and other catheterization',
+              'I88.8': 'Other nonspecific lymphadenitis',
+              'P22.9': 'Respiratory distress of newborn, unspecified',
+              'I85.9': 'Oesophageal varices without bleeding',
+              'Y47.9': 'Sedative, hypnotic and antianxiety drug, unspecified',
+              'R55': 'Syncope and collapse', 'R57.9': 'Shock, unspecified',
+              'K75.8': 'Other specified inflammatory liver diseases',
+              'L12.0': 'Bullous pemphigoid',
+              'Q85.0': 'Neurofibromatosis (nonmalignant)',
+              'C57.0': 'Fallopian tube - Malignant neoplasms',
+              'D37.3': 'Appendix - Uncertain neoplasms',
+              'D59.5': 'Paroxysmal nocturnal haemoglobinuria [Marchiafava-Micheli]',
+              'Q79.0': 'Congenital diaphragmatic hernia',
+              'C00.0': 'External upper lip - Malignant neoplasms',
+              'J32.0': 'Chronic maxillary sinusitis',
+              'R07.4': 'Chest pain, unspecified',
+              'C91.4': 'Hairy-cell leukaemia - Malignant neoplasms',
+              'M79.6': 'Pain in limb',
+              'P00.5': 'Newborn affected by maternal injury',
+              'J44.8': 'Other specified chronic obstructive pulmonary disease',
+              'G47.0': 'Disorders of initiating and maintaining sleep [insomnias]',
+              'Q06.9': 'Congenital malformation of spinal cord, unspecified',
+              'I07.9': 'Tricuspid valve disease, unspecified',
+              'C76.3': 'Pelvis - Malignant neoplasms',
+              'O90.3': 'Cardiomyopathy in the puerperium',
+              'D76.0': "Langerhans' cell histiocytosis, not elsewhere classified",
+              'I35.8': 'Other aortic valve disorders',
+              'M53.2': 'Spinal instabilities',
+              'N83.2': 'Other and unspecified ovarian cysts',
+              'J98.1': 'Pulmonary collapse',
+              'H49.9': 'Paralytic strabismus, unspecified',
+              'P23.0': 'Congenital pneumonia due to viral agent',
+              'D84.8': 'Other specified immunodeficiencies',
+              'B60.0': 'Babesiosis',
+              'G60.8': 'Other hereditary and idiopathic neuropathies',
+              'X53': 'Lack of food', 'I09.0': 'Rheumatic myocarditis',
+              'M48.3': 'Traumatic spondylopathy',
+              'R63.6': 'Insufficient intake of food and water due to self neglect',
+              'C43.2': 'Malignant melanoma of ear and external auricular canal - Malignant neoplasms',
+              'Y15': 'Poisoning by and exposure to alcohol, undetermined intent',
+              'P78.3': 'Noninfective neonatal diarrhoea',
+              'C82.7': "Other types of follicular non-Hodgkin's lymphoma - Malignant neoplasms",
+              'B40.7': 'Disseminated blastomycosis',
+              'P04.1': 'Newborn affected by other maternal medication',
+              'F14.2': 'Mental and behavioural disorders due to use of cocaine, dependence syndrome',
+              'A48.1': "Legionnaires' disease",
+              'C41.3': 'Ribs, sternum and clavicle - Malignant neoplasms',
+              'X02': 'Exposure to controlled fire in building or structure',
+              'C71.6': 'Cerebellum - Malignant neoplasms',
+              'J93.0': 'Spontaneous tension pneumothorax',
+              'W45': 'Foreign body or object entering through skin',
+              'V85.2': 'Person on outside of special construction vehicle injured in traffic accident',
+              'V81.9': 'Occupant of railway train or railway vehicle injured in unspecified railway accident',
+              'M72.0': 'Palmar fascial fibromatosis [Dupuytren]',
+              'I71.2': 'Thoracic aortic aneurysm, without mention of rupture',
+              'C79.7': 'Secondary malignant neoplasm of adrenal gland - Malignant neoplasms',
+              'Y88.1': 'Sequelae of misadventures to patients during surgical and medical procedures',
+              'R27.0': 'Ataxia, unspecified',
+              'I77.0': 'Arteriovenous fistula, acquired',
+              'K41.9': 'Unilateral or unspecified femoral hernia, without obstruction or gangrene',
+              'V14.3': 'Pedal cyclist injured in collision with heavy transport vehicle or bus, person injured while boarding or alighting',
+              'N93.8': 'Other specified abnormal uterine and vaginal bleeding',
+              'C57.4': 'Uterine adnexa, unspecified - Malignant neoplasms',
+              'C67.0': 'Trigone of bladder - Malignant neoplasms',
+              'V49.4': 'Driver injured in collision with other and unspecified motor vehicles in traffic accident',
+              'J38.6': 'Stenosis of larynx',
+              'C69.9': 'Eye, unspecified - Malignant neoplasms',
+              'O22.9': 'Venous complication in pregnancy, unspecified',
+              'C05.1': 'Soft palate - Malignant neoplasms',
+              'F32.9': 'Depressive episode, unspecified',
+              'L12.1': 'Cicatricial pemphigoid',
+              'O72.0': 'Third-stage haemorrhage',
+              'D42.0': 'Cerebral meninges - Uncertain neoplasms',
+              'I60.0': 'Subarachnoid haemorrhage from carotid siphon and bifurcation',
+              'G96.8': 'Other specified disorders of central nervous system',
+              'M80.0': 'Postmenopausal osteoporosis with pathological fracture',
+              'D18.1': 'Lymphangioma, any site - Benign neoplasms',
+              'C32.2': 'Subglottis - Malignant neoplasms',
+              'A53.9': 'Syphilis, unspecified',
+              'C18.4': 'Transverse colon - Malignant neoplasms',
+              'N30.8': 'Other cystitis',
+              'J15.4': 'Pneumonia due to other streptococci',
+              'D23.2': 'Skin of ear and external auricular canal - Benign neoplasms',
+              'N48.2': 'Other inflammatory disorders of penis',
+              'E74.0': 'Glycogen storage disease',
+              'R19.8': 'Other specified symptoms and signs involving the digestive system and abdomen',
+              'I42.7': 'Cardiomyopathy due to drugs and other external agents',
+              'K81.8': 'Other cholecystitis',
+              'G40.1': 'Localization-related (focal)(partial) symptomatic epilepsy and epileptic syndromes with simple partial seizures',
+              'C37': 'Malignant neoplasm of thymus',
+              'N28.9': 'Disorder of kidney and ureter, unspecified',
+              'A83.3': 'St Louis encephalitis',
+              'M00.9': 'Pyogenic arthritis, unspecified',
+              'D44.8': 'Pluriglandular involvement - Uncertain neoplasms',
+              'K21.9': 'Gastro-oesophageal reflux disease without oesophagitis',
+              'P58.2': 'Neonatal jaundice due to infection',
+              'C17.9': 'Small intestine, unspecified - Malignant neoplasms',
+              'W06': 'Fall involving bed',
+              'D09.7': 'Carcinoma in situ of other specified sites - In situ neoplasms',
+              'K45.8': 'Other specified abdominal hernia without obstruction or gangrene',
+              'I05.8': 'Other mitral valve diseases',
+              'V83.9': 'Unspecified occupant of special industrial vehicle injured in nontraffic accident',
+              'V10.9': 'Pedal cyclist injured in collision with pedestrian or animal, unspecified pedal cyclist injured in traffic accident',
+              'Y23': 'Rifle, shotgun and larger firearm discharge, undetermined intent',
+              'M62.9': 'Disorder of muscle, unspecified',
+              'V57.5': 'Occupant of pick-up truck or van injured in collision with fixed or stationary object, driver injured in traffic accident',
+              'M53.9': 'Dorsopathy, unspecified',
+              'D81.8': 'Other combined immunodeficiencies',
+              'I08.8': 'Other multiple valve diseases',
+              'P54.4': 'Neonatal adrenal haemorrhage',
+              'V97.3': 'Person on ground injured in air transport accident',
+              'H66.0': 'Acute suppurative otitis media',
+              'C43.4': 'Malignant melanoma of scalp and neck - Malignant neoplasms',
+              'Q32.1': 'Other congenital malformations of trachea',
+              'K86.0': 'Alcohol-induced chronic pancreatitis',
+              'R06.4': 'Hyperventilation',
+              'L93.2': 'Other local lupus erythematosus',
+              'I60.8': 'Other subarachnoid haemorrhage',
+              'N32.3': 'Diverticulum of bladder', 'G47.3': 'Sleep apnoea',
+              'R99': 'Other ill-defined and unspecified causes of mortality',
+              'B38.4': 'Coccidioidomycosis meningitis',
+              'Q89.7': 'Multiple congenital malformations, not elsewhere classified',
+              'D46.7': 'Other myelodysplastic syndromes - Uncertain neoplasms',
+              'Q75.1': 'Craniofacial dysostosis', 'K74.0': 'Hepatic fibrosis',
+              'G12.0': 'Infantile spinal muscular atrophy, type I [Werdnig-Hoffman]',
+              'M31.3': "Wegener's granulomatosis",
+              'K41.3': 'Unilateral or unspecified femoral hernia, with obstruction, without gangrene',
+              'Q85.9': 'Phakomatosis, unspecified',
+              'B45.9': 'Cryptococcosis, unspecified',
+              'N85.0': 'Endometrial glandular hyperplasia',
+              'J85.0': 'Gangrene and necrosis of lung',
+              'R25.2': 'Cramp and spasm',
+              'Y65.8': 'Other specified misadventures during surgical and medical care',
+              'R98': 'Unattended death',
+              'C94.0': 'Acute erythraemia and erythroleukaemia - Malignant neoplasms',
+              'D72.0': 'Genetic anomalies of leukocytes',
+              'M84.4': 'Pathological fracture, not elsewhere classified',
+              'C78.1': 'Secondary malignant neoplasm of mediastinum - Malignant neoplasms',
+              'D17.9': 'Benign lipomatous neoplasm, unspecified - Benign neoplasms',
+              'K46.9': 'Unspecified abdominal hernia without obstruction or gangrene',
+              'E87.5': 'Hyperkalaemia',
+              'A87.9': 'Viral meningitis, unspecified',
+              'X37': 'Victim of cataclysmic storm',
+              'N71.9': 'Inflammatory disease of uterus, unspecified',
+              'Q43.9': 'Congenital malformation of intestine, unspecified',
+              'C47.2': 'Peripheral nerves of lower limb, including hip - Malignant neoplasms',
+              'F98.2': 'Feeding disorder of infancy and childhood',
+              'P83.2': 'Hydrops fetalis not due to haemolytic disease',
+              'Y42.7': 'Androgens and anabolic congeners',
+              'A74.9': 'Chlamydial infection, unspecified',
+              'C93.1': 'Chronic monocytic leukaemia - Malignant neoplasms',
+              'W18': 'Other fall on same level',
+              'C40.2': 'Long bones of lower limb - Malignant neoplasms',
+              'G52.1': 'Disorders of glossopharyngeal nerve',
+              'Y40.9': 'Systemic antibiotic, unspecified',
+              'B17.2': 'Acute hepatitis E',
+              'J30.4': 'Allergic rhinitis, unspecified',
+              'V67.9': 'Occupant of heavy transport vehicle injured in collision with fixed or stationary object, unspecified occupant of heavy transport vehicle injured in traffic accident',
+              'M46.2': 'Osteomyelitis of vertebra',
+              'Q04.0': 'Congenital malformations of corpus callosum',
+              'E05.9': 'Thyrotoxicosis, unspecified',
+              'A41.0': 'Septicaemia due to Staphylococcus aureus',
+              'C34.0': 'Main bronchus - Malignant neoplasms',
+              'Q73.1': 'Phocomelia, unspecified limb(s)',
+              'J93.9': 'Pneumothorax, unspecified',
+              'C16.4': 'Pylorus - Malignant neoplasms',
+              'N28.1': 'Cyst of kidney, acquired',
+              'Q43.3': 'Congenital malformations of intestinal fixation',
+              'D01.0': 'Colon - In situ neoplasms',
+              'E07.8': 'Other specified disorders of thyroid',
+              'F07.2': 'Postconcussional syndrome',
+              'C78.2': 'Secondary malignant neoplasm of pleura - Malignant neoplasms',
+              'N34.2': 'Other urethritis', 'L73.1': 'Pseudofolliculitis barbae',
+              'Y07.8': 'By other specified persons',
+              'I02.9': 'Rheumatic chorea without heart involvement',
+              'N64.1': 'Fat necrosis of breast',
+              'P29.2': 'Neonatal hypertension',
+              'Q24.9': 'Congenital malformation of heart, unspecified',
+              'Q33.8': 'Other congenital malformations of lung',
+              'W65': 'Drowning and submersion while in bath-tub',
+              'M54.5': 'Low back pain', 'Q32.0': 'Congenital tracheomalacia',
+              'I28.0': 'Arteriovenous fistula of pulmonary vessels',
+              'K27.9': 'Peptic ulcer, site unspecified, unspecified as acute or chronic, without haemorrhage or perforation',
+              'N00.9': 'Acute nephritic syndrome, unspecified',
+              'E11.4': 'Non-insulin-dependent diabetes mellitus, with neurological complications',
+              'D53.9': 'Nutritional anaemia, unspecified',
+              'C18.8': 'Overlapping lesion of colon - Malignant neoplasms',
+              'I21.9': 'Acute myocardial infarction, unspecified',
+              'V78.9': 'Bus occupant injured in noncollision transport accident, unspecified bus occupant injured in traffic accident',
+              'V29.1': 'Passenger injured in collision with other and unspecified motor vehicles in nontraffic accident',
+              'K71.6': 'Toxic liver disease with hepatitis, not elsewhere classified',
+              'V80.0': 'Rider or occupant injured by fall from or being thrown from animal or animal-drawn vehicle in noncollision accident',
+              'P00.8': 'Newborn affected by other maternal conditions',
+              'B20.8': 'HIV disease resulting in other infectious and parasitic diseases',
+              'B00.8': 'Other forms of herpesviral infection',
+              'K61.0': 'Anal abscess',
+              'G09': 'Sequelae of inflammatory diseases of central nervous system',
+              'M41.5': 'Other secondary scoliosis',
+              'C83.0': 'Small cell (diffuse) - Malignant neoplasms',
+              'Q33.0': 'Congenital cystic lung',
+              'N04.9': 'Nephrotic syndrome, unspecified',
+              'V23.0': 'Motorcycle rider injured in collision with car, pick-up truck or van, driver injured in nontraffic accident',
+              'G23.9': 'Degenerative disease of basal ganglia, unspecified',
+              'N90.8': 'Other specified noninflammatory disorders of vulva and perineum',
+              'K26.2': 'Duodenal ulcer, acute with both haemorrhage and perforation',
+              'K43.0': 'Ventral hernia with obstruction, without gangrene',
+              'F71': 'Moderate mental retardation',
+              'Y55.1': 'Skeletal muscle relaxants [neuromuscular blocking agents]',
+              'D16.9': 'Bone and articular cartilage, unspecified - Benign neoplasms',
+              'N41.9': 'Inflammatory disease of prostate, unspecified',
+              'W84': 'Unspecified threat to breathing',
+              'C94.5': 'Acute myelofibrosis - Malignant neoplasms',
+              'I22.0': 'Subsequent myocardial infarction of anterior wall',
+              'L72.1': 'Trichilemmal cyst',
+              'F43.9': 'Reaction to severe stress, unspecified',
+              'K76.7': 'Hepatorenal syndrome',
+              'A41.1': 'Septicaemia due to other specified staphylococcus',
+              'N05.7': 'Unspecified nephritic syndrome, diffuse crescentic glomerulonephritis',
+              'I07.0': 'Tricuspid stenosis', 'Q98.5': 'Karyotype 47,XYY',
+              'C72.3': 'Optic nerve - Malignant neoplasms',
+              'V41.4': 'Car occupant injured in collision with pedal cycle, person injured while boarding or alighting',
+              'O95': 'Obstetric death of unspecified cause',
+              'C67.1': 'Dome of bladder - Malignant neoplasms',
+              'D38.6': 'Respiratory organ, unspecified - Uncertain neoplasms',
+              'R58': 'Haemorrhage, not elsewhere classified',
+              'J32.1': 'Chronic frontal sinusitis',
+              'E10.0': 'Insulin-dependent diabetes mellitus, with coma',
+              'I26.0': 'Pulmonary embolism with mention of acute cor pulmonale',
+              'D86.1': 'Sarcoidosis of lymph nodes',
+              'Q28.3': 'Other malformations of cerebral vessels',
+              'I63.9': 'Cerebral infarction, unspecified',
+              'I61.5': 'Intracerebral haemorrhage, intraventricular',
+              'E24.2': "Drug-induced Cushing's syndrome", 'K56.2': 'Volvulus',
+              'P01.0': 'Newborn affected by incompetent cervix',
+              'K36': 'Other appendicitis', 'I95.0': 'Idiopathic hypotension',
+              'K62.7': 'Radiation proctitis',
+              'P36.0': 'Sepsis of newborn due to streptococcus, group B',
+              'V14.9': 'Pedal cyclist injured in collision with heavy transport vehicle or bus, unspecified pedal cyclist injured in traffic accident',
+              'K28.9': 'Gastrojejunal ulcer, unspecified as acute or chronic, without haemorrhage or perforation',
+              'V67.6': 'Occupant of heavy transport vehicle injured in collision with fixed or stationary object, passenger injured in traffic accident',
+              'P28.4': 'Other apnoea of newborn',
+              'C16.3': 'Pyloric antrum - Malignant neoplasms',
+              'G23.1': 'Progressive supranuclear ophthalmoplegia [Steele-Richardson-Olszewski]',
+              'N11.1': 'Chronic obstructive pyelonephritis',
+              'C34.1': 'Upper lobe, bronchus or lung - Malignant neoplasms',
+              'P92.9': 'Feeding problem of newborn, unspecified',
+              'X92': 'Assault by drowning and submersion',
+              'Q23.1': 'Congenital insufficiency of aortic valve',
+              'M54.2': 'Cervicalgia', 'H70.1': 'Chronic mastoiditis',
+              'M19.9': 'Arthrosis, unspecified',
+              'D61.2': 'Aplastic anaemia due to other external agents',
+              'H47.2': 'Optic atrophy', 'H74.1': 'Adhesive middle ear disease',
+              'C57.9': 'Female genital organ, unspecified - Malignant neoplasms',
+              'G52.2': 'Disorders of vagus nerve',
+              'C44.2': 'Skin of ear and external auricular canal - Malignant neoplasms',
+              'V13.2': 'Pedal cyclist injured in collision with car, pick-up truck or van, unspecified pedal cyclist injured in nontraffic accident',
+              'J38.0': 'Paralysis of vocal cords and larynx',
+              'J45.1': 'Nonallergic asthma',
+              'E76.0': 'Mucopolysaccharidosis, type I',
+              'Y42.8': 'Other and unspecified hormones and their synthetic substitutes',
+              'P39.8': 'Other specified infections specific to the perinatal period',
+              'K74.5': 'Biliary cirrhosis, unspecified',
+              'E03.1': 'Congenital hypothyroidism without goitre',
+              'Q78.9': 'Osteochondrodysplasia, unspecified',
+              'M41.4': 'Neuromuscular scoliosis',
+              'R91': 'Abnormal findings on diagnostic imaging of lung',
+              'X06': 'Exposure to ignition or melting of other clothing and apparel',
+              'Y52.4': 'Angiotensin-converting-enzyme inhibitors',
+              'C92.7': 'Other myeloid leukaemia - Malignant neoplasms',
+              'E10.7': 'Insulin-dependent diabetes mellitus, with multiple complications',
+              'C78.5': 'Secondary malignant neoplasm of large intestine and rectum - Malignant neoplasms',
+              'C81.2': 'Mixed cellularity - Malignant neoplasms',
+              'F12.9': 'Mental and behavioural disorders due to use of cannabinoids, unspecified mental and behavioural disorder',
+              'D86.8': 'Sarcoidosis of other and combined sites',
+              'C15.2': 'Abdominal part of oesophagus - Malignant neoplasms',
+              'G45.0': 'Vertebro-basilar artery syndrome',
+              'V50.0': 'Occupant of pick-up truck or van injured in collision with pedestrian or animal, driver injured in nontraffic accident',
+              'V22.9': 'Motorcycle rider injured in collision with two- or three-wheeled motor vehicle, unspecified motorcycle rider injured in traffic accident',
+              'K37': 'Unspecified appendicitis',
+              'E74.9': 'Disorder of carbohydrate metabolism, unspecified',
+              'C45.9': 'Mesothelioma, unspecified - Malignant neoplasms',
+              'F01.9': 'Vascular dementia, unspecified',
+              'H40.9': 'Glaucoma, unspecified',
+              'M46.9': 'Inflammatory spondylopathy, unspecified',
+              'E72.0': 'Disorders of amino-acid transport',
+              'F13.9': 'Mental and behavioural disorders due to use of sedatives or hypnotics, unspecified mental and behavioural disorder',
+              'I44.7': 'Left bundle-branch block, unspecified',
+              'D41.3': 'Urethra - Uncertain neoplasms',
+              'X19': 'Contact with other and unspecified heat and hot substances',
+              'D37.7': 'Other digestive organs - Uncertain neoplasms',
+              'V90.8': 'Accident to watercraft causing drowning and submersion, other unpowered watercraft, surf-board, or windsurfer',
+              'G93.3': 'Postviral fatigue syndrome',
+              'I70.2': 'Atherosclerosis of arteries of extremities',
+              'H66.9': 'Otitis media, unspecified',
+              'D05.9': 'Carcinoma in situ of breast, unspecified - In situ neoplasms',
+              'D83.2': 'Common variable immunodeficiency with autoantibodies to B- or T-cells',
+              'O03.7': 'Spontaneous abortion, complete or unspecified, complicated by embolism',
+              'C18.6': 'Descending colon - Malignant neoplasms',
+              'R79.8': 'Other specified abnormal findings of blood chemistry',
+              'E10.5': 'Insulin-dependent diabetes mellitus, with peripheral circulatory complications',
+              'N88.8': 'Other specified noninflammatory disorders of cervix uteri',
+              'J37.0': 'Chronic laryngitis',
+              'D37.9': 'Digestive organ, unspecified - Uncertain neoplasms',
+              'V85.3': 'Unspecified occupant of special construction vehicle injured in traffic accident',
+              'O60': 'Preterm delivery',
+              'W51': 'Striking against or bumped into by another person',
+              'C18.1': 'Appendix - Malignant neoplasms',
+              'P37.2': 'Neonatal (disseminated) listeriosis',
+              'C10.4': 'Branchial cleft - Malignant neoplasms',
+              'Y87.1': 'Sequelae of assault', 'K12.0': 'Recurrent oral aphthae',
+              'V15.5': 'Pedal cyclist injured in collision with railway train or railway vehicle, passenger injured in traffic accident',
+              'C75.5': 'Aortic body and other paraganglia - Malignant neoplasms',
+              'X18': 'Contact with other hot metals',
+              'G40.3': 'Generalized idiopathic epilepsy and epileptic syndromes',
+              'Y85.9': 'Sequelae of other and unspecified transport accidents',
+              'P21.0': 'Severe birth asphyxia', 'A77.8': 'Other spotted fevers',
+              'B37.1': 'Pulmonary candidiasis', 'N21.0': 'Calculus in bladder',
+              'G95.9': 'Disease of spinal cord, unspecified',
+              'Y83.4': 'Other reconstructive surgery', 'Q02': 'Microcephaly',
+              'D51.1': 'Vitamin B12 deficiency anaemia due to selective vitamin B12 malabsorption with proteinuria',
+              'V80.8': 'Rider or occupant injured in collision with fixed or stationary object',
+              'K90.2': 'Blind loop syndrome, not elsewhere classified',
+              'N31.2': 'Flaccid neuropathic bladder, not elsewhere classified',
+              'I30.1': 'Infective pericarditis',
+              'K82.0': 'Obstruction of gallbladder',
+              'R73.0': 'Abnormal glucose tolerance test',
+              'B21.8': 'HIV disease resulting in other malignant neoplasms',
+              'I77.9': 'Disorder of arteries and arterioles, unspecified',
+              'V17.9': 'Pedal cyclist injured in collision with fixed or stationary object, unspecified pedal cyclist injured in traffic accident',
+              'D13.6': 'Pancreas - Benign neoplasms',
+              'G80.9': 'Infantile cerebral palsy, unspecified',
+              'V80.1': 'Rider or occupant injured in collision with pedestrian or animal',
+              'I33.9': 'Acute endocarditis, unspecified',
+              'D05.1': 'Intraductal carcinoma in situ - In situ neoplasms',
+              'V87.3': 'Person injured in collision between car and bus (traffic)',
+              'Y45.9': 'Analgesic, antipyretic and anti-inflammatory drug, unspecified',
+              'C47.0': 'Peripheral nerves of head, face and neck - Malignant neoplasms',
+              'P96.0': 'Congenital renal failure',
+              'L10.9': 'Pemphigus, unspecified',
+              'C79.6': 'Secondary malignant neoplasm of ovary - Malignant neoplasms',
+              'P61.2': 'Anaemia of prematurity',
+              'P28.9': 'Respiratory condition of newborn, unspecified',
+              'I61.6': 'Intracerebral haemorrhage, multiple localized',
+              'G00.9': 'Bacterial meningitis, unspecified',
+              'Q26.9': 'Congenital malformation of great vein, unspecified',
+              'R75': 'Laboratory evidence of human immunodeficiency virus [HIV]',
+              'I25.4': 'Coronary artery aneurysm',
+              'Q39.1': 'Atresia of oesophagus with tracheo-oesophageal fistula',
+              'H60.9': 'Otitis externa, unspecified',
+              'Q85.1': 'Tuberous sclerosis',
+              'F59': 'Unspecified behavioural syndromes associated with physiological disturbances and physical factors',
+              'V09.3': 'Pedestrian injured in unspecified traffic accident',
+              'J45.0': 'Predominantly allergic asthma',
+              'G60.3': 'Idiopathic progressive neuropathy',
+              'P02.0': 'Newborn affected by placenta praevia',
+              'C09.1': 'Tonsillar pillar (anterior)(posterior) - Malignant neoplasms',
+              'Q27.3': 'Peripheral arteriovenous malformation',
+              'Q23.9': 'Congenital malformation of aortic and mitral valves, unspecified',
+              'C63.9': 'Male genital organ, unspecified - Malignant neoplasms',
+              'D41.1': 'Renal pelvis - Uncertain neoplasms',
+              'F95.2': 'Combined vocal and multiple motor tic disorder [de la Tourette]',
+              'M83.9': 'Adult osteomalacia, unspecified',
+              'N20.1': 'Calculus of ureter',
+              'Y49.7': 'Psychostimulants with abuse potential',
+              'G23.2': 'Striatonigral degeneration',
+              'Q43.1': "Hirschsprung's disease",
+              'J96.1': 'Chronic respiratory failure',
+              'P52.9': 'Intracranial (nontraumatic) haemorrhage of newborn, unspecified',
+              'K20': 'Oesophagitis',
+              'C05.8': 'Overlapping lesion of palate - Malignant neoplasms',
+              'E23.2': 'Diabetes insipidus',
+              'K76.0': 'Fatty (change of) liver, not elsewhere classified',
+              'I31.1': 'Chronic constrictive pericarditis',
+              'D42.9': 'Meninges, unspecified - Uncertain neoplasms',
+              'P36.2': 'Sepsis of newborn due to Staphylococcus aureus',
+              'D82.4': 'Hyperimmunoglobulin E [IgE] syndrome',
+              'P23.2': 'Congenital pneumonia due to staphylococcus',
+              'D16.5': 'Lower jaw bone - Benign neoplasms',
+              'G45.9': 'Transient cerebral ischaemic attack, unspecified',
+              'O97.1': 'Death from sequelae of indirect obstetric cause',
+              'D89.1': 'Cryoglobulinaemia',
+              'F33.9': 'Recurrent depressive disorder, unspecified',
+              'X04': 'Exposure to ignition of highly flammable material',
+              'M61.1': 'Myositis ossificans progressiva',
+              'F20.0': 'Paranoid schizophrenia', 'L30.4': 'Erythema intertrigo',
+              'Q25.6': 'Stenosis of pulmonary artery',
+              'V84.1': 'Passenger of special agricultural vehicle injured in traffic accident',
+              'L53.8': 'Other specified erythematous conditions',
+              'X31': 'Exposure to excessive natural cold',
+              'C81.7': "Other Hodgkin's disease - Malignant neoplasms",
+              'J15.2': 'Pneumonia due to staphylococcus',
+              'Y60.9': 'During unspecified surgical and medical care',
+              'Q39.2': 'Congenital tracheo-oesophageal fistula without atresia',
+              'Q82.2': 'Mastocytosis',
+              'V18.9': 'Pedal cyclist injured in noncollision transport accident, unspecified pedal cyclist injured in traffic accident',
+              'C24.0': 'Extrahepatic bile duct - Malignant neoplasms',
+              'L92.8': 'Other granulomatous disorders of skin and subcutaneous tissue',
+              'L03.3': 'Cellulitis of trunk',
+              'L25.3': 'Unspecified contact dermatitis due to other chemical products',
+              'G37.3': 'Acute transverse myelitis in demyelinating disease of central nervous system',
+              'F43.0': 'Acute stress reaction',
+              'V80.7': 'Rider or occupant injured in collision with other nonmotor vehicle',
+              'M54.8': 'Other dorsalgia',
+              'V12.4': 'Pedal cyclist injured in collision with two- or three-wheeled motor vehicle, driver injured in traffic accident',
+              'V39.5': 'Passenger injured in collision with other and unspecified motor vehicles in traffic accident',
+              'B20.6': 'HIV disease resulting in Pneumocystis carinii pneumonia',
+              'B23.2': 'HIV disease resulting in haematological and immunological abnormalities, not elsewhere classified',
+              'I37.9': 'Pulmonary valve disorder, unspecified',
+              'G93.4': 'Encephalopathy, unspecified',
+              'K62.6': 'Ulcer of anus and rectum',
+              'G00.1': 'Pneumococcal meningitis',
+              'V17.2': 'Pedal cyclist injured in collision with fixed or stationary object, unspecified pedal cyclist injured in nontraffic accident',
+              'C83.7': "Burkitt's tumour - Malignant neoplasms",
+              'P25.1': 'Pneumothorax originating in the perinatal period',
+              'Q44.6': 'Cystic disease of liver',
+              'V29.6': 'Unspecified motorcycle rider injured in collision with other and unspecified motor vehicles in traffic accident',
+              'J41.1': 'Mucopurulent chronic bronchitis',
+              'V52.5': 'Occupant of pick-up truck or van injured in collision with two- or three-wheeled motor vehicle, driver injured in traffic accident',
+              'E21.2': 'Other hyperparathyroidism',
+              'B37.8': 'Candidiasis of other sites',
+              'G11.3': 'Cerebellar ataxia with defective DNA repair',
+              'V02.0': 'Pedestrian injured in collision with two- or three-wheeled motor vehicle, nontraffic accident',
+              'V29.5': 'Passenger injured in collision with other and unspecified motor vehicles in traffic accident',
+              'M35.2': "Behcet's disease", 'J64': 'Unspecified pneumoconiosis',
+              'E10.6': 'Insulin-dependent diabetes mellitus, with other specified complications',
+              'J15.7': 'Pneumonia due to Mycoplasma pneumoniae',
+              'E87.0': 'Hyperosmolality and hypernatraemia',
+              'R09.1': 'Pleurisy',
+              'Q26.5': 'Anomalous portal venous connection',
+              'K25.5': 'Gastric ulcer, chronic or unspecified with perforation',
+              'W79': 'Inhalation and ingestion of food causing obstruction of respiratory tract',
+              'V19.5': 'Passenger injured in collision with other and unspecified motor vehicles in traffic accident',
+              'C11.9': 'Nasopharynx, unspecified - Malignant neoplasms',
+              'O15.2': 'Eclampsia in the puerperium', 'E87.6': 'Hypokalaemia',
+              'C84.0': 'Mycosis fungoides - Malignant neoplasms',
+              'G90.8': 'Other disorders of autonomic nervous system',
+              'E25.0': 'Congenital adrenogenital disorders associated with enzyme deficiency',
+              'J98.9': 'Respiratory disorder, unspecified',
+              'E16.4': 'Abnormal secretion of gastrin',
+              'D48.2': 'Peripheral nerves and autonomic nervous system - Uncertain neoplasms',
+              'G72.8': 'Other specified myopathies',
+              'G25.8': 'Other specified extrapyramidal and movement disorders',
+              'N32.4': 'Rupture of bladder, nontraumatic',
+              'O96.0': 'Death from direct obstetric cause occurring more than 42 days but less than one year after delivery',
+              'K41.4': 'Unilateral or unspecified femoral hernia, with gangrene',
+              'K58.9': 'Irritable bowel syndrome without diarrhoea',
+              'K72.9': 'Hepatic failure, unspecified', 'I51.7': 'Cardiomegaly',
+              'Y11': 'Poisoning by and exposure to antiepileptic, sedative-hypnotic, antiparkinsonism and psychotropic drugs, not elsewhere classified, undetermined intent',
+              'E80.5': 'Crigler-Najjar syndrome',
+              'C90.1': 'Plasma cell leukaemia - Malignant neoplasms',
+              'G72.3': 'Periodic paralysis',
+              'Q63.1': 'Lobulated, fused and horseshoe kidney',
+              'B34.2': 'Coronavirus infection, unspecified',
+              'X91': 'Assault by hanging, strangulation and suffocation',
+              'I67.8': 'Other specified cerebrovascular diseases',
+              'D07.1': 'Vulva - In situ neoplasms',
+              'J35.9': 'Chronic disease of tonsils and adenoids, unspecified',
+              'O16': 'Unspecified maternal hypertension',
+              'M79.3': 'Panniculitis, unspecified',
+              'Q99.2': 'Fragile X chromosome',
+              'K66.9': 'Disorder of peritoneum, unspecified',
+              'K35.2': 'Acute appendicitis with generalized peritonitis',
+              'B20.3': 'HIV disease resulting in other viral infections',
+              'C53.0': 'Endocervix - Malignant neoplasms',
+              'Q77.6': 'Chondroectodermal dysplasia',
+              'I37.0': 'Pulmonary valve stenosis',
+              'V86.9': 'Unspecified occupant of all-terrain or other off-road motor vehicle injured in nontraffic accident',
+              'E10.3': 'Insulin-dependent diabetes mellitus, with ophthalmic complications',
+              'Y42.3': 'Insulin and oral hypoglycaemic [antidiabetic] drugs',
+              'N13.3': 'Other and unspecified hydronephrosis',
+              'K70.2': 'Alcoholic fibrosis and sclerosis of liver',
+              'G70.0': 'Myasthenia gravis',
+              'O03.9': 'Spontaneous abortion, complete or unspecified, without complication',
+              'R40.2': 'Coma, unspecified',
+              'K25.1': 'Gastric ulcer, acute with perforation',
+              'K59.3': 'Megacolon, not elsewhere classified',
+              'F50.8': 'Other eating disorders',
+              'N80.9': 'Endometriosis, unspecified',
+              'Q25.7': 'Other congenital malformations of pulmonary artery',
+              'X88': 'Assault by gases and vapours',
+              'I42.3': 'Endomyocardial (eosinophilic) disease',
+              'M86.8': 'Other osteomyelitis',
+              'D55.0': 'Anaemia due to glucose-6-phosphate dehydrogenase [G6PD] deficiency',
+              'E75.4': 'Neuronal ceroid lipofuscinosis',
+              'K51.0': 'Ulcerative (chronic) enterocolitis',
+              'I51.4': 'Myocarditis, unspecified',
+              'K38.8': 'Other specified diseases of appendix',
+              'L95.0': 'Livedoid vasculitis',
+              'N02.2': 'Recurrent and persistent haematuria, diffuse membranous glomerulonephritis',
+              'Q60.6': "Potter's syndrome", 'N14.0': 'Analgesic nephropathy',
+              'A08.0': 'Rotaviral enteritis',
+              'P25.2': 'Pneumomediastinum originating in the perinatal period',
+              'P00.2': 'Newborn affected by maternal infectious and parasitic diseases',
+              'N25.9': 'Disorder resulting from impaired renal tubular function, unspecified',
+              'Q22.8': 'Other congenital malformations of tricuspid valve',
+              'I99': 'Other and unspecified disorders of circulatory system',
+              'K22.6': 'Gastro-oesophageal laceration-haemorrhage syndrome',
+              'D44.0': 'Thyroid gland - Uncertain neoplasms',
+              'E80.2': 'Other porphyria',
+              'K63.1': 'Perforation of intestine (nontraumatic)',
+              'M87.8': 'Other osteonecrosis',
+              'V78.2': 'Bus occupant injured in noncollision transport accident, person on outside of vehicle injured in nontraffic accident',
+              'K51.9': 'Ulcerative colitis, unspecified',
+              'C92.9': 'Myeloid leukaemia, unspecified - Malignant neoplasms',
+              'V83.3': 'Unspecified occupant of special industrial vehicle injured in traffic accident',
+              'D29.1': 'Prostate - Benign neoplasms',
+              'O97.0': 'Death from sequelae of direct obstetric cause',
+              'Q77.3': 'Chondrodysplasia punctata',
+              'E66.0': 'Obesity due to excess calories',
+              'K70.1': 'Alcoholic hepatitis',
+              'V59.8': 'Occupant [any] of pick-up truck or van injured in other specified transport accidents',
+              'C54.1': 'Endometrium - Malignant neoplasms',
+              'Q21.4': 'Aortopulmonary septal defect',
+              'R47.0': 'Dysphasia and aphasia',
+              'K82.2': 'Perforation of gallbladder', 'R04.2': 'Haemoptysis',
+              'M50.2': 'Other cervical disc displacement',
+              'Y06.8': 'By other specified persons',
+              'E84.9': 'Cystic fibrosis, unspecified',
+              'J96.9': 'Respiratory failure, unspecified',
+              'I63.2': 'Cerebral infarction due to unspecified occlusion or stenosis of precerebral arteries',
+              'K13.7': 'Other and unspecified lesions of oral mucosa',
+              'V43.4': 'Car occupant injured in collision with car, pick-up truck or van, person injured while boarding or alighting',
+              'V68.5': 'Occupant of heavy transport vehicle injured in noncollision transport accident, driver injured in traffic accident',
+              'K11.5': 'Sialolithiasis',
+              'K59.8': 'Other specified functional intestinal disorders',
+              'X05': 'Exposure to ignition or melting of nightwear',
+              'R59.0': 'Localized enlarged lymph nodes',
+              'V19.3': 'Pedal cyclist [any] injured in unspecified nontraffic accident',
+              'R56.0': 'Febrile convulsions',
+              'P91.0': 'Neonatal cerebral ischaemia',
+              'Q05.9': 'Spina bifida, unspecified',
+              'D01.5': 'Liver, gallbladder and bile ducts - In situ neoplasms',
+              'I34.9': 'Nonrheumatic mitral valve disorder, unspecified',
+              'O99.8': 'Other specified diseases and conditions complicating pregnancy, childbirth and the puerperium',
+              'L10.0': 'Pemphigus vulgaris', 'G81.1': 'Spastic hemiplegia',
+              'A48.0': 'Gas gangrene',
+              'Y43.1': 'Antineoplastic antimetabolites',
+              'V58.4': 'Occupant of pick-up truck or van injured in noncollision transport accident, person injured while boarding or alighting',
+              'D73.1': 'Hypersplenism',
+              'J14': 'Pneumonia due to Haemophilus influenzae',
+              'A82.9': 'Rabies, unspecified',
+              'M95.9': 'Acquired deformity of musculoskeletal system, unspecified',
+              'Y35.5': 'Legal execution', 'I50.0': 'Congestive heart failure',
+              'I74.4': 'Embolism and thrombosis of arteries of extremities, unspecified',
+              'V59.0': 'Driver injured in collision with other and unspecified motor vehicles in nontraffic accident',
+              'O88.0': 'Obstetric air embolism',
+              'G24.3': 'Spasmodic torticollis',
+              'C48.0': 'Retroperitoneum - Malignant neoplasms',
+              'B21.0': "HIV disease resulting in Kaposi's sarcoma",
+              'W20': 'Struck by thrown, projected or falling object',
+              'R10.4': 'Other and unspecified abdominal pain',
+              'B30.8': 'Other viral conjunctivitis',
+              'K11.9': 'Disease of salivary gland, unspecified',
+              'A32.1': 'Listerial meningitis and meningoencephalitis',
+              'Q93.8': 'Other deletions from the autosomes',
+              'C95.1': 'Chronic leukaemia of unspecified cell type - Malignant neoplasms',
+              'M16.9': 'Coxarthrosis, unspecified',
+              'J06.9': 'Acute upper respiratory infection, unspecified',
+              'D33.9': 'Central nervous system, unspecified - Benign neoplasms',
+              'D73.8': 'Other diseases of spleen',
+              'I22.9': 'Subsequent myocardial infarction of unspecified site',
+              'Q55.4': 'Other congenital malformations of vas deferens, epididymis, seminal vesicles and prostate',
+              'L12.3': 'Acquired epidermolysis bullosa',
+              'B21.9': 'HIV disease resulting in unspecified malignant neoplasm',
+              'I25.5': 'Ischaemic cardiomyopathy',
+              'D76.2': 'Haemophagocytic syndrome, infection-associated',
+              'K55.0': 'Acute vascular disorders of intestine',
+              'K83.9': 'Disease of biliary tract, unspecified',
+              'F11.7': 'Mental and behavioural disorders due to use of opioids, residual and late-onset psychotic disorder',
+              'A18.8': 'Tuberculosis of other specified organs',
+              'P04.8': 'Newborn affected by other maternal noxious influences',
+              'Y18': 'Poisoning by and exposure to pesticides, undetermined intent',
+              'Q05.4': 'Unspecified spina bifida with hydrocephalus',
+              'L98.9': 'Disorder of skin and subcutaneous tissue, unspecified',
+              'R50.9': 'Fever, unspecified',
+              'Y86': 'Sequelae of other accidents',
+              'X59.0': 'Exposure to unspecified factor causing fracture',
+              'B37.9': 'Candidiasis, unspecified',
+              'Q24.5': 'Malformation of coronary vessels',
+              'R76.8': 'Other specified abnormal immunological findings in serum',
+              'V48.5': 'Car occupant injured in noncollision transport accident, driver injured in traffic accident',
+              'F10.6': 'Mental and behavioural disorders due to use of alcohol, amnesic syndrome',
+              'F10.5': 'Mental and behavioural disorders due to use of alcohol, psychotic disorder',
+              'V42.5': 'Car occupant injured in collision with two- or three-wheeled motor vehicle, driver injured in traffic accident',
+              'F01.1': 'Multi-infarct dementia',
+              'W49': 'Exposure to other and unspecified inanimate mechanical forces',
+              'C22.1': 'Intrahepatic bile duct carcinoma - Malignant neoplasms',
+              'R62.8': 'Other lack of expected normal physiological development',
+              'E75.0': 'GM2 gangliosidosis',
+              'I74.5': 'Embolism and thrombosis of iliac artery',
+              'K31.1': 'Adult hypertrophic pyloric stenosis',
+              'K22.9': 'Disease of oesophagus, unspecified',
+              'M60.0': 'Infective myositis', 'K76.3': 'Infarction of liver',
+              'F89': 'Unspecified disorder of psychological development',
+              'I73.1': 'Thromboangiitis obliterans [Buerger]',
+              'D46.9': 'Myelodysplastic syndrome, unspecified - Uncertain neoplasms',
+              'V41.5': 'Car occupant injured in collision with pedal cycle, driver injured in traffic accident',
+              'P01.8': 'Newborn affected by other maternal complications of pregnancy',
+              'G06.2': 'Extradural and subdural abscess, unspecified',
+              'E78.5': 'Hyperlipidaemia, unspecified',
+              'P52.3': 'Unspecified intraventricular (nontraumatic) haemorrhage of newborn',
+              'Q62.0': 'Congenital hydronephrosis',
+              'P29.0': 'Neonatal cardiac failure',
+              'V80.9': 'Rider or occupant injured in other and unspecified transport accidents',
+              'N76.0': 'Acute vaginitis',
+              'Y60.8': 'During other surgical and medical care',
+              'Q99.9': 'Chromosomal abnormality, unspecified',
+              'N32.9': 'Bladder disorder, unspecified',
+              'K65.0': 'Acute peritonitis',
+              'D58.9': 'Hereditary haemolytic anaemia, unspecified',
+              'Q93.3': 'Deletion of short arm of chromosome 4',
+              'D32.0': 'Cerebral meninges - Benign neoplasms',
+              'A09.0': 'Other and unspecified gastroenteritis and colitis of infectious origin',
+              'Q22.9': 'Congenital malformation of tricuspid valve, unspecified',
+              'V84.5': 'Driver of special agricultural vehicle injured in nontraffic accident',
+              'M41.9': 'Scoliosis, unspecified', 'O85': 'Puerperal sepsis',
+              'C50.3': 'Lower-inner quadrant of breast - Malignant neoplasms',
+              'B00.4': 'Herpesviral encephalitis',
+              'C67.4': 'Posterior wall of bladder - Malignant neoplasms',
+              'G83.9': 'Paralytic syndrome, unspecified',
+              'O62.2': 'Other uterine inertia',
+              'F72': 'Severe mental retardation',
+              'V43.0': 'Car occupant injured in collision with car, pick-up truck or van, driver injured in nontraffic accident',
+              'I72.1': 'Aneurysm of artery of upper extremity',
+              'R60.9': 'Oedema, unspecified',
+              'R56.8': 'Other and unspecified convulsions',
+              'D80.2': 'Selective deficiency of immunoglobulin A [IgA]',
+              'E15': 'Nondiabetic hypoglycaemic coma',
+              'K52.8': 'Other specified noninfective gastroenteritis and colitis',
+              'O88.2': 'Obstetric blood-clot embolism',
+              'Y83.0': 'Surgical operation with transplant of whole organ',
+              'E26.8': 'Other hyperaldosteronism',
+              'Q67.8': 'Other congenital deformities of chest',
+              'E11.6': 'Non-insulin-dependent diabetes mellitus, with other specified complications',
+              'C71.4': 'Occipital lobe - Malignant neoplasms',
+              'V28.9': 'Motorcycle rider injured in noncollision transport accident, unspecified motorcycle rider injured in traffic accident',
+              'A21.9': 'Tularaemia, unspecified',
+              'V13.5': 'Pedal cyclist injured in collision with car, pick-up truck or van, passenger injured in traffic accident',
+              'L50.9': 'Urticaria, unspecified',
+              'C88.9': 'Malignant immunoproliferative disease, unspecified - Malignant neoplasms',
+              'L02.3': 'Cutaneous abscess, furuncle and carbuncle of buttock',
+              'Q24.6': 'Congenital heart block',
+              'A49.2': 'Haemophilus influenzae infection, unspecified',
+              'E72.3': 'Disorders of lysine and hydroxylysine metabolism',
+              'D13.0': 'Oesophagus - Benign neoplasms',
+              'N48.8': 'Other specified disorders of penis',
+              'M81.9': 'Osteoporosis, unspecified',
+              'Q07.8': 'Other specified congenital malformations of nervous system',
+              'I89.8': 'Other specified noninfective disorders of lymphatic vessels and lymph nodes',
+              'V54.5': 'Occupant of pick-up truck or van injured in collision with heavy transport vehicle or bus, driver injured in traffic accident',
+              'E87.2': 'Acidosis',
+              'Q28.2': 'Arteriovenous malformation of cerebral vessels',
+              'K35.3': 'Acute appendicitis with localized peritonitis',
+              'I77.3': 'Arterial fibromuscular dysplasia',
+              'V68.4': 'Occupant of heavy transport vehicle injured in noncollision transport accident, person injured while boarding or alighting',
+              'D48.1': 'Connective and other soft tissue - Uncertain neoplasms',
+              'I49.3': 'Ventricular premature depolarization',
+              'O90.8': 'Other complications of the puerperium, not elsewhere classified',
+              'C69.4': 'Ciliary body - Malignant neoplasms',
+              'V13.0': 'Pedal cyclist injured in collision with car, pick-up truck or van, driver injured in nontraffic accident',
+              'J80': 'Adult respiratory distress syndrome',
+              'M31.6': 'Other giant cell arteritis',
+              'I44.1': 'Atrioventricular block, second degree',
+              'O23.5': 'Infections of the genital tract in pregnancy',
+              'G40.2': 'Localization-related (focal)(partial) symptomatic epilepsy and epileptic syndromes with complex partial seizures',
+              'L03.8': 'Cellulitis of other sites',
+              'D26.9': 'Uterus, unspecified - Benign neoplasms',
+              'F70': 'Mild mental retardation',
+              'E16.2': 'Hypoglycaemia, unspecified',
+              'M05.3': 'Rheumatoid arthritis with involvement of other organs and systems',
+              'X67': 'Intentional self-poisoning by and exposure to other gases and vapours',
+              'O45.9': 'Premature separation of placenta, unspecified',
+              'N02.9': 'Recurrent and persistent haematuria, unspecified',
+              'G47.4': 'Narcolepsy and cataplexy',
+              'B40.9': 'Blastomycosis, unspecified',
+              'D35.2': 'Pituitary gland - Benign neoplasms',
+              'I77.1': 'Stricture of artery', 'R63.0': 'Anorexia',
+              'H66.4': 'Suppurative otitis media, unspecified',
+              'W27': 'Contact with nonpowered hand tool',
+              'V97.8': 'Other air transport accidents, not elsewhere classified',
+              'R60.0': 'Localized oedema',
+              'W75': 'Accidental suffocation and strangulation in bed',
+              'A43.0': 'Pulmonary nocardiosis',
+              'Q63.9': 'Congenital malformation of kidney, unspecified',
+              'K62.4': 'Stenosis of anus and rectum',
+              'Q03.8': 'Other congenital hydrocephalus',
+              'F19.5': 'Mental and behavioural disorders due to multiple drug use and use of other psychoactive substances, psychotic disorder',
+              'I67.1': 'Cerebral aneurysm, nonruptured',
+              'Q89.8': 'Other specified congenital malformations',
+              'E14.3': 'Unspecified diabetes mellitus, with ophthalmic complications',
+              'N94.9': 'Unspecified condition associated with female genital organs and menstrual cycle',
+              'N28.0': 'Ischaemia and infarction of kidney',
+              'V47.0': 'Car occupant injured in collision with fixed or stationary object, driver injured in nontraffic accident',
+              'C44.4': 'Skin of scalp and neck - Malignant neoplasms',
+              'B83.2': 'Angiostrongyliasis due to Parastrongylus cantonensis',
+              'V17.4': 'Pedal cyclist injured in collision with fixed or stationary object, driver injured in traffic accident',
+              'V72.9': 'Bus occupant injured in collision with two- or three-wheeled motor vehicle, unspecified bus occupant injured in traffic accident',
+              'J04.2': 'Acute laryngotracheitis',
+              'C10.9': 'Oropharynx, unspecified - Malignant neoplasms',
+              'P91.2': 'Neonatal cerebral leukomalacia',
+              'X42': 'Accidental poisoning by and exposure to narcotics and psychodysleptics [hallucinogens], not elsewhere classified',
+              'M25.8': 'Other specified joint disorders',
+              'Y25': 'Contact with explosive material, undetermined intent',
+              'Y36.4': 'War operations involving firearm discharge and other forms of conventional warfare',
+              'D41.4': 'Bladder - Uncertain neoplasms',
+              'C17.0': 'Duodenum - Malignant neoplasms',
+              'C09.9': 'Tonsil, unspecified - Malignant neoplasms',
+              'P02.7': 'Newborn affected by chorioamnionitis',
+              'K10.2': 'Inflammatory conditions of jaws',
+              'V93.9': 'Accident on board watercraft without accident to watercraft, not causing drowning and submersion, unspecified watercraft, boat NOS, ship NOS, or watercraft NOS',
+              'Q25.0': 'Patent ductus arteriosus',
+              'V24.9': 'Motorcycle rider injured in collision with heavy transport vehicle or bus, unspecified motorcycle rider injured in traffic accident',
+              'C18.0': 'Caecum - Malignant neoplasms',
+              'X74': 'Intentional self-harm by other and unspecified firearm discharge',
+              'A03.9': 'Shigellosis, unspecified',
+              'Q91.5': 'Trisomy 13, mosaicism (mitotic nondisjunction)',
+              'D59.1': 'Other autoimmune haemolytic anaemias',
+              'E16.9': 'Disorder of pancreatic internal secretion, unspecified',
+              'J20.8': 'Acute bronchitis due to other specified organisms',
+              'K85.1': 'Biliary acute pancreatitis',
+              'F07.1': 'Postencephalitic syndrome',
+              'Q03.1': 'Atresia of foramina of Magendie and Luschka',
+              'K50.1': "Crohn's disease of large intestine",
+              'K61.3': 'Ischiorectal abscess',
+              'P52.8': 'Other intracranial (nontraumatic) haemorrhages of newborn',
+              'V43.9': 'Car occupant injured in collision with car, pick-up truck or van, unspecified car occupant injured in traffic accident',
+              'A41.9': 'Septicaemia, unspecified', 'K62.3': 'Rectal prolapse',
+              'I81': 'Portal vein thrombosis', 'L60.5': 'Yellow nail syndrome',
+              'N02.8': 'Recurrent and persistent haematuria, other',
+              'D44.4': 'Craniopharyngeal duct - Uncertain neoplasms',
+              'H91.9': 'Hearing loss, unspecified',
+              'V90.0': 'Accident to watercraft causing drowning and submersion, merchant ship',
+              'V59.6': 'Unspecified occupant of pick-up truck or van injured in collision with other and unspecified motor vehicles in traffic accident',
+              'E74.2': 'Disorders of galactose metabolism',
+              'Q87.0': 'Congenital malformation syndromes predominantly affecting facial appearance',
+              'Q35.9': 'Cleft palate, unspecified',
+              'D80.5': 'Immunodeficiency with increased immunoglobulin M [IgM]',
+              'Y01': 'Assault by pushing from high place',
+              'F48.9': 'Neurotic disorder, unspecified',
+              'V64.9': 'Occupant of heavy transport vehicle injured in collision with heavy transport vehicle or bus, unspecified occupant of heavy transport vehicle injured in traffic accident',
+              'I27.0': 'Primary pulmonary hypertension',
+              'Y62.6': 'During aspiration, puncture and other catheterization',
+              'P05.1': 'Small for gestational age',
+              'I42.0': 'Dilated cardiomyopathy',
+              'L67.8': 'Other hair colour and hair shaft abnormalities',
+              'G72.9': 'Myopathy, unspecified',
+              'N05.8': 'Unspecified nephritic syndrome, other',
+              'O42.9': 'Premature rupture of membranes, unspecified',
+              'B69.0': 'Cysticercosis of central nervous system',
+              'K71.1': 'Toxic liver disease with hepatic necrosis',
+              'M21.8': 'Other specified acquired deformities of limbs',
+              'K25.3': 'Gastric ulcer, acute without haemorrhage or perforation',
+              'M89.0': 'Algoneurodystrophy',
+              'C85.1': 'B-cell lymphoma, unspecified - Malignant neoplasms',
+              'M21.9': 'Acquired deformity of limb, unspecified',
+              'K80.1': 'Calculus of gallbladder with other cholecystitis',
+              'G52.8': 'Disorders of other specified cranial nerves',
+              'V27.4': 'Motorcycle rider injured in collision with fixed or stationary object, driver injured in traffic accident',
+              'V44.4': 'Car occupant injured in collision with heavy transport vehicle or bus, person injured while boarding or alighting',
+              'O22.3': 'Deep phlebothrombosis in pregnancy',
+              'V58.3': 'Occupant of pick-up truck or van injured in noncollision transport accident, unspecified occupant of pick-up truck or van injured in nontraffic accident',
+              'I63.1': 'Cerebral infarction due to embolism of precerebral arteries',
+              'K21.0': 'Gastro-oesophageal reflux disease with oesophagitis',
+              'W22': 'Striking against or struck by other objects',
+              'Q00.2': 'Iniencephaly', 'Q24.0': 'Dextrocardia',
+              'Y83.5': 'Amputation of limb(s)',
+              'B21.1': "HIV disease resulting in Burkitt's lymphoma",
+              'C34.2': 'Middle lobe, bronchus or lung - Malignant neoplasms',
+              'J43.2': 'Centrilobular emphysema',
+              'M12.2': 'Villonodular synovitis (pigmented)',
+              'D44.7': 'Aortic body and other paraganglia - Uncertain neoplasms',
+              'D07.3': 'Other and unspecified female genital organs - In situ neoplasms',
+              'W64': 'Exposure to other and unspecified animate mechanical forces',
+              'V10.4': 'Pedal cyclist injured in collision with pedestrian or animal, driver injured in traffic accident',
+              'C32.9': 'Larynx, unspecified - Malignant neoplasms',
+              'V03.9': 'Unspecified whether traffic or nontraffic accident',
+              'W92': 'Exposure to excessive heat of man-made origin',
+              'V24.5': 'Motorcycle rider injured in collision with heavy transport vehicle or bus, passenger injured in traffic accident',
+              'A18.1': 'Tuberculosis of genitourinary system',
+              'I20.0': 'Unstable angina', 'L89.3': 'Stage IV decubitus ulcer',
+              'G80.8': 'Other infantile cerebral palsy',
+              'K90.0': 'Coeliac disease', 'P07.1': 'Other low birth weight',
+              'F12.1': 'Mental and behavioural disorders due to use of cannabinoids, harmful use',
+              'I27.8': 'Other specified pulmonary heart diseases',
+              'I47.1': 'Supraventricular tachycardia',
+              'Q90.9': "Down's syndrome, unspecified",
+              'L97': 'Ulcer of lower limb, not elsewhere classified',
+              'J94.9': 'Pleural condition, unspecified',
+              'D75.1': 'Secondary polycythaemia',
+              'P91.4': 'Neonatal cerebral depression',
+              'I50.9': 'Heart failure, unspecified', 'Q04.5': 'Megalencephaly',
+              'G21.4': 'Vascular parkinsonism',
+              'A54.0': 'Gonococcal infection of lower genitourinary tract without periurethral or accessory gland abscess',
+              'K86.8': 'Other specified diseases of pancreas',
+              'B18.8': 'Other chronic viral hepatitis',
+              'J94.8': 'Other specified pleural conditions',
+              'J63.2': 'Berylliosis', 'A87.2': 'Lymphocytic choriomeningitis',
+              'J12.1': 'Respiratory syncytial virus pneumonia',
+              'N31.9': 'Neuromuscular dysfunction of bladder, unspecified',
+              'I82.0': 'Budd-Chiari syndrome',
+              'R04.8': 'Haemorrhage from other sites in respiratory passages',
+              'V40.5': 'Car occupant injured in collision with pedestrian or animal, driver injured in traffic accident',
+              'D83.9': 'Common variable immunodeficiency, unspecified',
+              'M30.0': 'Polyarteritis nodosa',
+              'L08.9': 'Local infection of skin and subcutaneous tissue, unspecified',
+              'O75.9': 'Complication of labour and delivery, unspecified',
+              'V94.6': 'Other and unspecified water transport accidents, inflatable craft (nonpowered)',
+              'C92.4': 'Acute promyelocytic leukaemia - Malignant neoplasms',
+              'J34.0': 'Abscess, furuncle and carbuncle of nose',
+              'B02.8': 'Zoster with other complications',
+              'C32.3': 'Laryngeal cartilage - Malignant neoplasms',
+              'V03.0': 'Pedestrian injured in collision with car, pick-up truck or van, nontraffic accident',
+              'B25.8': 'Other cytomegaloviral diseases',
+              'M35.3': 'Polymyalgia rheumatica',
+              'D44.6': 'Carotid body - Uncertain neoplasms',
+              'K27.1': 'Peptic ulcer, site unspecified, acute with perforation',
+              'V49.1': 'Passenger injured in collision with other and unspecified motor vehicles in nontraffic accident',
+              'K92.0': 'Haematemesis',
+              'I61.2': 'Intracerebral haemorrhage in hemisphere, unspecified',
+              'N25.8': 'Other disorders resulting from impaired renal tubular function',
+              'C71.1': 'Frontal lobe - Malignant neoplasms',
+              'E71.0': 'Maple-syrup-urine disease',
+              'D44.5': 'Pineal gland - Uncertain neoplasms',
+              'P02.2': 'Newborn affected by other and unspecified morphological and functional abnormalities of placenta',
+              'M79.2': 'Neuralgia and neuritis, unspecified',
+              'K29.2': 'Alcoholic gastritis',
+              'V87.0': 'Person injured in collision between car and two- or three-wheeled motor vehicle (traffic)',
+              'I38': 'Endocarditis, valve unspecified',
+              'W16': 'Diving or jumping into water causing injury other than drowning or submersion',
+              'Q04.2': 'Holoprosencephaly',
+              'V09.9': 'Pedestrian injured in unspecified transport accident',
+              'C84.5': 'Other and unspecified T-cell lymphomas - Malignant neoplasms',
+              'A40.0': 'Septicaemia due to streptococcus, group A',
+              'I71.4': 'Abdominal aortic aneurysm, without mention of rupture',
+              'W40': 'Explosion of other materials',
+              'C45.7': 'Mesothelioma of other sites - Malignant neoplasms',
+              'D40.9': 'Male genital organ, unspecified - Uncertain neoplasms',
+              'B20.7': 'HIV disease resulting in multiple infections',
+              'M72.9': 'Fibroblastic disorder, unspecified',
+              'V69.9': 'Occupant [any] of heavy transport vehicle injured in unspecified traffic accident',
+              'P24.9': 'Neonatal aspiration syndrome, unspecified',
+              'B44.9': 'Aspergillosis, unspecified',
+              'X85': 'Assault by drugs, medicaments and biological substances',
+              'G14': 'Postpolio syndrome',
+              'C44.5': 'Skin of trunk - Malignant neoplasms',
+              'R00.0': 'Tachycardia, unspecified',
+              'Y56.0': 'Local antifungal, anti-infective and anti-inflammatory drugs, not elsewhere classified',
+              'J15.9': 'Bacterial pneumonia, unspecified',
+              'C76.0': 'Head, face and neck - Malignant neoplasms',
+              'Q85.8': 'Other phakomatoses, not elsewhere classified',
+              'V86.4': 'Person injured while boarding or alighting from all-terrain or other off-road motor vehicle',
+              'D57.3': 'Sickle-cell trait',
+              'C11.2': 'Lateral wall of nasopharynx - Malignant neoplasms',
+              'C24.9': 'Biliary tract, unspecified - Malignant neoplasms',
+              'Q32.4': 'Other congenital malformations of bronchus',
+              'I31.8': 'Other specified diseases of pericardium',
+              'D48.0': 'Bone and articular cartilage - Uncertain neoplasms',
+              'V92.9': 'Water-transport-related drowning and submersion without accident to watercraft, unspecified watercraft, boat NOS, ship NOS, or watercraft NOS',
+              'C79.3': 'Secondary malignant neoplasm of brain and cerebral meninges - Malignant neoplasms',
+              'N18.9': 'Chronic renal failure, unspecified',
+              'M79.7': 'Fibromyalgia'}
@@ -0,0 +1,372 @@
+"""Columnar NumPy storage for the CDC Mortality Database
+
+The ColumnarStore keeps the codes as a sorted fixed-width string array and
+the deaths as an int64 array at the same positions. Threshold queries are
+binary searches in the deaths sorted once, so their codes come in the same
+order as from MortalityStore. Because the codes are sorted, every chapter,
+category or code prefix is a contiguous slice, so its total is the
+difference of two entries of the cumulative deaths array.
+
+The class answers the same queries as MortalityStore and can be used by the
+hw1 functions in its place (see hw1.use_store). NumPy is an optional
+dependency, it is only needed when a ColumnarStore is created.
+"""
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from distribution import DeathDistribution
+from icd import CHAPTERS, PREFIX_END, block_of
+from textindex import NamedStore, query_totals, rank_matches
+
+
+def code_span(codes, first, last):
+    """Return the slice of a sorted code array from first up to last
+
+    Parameters:
+        codes (array): sorted ICD-10 codes
+        first (string): the first code or prefix, e.g.: 'I00'
+        last (string): the last code prefix, e.g.: 'I99'
+
+    Every code which starts with last, e.g. 'I99.9' for 'I99', is included
+    in the slice. Returns a (begin, end) pair of indexes.
+    """
+    begin = int(np.searchsorted(codes, first, side='left'))
+    end = int(np.searchsorted(codes, last + PREFIX_END, side='right'))
+    return begin, max(begin, end)
+
+
+class ColumnarStore(NamedStore):
+    """NumPy array backed view of a list of [code, deaths] pairs"""
+
+    def __init__(self, rows=(), names=None):
+        """Build the columns from [code, deaths] pairs
+
+        Parameters:
+            rows (iterable of pairs), e.g.: [['D35.2', 50], ['Y17', 3]]
+            names (dict): optional ICD-10 category names by code, e.g.:
+                {'D35.2': 'Pituitary gland - Benign neoplasms'}, or a
+                function returning them, which is called on first use
+
+        Repeated codes are aggregated, i.e. their deaths are summed up.
+        Raises an ImportError exception if NumPy is not installed.
+        """
+        rows = list(rows)
+        codes = [code for code, deaths in rows]
+        deaths = [deaths for code, deaths in rows]
+        self._build(codes, deaths, names)
+
+    @classmethod
+    def from_arrays(cls, codes, deaths, names=None):
+        """Build the store from parallel code and deaths sequences
+
+        Parameters:
+            codes (sequence of strings or array), e.g.: ['D35.2', 'Y17']
+            deaths (sequence of integers or array), e.g.: [50, 3]
+            names (dict): optional ICD-10 category names by code, or a
+                function returning them, which is called on first use
+
+        Avoids creating a Python list per row for large extracts.
+        """
+        store = cls.__new__(cls)
+        store._build(codes, deaths, names)
+        return store
+
+    def _build(self, codes, deaths, names):
+        """Sort and aggregate the columns and derive the lookup arrays"""
+        if np is None:
+            raise ImportError('NumPy is required for ColumnarStore')
+        codes = np.asarray(codes, dtype=str)
+        deaths = np.asarray(deaths, dtype=np.int64)
+        if codes.shape != deaths.shape or codes.ndim != 1:
+            raise ValueError('codes and deaths must be 1D arrays of equal size')
+        order = np.argsort(codes, kind='stable')
+        codes = codes[order]
+        deaths = deaths[order]
+        if len(codes):
+            starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+            codes = codes[starts]
+            deaths = np.add.reduceat(deaths, starts)
+        self.codes = codes
+        self.deaths = deaths
+        self.cumulative = np.concatenate(([0], np.cumsum(deaths)))
+        # positions in ascending order of deaths, ties by code like the
+        # threshold index of MortalityStore (the codes are sorted already)
+        self.ranked = np.argsort(deaths, kind='stable')
+        self.ranked_deaths = deaths[self.ranked]
+        self._set_names(names)
+        self._lowered_names = None
+        self._named = None
+        self._distribution = None
+
+    @property
+    def distribution(self):
+        """Quantiles and shares of the deaths per code, built on first use"""
+        if self._distribution is None:
+            self._distribution = DeathDistribution(
+                self.ranked_deaths.tolist(), presorted=True)
+        return self._distribution
+
+    def __len__(self):
+        """Get the number of distinct ICD-10 codes in the store"""
+        return len(self.codes)
+
+    def __contains__(self, code):
+        """Test if the ICD-10 code has an entry in the store"""
+        return self._position(code) is not None
+
+    def __iter__(self):
+        """Iterate over the [code, deaths] pairs of the store"""
+        for code, deaths in zip(self.codes.tolist(), self.deaths.tolist()):
+            yield [code, deaths]
+
+    def _position(self, code):
+        """Return the index of code in the columns, or None"""
+        index = int(np.searchsorted(self.codes, code))
+        if index < len(self.codes) and self.codes[index] == code:
+            return index
+        return None
+
+    def _span(self, first, last):
+        """Return the slice of the codes from first up to the last prefix"""
+        return code_span(self.codes, first, last)
+
+    def _sum_span(self, begin, end):
+        """Return the aggregated deaths of the codes[begin:end] slice"""
+        return int(self.cumulative[end] - self.cumulative[begin])
+
+    def deaths_by_code(self, code):
+        """Return number of deaths by ICD-10 code, or None if not found."""
+        index = self._position(code)
+        return None if index is None else int(self.deaths[index])
+
+    def most_deaths(self):
+        """Return [code, number_of_deaths] for the deadliest category, or None."""
+        if not len(self.codes):
+            return None
+        index = int(self.ranked[-1])
+        return [str(self.codes[index]), int(self.deaths[index])]
+
+    def top_k(self, n, chapter=None):
+        """Return the n deadliest ICD-10 categories.
+
+        Parameters:
+            n: (int) maximum number of categories to return
+            chapter: (int) optional chapter number to restrict the list to
+
+        Returns a list of [code, number_of_deaths] pairs in descending order
+        of deaths, e.g. [['I25.1', 161745], ['C34.9', 154723]]
+        """
+        if n <= 0:
+            return []
+        if chapter is None:
+            top = self.ranked[-n:]
+        elif chapter in CHAPTERS:
+            begin, end = self._span(*CHAPTERS[chapter])
+            order = np.argsort(self.deaths[begin:end], kind='stable')
+            top = begin + order[-n:]
+        else:
+            return []
+        return [[str(self.codes[index]), int(self.deaths[index])]
+                for index in top[::-1].tolist()]
+
+    def _ranked_codes(self, begin, end):
+        """Return the codes of ranked[begin:end] as a list of strings"""
+        return self.codes[self.ranked[begin:end]].tolist()
+
+    def codes_above(self, threshold):
+        """Return a list of ICD-10 codes with at least threshold deaths.
+
+        The codes are in ascending order of deaths, like MortalityStore.
+        """
+        begin = int(np.searchsorted(self.ranked_deaths, threshold))
+        return self._ranked_codes(begin, len(self.ranked))
+
+    def codes_below(self, threshold):
+        """Return a list of ICD-10 codes with deaths below threshold."""
+        return self._ranked_codes(
+            0, int(np.searchsorted(self.ranked_deaths, threshold)))
+
+    def codes_between(self, low, high):
+        """Return a list of ICD-10 codes with low <= deaths < high."""
+        begin = int(np.searchsorted(self.ranked_deaths, low))
+        end = int(np.searchsorted(self.ranked_deaths, high))
+        return self._ranked_codes(begin, max(begin, end))
+
+    def sum_deaths_by_codes(self, codes):
+        """Return the aggregated number of deaths by multiple ICD-10 codes."""
+        codes = list(set(codes))
+        if not codes or not len(self.codes):
+            return 0
+        return int(self.deaths[np.isin(self.codes, codes)].sum())
+
+    def sum_deaths_by_codes_batch(self, groups):
+        """Return the aggregated number of deaths for many groups of codes."""
+        return [self.sum_deaths_by_codes(codes) for codes in groups]
+
+    def sum_deaths_by_query(self, query):
+        """Return the aggregated number of deaths by a query string.
+
+        The names of the stored codes are lowercased once, and matched with
+        a vectorized substring search. Codes without a name never match.
+        """
+        if self._lowered_names is None:
+            codes = self.codes.tolist()
+            self._lowered_names = np.char.lower(np.array(
+                [self.names.get(code, '') for code in codes], dtype=str))
+            self._named = np.array([code in self.names for code in codes],
+                                   dtype=bool)
+        mask = np.char.find(self._lowered_names, query.lower()) >= 0
+        return int(self.deaths[mask & self._named].sum())
+
+    def sum_deaths_by_queries(self, queries):
+        """Return the aggregated number of deaths for each of many queries."""
+        return query_totals(queries, self.names, self.deaths_by_code)
+
+    def search_codes(self, query, mode='fuzzy', n=None):
+        """Return the ICD-10 codes whose name matches a query, best first."""
+        return rank_matches(self.search_index.match(query, mode),
+                            self.deaths_by_code, n)
+
+    def sum_deaths_by_chapter(self, chapter):
+        """Return the aggregated number of deaths in an ICD-10 chapter."""
+        if chapter not in CHAPTERS:
+            return 0
+        return self._sum_span(*self._span(*CHAPTERS[chapter]))
+
+    def sum_deaths_by_prefix(self, prefix):
+        """Return the aggregated number of deaths by an ICD-10 code prefix.
+
+        Parameters:
+            prefix (string), e.g.: 'I25'
+
+        Returns an integer, the aggregated (sum) number of deaths across all
+        ICD-10 codes starting with prefix, e.g. 'I25', 'I25.1', 'I25.9'.
+        """
+        return self._sum_span(*self._span(prefix, prefix))
+
+    def sum_deaths_in_range(self, first, last):
+        """Return the aggregated number of deaths in a range of ICD-10 codes.
+
+        Parameters:
+            first (string): the first code of the range, e.g.: 'C00'
+            last (string): the last code of the range, e.g.: 'D48'
+
+        Returns an integer, the sum of deaths of the codes from first up to
+        and including every code starting with last, e.g. 'D48.9'.
+        """
+        return self._sum_span(*self._span(first, last))
+
+    def sum_deaths_by_block(self, block):
+        """Return the aggregated number of deaths in an ICD-10 block.
+
+        Parameters:
+            block (string): the block name, e.g.: 'I20-I25'
+        """
+        if block_of(block.partition('-')[0]) != block:
+            return 0
+        return self._sum_span(*self._span(*block.split('-')))
+
+    def category_totals(self):
+        """Return the aggregated deaths per ICD-10 category.
+
+        The codes are grouped by their first three characters, and each
+        group is summed with a single np.add.reduceat call.
+
+        Returns a pair of arrays (categories, totals), e.g.:
+        (['I24', 'I25'], [1234, 170000])
+        """
+        if not len(self.codes):
+            return self.codes.astype('U3'), self.deaths.copy()
+        categories = self.codes.astype('U3')
+        starts = np.flatnonzero(
+            np.r_[True, categories[1:] != categories[:-1]])
+        return categories[starts], np.add.reduceat(self.deaths, starts)
+
+
+###############################################################################
+# TEST functions
+
+def test_columnar_store():
+    """Test ColumnarStore against MortalityStore on the CDC data"""
+    if np is None:
+        # optional dependency, nothing to test
+        return
+    from random import randint, sample
+    from cdc import db, code_names
+    from mortality import MortalityStore
+    reference = MortalityStore(db, code_names)
+    store = ColumnarStore(db, code_names)
+    assert len(store) == len(reference)
+    assert sorted(store) == sorted(reference)
+    assert store.deaths_by_code('I82.3') == 3
+    assert store.deaths_by_code('W17') == 481
+    assert store.deaths_by_code('does not exist') is None
+    assert store.most_deaths() == reference.most_deaths()
+    assert store.top_k(len(db)) == reference.top_k(len(db))
+    for chapter in (0, 2, 9, 20):
+        assert (store.top_k(25, chapter=chapter) ==
+                reference.top_k(25, chapter=chapter))
+    for i in range(10):
+        low, high = sorted((randint(0, 2000), randint(0, 2000)))
+        assert store.codes_above(low) == reference.codes_above(low)
+        assert store.codes_below(low) == reference.codes_below(low)
+        assert (store.codes_between(low, high) ==
+                reference.codes_between(low, high))
+        assert store.codes_between(high, low) == []
+        codes = [code for code, deaths in sample(db, randint(0, 100))]
+        assert (store.sum_deaths_by_codes(codes) ==
+                reference.sum_deaths_by_codes(codes))
+    for query in ('heart', 'LUNG', '', 'broccoli'):
+        assert (store.sum_deaths_by_query(query) ==
+                reference.sum_deaths_by_query(query))
+    for chapter in range(0, 24):
+        assert (store.sum_deaths_by_chapter(chapter) ==
+                reference.sum_deaths_by_chapter(chapter))
+
+
+def test_columnar_prefix_totals():
+    """Test ColumnarStore prefix and category totals"""
+    if np is None:
+        # optional dependency, nothing to test
+        return
+    store = ColumnarStore.from_arrays(
+        ['I25.1', 'I24', 'I25', 'I25.9', 'I24', 'J18.9'], [5, 1, 2, 3, 4, 7])
+    assert store.deaths_by_code('I24') == 5
+    assert store.sum_deaths_by_prefix('I25') == 10
+    assert store.sum_deaths_by_prefix('I2') == 15
+    assert store.sum_deaths_by_prefix('I25.1') == 5
+    assert store.sum_deaths_by_prefix('K') == 0
+    assert store.sum_deaths_by_block('I20-I25') == 15
+    assert store.sum_deaths_by_block('I20') == 0
+    assert store.sum_deaths_in_range('I24', 'I25') == 15
+    assert store.sum_deaths_in_range('I25.5', 'J') == 10
+    assert store.sum_deaths_in_range('J', 'I') == 0
+    categories, totals = store.category_totals()
+    assert categories.tolist() == ['I24', 'I25', 'J18']
+    assert totals.tolist() == [5, 10, 7]
+    assert store.top_k(2) == [['J18.9', 7], ['I25.1', 5]]
+    assert store.codes_above(5) == ['I24', 'I25.1', 'J18.9']
+    assert store.sum_deaths_by_query('') == 0
+    empty = ColumnarStore()
+    assert empty.most_deaths() is None
+    assert empty.top_k(5) == []
+    assert empty.sum_deaths_by_prefix('I') == 0
+    assert empty.sum_deaths_by_codes(['I25']) == 0
+
+
+if __name__ == '__main__':
+    import sys
+    import traceback
+
+    for test in (test_columnar_store,
+                 test_columnar_prefix_totals):
+        try:
+            print(test.__doc__, '... ', end='', flush=True)
+            test()
+            print('PASSED')
+        except:
+            print('FAILED')
+            exc_info = sys.exc_info()
+            traceback.print_exception(*exc_info)
@@ -0,0 +1,305 @@
+"""Multi-dimensional mortality statistics
+
+cdc.db has the deaths by ICD-10 code only. The MortalityCube keeps them by
+code, age group, sex, state and year (or any other dimensions): every
+dimension's members are encoded as dense ordinals, and the deaths are one
+int64 NumPy array with an axis per dimension. The totals of each single
+dimension (marginals) are computed along with the cube, and the cube
+rolled up to a set of dimensions is kept once asked for. Slicing, dicing
+and rolling up are then array indexing and sums along axes, e.g.:
+
+    heart = store.text_index.search('heart')
+    cube.breakdown('state', code=heart, sex='F', age=['65-74', '75-84', '85+'])
+
+The array is dense, it takes 8 bytes for every combination of members, so
+the dimensions should be chosen to keep their product reasonable. NumPy is
+an optional dependency, it is only needed when a MortalityCube is created.
+"""
+from columnar import np
+
+DIMENSIONS = ('code', 'age', 'sex', 'state', 'year')
+
+
+class MortalityCube:
+    """Dense NumPy array of deaths over several dimensions"""
+
+    def __init__(self, records=(), dimensions=DIMENSIONS):
+        """Build the cube from death records
+
+        Parameters:
+            records (iterable of tuples): one member of every dimension and
+                the number of deaths, e.g.: [('I25.1', '85+', 'F', 'CA',
+                2014, 812), ('I25.1', '75-84', 'M', 'NY', 2014, 507)]
+            dimensions (tuple of strings): the names of the dimensions
+
+        Repeated combinations are aggregated, i.e. their deaths are summed
+        up. Raises an ImportError exception if NumPy is not installed, and a
+        ValueError exception for records of the wrong length.
+        """
+        if np is None:
+            raise ImportError('NumPy is required for MortalityCube')
+        rows = list(records)
+        for row in rows:
+            if len(row) != len(dimensions) + 1:
+                raise ValueError('record {} does not match dimensions {}'
+                                 .format(row, dimensions))
+        columns = list(zip(*rows)) or [()] * (len(dimensions) + 1)
+        members = []
+        indexes = []
+        for column in columns[:-1]:
+            values, index = np.unique(np.array(column), return_inverse=True)
+            members.append(values.tolist())
+            indexes.append(index)
+        deaths = np.zeros([len(values) for values in members], dtype=np.int64)
+        np.add.at(deaths, tuple(indexes), np.array(columns[-1], dtype=np.int64))
+        self._build(dimensions, members, deaths)
+
+    @classmethod
+    def _from_array(cls, dimensions, members, deaths):
+        """Create a cube from its members and deaths array"""
+        cube = cls.__new__(cls)
+        cube._build(dimensions, members, deaths)
+        return cube
+
+    def _build(self, dimensions, members, deaths):
+        """Set the encodings, the deaths array and the marginals"""
+        self.dimensions = tuple(dimensions)
+        self.members = dict(zip(self.dimensions, members))
+        self.ordinals = {dimension: {member: index
+                                     for index, member in enumerate(values)}
+                         for dimension, values in self.members.items()}
+        self.deaths = deaths
+        axes = range(len(self.dimensions))
+        self.marginals = {
+            dimension: deaths.sum(axis=tuple(x for x in axes if x != axis))
+            for axis, dimension in enumerate(self.dimensions)}
+        self._rollups = {tuple(axes): deaths}
+
+    def _axis(self, dimension):
+        """Return the axis of a dimension
+
+        Raises a ValueError exception for unknown dimensions.
+        """
+        if dimension not in self.members:
+            raise ValueError('unknown dimension: {}'.format(dimension))
+        return self.dimensions.index(dimension)
+
+    def _select(self, dimension, members):
+        """Return the ordinals of the selected members of a dimension
+
+        The members are one member, a list of them, or a function returning
+        True for the wanted ones. Unknown members are ignored.
+        """
+        ordinals = self.ordinals[dimension]
+        if callable(members):
+            return [index for index, member in
+                    enumerate(self.members[dimension]) if members(member)]
+        if isinstance(members, (list, tuple, set, frozenset)):
+            return sorted({ordinals[member] for member in members
+                           if member in ordinals})
+        return [ordinals[members]] if members in ordinals else []
+
+    def _rollup(self, axes):
+        """Return the deaths summed over all but the axes, kept for reuse"""
+        deaths = self._rollups.get(axes)
+        if deaths is None:
+            other = tuple(axis for axis in range(len(self.dimensions))
+                          if axis not in axes)
+            deaths = self._rollups[axes] = self.deaths.sum(axis=other)
+        return deaths
+
+    def _reduce(self, by, members):
+        """Return the deaths selected by members, summed over all axes but by
+
+        Only the filtered dimensions and by are taken from the (cached)
+        rolled-up cube, the other dimensions are never looked at.
+        """
+        selected = {self._axis(dimension): self._select(dimension, values)
+                    for dimension, values in members.items()}
+        kept = tuple(sorted(set(selected) | set(by)))
+        deaths = self._rollup(kept)
+        for position, axis in enumerate(kept):
+            if axis in selected:
+                deaths = deaths.take(selected[axis], axis=position)
+        other = tuple(position for position, axis in enumerate(kept)
+                      if axis not in by)
+        return deaths.sum(axis=other), selected
+
+    def total(self, **members):
+        """Return the number of deaths of the selected members.
+
+        Parameters:
+            members: the members to select by dimension, a single member, a
+                list of them, or a function returning True for the wanted
+                ones, e.g.: sex='F', age=lambda x: x >= '65'
+
+        Returns an integer, e.g.: cube.total(code='I25.1', state='CA')
+        Raises a ValueError exception for unknown dimensions.
+        """
+        if not members:
+            return int(self.deaths.sum())
+        return int(self._reduce((), members)[0])
+
+    def breakdown(self, by, **members):
+        """Return the deaths of the selected members by one dimension.
+
+        Parameters:
+            by (string): the dimension to break the deaths down by, e.g.:
+                'state'
+            members: the members to select by dimension, see total
+
+        Returns a list of [member, number_of_deaths] pairs in the order of
+        the members, zeros included, e.g.: [['AK', 12], ['AL', 410], ...]
+        A dimension without filter is answered from its marginal.
+        """
+        axis = self._axis(by)
+        if not members:
+            return [[member, int(deaths)] for member, deaths in
+                    zip(self.members[by], self.marginals[by].tolist())]
+        deaths, selected = self._reduce((axis,), members)
+        values = self.members[by]
+        if axis in selected:
+            values = [values[index] for index in selected[axis]]
+        return [[member, int(count)]
+                for member, count in zip(values, deaths.tolist())]
+
+    def dice(self, **members):
+        """Return the sub-cube of the selected members of some dimensions.
+
+        Parameters:
+            members: the members to keep by dimension, see total
+
+        E.g.: cube.dice(age=['75-84', '85+'], state=['CA', 'NY'])
+        """
+        deaths = self.deaths
+        values = [self.members[dimension] for dimension in self.dimensions]
+        for dimension, selection in members.items():
+            axis = self._axis(dimension)
+            ordinals = self._select(dimension, selection)
+            deaths = deaths.take(ordinals, axis=axis)
+            values[axis] = [values[axis][index] for index in ordinals]
+        return self._from_array(self.dimensions, values, deaths)
+
+    def slice(self, **members):
+        """Return the cube of single members, without their dimensions.
+
+        Parameters:
+            members: one member by dimension, e.g.: sex='F', year=2014
+
+        Raises a KeyError exception for unknown members.
+        """
+        deaths = self.deaths
+        dimensions = list(self.dimensions)
+        for dimension, member in members.items():
+            self._axis(dimension)
+            axis = dimensions.index(dimension)
+            deaths = deaths.take(self.ordinals[dimension][member], axis=axis)
+            del dimensions[axis]
+        return self._from_array(
+            dimensions, [self.members[dimension] for dimension in dimensions],
+            deaths)
+
+    def rollup(self, *dimensions):
+        """Return the cube of some dimensions, summed over all others.
+
+        Parameters:
+            dimensions (strings): the dimensions to keep, e.g.: 'state', 'year'
+        """
+        axes = tuple(sorted(self._axis(dimension) for dimension in dimensions))
+        kept = [self.dimensions[axis] for axis in axes]
+        return self._from_array(
+            kept, [self.members[dimension] for dimension in kept],
+            self._rollup(axes))
+
+
+###############################################################################
+# TEST functions
+
+RECORDS = [('I25.1', '65-74', 'F', 'CA', 2013, 10),
+           ('I25.1', '85+', 'F', 'CA', 2014, 20),
+           ('I25.1', '85+', 'M', 'NY', 2014, 5),
+           ('I50.0', '85+', 'F', 'NY', 2014, 7),
+           ('C34.9', '45-54', 'M', 'CA', 2014, 3),
+           ('I50.0', '85+', 'F', 'NY', 2014, 1)]
+
+
+def test_mortality_cube():
+    """Test MortalityCube slice, dice and roll-up queries"""
+    if np is None:
+        # optional dependency, nothing to test
+        return
+    cube = MortalityCube(RECORDS)
+    assert cube.deaths.shape == (3, 3, 2, 2, 2)
+    assert cube.members['age'] == ['45-54', '65-74', '85+']
+    assert cube.total() == 46
+    assert cube.total(code='I25.1', state='CA') == 30
+    assert cube.total(code=['I25.1', 'I50.0', 'K00'], sex='F') == 38
+    assert cube.total(age=lambda x: x >= '65', year=2014) == 33
+    assert cube.total(state='TX') == 0
+    assert cube.breakdown('state') == [['CA', 33], ['NY', 13]]
+    assert cube.breakdown('state', code=['I25.1', 'I50.0'], sex='F',
+                          age=['65-74', '85+']) == [['CA', 30], ['NY', 8]]
+    assert cube.breakdown('year', year=[2014]) == [[2014, 36]]
+    assert cube.breakdown('sex', state='NY') == [['F', 8], ['M', 5]]
+    diced = cube.dice(code=['I25.1'], state=['NY', 'CA'])
+    assert diced.members['state'] == ['CA', 'NY']
+    assert diced.breakdown('age') == [['45-54', 0], ['65-74', 10],
+                                      ['85+', 25]]
+    sliced = cube.slice(sex='F', year=2014)
+    assert sliced.dimensions == ('code', 'age', 'state')
+    assert sliced.breakdown('code') == [['C34.9', 0], ['I25.1', 20],
+                                        ['I50.0', 8]]
+    rolled = cube.rollup('year', 'sex')
+    assert rolled.dimensions == ('sex', 'year')
+    assert rolled.deaths.tolist() == [[10, 28], [0, 8]]
+    assert rolled.total(sex='M') == 8
+    try:
+        cube.total(county='Kings')
+    except ValueError:
+        pass
+    else:
+        assert False, 'unknown dimension accepted'
+    assert MortalityCube().total() == 0
+
+
+def test_mortality_cube_loops():
+    """Test MortalityCube breakdowns against Python loops"""
+    if np is None:
+        # optional dependency, nothing to test
+        return
+    import random
+    from cdc import db
+    generator = random.Random(20)
+    ages = ['<1', '1-24', '25-44', '45-64', '65-74', '75-84', '85+']
+    states = ['CA', 'FL', 'NY', 'TX']
+    records = [(code, generator.choice(ages), generator.choice('FM'),
+                generator.choice(states), generator.choice([2013, 2014]),
+                deaths) for code, deaths in db[::20]]
+    cube = MortalityCube(records)
+    old = ['65-74', '75-84', '85+']
+    expected = {}
+    for code, age, sex, state, year, deaths in records:
+        if code.startswith('I') and sex == 'F' and age in old:
+            expected[state] = expected.get(state, 0) + deaths
+    assert expected
+    assert cube.breakdown(
+        'state', code=lambda x: x.startswith('I'), sex='F', age=old) == [
+        [state, expected.get(state, 0)] for state in states]
+    assert cube.total() == sum(row[-1] for row in records)
+    assert cube.rollup('code').breakdown('code') == cube.breakdown('code')
+
+
+if __name__ == '__main__':
+    import sys
+    import traceback
+
+    for test in (test_mortality_cube,
+                 test_mortality_cube_loops):
+        try:
+            print(test.__doc__, '... ', end='', flush=True)
+            test()
+            print('PASSED')
+        except:
+            print('FAILED')
+            exc_info = sys.exc_info()
+            traceback.print_exception(*exc_info)
@@ -0,0 +1,244 @@
+"""Compact storage of ICD-10 category names
+
+The category names repeat a lot: many end with the same suffix, e.g.
+' - Malignant neoplasms', and words like 'unspecified' appear in hundreds
+of them. The DescriptionStore keeps every distinct suffix and every distinct
+word (token) only once, in a shared UTF-8 blob with an offset array, and a
+name becomes its suffix number plus a run of token numbers in one array.
+
+Substring search works on the compact form: a query can only match names
+which contain one of the tokens (or the suffix) matching its longest word,
+so those are found in the small token blob first and then verified.
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+
+# separator of the suffix, e.g. 'Pituitary gland - Benign neoplasms'
+SUFFIX_SEPARATOR = ' - '
+
+
+def _typecode(size):
+    """Return the smallest unsigned array typecode for numbers below size"""
+    return 'H' if size <= 1 << 16 else 'I'
+
+
+def _postings(lists, size):
+    """Flatten lists of name numbers into one array with start offsets"""
+    flat = array(_typecode(size))
+    starts = array('I', [0])
+    for numbers in lists:
+        flat.extend(numbers)
+        starts.append(len(flat))
+    return flat, starts
+
+
+class StringTable:
+    """Distinct strings stored in one blob with offsets"""
+
+    def __init__(self, strings):
+        """Store the strings in the order given
+
+        Parameters:
+            strings (iterable of strings), e.g.: ['heart', 'failure']
+        """
+        self.blob, self.offsets = self._pack(strings)
+        self.lower_blob, self.lower_offsets = self._pack(
+            string.lower() for string in self)
+
+    @staticmethod
+    def _pack(strings):
+        """Return the UTF-8 blob and offset array of the strings"""
+        blob = bytearray()
+        offsets = array('I', [0])
+        for string in strings:
+            blob += string.encode('utf-8')
+            offsets.append(len(blob))
+        return bytes(blob), offsets
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if not 0 <= index < len(self):
+            raise IndexError('string index out of range')
+        return self.blob[self.offsets[index]:
+                         self.offsets[index + 1]].decode('utf-8')
+
+    def find(self, text):
+        """Return the numbers of the strings containing the lowercased text"""
+        needle = text.encode('utf-8')
+        found = set()
+        start = self.lower_blob.find(needle)
+        while start >= 0:
+            index = bisect_right(self.lower_offsets, start) - 1
+            end = self.lower_offsets[index + 1]
+            if start + len(needle) <= end:
+                found.add(index)
+                start = self.lower_blob.find(needle, end)
+            else:
+                start = self.lower_blob.find(needle, start + 1)
+        return found
+
+
+class DescriptionStore:
+    """Dictionary encoded, read-only code -> name mapping"""
+
+    def __init__(self, names):
+        """Encode the names of a code -> name mapping
+
+        Parameters:
+            names (dict), e.g.: {'D35.2': 'Pituitary gland - Benign neoplasms'}
+        """
+        tokens = {}
+        suffixes = {'': 0}
+        self.codes = sorted(names)
+        sequence = []
+        self.starts = array('I', [0])
+        suffix_ids = []
+        for code in self.codes:
+            head, separator, suffix = names[code].rpartition(SUFFIX_SEPARATOR)
+            if not separator:
+                head = suffix
+            suffix = separator + suffix if separator else ''
+            for token in head.split(' '):
+                sequence.append(tokens.setdefault(token, len(tokens)))
+            self.starts.append(len(sequence))
+            suffix_ids.append(suffixes.setdefault(suffix, len(suffixes)))
+        self.sequence = array(_typecode(len(tokens)), sequence)
+        self.suffix_ids = array(_typecode(len(suffixes)), suffix_ids)
+        self.tokens = StringTable(tokens)
+        self.suffixes = StringTable(suffixes)
+        token_lists = [[] for token in tokens]
+        suffix_lists = [[] for suffix in suffixes]
+        for index in range(len(self.codes)):
+            for token in set(sequence[self.starts[index]:
+                                      self.starts[index + 1]]):
+                token_lists[token].append(index)
+            suffix_lists[suffix_ids[index]].append(index)
+        self.token_postings = _postings(token_lists, len(self.codes))
+        self.suffix_postings = _postings(suffix_lists, len(self.codes))
+
+    def _index(self, code):
+        """Return the position of code, or None"""
+        index = bisect_left(self.codes, code)
+        if index < len(self.codes) and self.codes[index] == code:
+            return index
+        return None
+
+    def _name(self, index):
+        """Decode the name at a position"""
+        head = ' '.join(self.tokens[token] for token in
+                        self.sequence[self.starts[index]:
+                                      self.starts[index + 1]])
+        return head + self.suffixes[self.suffix_ids[index]]
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __iter__(self):
+        return iter(self.codes)
+
+    def __contains__(self, code):
+        return self._index(code) is not None
+
+    def __getitem__(self, code):
+        index = self._index(code)
+        if index is None:
+            raise KeyError(code)
+        return self._name(index)
+
+    def get(self, code, default=None):
+        """Return the name of code, or default if not found"""
+        index = self._index(code)
+        return default if index is None else self._name(index)
+
+    def items(self):
+        """Iterate over the (code, name) pairs"""
+        for index, code in enumerate(self.codes):
+            yield code, self._name(index)
+
+    def search(self, query):
+        """Return the codes whose name contains the query string.
+
+        Parameters:
+            query: (string) search string, matched case insensitive
+
+        Returns a list of codes, e.g. ['I25.1', 'I50.0']
+        """
+        text = query.lower()
+        words = [word for word in text.split(' ') if word]
+        if not words:
+            candidates = range(len(self.codes))
+        else:
+            word = max(words, key=len)
+            candidates = set()
+            for table, (postings, starts) in (
+                    (self.tokens, self.token_postings),
+                    (self.suffixes, self.suffix_postings)):
+                for number in table.find(word):
+                    candidates.update(
+                        postings[starts[number]:starts[number + 1]])
+            candidates = sorted(candidates)
+        return [self.codes[index] for index in candidates
+                if text in self._name(index).lower()]
+
+
+###############################################################################
+# TEST functions
+
+def test_description_store():
+    """Test DescriptionStore encoding and lookups"""
+    names = {'D35.2': 'Pituitary gland - Benign neoplasms',
+             'C71.9': 'Brain, unspecified - Malignant neoplasms',
+             'C34.9': 'Bronchus or lung, unspecified - Malignant neoplasms',
+             'I50.0': 'Congestive heart failure',
+             'X1': '  double  spaces ',
+             'X2': ''}
+    store = DescriptionStore(names)
+    assert len(store) == 6
+    assert dict(store.items()) == names
+    assert store['I50.0'] == 'Congestive heart failure'
+    assert store.get('K00') is None
+    assert 'C71.9' in store and 'K00' not in store
+    assert len(store.suffixes) == 3
+    assert {store.tokens[index]
+            for index in store.tokens.find('spec')} == {'unspecified'}
+    assert {store.suffixes[index]
+            for index in store.suffixes.find('neo')} == {
+        ' - Benign neoplasms', ' - Malignant neoplasms'}
+    assert store.tokens.find('ain, un') == set()
+    try:
+        store['K00']
+    except KeyError:
+        pass
+    else:
+        assert False, 'missing code found'
+
+
+def test_description_search():
+    """Test DescriptionStore.search() against a plain scan of the CDC names"""
+    from cdc import code_names
+    store = DescriptionStore(code_names)
+    assert dict(store.items()) == code_names
+    for query in ('heart', 'LUNG', 'diabetes', 'broccoli', 'heart failure',
+                  ' - malignant', 'neoplasms', 'y, un', ' ', '', 'a',
+                  'unspecified - b', 's -', '-'):
+        assert sorted(store.search(query)) == sorted(
+            code for code, name in code_names.items()
+            if query.lower() in name.lower()), query
+
+
+if __name__ == '__main__':
+    import sys
+    import traceback
+
+    for test in (test_description_store,
+                 test_description_search):
+        try:
+            print(test.__doc__, '... ', end='', flush=True)
+            test()
+            print('PASSED')
+        except:
+            print('FAILED')
+            exc_info = sys.exc_info()
+            traceback.print_exception(*exc_info)
@@ -0,0 +1,220 @@
+"""Distribution of the deaths over the ICD-10 codes
+
+A few codes account for most deaths. The DeathDistribution answers how
+skewed the counts are: quantiles of the deaths per code, histograms, the
+share of all deaths of the deadliest codes and the Lorenz curve. It keeps
+the deaths per code sorted, and their prefix sums, so every answer is an
+index or a binary search into those plus a subtraction, O(log n) per
+quantile, share or histogram bin after the one-time build.
+"""
+import numbers
+from bisect import bisect_left, bisect_right
+
+
+class DeathDistribution:
+    """Sorted deaths per code with prefix sums"""
+
+    def __init__(self, deaths, presorted=False):
+        """Sort the deaths and build the prefix sums
+
+        Parameters:
+            deaths (iterable of ints): the number of deaths of every code,
+                e.g.: [50, 3, 1660]
+            presorted (bool): the deaths are in ascending order already,
+                e.g. a store's ranked_deaths
+        """
+        self.deaths = list(deaths) if presorted else sorted(deaths)
+        self.cumulative = [0]
+        for count in self.deaths:
+            self.cumulative.append(self.cumulative[-1] + count)
+        self.total = self.cumulative[-1]
+
+    def __len__(self):
+        """Get the number of codes"""
+        return len(self.deaths)
+
+    def quantile(self, q):
+        """Return a quantile of the number of deaths per code.
+
+        Parameters:
+            q (float): the quantile, between 0 and 1, e.g.: 0.9
+
+        Returns a float, interpolated linearly between the two nearest
+        counts (like numpy.quantile), e.g. quantile(0.5) is the median.
+        Returns None if there are no codes, raises a ValueError exception
+        for q outside of [0, 1].
+        """
+        if not 0 <= q <= 1:
+            raise ValueError('quantile not between 0 and 1: {}'.format(q))
+        if not self.deaths:
+            return None
+        position = q * (len(self.deaths) - 1)
+        index = int(position)
+        if index + 1 >= len(self.deaths):
+            return float(self.deaths[-1])
+        low = self.deaths[index]
+        return low + (self.deaths[index + 1] - low) * (position - index)
+
+    def histogram(self, bins):
+        """Return the number of codes and deaths in ranges of deaths per code.
+
+        Parameters:
+            bins: the ascending bin edges, e.g.: [0, 10, 100, 1000], or the
+                number of equal width bins from the least to the most deaths
+
+        Returns a list of [low, high, number_of_codes, number_of_deaths] for
+        each bin of codes with low <= deaths < high, the last bin including
+        high (like numpy.histogram), e.g. [[0, 10, 1720, 5113], ...]
+        Raises a ValueError exception for edges not in ascending order.
+        """
+        if isinstance(bins, numbers.Integral):
+            if bins <= 0:
+                raise ValueError('number of bins must be positive')
+            low = self.deaths[0] if self.deaths else 0
+            high = self.deaths[-1] if self.deaths else 1
+            if low == high:
+                low, high = low - 0.5, high + 0.5
+            edges = [low + (high - low) * i / bins for i in range(bins)]
+            edges.append(high)
+        else:
+            edges = list(bins)
+            if any(a > b for a, b in zip(edges, edges[1:])):
+                raise ValueError('bin edges not in ascending order')
+        result = []
+        for index in range(len(edges) - 1):
+            low, high = edges[index], edges[index + 1]
+            begin = bisect_left(self.deaths, low)
+            if index == len(edges) - 2:
+                end = bisect_right(self.deaths, high)
+            else:
+                end = bisect_left(self.deaths, high)
+            end = max(begin, end)
+            result.append([low, high, end - begin,
+                           self.cumulative[end] - self.cumulative[begin]])
+        return result
+
+    def cumulative_share(self, k):
+        """Return the share of all deaths of the k deadliest codes.
+
+        Parameters:
+            k (int): the number of codes, e.g. len(store) // 100 for the
+                deadliest 1%
+
+        Returns a float between 0 and 1, 0.0 if there are no deaths.
+        """
+        if self.total == 0 or k <= 0:
+            return 0.0
+        begin = max(0, len(self.deaths) - k)
+        return (self.total - self.cumulative[begin]) / self.total
+
+    def lorenz_curve(self, points=None):
+        """Return the Lorenz curve of the deaths over the codes.
+
+        Parameters:
+            points (int): the number of equal steps of the share of codes,
+                one step per code by default
+
+        Returns a list of [share_of_codes, share_of_deaths] pairs from
+        [0.0, 0.0] to [1.0, 1.0]: the share of all deaths of the given share
+        of the least deadly codes, e.g. [[0.0, 0.0], [0.5, 0.0025], ...]
+        Raises a ValueError exception for less than one step.
+        """
+        if points is not None and points < 1:
+            raise ValueError('number of points must be positive')
+        count = len(self.deaths)
+        if count == 0 or self.total == 0:
+            return [[0.0, 0.0], [1.0, 1.0]]
+        if points is None:
+            points = count
+        curve = []
+        for step in range(points + 1):
+            index = count * step // points
+            curve.append([step / points, self.cumulative[index] / self.total])
+        return curve
+
+
+###############################################################################
+# TEST functions
+
+def test_death_distribution():
+    """Test DeathDistribution quantiles, histogram, shares and Lorenz curve"""
+    distribution = DeathDistribution([5, 1, 100, 10, 4])
+    assert distribution.deaths == [1, 4, 5, 10, 100]
+    assert distribution.quantile(0) == 1
+    assert distribution.quantile(0.5) == 5
+    assert distribution.quantile(0.9) == 64.0
+    assert distribution.quantile(1) == 100
+    assert distribution.histogram([0, 5, 10, 100]) == [
+        [0, 5, 2, 5], [5, 10, 1, 5], [10, 100, 2, 110]]
+    try:
+        distribution.histogram([50, 20])
+    except ValueError:
+        pass
+    else:
+        assert False, 'descending edges accepted'
+    assert [count for low, high, count, deaths in
+            distribution.histogram(3)] == [4, 0, 1]
+    assert distribution.cumulative_share(1) == 100 / 120
+    assert distribution.cumulative_share(9) == 1.0
+    assert distribution.cumulative_share(0) == 0.0
+    assert distribution.lorenz_curve() == [
+        [0.0, 0.0], [0.2, 1 / 120], [0.4, 5 / 120], [0.6, 10 / 120],
+        [0.8, 20 / 120], [1.0, 1.0]]
+    assert distribution.lorenz_curve(2) == [[0.0, 0.0], [0.5, 5 / 120],
+                                            [1.0, 1.0]]
+    try:
+        distribution.lorenz_curve(0)
+    except ValueError:
+        pass
+    else:
+        assert False, 'no points accepted'
+    empty = DeathDistribution([])
+    assert empty.quantile(0.5) is None
+    assert empty.cumulative_share(3) == 0.0
+    assert empty.histogram(2) == [[0, 0.5, 0, 0], [0.5, 1, 0, 0]]
+    try:
+        distribution.quantile(1.5)
+    except ValueError:
+        pass
+    else:
+        assert False, 'quantile above 1 accepted'
+
+
+def test_death_distribution_cdc():
+    """Test DeathDistribution against NumPy on the CDC data"""
+    from cdc import db
+    from columnar import np
+    deaths = [count for code, count in db]
+    distribution = DeathDistribution(deaths)
+    top = sorted(deaths, reverse=True)
+    for k in (1, 10, len(deaths) // 100, len(deaths)):
+        assert abs(distribution.cumulative_share(k) -
+                   sum(top[:k]) / sum(deaths)) < 1e-12
+    if np is None:
+        # optional dependency, nothing more to test
+        return
+    for q in (0, 0.1, 0.25, 0.5, 0.9, 0.99, 1):
+        assert abs(distribution.quantile(q) - np.quantile(deaths, q)) < 1e-9
+    for bins in (10, [0, 1, 10, 100, 1000, 10 ** 6]):
+        counts, edges = np.histogram(deaths, bins)
+        assert [count for low, high, count, total in
+                distribution.histogram(bins)] == counts.tolist()
+    assert sum(total for low, high, count, total in
+               distribution.histogram(7)) == sum(deaths)
+    assert distribution.histogram(np.int64(10)) == distribution.histogram(10)
+
+
+if __name__ == '__main__':
+    import sys
+    import traceback
+
+    for test in (test_death_distribution,
+                 test_death_distribution_cdc):
+        try:
+            print(test.__doc__, '... ', end='', flush=True)
+            test()
+            print('PASSED')
+        except:
+            print('FAILED')
+            exc_info = sys.exc_info()
+            traceback.print_exception(*exc_info)
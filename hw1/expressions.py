@@ -0,0 +1,502 @@
+"""Composable mortality queries
+
+Combining conditions by hand, e.g. the codes of chapter 9 with 'heart' in
+their name and over 100 deaths, means calling several store methods and
+intersecting their results. A query expression states the conditions
+instead, and is evaluated in one go:
+
+    expression = Q.chapter(9) & Q.text('heart') & Q.deaths_gt(100)
+    expression.select(store)    # [['I25.1', 161745], ['I50.0', 60394], ...]
+    expression.sum(store)       # 300546
+
+The planner estimates the number of codes each condition of a conjunction
+selects from the store's indexes (a binary search for code ranges and death
+thresholds, the shortest trigram posting list for text), and lists the
+codes of the most selective one first. Each further condition is either
+listed too and intersected with the codes left, or, if that would cost
+more, tested against every code left, e.g. a code range is a comparison,
+but a text test lowercases a whole name.
+
+The expressions work with any store, the indexes of MortalityStore are
+used for the estimates and lists when present.
+"""
+import math
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+
+from icd import CHAPTERS, PREFIX_END, block_of
+
+
+class Query(ABC):
+    """Condition on the ICD-10 codes of a store"""
+
+    # the cost of test() relative to listing one code
+    test_cost = 1
+
+    def __and__(self, other):
+        return And(self, other)
+
+    def __or__(self, other):
+        return Or(self, other)
+
+    def __invert__(self):
+        return Not(self)
+
+    @abstractmethod
+    def estimate(self, store):
+        """Return the (estimated) number of codes matching in store"""
+
+    @abstractmethod
+    def evaluate(self, store):
+        """Return the set of codes of store matching the condition"""
+
+    @abstractmethod
+    def test(self, store, code):
+        """Test if a code of store matches the condition"""
+
+    def select(self, store):
+        """Return the matching codes with their number of deaths.
+
+        Parameters:
+            store: the store to query, e.g. a MortalityStore
+
+        Returns a list of [code, number_of_deaths] pairs in descending order
+        of deaths, e.g. [['I25.1', 161745], ['I50.0', 60394]]
+        """
+        pairs = [[code, store.deaths_by_code(code)]
+                 for code in self.evaluate(store)]
+        pairs.sort(key=lambda x: (x[1], x[0]), reverse=True)
+        return pairs
+
+    def codes(self, store):
+        """Return the matching codes in descending order of deaths"""
+        return [code for code, deaths in self.select(store)]
+
+    def count(self, store):
+        """Return the number of matching codes"""
+        return len(self.evaluate(store))
+
+    def sum(self, store):
+        """Return the aggregated number of deaths of the matching codes"""
+        return sum(store.deaths_by_code(code)
+                   for code in self.evaluate(store))
+
+    def explain(self, store):
+        """Return the evaluation plan, one line per step, e.g.:
+
+        ["list text('heart') ~73", 'filter chapter(9) ~285']
+        """
+        return ['list {} ~{}'.format(self, self.estimate(store))]
+
+
+class CodeRange(Query):
+    """Codes from a first code up to every code starting with a last one"""
+
+    def __init__(self, label, first, last):
+        """Parameters:
+            label (string): the name in plans, e.g.: 'chapter(9)'
+            first (string): the first code, e.g.: 'I00'
+            last (string): the last code prefix, e.g.: 'I99'
+        """
+        self.label = label
+        self.first = first
+        self.last = last + PREFIX_END
+
+    def __repr__(self):
+        return self.label
+
+    def _span(self, store):
+        """Return the slice of store.ordered_codes in the range"""
+        begin = bisect_left(store.ordered_codes, self.first)
+        return begin, max(begin, bisect_right(store.ordered_codes, self.last))
+
+    def estimate(self, store):
+        if self.first > self.last:
+            return 0
+        if hasattr(store, 'ordered_codes'):
+            begin, end = self._span(store)
+            return end - begin
+        return len(store)
+
+    def evaluate(self, store):
+        if self.first > self.last:
+            return set()
+        if hasattr(store, 'ordered_codes'):
+            begin, end = self._span(store)
+            return set(store.ordered_codes[begin:end])
+        return {code for code, deaths in store if self.test(store, code)}
+
+    def test(self, store, code):
+        return self.first <= code <= self.last
+
+
+class Text(Query):
+    """Codes whose category name contains a string"""
+
+    test_cost = 10
+
+    def __init__(self, query):
+        """Parameters:
+            query (string): matched case insensitive, e.g.: 'heart'
+        """
+        self.query = query
+
+    def __repr__(self):
+        return 'text({!r})'.format(self.query)
+
+    @staticmethod
+    def _index(store):
+        """Return the text index of store"""
+        index = getattr(store, 'text_index', None)
+        return index if index is not None else store.search_index
+
+    def estimate(self, store):
+        postings = getattr(self._index(store), 'postings', None)
+        text = self.query.lower()
+        if postings is None or len(text) < 3:
+            return len(store)
+        return min(len(postings.get(text[i:i + 3], ()))
+                   for i in range(len(text) - 2))
+
+    def evaluate(self, store):
+        return {code for code in self._index(store).search(self.query)
+                if code in store}
+
+    def test(self, store, code):
+        return self.query.lower() in store.names.get(code, '').lower()
+
+
+class Deaths(Query):
+    """Codes with low <= deaths < high"""
+
+    def __init__(self, label, low=None, high=None):
+        """Parameters:
+            label (string): the name in plans, e.g.: 'deaths_gt(100)'
+            low (number): the minimum number of deaths, no minimum if None
+            high (number): the number of deaths above the maximum, no
+                maximum if None
+        """
+        self.label = label
+        self.low = low
+        self.high = high
+
+    def __repr__(self):
+        return self.label
+
+    def estimate(self, store):
+        ranked = getattr(store, 'ranked_deaths', None)
+        if ranked is None:
+            return len(store)
+        begin = 0 if self.low is None else bisect_left(ranked, self.low)
+        end = len(ranked) if self.high is None else bisect_left(ranked,
+                                                                self.high)
+        return max(0, end - begin)
+
+    def evaluate(self, store):
+        if self.low is None and self.high is None:
+            return {code for code, deaths in store}
+        if self.high is None:
+            return set(store.codes_above(self.low))
+        if self.low is None:
+            return set(store.codes_below(self.high))
+        return set(store.codes_between(self.low, self.high))
+
+    def test(self, store, code):
+        deaths = store.deaths_by_code(code)
+        return ((self.low is None or deaths >= self.low) and
+                (self.high is None or deaths < self.high))
+
+
+class Codes(Query):
+    """Codes of a given list"""
+
+    def __init__(self, codes):
+        self.members = frozenset(codes)
+
+    def __repr__(self):
+        return 'codes({})'.format(len(self.members))
+
+    def estimate(self, store):
+        return sum(1 for code in self.members if code in store)
+
+    def evaluate(self, store):
+        return {code for code in self.members if code in store}
+
+    def test(self, store, code):
+        return code in self.members
+
+
+class And(Query):
+    """Codes matching all of several conditions"""
+
+    def __init__(self, *terms):
+        self.terms = []
+        for term in terms:
+            self.terms.extend(term.terms if isinstance(term, And) else [term])
+
+    def __repr__(self):
+        return '({})'.format(' & '.join(map(repr, self.terms)))
+
+    @property
+    def test_cost(self):
+        return sum(term.test_cost for term in self.terms)
+
+    def estimate(self, store):
+        return min(term.estimate(store) for term in self.terms)
+
+    def plan(self, store):
+        """Return the terms ordered by estimate, with how to apply them
+
+        The first term is listed. Every further term is listed and
+        intersected if that is estimated to be cheaper than testing the
+        codes left, otherwise it filters the codes left.
+
+        Returns a list of (term, estimate, step) tuples, where step is
+        'list', 'intersect' or 'filter'.
+        """
+        estimates = sorted(((term.estimate(store), index, term)
+                            for index, term in enumerate(self.terms)),
+                           key=lambda x: x[:2])
+        steps = []
+        left = None
+        for estimate, index, term in estimates:
+            if left is None:
+                step = 'list'
+                left = estimate
+            elif estimate + left < left * term.test_cost:
+                step = 'intersect'
+            else:
+                step = 'filter'
+            left = min(left, estimate)
+            steps.append((term, estimate, step))
+        return steps
+
+    def evaluate(self, store):
+        codes = None
+        for term, estimate, step in self.plan(store):
+            if step == 'list':
+                codes = term.evaluate(store)
+            elif step == 'intersect':
+                codes &= term.evaluate(store)
+            else:
+                codes = {code for code in codes if term.test(store, code)}
+            if not codes:
+                break
+        return codes
+
+    def test(self, store, code):
+        return all(term.test(store, code) for term in self.terms)
+
+    def explain(self, store):
+        return ['{} {} ~{}'.format(step, term, estimate)
+                for term, estimate, step in self.plan(store)]
+
+
+class Or(Query):
+    """Codes matching any of several conditions"""
+
+    def __init__(self, *terms):
+        self.terms = []
+        for term in terms:
+            self.terms.extend(term.terms if isinstance(term, Or) else [term])
+
+    def __repr__(self):
+        return '({})'.format(' | '.join(map(repr, self.terms)))
+
+    @property
+    def test_cost(self):
+        return sum(term.test_cost for term in self.terms)
+
+    def estimate(self, store):
+        return min(len(store), sum(term.estimate(store)
+                                   for term in self.terms))
+
+    def evaluate(self, store):
+        return set().union(*(term.evaluate(store) for term in self.terms))
+
+    def test(self, store, code):
+        return any(term.test(store, code) for term in self.terms)
+
+
+class Not(Query):
+    """Codes not matching a condition"""
+
+    def __init__(self, term):
+        self.term = term
+
+    def __repr__(self):
+        return '~{}'.format(self.term)
+
+    @property
+    def test_cost(self):
+        return self.term.test_cost
+
+    def estimate(self, store):
+        return max(0, len(store) - self.term.estimate(store))
+
+    def evaluate(self, store):
+        excluded = self.term.evaluate(store)
+        return {code for code, deaths in store if code not in excluded}
+
+    def test(self, store, code):
+        return not self.term.test(store, code)
+
+
+class Q:
+    """Constructors of query expressions, e.g.: Q.chapter(9) & Q.text('heart')"""
+
+    @staticmethod
+    def chapter(chapter):
+        """Codes of an ICD-10 chapter, e.g.: Q.chapter(9)"""
+        first, last = CHAPTERS.get(chapter, ('1', '0'))
+        return CodeRange('chapter({})'.format(chapter), first, last)
+
+    @staticmethod
+    def block(block):
+        """Codes of an ICD-10 block, e.g.: Q.block('I20-I25')"""
+        first, separator, last = block.partition('-')
+        if block_of(first) != block:
+            first, last = '1', '0'
+        return CodeRange('block({!r})'.format(block), first, last)
+
+    @staticmethod
+    def prefix(prefix):
+        """Codes starting with prefix, e.g.: Q.prefix('I25')"""
+        return CodeRange('prefix({!r})'.format(prefix), prefix, prefix)
+
+    @staticmethod
+    def code_range(first, last):
+        """Codes from first up to every code starting with last"""
+        return CodeRange('code_range({!r}, {!r})'.format(first, last),
+                         first, last)
+
+    @staticmethod
+    def text(query):
+        """Codes whose name contains query, e.g.: Q.text('heart')"""
+        return Text(query)
+
+    @staticmethod
+    def codes(codes):
+        """Codes of a list, e.g.: Q.codes(['I25.1', 'I21.9'])"""
+        return Codes(codes)
+
+    @staticmethod
+    def deaths_gt(deaths):
+        """Codes with more than the number of deaths"""
+        return Deaths('deaths_gt({})'.format(deaths),
+                      low=math.floor(deaths) + 1)
+
+    @staticmethod
+    def deaths_ge(deaths):
+        """Codes with at least the number of deaths"""
+        return Deaths('deaths_ge({})'.format(deaths), low=deaths)
+
+    @staticmethod
+    def deaths_lt(deaths):
+        """Codes with less than the number of deaths"""
+        return Deaths('deaths_lt({})'.format(deaths), high=deaths)
+
+    @staticmethod
+    def deaths_le(deaths):
+        """Codes with at most the number of deaths"""
+        return Deaths('deaths_le({})'.format(deaths),
+                      high=math.floor(deaths) + 1)
+
+    @staticmethod
+    def deaths_between(low, high):
+        """Codes with low <= deaths < high, like codes_between"""
+        return Deaths('deaths_between({}, {})'.format(low, high), low, high)
+
+
+###############################################################################
+# TEST functions
+
+def test_query_expressions():
+    """Test query expressions on a small store"""
+    from mortality import MortalityStore
+    store = MortalityStore([['I25.1', 50], ['I21.9', 40], ['I50.0', 5],
+                            ['J18.9', 70], ['C34.9', 60], ['I10', 1]],
+                           {'I25.1': 'Atherosclerotic heart disease',
+                            'I21.9': 'Acute myocardial infarction',
+                            'I50.0': 'Congestive heart failure',
+                            'J18.9': 'Pneumonia, unspecified'})
+    expression = Q.chapter(9) & Q.text('heart') & Q.deaths_gt(10)
+    assert expression.select(store) == [['I25.1', 50]]
+    assert expression.codes(store) == ['I25.1']
+    assert expression.count(store) == 1
+    assert expression.sum(store) == 50
+    assert (Q.chapter(9) & Q.text('HEART')).sum(store) == 55
+    assert (Q.text('heart') | Q.prefix('C')).codes(store) == [
+        'C34.9', 'I25.1', 'I50.0']
+    assert (Q.chapter(9) & ~Q.text('heart')).codes(store) == ['I21.9', 'I10']
+    assert (~Q.chapter(9)).codes(store) == ['J18.9', 'C34.9']
+    assert Q.block('I20-I25').sum(store) == 90
+    assert Q.block('I25').sum(store) == 0
+    assert Q.chapter(99).sum(store) == 0
+    assert Q.deaths_le(5).codes(store) == ['I50.0', 'I10']
+    assert Q.deaths_between(5, 50).codes(store) == ['I21.9', 'I50.0']
+    assert (Q.deaths_ge(50) & Q.deaths_lt(70)).codes(store) == [
+        'C34.9', 'I25.1']
+    assert (Q.codes(['I10', 'K00']) | Q.text('pneumonia')).sum(store) == 71
+    assert (Q.chapter(9) & Q.text('broccoli')).count(store) == 0
+    assert (Q.code_range('I21', 'I50') & Q.deaths_gt(1)).sum(store) == 95
+    assert Q.chapter(9).select(store) == (Q.chapter(9) & Q.chapter(9)).select(
+        store)
+    assert Q.codes(['I10', 'K00', 'X1']).estimate(store) == 1
+    missing = ~Q.codes(['X1', 'X2', 'X3'])
+    assert missing.estimate(MortalityStore([['A00', 1]])) == 1
+
+
+def test_query_planner():
+    """Test the query planner against plain evaluation on the CDC data"""
+    import cdc
+    from cdc import db
+    from columnar import ColumnarStore, np
+    from mortality import MortalityStore
+    from packed import PackedStore
+    store = MortalityStore(db, cdc.code_names)
+    expression = Q.chapter(9) & Q.text('heart') & Q.deaths_gt(100)
+    assert [str(term) for term, estimate, step in expression.plan(store)] == [
+        "text('heart')", 'chapter(9)', 'deaths_gt(100)']
+    assert [step for term, estimate, step in expression.plan(store)] == [
+        'list', 'filter', 'filter']
+    assert [step for term, estimate, step in
+            (Q.text('unspecified') & Q.chapter(9)).plan(store)] == [
+        'list', 'intersect']
+    assert (Q.text('unspecified') & Q.chapter(9)).explain(store)[0] == (
+        'list chapter(9) ~{}'.format(len(store.chapter_codes[9])))
+    expected = sorted(
+        [code, deaths] for code, deaths in db
+        if 'I00' <= code[:3] <= 'I99' and deaths > 100 and
+        'heart' in cdc.code_names.get(code, '').lower())
+    assert sorted(expression.select(store)) == expected
+    assert expression.sum(store) == sum(deaths for code, deaths in expected)
+    backends = [PackedStore(db, cdc.code_names)]
+    if np is not None:
+        backends.append(ColumnarStore(db, cdc.code_names))
+    for backend in backends:
+        assert sorted(expression.select(backend)) == expected
+    for expression in (Q.text('neoplasm') & ~Q.deaths_lt(1000),
+                       Q.block('I20-I25') | Q.prefix('C34'),
+                       Q.chapter(2) & Q.text('lung') & Q.deaths_le(10),
+                       Q.chapter(9) & Q.text('unspecified')):
+        assert expression.select(store) == sorted(
+            ([code, deaths] for code, deaths in db
+             if expression.test(store, code)),
+            key=lambda x: (x[1], x[0]), reverse=True)
+
+
+if __name__ == '__main__':
+    import sys
+    import traceback
+
+    for test in (test_query_expressions,
+                 test_query_planner):
+        try:
+            print(test.__doc__, '... ', end='', flush=True)
+            test()
+            print('PASSED')
+        except:
+            print('FAILED')
+            exc_info = sys.exc_info()
+            traceback.print_exception(*exc_info)
@@ -8,7 +8,43 @@ Email: adam.gross@vannderbilt.edu
 
 Honor Statement: I have neither given nor received unauthorized aid on this assignment.
 """
-from cdc import db, code_names
+import cdc
+from cache import ResultCache
+from cdc import db
+from expressions import Q
+from mortality import MortalityStore
+
+# the category names are only loaded by the first text query
+store = MortalityStore(db, lambda: cdc.code_names)
+# answers of the repeated text, threshold and chapter queries
+cache = ResultCache(maxsize=1024)
+# the store attributes the query functions of this module use
+STORE_METHODS = ('deaths_by_code', 'most_deaths', 'top_k', 'codes_above',
+                 'codes_below', 'codes_between', 'sum_deaths_by_codes',
+                 'sum_deaths_by_codes_batch', 'sum_deaths_by_query',
+                 'sum_deaths_by_queries', 'search_codes',
+                 'sum_deaths_by_chapter', 'sum_deaths_by_prefix',
+                 'sum_deaths_in_range', 'sum_deaths_by_block', 'distribution')
+
+
+def use_store(new_store):
+    """Answer the queries of this module from a different store.
+
+    Parameters:
+        new_store: an object with the query methods of MortalityStore, e.g.
+            columnar.ColumnarStore(db, cdc.code_names) for the NumPy backend
+            or packed.PackedStore(db, cdc.code_names) for compact arrays
+
+    Raises a ValueError exception for objects lacking any of the query
+    methods, e.g. the approximate summaries of the sketches module.
+    """
+    missing = [name for name in STORE_METHODS
+               if not hasattr(new_store, name)]
+    if missing:
+        raise ValueError('not a store, missing: {}'.format(', '.join(missing)))
+    global store
+    store = new_store
+    cache.clear()
 
 
 def deaths_by_code(code):
@@ -21,10 +57,7 @@ def deaths_by_code(code):
     single ICD-10 category, e.g.: 50.
     If the category is not found, returns None.
     """
-    for entry in db:
-        if entry[0] == code:
-            return entry[1]
-    return None
+    return store.deaths_by_code(code)
 
 
 def most_deaths():
@@ -32,8 +65,21 @@ def most_deaths():
 
     Returns a two element list of [code, number_of_deaths], e.g. ['D35.2', 50]
     """
-    db.sort(key=lambda x: x[1])
-    return db[-1]
+    return store.most_deaths()
+
+
+def top_k(n, chapter=None):
+    """Return the ICD-10 codes and number of deaths for the deadliest categories.
+
+    Parameters:
+        n: (int) maximum number of categories to return
+        chapter: (int) optional chapter number to restrict the list to
+
+    Returns a list of [code, number_of_deaths] pairs in descending order of
+    deaths, e.g. [['I25.1', 161745], ['C34.9', 154723]]
+    """
+    return store.top_k(n, chapter)
+
 
 def codes_above(threshold):
     """Return a list of ICD-10 codes which have deaths above threshold.
@@ -46,14 +92,7 @@ def codes_above(threshold):
 
     Returns a list of codes, e.g. ['D35.2', 'I46.1', 'Y17']
     """
-    index = 0
-    db.sort(key=lambda x: x[1])
-    if threshold > db[-1][1]:
-        index = len(db)
-    else:
-        while db[index][1] < threshold:
-            index += 1
-    return [entry[0] for entry in db[index:]]
+    return cache.lookup(store, 'codes_above', threshold)
 
 
 def codes_below(threshold):
@@ -67,7 +106,22 @@ def codes_below(threshold):
 
     Returns a list of codes, e.g. ['D35.2', 'I46.1', 'Y17']
     """
-    return([entry[0] for entry in db if entry[1] < threshold])
+    return cache.lookup(store, 'codes_below', threshold)
+
+
+def codes_between(low, high):
+    """Return a list of ICD-10 codes with deaths between two thresholds.
+
+    The list contains all the ICD-10 codes where the number of deaths are at
+    least low, but lower than high.
+
+    Parameters:
+        low: (int) minimum threshold for number of deaths
+        high: (int) maximum threshold for number of deaths
+
+    Returns a list of codes, e.g. ['D35.2', 'I46.1', 'Y17']
+    """
+    return cache.lookup(store, 'codes_between', low, high)
 
 
 def sum_deaths_by_codes(codes):
@@ -79,7 +133,19 @@ def sum_deaths_by_codes(codes):
     Returns an integer, the aggregated (sum) number of deaths across the
     specified list of ICD-10 categories, e.g.: 1713
     """
-    return sum([code[1] if code[0] in codes else 0 for code in db])
+    return store.sum_deaths_by_codes(codes)
+
+
+def sum_deaths_by_codes_batch(groups):
+    """Return the aggregated number of deaths for many groups of ICD-10 codes.
+
+    Parameters:
+        groups (list of lists of strings), e.g.: [['D35.2', 'Y17'], ['I46.1']]
+
+    Returns a list of integers, the aggregated (sum) number of deaths for each
+    group of ICD-10 categories, in the order of the groups, e.g.: [156, 1557]
+    """
+    return store.sum_deaths_by_codes_batch(groups)
 
 
 def sum_deaths_by_query(query):
@@ -96,11 +162,104 @@ def sum_deaths_by_query(query):
 
     E.g.: sum_deaths_by_query('heart')
     """
-    codes = []
-    for codename in code_names:
-        if query.lower() in code_names[codename].lower():
-            codes.append(codename)
-    return sum_deaths_by_codes(codes)
+    return cache.lookup(store, 'sum_deaths_by_query', query)
+
+
+def sum_deaths_by_queries(queries):
+    """Return the aggregated number of deaths for each of many query strings.
+
+    Parameters:
+        queries: (list of strings) search strings to match against ICD-10
+            category names, e.g.: ['heart', 'lung', 'diabetes']
+
+    Returns a list of integers in the order of the queries, each the same
+    as sum_deaths_by_query(query), computed in a single pass over the names.
+    """
+    return store.sum_deaths_by_queries(queries)
+
+
+def search_codes(query, mode='fuzzy', n=None):
+    """Return the ICD-10 codes whose category name matches a query.
+
+    Parameters:
+        query: (string) search words or regular expression to match against
+            ICD-10 category names, e.g.: 'diabetis'
+        mode: (string) 'fuzzy' tolerates a few typos per word, 'regex'
+            searches a regular expression and 'token' whole words, all
+            case insensitive
+        n: (int) optional maximum number of codes to return
+
+    Returns a list of [code, number_of_deaths] pairs, the closest matches
+    and then the deadliest categories first, e.g. search_codes('diabetis')
+    is [['E14.9', 30053], ['E14.2', 14495], ...]
+    """
+    return store.search_codes(query, mode, n)
+
+
+def select(expression):
+    """Return the ICD-10 codes matching a query expression.
+
+    Parameters:
+        expression: a condition built with Q, e.g.:
+            Q.chapter(9) & Q.text('heart') & Q.deaths_gt(100)
+
+    Returns a list of [code, number_of_deaths] pairs in descending order
+    of deaths, e.g. [['I25.1', 161745], ['I50.0', 60394]]. The conditions
+    are evaluated by the most selective index first (see expressions.py).
+    """
+    return expression.select(store)
+
+
+def quantile(q):
+    """Return a quantile of the number of deaths per ICD-10 category.
+
+    Parameters:
+        q: (float) the quantile between 0 and 1, e.g.: 0.9
+
+    Returns a float, interpolated between the two nearest counts, e.g.
+    quantile(0.5) is the median number of deaths per category.
+    """
+    return store.distribution.quantile(q)
+
+
+def histogram(bins):
+    """Return the number of categories and deaths by ranges of deaths.
+
+    Parameters:
+        bins: the ascending bin edges, e.g.: [0, 10, 100, 1000], or the
+            number of equal width bins
+
+    Returns a list of [low, high, number_of_categories, number_of_deaths]
+    for the categories with low <= deaths < high, the last bin including
+    high, e.g. [[0, 10, 1720, 5113], [10, 100, 1123, 39797], ...]
+    """
+    return store.distribution.histogram(bins)
+
+
+def cumulative_share(k):
+    """Return the share of all deaths in the k deadliest categories.
+
+    Parameters:
+        k: (int) the number of categories, e.g. len(db) // 100 for the
+            deadliest 1%
+
+    Returns a float between 0 and 1, e.g.: 0.595 for the deadliest 1%
+    """
+    return store.distribution.cumulative_share(k)
+
+
+def lorenz_curve(points=None):
+    """Return the Lorenz curve of the deaths over the ICD-10 categories.
+
+    Parameters:
+        points: (int) optional number of equal steps, one per category by
+            default
+
+    Returns a list of [share_of_categories, share_of_deaths] pairs, the
+    share of all deaths in the given share of the least deadly categories,
+    e.g. [[0.0, 0.0], [0.1, 0.0001], ..., [1.0, 1.0]]
+    """
+    return store.distribution.lorenz_curve(points)
 
 
 # EXTRA CREDIT: optional work
@@ -117,62 +276,45 @@ def sum_deaths_by_chapter(chapter):
     integer value (e.g. IX - Diseases of the circulatory system is represented
     by 9)
     """
-    if chapter < 1 or chapter > 22:
-        return 0
-    chapters = {1: ('A00', 'B99'),
-                2: ('C00', 'D48'),
-                3: ('D50', 'D89'),
-                4: ('E00', 'E90'),
-                5: ('F00', 'F99'),
-                6: ('G00', 'G99'),
-                7: ('H00', 'H59'),
-                8: ('H60', 'H95'),
-                9: ('I00', 'I99'),
-                10: ('J00', 'J99'),
-                11: ('K00', 'K93'),
-                12: ('L00', 'L99'),
-                13: ('M00', 'M99'),
-                14: ('N00,' 'N99'),
-                15: ('O00', 'O99'),
-                16: ('P00', 'P96'),
-                17: ('Q00', 'Q99'),
-                18: ('R00', 'R99'),
-                19: ('S00', 'T98'),
-                20: ('V01', 'Y98'),
-                21: ('Z00', 'Z99'),
-                22: ('U00', 'U99')
-                }
-
-    def valid_icd(prefix):
-        for codename in code_names:
-            if prefix in codename:
-                return True
-        return False
-
-    def generate_icd_list(chapter):
-        begin, end = chapters[chapter]
-        icd_list = []
-        current = begin
-        while current[0] <= end[0]:
-            if int(current[1:]) > int(end[1:]):
-                break
-            if valid_icd(current):
-                for i in range(10):
-                    code = '{}.{}'.format(current, i)
-                    if code in code_names:
-                        icd_list.append(code)
-
-            number = int(current[1:])
-            next_num = (int(current[1:]) + 1) % 100
-            letter = current[0]
-            if next_num == 0:
-                letter = chr(ord(letter) + 1)
-                next_num = '00'
-            if int(next_num) < 10:
-                next_num = '0' + str(next_num)
-            current = letter + str(next_num)
-        return icd_list
-    return sum_deaths_by_codes(generate_icd_list(chapter))
+    return cache.lookup(store, 'sum_deaths_by_chapter', chapter)
+
+
+def sum_deaths_by_prefix(prefix):
+    """Return the aggregated number of deaths by an ICD-10 code prefix.
+
+    Parameters:
+        prefix: (string) the beginning of the codes, e.g.: 'I25'
+
+    Returns an integer, the aggregated (sum) number of deaths across all ICD-10
+    categories whose code starts with prefix, e.g. 'I25', 'I25.1', 'I25.9'.
+    """
+    return store.sum_deaths_by_prefix(prefix)
+
+
+def sum_deaths_in_range(first, last):
+    """Return the aggregated number of deaths in a range of ICD-10 codes.
+
+    Parameters:
+        first: (string) the first code of the range, e.g.: 'C00'
+        last: (string) the last code of the range, e.g.: 'D48'
+
+    Returns an integer, the aggregated (sum) number of deaths across all ICD-10
+    categories from first up to and including last and its subcategories,
+    e.g.: sum_deaths_in_range('V01', 'Y98')
+    """
+    return store.sum_deaths_in_range(first, last)
+
+
+def sum_deaths_by_block(block):
+    """Return the aggregated number of deaths in an ICD-10 block.
+
+    Parameters:
+        block: (string) the block as a range of categories, e.g.: 'I20-I25'
+
+    Returns an integer, the aggregated (sum) number of deaths across all ICD-10
+    categories belonging to the specified block.
+    """
+    return store.sum_deaths_by_block(block)
 
 ###############################################################################
 # TEST functions : ignore everything from here
@@ -190,6 +332,18 @@ def test_most_deaths():
     assert list(most_deaths()) == ['I25.1', 161745]
 
 
+def test_top_k():
+    """Test top_k() function"""
+    assert top_k(0) == []
+    assert top_k(1) == [most_deaths()]
+    top = top_k(25)
+    assert len(top) == 25
+    assert [deaths for code, deaths in top] == sorted(
+        [deaths for code, deaths in db], reverse=True)[:25]
+    assert top_k(3, chapter=9)[0] == ['I25.1', 161745]
+    assert all(code.startswith('C') for code, deaths in top_k(5, chapter=2))
+
+
 def test_codes_above():
     """Test codes_above() function"""
     from random import randint
@@ -214,6 +368,18 @@ def test_codes_below():
             assert ((code in codes) and (deaths < thr)) or (deaths >= thr)
 
 
+def test_codes_between():
+    """Test codes_between() function"""
+    from random import randint
+    assert len(codes_between(-1, 1e10)) == len(db)
+    assert len(codes_between(100, 100)) == 0
+    for i in range(10):
+        low, high = sorted((randint(0, 2000), randint(0, 2000)))
+        codes = codes_between(low, high)
+        for code, deaths in db:
+            assert (code in codes) == (low <= deaths < high)
+
+
 def test_sum_deaths_by_codes():
     """Test sum_deaths_by_codes() function"""
     from random import sample, randint
@@ -223,6 +389,17 @@ def test_sum_deaths_by_codes():
         assert sum_deaths_by_codes(codes) == sum(deaths)
 
 
+def test_sum_deaths_by_codes_batch():
+    """Test sum_deaths_by_codes_batch() function"""
+    from random import sample, randint
+    assert sum_deaths_by_codes_batch([]) == []
+    groups = [[code for code, deaths in sample(db, randint(0, 100))]
+              for i in range(10)]
+    groups.append([])
+    assert sum_deaths_by_codes_batch(groups) == [
+        sum_deaths_by_codes(codes) for codes in groups]
+
+
 def test_sum_deaths_by_query():
     """Test sum_deaths_by_query() function"""
     assert sum_deaths_by_query('heart') == 302182
@@ -230,6 +407,92 @@ def test_sum_deaths_by_query():
     assert sum_deaths_by_query('diabetes') == 76587
     assert sum_deaths_by_query('too much running') == 0
     assert sum_deaths_by_query('broccoli') == 0
+    for query in ('HEART', 'neoplasms', ' - ', 'ia', '', 'x'):
+        codes = [code for code in cdc.code_names
+                 if query.lower() in cdc.code_names[code].lower()]
+        assert sum_deaths_by_query(query) == sum_deaths_by_codes(codes)
+
+
+def test_sum_deaths_by_queries():
+    """Test sum_deaths_by_queries() function"""
+    queries = ['heart', 'LUNG', 'diabetes', 'broccoli', 'heart', '',
+               'Malignant neoplasms', 'y, un']
+    assert sum_deaths_by_queries(queries) == [
+        sum_deaths_by_query(query) for query in queries]
+    assert sum_deaths_by_queries([]) == []
+
+
+def test_search_codes():
+    """Test search_codes() function"""
+    import re
+    names = cdc.code_names
+    for typo, word in (('diabetis', 'diabetes'), ('pnuemonia', 'pneumonia'),
+                       ('haert', 'heart')):
+        found = search_codes(typo)
+        exact = search_codes(word, 'token')
+        assert exact and all(pair in found for pair in exact)
+    top = search_codes('diabetis', n=3)
+    assert top == search_codes('diabetes', n=3)
+    assert [deaths for code, deaths in top] == sorted(
+        (deaths for code, deaths in top), reverse=True)
+    assert search_codes('broccoli') == []
+    for pattern in (r'diabet.*(coma|ketoacidosis)', r'^acute', r'\bheart\b',
+                    r'lung|bronch', r'fail(ure)?s?$', r'c.r.i',
+                    r'\x68eart', r'\101cute', r'\x20-\x20Malignant',
+                    r'\u0068eart \N{LATIN SMALL LETTER F}ail'):
+        expected = sorted(code for code, name in names.items()
+                          if re.search(pattern, name, re.IGNORECASE))
+        assert sorted(code for code, deaths in
+                      search_codes(pattern, 'regex')) == expected
+    expected = sorted(code for code, name in names.items()
+                      if {'heart', 'failure'} <= set(re.findall(
+                          r'[^\W_]+', name.lower())))
+    assert sorted(code for code, deaths in
+                  search_codes('Heart FAILURE', 'token')) == expected
+    try:
+        search_codes('heart', 'soundex')
+    except ValueError:
+        pass
+    else:
+        assert False, 'unknown mode accepted'
+
+
+def test_select():
+    """Test select() function"""
+    heart = select(Q.chapter(9) & Q.text('heart') & Q.deaths_gt(100))
+    assert heart[0] == ['I25.1', 161745]
+    assert sorted(heart) == sorted(
+        [code, deaths] for code, deaths in db
+        if deaths > 100 and 'I00' <= code[:3] <= 'I99' and
+        'heart' in cdc.code_names.get(code, '').lower())
+    assert sum(deaths for code, deaths in select(Q.text('heart'))) == (
+        sum_deaths_by_query('heart'))
+    assert select(Q.chapter(9) & ~Q.chapter(9)) == []
+
+
+def test_distribution():
+    """Test quantile(), histogram(), cumulative_share() and lorenz_curve()"""
+    deaths = sorted(deaths for code, deaths in db)
+    total = sum(deaths)
+    assert quantile(0) == deaths[0]
+    assert quantile(1) == 161745
+    assert quantile(0.5) == (deaths[(len(deaths) - 1) // 2] if len(deaths) % 2
+                             else (deaths[len(deaths) // 2 - 1] +
+                                   deaths[len(deaths) // 2]) / 2)
+    bins = histogram([0, 10, 100, 1000, 10 ** 6])
+    assert sum(count for low, high, count, total in bins) == len(deaths)
+    assert bins[0][2] == len([count for count in deaths if count < 10])
+    assert sum(count for low, high, count, total in histogram(5)) == len(db)
+    assert cumulative_share(1) == 161745 / total
+    one_percent = len(deaths) // 100
+    assert abs(cumulative_share(one_percent) -
+               sum(deaths[-one_percent:]) / total) < 1e-12
+    curve = lorenz_curve(10)
+    assert curve[0] == [0.0, 0.0] and curve[-1] == [1.0, 1.0]
+    assert all(a[1] <= b[1] for a, b in zip(curve, curve[1:]))
+    assert abs(curve[9][1] - (1 - cumulative_share(len(deaths) -
+                                                   9 * len(deaths) // 10))
+               ) < 1e-12
 
 
 def test_sum_deaths_by_chapter():
@@ -239,6 +502,86 @@ def test_sum_deaths_by_chapter():
     assert sum_deaths_by_chapter(1) == 70413
     assert sum_deaths_by_chapter(7) == 34
     assert sum_deaths_by_chapter(13) == 13344
+    assert sum_deaths_by_chapter(14) == sum(
+        deaths for code, deaths in db if 'N00' <= code[:3] <= 'N99')
+    assert sum(sum_deaths_by_chapter(i) for i in range(1, 23)) == sum(
+        deaths for code, deaths in db)
+
+
+def test_sum_deaths_by_prefix():
+    """Test sum_deaths_by_prefix() and sum_deaths_by_block() functions"""
+    assert sum_deaths_by_prefix('I25.1') == 161745
+    assert sum_deaths_by_prefix('broccoli') == 0
+    for prefix in ('I25', 'I2', 'C', 'W17', ''):
+        assert sum_deaths_by_prefix(prefix) == sum(
+            deaths for code, deaths in db if code.startswith(prefix))
+    assert sum_deaths_by_block('I20-I25') == sum(
+        deaths for code, deaths in db if 'I20' <= code[:3] <= 'I25')
+    assert sum_deaths_by_block('I25') == 0
+
+
+def test_sum_deaths_in_range():
+    """Test sum_deaths_in_range() function"""
+    from icd import CHAPTERS
+    for chapter, (first, last) in CHAPTERS.items():
+        assert (sum_deaths_in_range(first, last) ==
+                sum_deaths_by_chapter(chapter))
+    assert sum_deaths_in_range('A00', 'Z99') == sum(
+        deaths for code, deaths in db)
+    assert sum_deaths_in_range('I25.1', 'I25.1') == 161745
+    assert sum_deaths_in_range('Z99', 'A00') == 0
+
+
+def test_cache():
+    """Test the result cache of the query functions"""
+    cache.clear()
+    hits, misses = cache.hits, cache.misses
+    assert sum_deaths_by_query('heart') == 302182
+    assert sum_deaths_by_query('heart') == 302182
+    assert cache.hits == hits + 1
+    assert cache.misses == misses + 1
+    codes = codes_above(161745)
+    codes.append('changed')
+    assert codes_above(161745) == ['I25.1']
+    store.version += 1
+    assert sum_deaths_by_query('heart') == 302182
+    assert cache.misses == misses + 3
+
+
+def test_use_store():
+    """Test the query functions with the packed and columnar backends"""
+    from columnar import ColumnarStore, np
+    from packed import PackedStore
+    backends = [PackedStore]
+    if np is not None:
+        backends.append(ColumnarStore)
+    previous = store
+    try:
+        for backend in backends:
+            use_store(backend(db, lambda: cdc.code_names))
+            test_deaths_by_code()
+            test_most_deaths()
+            test_codes_above()
+            test_codes_below()
+            test_sum_deaths_by_query()
+            test_sum_deaths_by_queries()
+            test_search_codes()
+            test_select()
+            test_distribution()
+            test_sum_deaths_by_chapter()
+            test_sum_deaths_by_prefix()
+            test_sum_deaths_in_range()
+    finally:
+        use_store(previous)
+    from sketches import CountMinSketch, SpaceSaving
+    for summary in (CountMinSketch(), SpaceSaving()):
+        try:
+            use_store(summary)
+        except ValueError:
+            pass
+        else:
+            assert False, 'summary accepted as a store'
+    assert store is previous
 
 
 if __name__ == '__main__':
@@ -247,11 +590,22 @@ if __name__ == '__main__':
 
     for test in (test_deaths_by_code,
                  test_most_deaths,
+                 test_top_k,
                  test_codes_above,
                  test_codes_below,
+                 test_codes_between,
                  test_sum_deaths_by_codes,
+                 test_sum_deaths_by_codes_batch,
                  test_sum_deaths_by_query,
-                 test_sum_deaths_by_chapter):
+                 test_sum_deaths_by_queries,
+                 test_search_codes,
+                 test_select,
+                 test_distribution,
+                 test_sum_deaths_by_chapter,
+                 test_sum_deaths_by_prefix,
+                 test_sum_deaths_in_range,
+                 test_cache,
+                 test_use_store):
         try:
             print(test.__doc__, '... ', end='', flush=True)
             test()
@@ -0,0 +1,425 @@
+"""ICD-10 chapter and block tables and code helpers
+
+See: https://en.wikipedia.org/wiki/ICD-10 for the chapter-code assignment.
+ICD-10 uses roman numerals for chapters, but here we just use the integer
+value (e.g. IX - Diseases of the circulatory system is represented by 9)
+
+Chapters are divided into blocks of categories, e.g. I20-I25 - Ischaemic
+heart diseases. Blocks are named by their category range here.
+"""
+import re
+from bisect import bisect_right
+
+# sorts after every character which may follow a code prefix, so every code
+# starting with 'I99' is less than 'I99' + PREFIX_END
+PREFIX_END = '\U0010ffff'
+
+_CODE = re.compile(r'[A-Z][0-9]{2}(\.[0-9]{1,2})?')
+_CODE_PREFIX = re.compile(r'([A-Z]([0-9]([0-9](\.([0-9][0-9]?)?)?)?)?)?')
+
+CHAPTERS = {1: ('A00', 'B99'),
+            2: ('C00', 'D48'),
+            3: ('D50', 'D89'),
+            4: ('E00', 'E90'),
+            5: ('F00', 'F99'),
+            6: ('G00', 'G99'),
+            7: ('H00', 'H59'),
+            8: ('H60', 'H95'),
+            9: ('I00', 'I99'),
+            10: ('J00', 'J99'),
+            11: ('K00', 'K93'),
+            12: ('L00', 'L99'),
+            13: ('M00', 'M99'),
+            14: ('N00', 'N99'),
+            15: ('O00', 'O99'),
+            16: ('P00', 'P96'),
+            17: ('Q00', 'Q99'),
+            18: ('R00', 'R99'),
+            19: ('S00', 'T98'),
+            20: ('V01', 'Y98'),
+            21: ('Z00', 'Z99'),
+            22: ('U00', 'U99')
+            }
+
+BLOCKS = [('A00', 'A09'), ('A15', 'A19'), ('A20', 'A28'), ('A30', 'A49'),
+          ('A50', 'A64'), ('A65', 'A69'), ('A70', 'A74'), ('A75', 'A79'),
+          ('A80', 'A89'), ('A90', 'A99'), ('B00', 'B09'), ('B15', 'B19'),
+          ('B20', 'B24'), ('B25', 'B34'), ('B35', 'B49'), ('B50', 'B64'),
+          ('B65', 'B83'), ('B85', 'B89'), ('B90', 'B94'), ('B95', 'B98'),
+          ('B99', 'B99'),
+          ('C00', 'C14'), ('C15', 'C26'), ('C30', 'C39'), ('C40', 'C41'),
+          ('C43', 'C44'), ('C45', 'C49'), ('C50', 'C50'), ('C51', 'C58'),
+          ('C60', 'C63'), ('C64', 'C68'), ('C69', 'C72'), ('C73', 'C75'),
+          ('C76', 'C80'), ('C81', 'C96'), ('C97', 'C97'), ('D00', 'D09'),
+          ('D10', 'D36'), ('D37', 'D48'),
+          ('D50', 'D53'), ('D55', 'D59'), ('D60', 'D64'), ('D65', 'D69'),
+          ('D70', 'D77'), ('D80', 'D89'),
+          ('E00', 'E07'), ('E10', 'E14'), ('E15', 'E16'), ('E20', 'E35'),
+          ('E40', 'E46'), ('E50', 'E64'), ('E65', 'E68'), ('E70', 'E90'),
+          ('F00', 'F09'), ('F10', 'F19'), ('F20', 'F29'), ('F30', 'F39'),
+          ('F40', 'F48'), ('F50', 'F59'), ('F60', 'F69'), ('F70', 'F79'),
+          ('F80', 'F89'), ('F90', 'F98'), ('F99', 'F99'),
+          ('G00', 'G09'), ('G10', 'G14'), ('G20', 'G26'), ('G30', 'G32'),
+          ('G35', 'G37'), ('G40', 'G47'), ('G50', 'G59'), ('G60', 'G64'),
+          ('G70', 'G73'), ('G80', 'G83'), ('G90', 'G99'),
+          ('H00', 'H06'), ('H10', 'H13'), ('H15', 'H22'), ('H25', 'H28'),
+          ('H30', 'H36'), ('H40', 'H42'), ('H43', 'H45'), ('H46', 'H48'),
+          ('H49', 'H52'), ('H53', 'H54'), ('H55', 'H59'),
+          ('H60', 'H62'), ('H65', 'H75'), ('H80', 'H83'), ('H90', 'H95'),
+          ('I00', 'I02'), ('I05', 'I09'), ('I10', 'I15'), ('I20', 'I25'),
+          ('I26', 'I28'), ('I30', 'I52'), ('I60', 'I69'), ('I70', 'I79'),
+          ('I80', 'I89'), ('I95', 'I99'),
+          ('J00', 'J06'), ('J09', 'J18'), ('J20', 'J22'), ('J30', 'J39'),
+          ('J40', 'J47'), ('J60', 'J70'), ('J80', 'J84'), ('J85', 'J86'),
+          ('J90', 'J94'), ('J95', 'J99'),
+          ('K00', 'K14'), ('K20', 'K31'), ('K35', 'K38'), ('K40', 'K46'),
+          ('K50', 'K52'), ('K55', 'K64'), ('K65', 'K67'), ('K70', 'K77'),
+          ('K80', 'K87'), ('K90', 'K93'),
+          ('L00', 'L08'), ('L10', 'L14'), ('L20', 'L30'), ('L40', 'L45'),
+          ('L50', 'L54'), ('L55', 'L59'), ('L60', 'L75'), ('L80', 'L99'),
+          ('M00', 'M03'), ('M05', 'M14'), ('M15', 'M19'), ('M20', 'M25'),
+          ('M30', 'M36'), ('M40', 'M43'), ('M45', 'M49'), ('M50', 'M54'),
+          ('M60', 'M63'), ('M65', 'M68'), ('M70', 'M79'), ('M80', 'M85'),
+          ('M86', 'M90'), ('M91', 'M94'), ('M95', 'M99'),
+          ('N00', 'N08'), ('N10', 'N16'), ('N17', 'N19'), ('N20', 'N23'),
+          ('N25', 'N29'), ('N30', 'N39'), ('N40', 'N51'), ('N60', 'N64'),
+          ('N70', 'N77'), ('N80', 'N98'), ('N99', 'N99'),
+          ('O00', 'O08'), ('O10', 'O16'), ('O20', 'O29'), ('O30', 'O48'),
+          ('O60', 'O75'), ('O80', 'O84'), ('O85', 'O92'), ('O94', 'O99'),
+          ('P00', 'P04'), ('P05', 'P08'), ('P10', 'P15'), ('P20', 'P29'),
+          ('P35', 'P39'), ('P50', 'P61'), ('P70', 'P74'), ('P75', 'P78'),
+          ('P80', 'P83'), ('P90', 'P96'),
+          ('Q00', 'Q07'), ('Q10', 'Q18'), ('Q20', 'Q28'), ('Q30', 'Q34'),
+          ('Q35', 'Q37'), ('Q38', 'Q45'), ('Q50', 'Q56'), ('Q60', 'Q64'),
+          ('Q65', 'Q79'), ('Q80', 'Q89'), ('Q90', 'Q99'),
+          ('R00', 'R09'), ('R10', 'R19'), ('R20', 'R23'), ('R25', 'R29'),
+          ('R30', 'R39'), ('R40', 'R46'), ('R47', 'R49'), ('R50', 'R69'),
+          ('R70', 'R79'), ('R80', 'R82'), ('R83', 'R89'), ('R90', 'R94'),
+          ('R95', 'R99'),
+          ('S00', 'S09'), ('S10', 'S19'), ('S20', 'S29'), ('S30', 'S39'),
+          ('S40', 'S49'), ('S50', 'S59'), ('S60', 'S69'), ('S70', 'S79'),
+          ('S80', 'S89'), ('S90', 'S99'), ('T00', 'T07'), ('T08', 'T14'),
+          ('T15', 'T19'), ('T20', 'T25'), ('T26', 'T28'), ('T29', 'T32'),
+          ('T33', 'T35'), ('T36', 'T50'), ('T51', 'T65'), ('T66', 'T78'),
+          ('T79', 'T79'), ('T80', 'T88'), ('T90', 'T98'),
+          ('U00', 'U49'), ('U82', 'U85'),
+          ('V01', 'V09'), ('V10', 'V19'), ('V20', 'V29'), ('V30', 'V39'),
+          ('V40', 'V49'), ('V50', 'V59'), ('V60', 'V69'), ('V70', 'V79'),
+          ('V80', 'V89'), ('V90', 'V94'), ('V95', 'V97'), ('V98', 'V99'),
+          ('W00', 'W19'), ('W20', 'W49'), ('W50', 'W64'), ('W65', 'W74'),
+          ('W75', 'W84'), ('W85', 'W99'), ('X00', 'X09'), ('X10', 'X19'),
+          ('X20', 'X29'), ('X30', 'X39'), ('X40', 'X49'), ('X50', 'X57'),
+          ('X58', 'X59'), ('X60', 'X84'), ('X85', 'Y09'), ('Y10', 'Y34'),
+          ('Y35', 'Y36'), ('Y40', 'Y59'), ('Y60', 'Y69'), ('Y70', 'Y82'),
+          ('Y83', 'Y84'), ('Y85', 'Y89'), ('Y90', 'Y98'),
+          ('Z00', 'Z13'), ('Z20', 'Z29'), ('Z30', 'Z39'), ('Z40', 'Z54'),
+          ('Z55', 'Z65'), ('Z70', 'Z76'), ('Z80', 'Z99')]
+
+
+def is_code(code):
+    """Test if code is a well formed ICD-10 code, e.g.: 'I25' or 'I25.1'"""
+    return _CODE.fullmatch(code) is not None
+
+
+def is_category(code):
+    """Test if code is a well formed ICD-10 category, e.g.: 'I25'"""
+    return (len(code) == 3 and 'A' <= code[0] <= 'Z' and
+            code[1:].isdigit())
+
+
+def validate_chapters(chapters):
+    """Check a chapter -> (first, last) category range table
+
+    Parameters:
+        chapters (dict), e.g.: {9: ('I00', 'I99')}
+
+    Every range has to be a pair of well formed categories with the first
+    not after the last one, and the ranges of different chapters must not
+    overlap. Raises a ValueError exception describing the first problem
+    found, otherwise no return value is provided.
+    """
+    ranges = []
+    for chapter, bounds in chapters.items():
+        if (not isinstance(bounds, tuple) or len(bounds) != 2 or
+                not all(isinstance(code, str) and is_category(code)
+                        for code in bounds)):
+            raise ValueError('invalid range for chapter {}: {!r}'
+                             .format(chapter, bounds))
+        if bounds[0] > bounds[1]:
+            raise ValueError('empty range for chapter {}: {!r}'
+                             .format(chapter, bounds))
+        ranges.append((bounds, chapter))
+    ranges.sort()
+    for (prev, prev_chapter), (bounds, chapter) in zip(ranges, ranges[1:]):
+        if bounds[0] <= prev[1]:
+            raise ValueError('overlapping ranges for chapters {} and {}'
+                             .format(prev_chapter, chapter))
+
+
+def validate_blocks(blocks, chapters):
+    """Check a list of (first, last) block category ranges
+
+    Parameters:
+        blocks (list of pairs), e.g.: [('I20', 'I25'), ('I26', 'I28')]
+        chapters (dict): the chapter table the blocks belong to
+
+    Every block has to be a pair of well formed categories with the first
+    not after the last one, and inside a single chapter. The blocks must be
+    sorted and must not overlap. Raises a ValueError exception describing
+    the first problem found, otherwise no return value is provided.
+    """
+    previous = None
+    for block in blocks:
+        if (not isinstance(block, tuple) or len(block) != 2 or
+                not all(isinstance(code, str) and is_category(code)
+                        for code in block) or block[0] > block[1]):
+            raise ValueError('invalid block: {!r}'.format(block))
+        chapter = chapter_of(block[0], chapters)
+        if chapter is None or chapter != chapter_of(block[1], chapters):
+            raise ValueError('block outside of a chapter: {!r}'.format(block))
+        if previous is not None and block[0] <= previous[1]:
+            raise ValueError('unsorted or overlapping blocks: {!r} {!r}'
+                             .format(previous, block))
+        previous = block
+
+
+def chapter_of(code, chapters=CHAPTERS):
+    """Return the chapter of an ICD-10 code.
+
+    Parameters:
+        code (string), e.g.: 'I25.1'
+        chapters (dict): the chapter table, CHAPTERS by default
+
+    Returns an integer, the chapter number the category of the code
+    (the letter and two digits) falls into, e.g.: 9.
+    If the code is not in any chapter, returns None.
+    """
+    category = code[:3]
+    for chapter, (begin, end) in chapters.items():
+        if begin <= category <= end:
+            return chapter
+    return None
+
+
+def block_name(block):
+    """Return the name of a (first, last) block, e.g.: 'I20-I25'"""
+    return '{}-{}'.format(*block)
+
+
+# sorted first categories of the blocks, for bisect in block_of
+_BLOCK_STARTS = [first for first, last in BLOCKS]
+
+
+def block_of(code):
+    """Return the block of an ICD-10 code.
+
+    Parameters:
+        code (string), e.g.: 'I25.1'
+
+    Returns the name of the block the category of the code falls into,
+    e.g.: 'I20-I25'. If the code is not in any block, returns None.
+    """
+    category = code[:3]
+    index = bisect_right(_BLOCK_STARTS, category) - 1
+    if index >= 0 and category <= BLOCKS[index][1]:
+        return block_name(BLOCKS[index])
+    return None
+
+
+def _encode_subcode(subcode):
+    """Return the integer for the digits after the dot of a code
+
+    No subcode is 0, a single digit d is 1 + 11 * d and two digits d, e are
+    2 + 11 * d + e, so the integers sort like the strings, e.g.:
+    '' < '1' < '10' < '19' < '2'
+    """
+    if not subcode:
+        return 0
+    value = 1 + 11 * int(subcode[0])
+    if len(subcode) == 2:
+        value += 1 + int(subcode[1])
+    return value
+
+
+def encode_code(code):
+    """Pack an ICD-10 code into an integer.
+
+    Parameters:
+        code (string), e.g.: 'I25.1'
+
+    The letter, the two digits and the subcode are stored in the bits 16-20,
+    8-14 and 0-7 of the result, which fits into 32 bits. Integers compare
+    like the codes do, so a chapter or category is an integer range, e.g.:
+    encode_code('I25') <= encode_code('I25.1') < encode_code('I26')
+
+    Returns an integer, e.g.: 530700 for 'I25.1'
+    Raises a ValueError exception if code is not a well formed ICD-10 code.
+    """
+    if not is_code(code):
+        raise ValueError('invalid ICD-10 code: {!r}'.format(code))
+    return (((ord(code[0]) - ord('A')) << 16) | (int(code[1:3]) << 8) |
+            _encode_subcode(code[4:]))
+
+
+def decode_code(value):
+    """Unpack an integer created by encode_code.
+
+    Parameters:
+        value (int), e.g.: 530700
+
+    Returns the ICD-10 code as a string, e.g.: 'I25.1' for 530700
+    """
+    code = '{}{:02d}'.format(chr(ord('A') + (value >> 16)), (value >> 8) & 0xFF)
+    subcode = value & 0xFF
+    if subcode:
+        digit, rest = divmod(subcode - 1, 11)
+        code += '.{}'.format(digit) + ('{}'.format(rest - 1) if rest else '')
+    return code
+
+
+def prefix_range(prefix):
+    """Return the range of encoded codes starting with a prefix.
+
+    Parameters:
+        prefix (string), e.g.: 'I2', 'I25', 'I25.1'
+
+    Returns a (low, high) pair of integers, every code starting with prefix
+    is encoded to a value with low <= value <= high.
+    If prefix can not start a well formed ICD-10 code, returns None.
+    """
+    if _CODE_PREFIX.fullmatch(prefix) is None:
+        return None
+    if not prefix:
+        return 0, (26 << 16) - 1
+    letter = (ord(prefix[0]) - ord('A')) << 16
+    digits = prefix[1:3]
+    low = letter | (int(digits.ljust(2, '0')) << 8)
+    high = letter | (int(digits.ljust(2, '9')) << 8)
+    subcode = prefix[4:]
+    if '.' not in prefix:
+        return low, high | 0xFF
+    if not subcode:
+        return low | 1, high | 0xFF
+    if len(subcode) == 1:
+        return (low | _encode_subcode(subcode),
+                high | _encode_subcode(subcode + '9'))
+    return low | _encode_subcode(subcode), high | _encode_subcode(subcode)
+
+
+validate_chapters(CHAPTERS)
+validate_blocks(BLOCKS, CHAPTERS)
+
+
+###############################################################################
+# TEST functions
+
+def test_validate_chapters():
+    """Test validate_chapters() function"""
+    validate_chapters(CHAPTERS)
+    assert len(CHAPTERS) == 22
+    for bad in ({14: ('N00,' 'N99')},
+                {14: ('N00', 'N9')},
+                {14: ('N99', 'N00')},
+                {13: ('M00', 'N10'), 14: ('N00', 'N99')}):
+        try:
+            validate_chapters(bad)
+        except ValueError:
+            pass
+        else:
+            assert False, bad
+
+
+def test_validate_blocks():
+    """Test validate_blocks() function"""
+    validate_blocks(BLOCKS, CHAPTERS)
+    for bad in ([('I20', 'I2')],
+                [('I25', 'I20')],
+                [('H55', 'H62')],
+                [('I20', 'I25'), ('I10', 'I15')],
+                [('I20', 'I25'), ('I25', 'I28')]):
+        try:
+            validate_blocks(bad, CHAPTERS)
+        except ValueError:
+            pass
+        else:
+            assert False, bad
+
+
+def test_block_of():
+    """Test block_of() function"""
+    from cdc import db
+    assert block_of('A00') == 'A00-A09'
+    assert block_of('I25.1') == 'I20-I25'
+    assert block_of('I20') == 'I20-I25'
+    assert block_of('W17') == 'W00-W19'
+    assert block_of('B99.9') == 'B99-B99'
+    assert block_of('A10') is None
+    assert block_of('') is None
+    for code, deaths in db:
+        assert chapter_of(block_of(code)) == chapter_of(code)
+
+
+def test_encode_code():
+    """Test encode_code() and decode_code() functions"""
+    from cdc import db
+    codes = sorted({code for code, deaths in db} |
+                   {'A00', 'Z99.99', 'I25.10', 'I25.19', 'I25.2', 'I25.0'})
+    values = [encode_code(code) for code in codes]
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+    assert all(0 <= value < 2 ** 32 for value in values)
+    assert [decode_code(value) for value in values] == codes
+    for bad in ('', 'I2', 'i25', 'I25.', 'I25.123', 'I2X'):
+        try:
+            encode_code(bad)
+        except ValueError:
+            pass
+        else:
+            assert False, bad
+
+
+def test_prefix_range():
+    """Test prefix_range() function"""
+    from cdc import db
+    for prefix in ('', 'I', 'I2', 'I25', 'I25.', 'I25.1', 'I25.10', 'W1'):
+        low, high = prefix_range(prefix)
+        for code in [code for code, deaths in db] + ['I25.10', 'I25.19']:
+            assert (code.startswith(prefix) ==
+                    (low <= encode_code(code) <= high)), (prefix, code)
+    assert prefix_range('I2.') is None
+    assert prefix_range('i') is None
+    assert prefix_range('I25.123') is None
+
+
+def test_chapter_of():
+    """Test chapter_of() function"""
+    assert chapter_of('A00') == 1
+    assert chapter_of('B99.9') == 1
+    assert chapter_of('D48.0') == 2
+    assert chapter_of('D50.1') == 3
+    assert chapter_of('I25.1') == 9
+    assert chapter_of('N18.9') == 14
+    assert chapter_of('W17') == 20
+    assert chapter_of('D49') is None
+    assert chapter_of('V00') is None
+    assert chapter_of('') is None
+
+
+if __name__ == '__main__':
+    import sys
+    import traceback
+
+    for test in (test_validate_chapters,
+                 test_validate_blocks,
+                 test_block_of,
+                 test_encode_code,
+                 test_prefix_range,
+                 test_chapter_of):
+        try:
+            print(test.__doc__, '... ', end='', flush=True)
+            test()
+            print('PASSED')
+        except:
+            print('FAILED')
+            exc_info = sys.exc_info()
+            traceback.print_exception(*exc_info)
@@ -0,0 +1,221 @@
+"""ICD-10 hierarchy with rolled-up death counts
+
+ICD-10 codes form a tree: chapter -> block -> category (e.g. 'I25') ->
+subcategory (e.g. 'I25.1'). The IcdTree keeps a node for every level with
+the total number of deaths of its subtree, so the sum for a chapter, block,
+category or code is a single dict lookup, and drilling down is a listing of
+the children of a node.
+"""
+from bisect import bisect_left, insort
+
+from icd import block_of, chapter_of
+
+
+class IcdNode:
+    """Node of the ICD-10 tree"""
+
+    __slots__ = ('name', 'level', 'deaths', 'total', 'parent', 'children')
+
+    def __init__(self, name, level, parent=None):
+        """Create a node without deaths
+
+        Parameters:
+            name: the chapter number (int), block name, category or code,
+                e.g.: 9, 'I20-I25', 'I25', 'I25.1'
+            level (string): 'root', 'chapter', 'block', 'category' or 'code'
+            parent (IcdNode): the parent node, None for the root
+        """
+        self.name = name
+        self.level = level
+        self.deaths = 0
+        self.total = 0
+        self.parent = parent
+        self.children = {}
+        if parent is not None:
+            parent.children[name] = self
+
+
+class IcdTree:
+    """ICD-10 hierarchy of [code, deaths] pairs with subtree totals"""
+
+    def __init__(self, rows=()):
+        """Build the tree from [code, deaths] pairs
+
+        Parameters:
+            rows (iterable of pairs), e.g.: [['I25.1', 50], ['I25', 3]]
+
+        Codes outside of the ICD-10 chapters or blocks are attached to the
+        nearest level they belong to, e.g. directly to the root.
+        """
+        self.root = IcdNode(None, 'root')
+        self.nodes = {}
+        self.categories = []
+        for code, deaths in rows:
+            self.add(code, deaths)
+
+    def _child(self, parent, name, level):
+        """Return the child of parent with the name, created if needed"""
+        node = parent.children.get(name)
+        if node is None:
+            node = IcdNode(name, level, parent)
+            self.nodes[name] = node
+            if level == 'category':
+                insort(self.categories, name)
+        return node
+
+    def add(self, code, deaths):
+        """Add deaths to an ICD-10 code and all its ancestors
+
+        Parameters:
+            code (string), e.g.: 'I25.1'
+            deaths (int): the number of deaths to add, may be negative
+        """
+        node = self.nodes.get(code)
+        if node is None:
+            node = self.root
+            chapter = chapter_of(code)
+            if chapter is not None:
+                node = self._child(node, chapter, 'chapter')
+            block = block_of(code)
+            if block is not None:
+                node = self._child(node, block, 'block')
+            node = self._child(node, code[:3], 'category')
+            if len(code) > 3:
+                node = self._child(node, code, 'code')
+        node.deaths += deaths
+        while node is not None:
+            node.total += deaths
+            node = node.parent
+
+    def total(self, name):
+        """Return the aggregated number of deaths of a node.
+
+        Parameters:
+            name: the chapter number (int), block name, category or code,
+                e.g.: 9, 'I20-I25', 'I25', 'I25.1'
+
+        Returns an integer, 0 for unknown names.
+        """
+        node = self.nodes.get(name)
+        return 0 if node is None else node.total
+
+    def sum_deaths_by_chapter(self, chapter):
+        """Return the aggregated number of deaths in an ICD-10 chapter."""
+        return self.total(chapter) if isinstance(chapter, int) else 0
+
+    def sum_deaths_by_block(self, block):
+        """Return the aggregated number of deaths in an ICD-10 block.
+
+        Parameters:
+            block (string): the block name, e.g.: 'I20-I25'
+        """
+        return self.total(block) if '-' in str(block) else 0
+
+    def sum_deaths_by_prefix(self, prefix):
+        """Return the aggregated number of deaths by an ICD-10 code prefix.
+
+        Parameters:
+            prefix (string), e.g.: 'I25'
+
+        Returns an integer, the aggregated (sum) number of deaths across all
+        ICD-10 codes starting with prefix. A whole category is a single
+        lookup, shorter prefixes sum up the matching categories and longer
+        ones the matching codes of their category.
+        """
+        if len(prefix) == 3:
+            node = self.nodes.get(prefix)
+            return 0 if node is None else node.total
+        if len(prefix) < 3:
+            total = 0
+            index = bisect_left(self.categories, prefix)
+            while (index < len(self.categories) and
+                   self.categories[index].startswith(prefix)):
+                total += self.nodes[self.categories[index]].total
+                index += 1
+            return total
+        category = self.nodes.get(prefix[:3])
+        if category is None:
+            return 0
+        return sum(node.total for name, node in category.children.items()
+                   if name.startswith(prefix))
+
+    def children(self, name=None):
+        """Return the children of a node for drilling down.
+
+        Parameters:
+            name: the chapter number (int), block name or category, the
+                chapters are listed by default
+
+        Returns a list of [name, total_deaths] pairs ordered by name, e.g.:
+        children('I20-I25') == [['I20', 1234], ..., ['I25', 170000]]
+        Chapters are listed before codes outside of any chapter.
+        """
+        node = self.root if name is None else self.nodes.get(name)
+        if node is None:
+            return []
+        return [[child.name, child.total] for child in
+                sorted(node.children.values(),
+                       key=lambda x: (isinstance(x.name, str), x.name))]
+
+
+###############################################################################
+# TEST functions
+
+def test_icd_tree():
+    """Test IcdTree totals and drill-down"""
+    tree = IcdTree([['I25.1', 5], ['I25', 2], ['I25.9', 3], ['I21.0', 4],
+                    ['I10', 1], ['A02.0', 7], ['D49', 6]])
+    assert tree.total('I25.1') == 5
+    assert tree.total('I25') == 10
+    assert tree.nodes['I25'].deaths == 2
+    assert tree.total('I20-I25') == 14
+    assert tree.sum_deaths_by_block('I20-I25') == 14
+    assert tree.sum_deaths_by_block('I25') == 0
+    assert tree.sum_deaths_by_chapter(9) == 15
+    assert tree.sum_deaths_by_chapter(2) == 0
+    assert tree.root.total == 28
+    assert tree.sum_deaths_by_prefix('I25') == 10
+    assert tree.sum_deaths_by_prefix('I2') == 14
+    assert tree.sum_deaths_by_prefix('I') == 15
+    assert tree.sum_deaths_by_prefix('') == 28
+    assert tree.sum_deaths_by_prefix('I25.') == 8
+    assert tree.sum_deaths_by_prefix('I25.9') == 3
+    assert tree.sum_deaths_by_prefix('K') == 0
+    assert tree.sum_deaths_by_prefix('K25.1') == 0
+    assert tree.children() == [[1, 7], [9, 15], ['D49', 6]]
+    assert tree.children(9) == [['I10-I15', 1], ['I20-I25', 14]]
+    assert tree.children('I25') == [['I25.1', 5], ['I25.9', 3]]
+    assert tree.children('I25.1') == []
+    assert tree.children('nothing') == []
+    tree.add('I25.1', -5)
+    assert tree.sum_deaths_by_chapter(9) == 10
+
+
+def test_icd_tree_cdc():
+    """Test IcdTree on the CDC data"""
+    from cdc import db
+    from mortality import MortalityStore
+    store = MortalityStore(db)
+    tree = IcdTree(db)
+    for chapter in range(1, 23):
+        assert (tree.sum_deaths_by_chapter(chapter) ==
+                store.sum_deaths_by_chapter(chapter))
+    for prefix in ('I25', 'I2', 'C3', 'W17', 'A41.9', 'X'):
+        assert tree.sum_deaths_by_prefix(prefix) == sum(
+            deaths for code, deaths in db if code.startswith(prefix))
+
+
+if __name__ == '__main__':
+    import sys
+    import traceback
+
+    for test in (test_icd_tree,
+                 test_icd_tree_cdc):
+        try:
+            print(test.__doc__, '... ', end='', flush=True)
+            test()
+            print('PASSED')
+        except:
+            print('FAILED')
+            exc_info = sys.exc_info()
+            traceback.print_exception(*exc_info)
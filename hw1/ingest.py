@@ -0,0 +1,178 @@
+"""Ingestion of CDC WONDER mortality exports
+
+CDC WONDER exports query results as tab-delimited text: a header row with
+the quoted column names, one row per group, and a footer of notes which
+starts with a '---' line. For an export grouped by ICD-10 codes, e.g.:
+
+    "Notes"	"Cause of death"	"Cause of death Code"	"Deaths"
+    	"Salmonella enteritis"	"A02.0"	11
+    	"Pituitary gland - Benign neoplasms"	"D35.2"	50
+    "Total"			1713
+    "---"
+    "Dataset: Underlying Cause of Death, 1999-2014"
+
+The export is read one row at a time, so memory use depends on the number of
+distinct codes only, not on the number of rows in the file.
+"""
+import csv
+
+from icd import is_code
+from mortality import MortalityStore
+
+CODE_COLUMN = 'Cause of death Code'
+NAME_COLUMN = 'Cause of death'
+DEATHS_COLUMN = 'Deaths'
+
+
+def parse_code(text):
+    """Return a normalized ICD-10 code, or None if text is not a code
+
+    Parameters:
+        text (string), e.g.: ' i25.1 '
+
+    Returns the code in upper case without surrounding whitespace,
+    e.g.: 'I25.1'
+    """
+    code = text.strip().upper()
+    return code if is_code(code) else None
+
+
+def parse_deaths(text):
+    """Return the number of deaths, or None for 'Suppressed', 'Missing', etc.
+
+    Parameters:
+        text (string), e.g.: '1,049'
+    """
+    text = text.strip().replace(',', '')
+    return int(text) if text.isdecimal() else None
+
+
+def read_export(lines, code_column=CODE_COLUMN, deaths_column=DEATHS_COLUMN,
+                name_column=NAME_COLUMN):
+    """Generate the records of a CDC WONDER export
+
+    Parameters:
+        lines (iterable of strings): an open export file or its lines
+        code_column (string): the header of the ICD-10 code column
+        deaths_column (string): the header of the number of deaths column
+        name_column (string): the header of the category name column, the
+            names are None if the export has no such column
+
+    Generates (code, deaths, name) tuples, e.g.: ('D35.2', 50, 'Pituitary
+    gland - Benign neoplasms'). Total rows, rows with an invalid code and
+    rows with suppressed or missing counts are skipped, reading stops at the
+    notes footer.
+
+    Raises a ValueError exception if the code or deaths column is missing.
+    """
+    reader = csv.reader(lines, delimiter='\t')
+    header = next(reader, None)
+    if header is None:
+        return
+    header = [column.strip() for column in header]
+    for column in (code_column, deaths_column):
+        if column not in header:
+            raise ValueError('missing column in export: {}'.format(column))
+    code_index = header.index(code_column)
+    deaths_index = header.index(deaths_column)
+    name_index = header.index(name_column) if name_column in header else None
+    width = max(code_index, deaths_index,
+                -1 if name_index is None else name_index) + 1
+    for row in reader:
+        if row and row[0].strip() == '---':
+            break
+        if len(row) < width:
+            continue
+        code = parse_code(row[code_index])
+        deaths = parse_deaths(row[deaths_index])
+        if code is None or deaths is None:
+            continue
+        yield code, deaths, None if name_index is None else row[name_index]
+
+
+def ingest_export(path, **columns):
+    """Build a MortalityStore from a CDC WONDER export file
+
+    Parameters:
+        path (string): the export file, e.g.: 'wonder-2014.txt'
+        columns: the column headers, see read_export
+
+    Deaths of repeated codes are summed up, the last name seen for a code
+    is kept. Returns a MortalityStore, e.g.: ingest_export(path).most_deaths()
+    """
+    totals = {}
+    names = {}
+    with open(path, newline='', encoding='utf-8') as export:
+        for code, deaths, name in read_export(export, **columns):
+            totals[code] = totals.get(code, 0) + deaths
+            if name:
+                names[code] = name
+    return MortalityStore.from_totals(totals, names)
+
+
+###############################################################################
+# TEST functions
+
+EXPORT = ('"Notes"\t"Cause of death"\t"Cause of death Code"\t"Deaths"\n'
+          '\t"Salmonella enteritis"\t"A02.0"\t11\n'
+          '\t"Pituitary gland - Benign neoplasms"\t"D35.2"\t50\n'
+          '\t"Fall involving ice and snow"\t"W00"\tSuppressed\n'
+          '\t"Pituitary gland - Benign neoplasms"\t"D35.2"\t2\n'
+          '\t"Group"\t"GR113-001"\t7\n'
+          '\t"Water-transport-related drowning"\t"v92.9"\t"1,049"\n'
+          '"Total"\t\t\t1112\n'
+          '"---"\n'
+          '"Dataset: Underlying Cause of Death, 1999-2014"\n'
+          '\t"Late"\t"Y17"\t3\n')
+
+
+def test_read_export():
+    """Test read_export() function"""
+    from io import StringIO
+    assert list(read_export(StringIO(EXPORT))) == [
+        ('A02.0', 11, 'Salmonella enteritis'),
+        ('D35.2', 50, 'Pituitary gland - Benign neoplasms'),
+        ('D35.2', 2, 'Pituitary gland - Benign neoplasms'),
+        ('V92.9', 1049, 'Water-transport-related drowning')]
+    assert list(read_export(StringIO(''))) == []
+    assert parse_deaths(' 1,049 ') == 1049
+    assert parse_deaths('\u00b2') is None and parse_deaths('-3') is None
+    assert list(read_export(StringIO(EXPORT), name_column='Name'))[0] == (
+        'A02.0', 11, None)
+    try:
+        list(read_export(StringIO(EXPORT), code_column='Code'))
+    except ValueError:
+        pass
+    else:
+        assert False, 'missing column accepted'
+
+
+def test_ingest_export():
+    """Test ingest_export() function"""
+    import os
+    import tempfile
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'export.txt')
+        with open(path, 'w', encoding='utf-8') as export:
+            export.write(EXPORT)
+        store = ingest_export(path)
+    assert sorted(store) == [['A02.0', 11], ['D35.2', 52], ['V92.9', 1049]]
+    assert store.most_deaths() == ['V92.9', 1049]
+    assert store.sum_deaths_by_query('GLAND') == 52
+    assert store.sum_deaths_by_chapter(1) == 11
+
+
+if __name__ == '__main__':
+    import sys
+    import traceback
+
+    for test in (test_read_export,
+                 test_ingest_export):
+        try:
+            print(test.__doc__, '... ', end='', flush=True)
+            test()
+            print('PASSED')
+        except:
+            print('FAILED')
+            exc_info = sys.exc_info()
+            traceback.print_exception(*exc_info)
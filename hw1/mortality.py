@@ -0,0 +1,728 @@
+"""Indexed storage for the CDC Mortality Database
+
+The hw1 query functions scan the db list of [code, deaths] pairs on every
+call. The MortalityStore class builds the derived lookup structures once
+and answers the same questions from them.
+"""
+from bisect import bisect_left, bisect_right, insort
+
+from distribution import DeathDistribution
+from icd import PREFIX_END, chapter_of
+from icdtree import IcdTree
+from textindex import NamedStore, query_totals, rank_matches
+
+
+class FenwickTree:
+    """Binary indexed tree of prefix sums with O(log n) point updates"""
+
+    def __init__(self, values=()):
+        """Build the tree from a list of numbers in O(n)
+
+        Parameters:
+            values (iterable of ints), e.g.: [50, 3, 1660]
+        """
+        self.sums = [0]
+        self.sums.extend(values)
+        size = len(self.sums) - 1
+        for index in range(1, size + 1):
+            parent = index + (index & -index)
+            if parent <= size:
+                self.sums[parent] += self.sums[index]
+
+    def __len__(self):
+        """Get the number of values"""
+        return len(self.sums) - 1
+
+    def __eq__(self, other):
+        """Test if two trees hold the same values"""
+        return isinstance(other, FenwickTree) and self.sums == other.sums
+
+    def add(self, index, delta):
+        """Add delta to the value at index (from 0)"""
+        index += 1
+        while index < len(self.sums):
+            self.sums[index] += delta
+            index += index & -index
+
+    def prefix(self, count):
+        """Return the sum of the first count values"""
+        total = 0
+        while count > 0:
+            total += self.sums[count]
+            count -= count & -count
+        return total
+
+
+class MortalityStore(NamedStore):
+    """Indexed view of a list of [code, deaths] pairs"""
+
+    def __init__(self, rows=(), names=None):
+        """Build the indexes from [code, deaths] pairs
+
+        Parameters:
+            rows (iterable of pairs), e.g.: [['D35.2', 50], ['Y17', 3]]
+            names (dict): optional ICD-10 category names by code, e.g.:
+                {'D35.2': 'Pituitary gland - Benign neoplasms'}, or a
+                function returning them, which is called on first use
+
+        Repeated codes are aggregated, i.e. their deaths are summed up.
+        The rows are copied, later changes to the source list are not
+        reflected in the store.
+        """
+        self.deaths = {}
+        for code, deaths in rows:
+            self.deaths[code] = self.deaths.get(code, 0) + deaths
+        self._index_deaths()
+        self._set_names(names)
+        self._tree = None
+        self._distribution = None
+        # incremented by every change of the counts, see cache.ResultCache
+        self.version = 0
+
+    @classmethod
+    def from_totals(cls, totals, names=None):
+        """Build the store from a code -> deaths dict
+
+        Parameters:
+            totals (dict), e.g.: {'D35.2': 50, 'Y17': 3}
+            names (dict or function): optional ICD-10 category names by code
+
+        The dict is used as the store's hash index without being copied.
+        """
+        store = cls(names=names)
+        store.deaths = totals
+        store._index_deaths()
+        return store
+
+    def _index_deaths(self):
+        """Build the sorted threshold index
+
+        ranked_codes and ranked_deaths are parallel lists ordered by the
+        number of deaths (ties broken by code), so threshold queries are a
+        binary search plus a slice.
+
+        The chapter index maps each chapter number to its member codes (in
+        the same order) and the chapter totals to the aggregated deaths.
+
+        ordered_codes lists the codes in ICD-10 order, and cumulative is a
+        FenwickTree of their deaths, so the total of any code range is the
+        difference of two prefix sums, each kept up to date in O(log n).
+        """
+        ranked = sorted(self.deaths.items(), key=lambda x: (x[1], x[0]))
+        self.ranked_codes = [code for code, deaths in ranked]
+        self.ranked_deaths = [deaths for code, deaths in ranked]
+        self.chapter_codes = {}
+        self.chapter_totals = {}
+        for code, deaths in ranked:
+            chapter = chapter_of(code)
+            if chapter is None:
+                continue
+            self.chapter_codes.setdefault(chapter, []).append(code)
+            self.chapter_totals[chapter] = (
+                self.chapter_totals.get(chapter, 0) + deaths)
+        self.ordered_codes = sorted(self.deaths)
+        self._index_ranges()
+
+    def _index_ranges(self):
+        """Build the prefix sums of the deaths of the ordered codes"""
+        self.cumulative = FenwickTree(self.deaths[code]
+                                      for code in self.ordered_codes)
+
+    @property
+    def tree(self):
+        """ICD-10 hierarchy with subtree totals, built on first use"""
+        if self._tree is None:
+            self._tree = IcdTree(self.deaths.items())
+        return self._tree
+
+    @property
+    def distribution(self):
+        """Quantiles, histograms and shares of the deaths per code
+
+        A DeathDistribution over the threshold index, built on first use
+        after every change of the counts.
+        """
+        if self._distribution is None:
+            self._distribution = DeathDistribution(self.ranked_deaths,
+                                                   presorted=True)
+        return self._distribution
+
+    def __len__(self):
+        """Get the number of distinct ICD-10 codes in the store"""
+        return len(self.deaths)
+
+    def __contains__(self, code):
+        """Test if the ICD-10 code has an entry in the store"""
+        return code in self.deaths
+
+    def __iter__(self):
+        """Iterate over the [code, deaths] pairs of the store"""
+        for code, deaths in self.deaths.items():
+            yield [code, deaths]
+
+    def deaths_by_code(self, code):
+        """Return number of deaths by ICD-10 code.
+
+        Parameters:
+            code (string), e.g.: 'D35.2'
+
+        Returns an integer, the number of deaths in a
+        single ICD-10 category, e.g.: 50.
+        If the category is not found, returns None.
+        """
+        return self.deaths.get(code)
+
+    def most_deaths(self):
+        """Return the ICD-10 code and number of deaths for the deadliest category.
+
+        The maximum is the last entry of the threshold index, no sorting or
+        scanning is needed.
+
+        Returns a two element list of [code, number_of_deaths], e.g. ['D35.2', 50]
+        If the store is empty, returns None.
+        """
+        if not self.ranked_codes:
+            return None
+        return [self.ranked_codes[-1], self.ranked_deaths[-1]]
+
+    def top_k(self, n, chapter=None):
+        """Return the n deadliest ICD-10 categories.
+
+        Parameters:
+            n: (int) maximum number of categories to return
+            chapter: (int) optional chapter number to restrict the list to
+
+        Returns a list of [code, number_of_deaths] pairs in descending order
+        of deaths, e.g. [['I25.1', 161745], ['C34.9', 154723]]
+        """
+        if chapter is None:
+            codes = self.ranked_codes
+        else:
+            codes = self.chapter_codes.get(chapter, [])
+        return [[code, self.deaths[code]]
+                for code in reversed(codes[max(len(codes) - n, 0):])]
+
+    def codes_above(self, threshold):
+        """Return a list of ICD-10 codes with at least threshold deaths.
+
+        Parameters:
+            threshold: (int) minimum threshold for number of deaths
+
+        Returns a list of codes in ascending order of deaths,
+        e.g. ['D35.2', 'I46.1', 'Y17']
+        """
+        return self.ranked_codes[bisect_left(self.ranked_deaths, threshold):]
+
+    def codes_below(self, threshold):
+        """Return a list of ICD-10 codes with deaths below threshold.
+
+        Parameters:
+            threshold: (int) maximum threshold for number of deaths
+
+        Returns a list of codes in ascending order of deaths,
+        e.g. ['D35.2', 'I46.1', 'Y17']
+        """
+        return self.ranked_codes[:bisect_left(self.ranked_deaths, threshold)]
+
+    def codes_between(self, low, high):
+        """Return a list of ICD-10 codes with low <= deaths < high.
+
+        Parameters:
+            low: (int) minimum threshold for number of deaths
+            high: (int) maximum threshold for number of deaths
+
+        Returns a list of codes in ascending order of deaths,
+        e.g. ['D35.2', 'I46.1', 'Y17']
+        """
+        begin = bisect_left(self.ranked_deaths, low)
+        end = bisect_left(self.ranked_deaths, high)
+        return self.ranked_codes[begin:max(begin, end)]
+
+    def sum_deaths_by_codes(self, codes):
+        """Return the aggregated number of deaths by multiple ICD-10 codes.
+
+        Parameters:
+            codes (iterable of strings), e.g.: ['D35.2', 'I46.1', 'Y17']
+
+        Returns an integer, the aggregated (sum) number of deaths across the
+        specified ICD-10 categories, e.g.: 1713. Every category is counted
+        once, even if it is listed multiple times.
+        """
+        return sum(self.deaths.get(code, 0) for code in set(codes))
+
+    def sum_deaths_by_codes_batch(self, groups):
+        """Return the aggregated number of deaths for many groups of codes.
+
+        Parameters:
+            groups (iterable of code lists), e.g.: [['D35.2', 'Y17'], ['I46.1']]
+
+        The groups are inverted into a code -> group numbers mapping first,
+        so every distinct code is looked up only once, no matter how many
+        groups it belongs to.
+
+        Returns a list of integers, the sum of deaths for each group in the
+        order given, e.g.: [156, 1557]
+        """
+        totals = []
+        members = {}
+        for index, codes in enumerate(groups):
+            totals.append(0)
+            for code in set(codes):
+                members.setdefault(code, []).append(index)
+        for code, indices in members.items():
+            deaths = self.deaths.get(code)
+            if deaths:
+                for index in indices:
+                    totals[index] += deaths
+        return totals
+
+    def sum_deaths_by_query(self, query):
+        """Return the aggregated number of deaths by a query string.
+
+        Parameters:
+            query: (string) search string to match against ICD-10 category names
+
+        Returns an integer, the aggregated (sum) number of deaths across all
+        ICD-10 categories whose name contains the query as a case insensitive
+        substring.
+        """
+        return sum(self.deaths.get(code, 0)
+                   for code in self.text_index.search(query))
+
+    def sum_deaths_by_queries(self, queries):
+        """Return the aggregated number of deaths for each of many queries.
+
+        Parameters:
+            queries (list of strings), e.g.: ['heart', 'lung', 'diabetes']
+
+        Returns a list of integers in the order of the queries, each the
+        same as sum_deaths_by_query(query). The names are scanned once for
+        all queries (see textindex.query_totals), instead of once per query.
+        """
+        return query_totals(queries, self.names, self.deaths.get)
+
+    def search_codes(self, query, mode='fuzzy', n=None):
+        """Return the ICD-10 codes whose name matches a query, best first.
+
+        Parameters:
+            query: (string) search words or regular expression, e.g.:
+                'diabetis', r'diabet.*coma' or 'heart failure'
+            mode: (string) 'fuzzy' for words within a few typos, 'regex' for
+                a regular expression or 'token' for whole words
+            n: (int) optional maximum number of codes to return
+
+        Returns a list of [code, number_of_deaths] pairs, ordered by the
+        edit distance of fuzzy matches, then by deaths descending, e.g.
+        [['E14.9', 30053], ['E14.2', 14495]] (see TrigramIndex.match)
+        """
+        return rank_matches(self.search_index.match(query, mode),
+                            self.deaths.get, n)
+
+    def sum_deaths_by_chapter(self, chapter):
+        """Return the aggregated number of deaths in an ICD-10 chapter.
+
+        Parameters:
+            chapter: (int) the chapter number, e.g.: 9
+
+        Returns an integer, the aggregated (sum) number of deaths across all
+        ICD-10 categories belonging to the specified chapter, 0 for unknown
+        chapters.
+        """
+        return self.chapter_totals.get(chapter, 0)
+
+    def sum_deaths_by_prefix(self, prefix):
+        """Return the aggregated number of deaths by an ICD-10 code prefix.
+
+        Parameters:
+            prefix (string), e.g.: 'I25'
+
+        Returns an integer, the aggregated (sum) number of deaths across all
+        ICD-10 codes starting with prefix, e.g. 'I25', 'I25.1', 'I25.9'.
+        """
+        return self.tree.sum_deaths_by_prefix(prefix)
+
+    def sum_deaths_in_range(self, first, last):
+        """Return the aggregated number of deaths in a range of ICD-10 codes.
+
+        Parameters:
+            first (string): the first code of the range, e.g.: 'C00'
+            last (string): the last code of the range, e.g.: 'D48'
+
+        Returns an integer, the sum of deaths of the codes from first up to
+        and including every code starting with last, e.g. 'D48.9'. Costs two
+        binary searches over the ordered codes and two prefix sums.
+        """
+        begin = bisect_left(self.ordered_codes, first)
+        end = bisect_right(self.ordered_codes, last + PREFIX_END)
+        return (self.cumulative.prefix(max(begin, end)) -
+                self.cumulative.prefix(begin))
+
+    def sum_deaths_by_block(self, block):
+        """Return the aggregated number of deaths in an ICD-10 block.
+
+        Parameters:
+            block (string): the block name, e.g.: 'I20-I25'
+        """
+        return self.tree.sum_deaths_by_block(block)
+
+    def _rank(self, code, deaths):
+        """Return the position of code with deaths in the threshold index"""
+        begin = bisect_left(self.ranked_deaths, deaths)
+        end = bisect_right(self.ranked_deaths, deaths, begin)
+        return bisect_left(self.ranked_codes, code, begin, end)
+
+    def _rank_in_chapter(self, codes, code):
+        """Return the position of code in a chapter list ordered by deaths"""
+        key = (self.deaths[code], code)
+        low, high = 0, len(codes)
+        while low < high:
+            middle = (low + high) // 2
+            if (self.deaths[codes[middle]], codes[middle]) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _update(self, code, deaths):
+        """Change the deaths of one code in every index but the prefix sums
+
+        The code is taken out of the threshold index and its chapter list at
+        its old position and put back at the new one, the chapter total and
+        the tree (if it was built) are adjusted by the difference. New codes
+        are also inserted into the ordered codes.
+        """
+        old = self.deaths.get(code)
+        chapter = chapter_of(code)
+        if old is None:
+            old = 0
+            insort(self.ordered_codes, code)
+        else:
+            index = self._rank(code, old)
+            del self.ranked_codes[index]
+            del self.ranked_deaths[index]
+            if chapter is not None:
+                codes = self.chapter_codes[chapter]
+                del codes[self._rank_in_chapter(codes, code)]
+        self.deaths[code] = deaths
+        index = self._rank(code, deaths)
+        self.ranked_codes.insert(index, code)
+        self.ranked_deaths.insert(index, deaths)
+        if chapter is not None:
+            codes = self.chapter_codes.setdefault(chapter, [])
+            codes.insert(self._rank_in_chapter(codes, code), code)
+            self.chapter_totals[chapter] = (
+                self.chapter_totals.get(chapter, 0) + deaths - old)
+        if self._tree is not None:
+            self._tree.add(code, deaths - old)
+
+    def add_deaths(self, code, deaths):
+        """Add deaths to an ICD-10 code, updating every index
+
+        Parameters:
+            code (string), e.g.: 'D35.2'
+            deaths (int): the number of deaths to add, may be negative
+
+        Unknown codes are added to the store. Raises a ValueError exception
+        if the number of deaths of the code would become negative.
+        """
+        self.apply_batch([[code, deaths]])
+
+    def set_deaths(self, code, deaths):
+        """Set the number of deaths of an ICD-10 code, updating every index
+
+        Parameters:
+            code (string), e.g.: 'D35.2'
+            deaths (int): the new number of deaths, e.g.: 52
+
+        Unknown codes are added to the store. Raises a ValueError exception
+        for negative numbers of deaths.
+        """
+        self.apply_batch([[code, deaths - self.deaths.get(code, 0)]])
+
+    def apply_batch(self, updates):
+        """Add deaths to many ICD-10 codes, updating every index once
+
+        Parameters:
+            updates (iterable of pairs), e.g.: [['D35.2', 2], ['Y17', -1]]
+
+        Repeated codes are aggregated first, so every changed code is moved
+        in the threshold index and its prefix sums are updated once. Costs
+        O(k log n) searches and prefix sum updates plus the list insertions
+        for k changed codes, instead of sorting all n codes again. New codes
+        shift the ordered codes, the prefix sums are then built again in
+        O(n), like the list insertion costs. The version number is
+        incremented, which invalidates cached results (see
+        cache.ResultCache).
+
+        Raises a ValueError exception, without changing anything, if the
+        number of deaths of a code would become negative.
+        """
+        totals = {}
+        for code, deaths in updates:
+            totals[code] = totals.get(code, self.deaths.get(code, 0)) + deaths
+        for code, deaths in totals.items():
+            if deaths < 0:
+                raise ValueError('negative number of deaths for {}: {}'
+                                 .format(code, deaths))
+        changed = [code for code, deaths in totals.items()
+                   if deaths != self.deaths.get(code)]
+        if not changed:
+            return
+        deltas = {code: totals[code] - self.deaths.get(code, 0)
+                  for code in changed}
+        inserted = any(code not in self.deaths for code in changed)
+        for code in changed:
+            self._update(code, totals[code])
+        if inserted:
+            self._index_ranges()
+        else:
+            for code, delta in deltas.items():
+                self.cumulative.add(bisect_left(self.ordered_codes, code),
+                                    delta)
+        self._distribution = None
+        self.version += 1
+
+
+###############################################################################
+# TEST functions
+
+def test_fenwick_tree():
+    """Test FenwickTree prefix sums and point updates"""
+    values = [5, 0, 3, 7, 1, 2, 9]
+    tree = FenwickTree(values)
+    assert len(tree) == 7
+    assert [tree.prefix(count) for count in range(8)] == [
+        sum(values[:count]) for count in range(8)]
+    tree.add(2, 4)
+    tree.add(6, -9)
+    values[2] += 4
+    values[6] -= 9
+    assert [tree.prefix(count) for count in range(8)] == [
+        sum(values[:count]) for count in range(8)]
+    assert tree == FenwickTree(values)
+    assert FenwickTree().prefix(0) == 0
+
+
+def test_store_deaths_by_code():
+    """Test MortalityStore.deaths_by_code() method"""
+    store = MortalityStore([['D35.2', 50], ['Y17', 3], ['D35.2', 2]])
+    assert len(store) == 2
+    assert 'Y17' in store
+    assert 'I25.1' not in store
+    assert store.deaths_by_code('D35.2') == 52
+    assert store.deaths_by_code('Y17') == 3
+    assert store.deaths_by_code('') is None
+    assert sorted(store) == [['D35.2', 52], ['Y17', 3]]
+
+
+def test_store_thresholds():
+    """Test MortalityStore threshold queries"""
+    store = MortalityStore([['A', 5], ['B', 1], ['C', 5], ['D', 9]])
+    assert store.codes_above(-1) == ['B', 'A', 'C', 'D']
+    assert store.codes_above(5) == ['A', 'C', 'D']
+    assert store.codes_above(10) == []
+    assert store.codes_below(5) == ['B']
+    assert store.codes_below(0) == []
+    assert store.codes_below(1e10) == ['B', 'A', 'C', 'D']
+    assert store.codes_between(1, 9) == ['B', 'A', 'C']
+    assert store.codes_between(2, 5) == []
+    assert store.codes_between(9, 1) == []
+
+
+def test_store_top_k():
+    """Test MortalityStore.most_deaths() and top_k() methods"""
+    assert MortalityStore().most_deaths() is None
+    assert MortalityStore().top_k(3) == []
+    store = MortalityStore([['A01', 5], ['I25.1', 1], ['I10', 7], ['D35.2', 9]])
+    assert store.most_deaths() == ['D35.2', 9]
+    assert store.top_k(0) == []
+    assert store.top_k(2) == [['D35.2', 9], ['I10', 7]]
+    assert store.top_k(10) == [['D35.2', 9], ['I10', 7], ['A01', 5],
+                               ['I25.1', 1]]
+    assert store.top_k(5, chapter=9) == [['I10', 7], ['I25.1', 1]]
+    assert store.top_k(1, chapter=9) == [['I10', 7]]
+    assert store.top_k(5, chapter=22) == []
+
+
+def test_store_sum_deaths_by_codes():
+    """Test MortalityStore.sum_deaths_by_codes() and batch methods"""
+    store = MortalityStore([['D35.2', 50], ['Y17', 3], ['I46.1', 1660]])
+    assert store.sum_deaths_by_codes([]) == 0
+    assert store.sum_deaths_by_codes(('Y17', 'D35.2', 'Y17', 'X')) == 53
+    assert store.sum_deaths_by_codes_batch([]) == []
+    assert store.sum_deaths_by_codes_batch(
+        [['D35.2', 'Y17'], ['I46.1'], [], ['X', 'Y17', 'Y17'],
+         store.deaths]) == [53, 1660, 0, 3, 1713]
+
+
+def test_store_sum_deaths_by_query():
+    """Test MortalityStore.sum_deaths_by_query() method"""
+    store = MortalityStore([['I50.0', 5], ['I51.7', 1], ['J18.9', 7]],
+                           {'I50.0': 'Congestive heart failure',
+                            'I51.7': 'Cardiomegaly',
+                            'J18.9': 'Pneumonia, unspecified',
+                            'I42.9': 'Cardiomyopathy, unspecified'})
+    assert store.sum_deaths_by_query('Heart') == 5
+    assert store.sum_deaths_by_query('cardio') == 1
+    assert store.sum_deaths_by_query('unspecified') == 7
+    assert store.sum_deaths_by_query('') == 13
+    assert store.sum_deaths_by_query('broccoli') == 0
+    assert MortalityStore([['I50.0', 5]]).sum_deaths_by_query('heart') == 0
+    assert store.search_codes('hearth failur') == [['I50.0', 5]]
+    assert store.search_codes('cardio.*y,', 'regex') == [['I42.9', 0]]
+    assert store.search_codes('UNSPECIFIED', 'token', n=1) == [['J18.9', 7]]
+    assert store.sum_deaths_by_queries(['Heart', 'cardio', 'unspecified', '',
+                                        'broccoli', 'heart']) == [5, 1, 7, 13,
+                                                                   0, 5]
+
+
+def test_store_lazy_names():
+    """Test MortalityStore loading the names on first use"""
+    calls = []
+
+    def load_names():
+        calls.append(True)
+        return {'I50.0': 'Congestive heart failure'}
+
+    store = MortalityStore([['I50.0', 5], ['I51.7', 1]], load_names)
+    assert store.deaths_by_code('I50.0') == 5
+    assert store.codes_above(1) == ['I51.7', 'I50.0']
+    assert store.sum_deaths_by_chapter(9) == 6
+    assert calls == []
+    assert store.sum_deaths_by_query('heart') == 5
+    assert store.sum_deaths_by_query('failure') == 5
+    assert calls == [True]
+
+
+def test_store_description_names():
+    """Test MortalityStore searching a DescriptionStore"""
+    from cdc import db, code_names
+    from descriptions import DescriptionStore
+    reference = MortalityStore(db, code_names)
+    store = MortalityStore(db, lambda: DescriptionStore(code_names))
+    for query in ('heart', 'Malignant', 'heart failure', ''):
+        assert (store.sum_deaths_by_query(query) ==
+                reference.sum_deaths_by_query(query))
+
+
+def test_store_sum_deaths_by_chapter():
+    """Test MortalityStore.sum_deaths_by_chapter() method"""
+    store = MortalityStore([['A01', 5], ['B99.1', 1], ['I10', 7],
+                            ['N18.9', 9], ['D49', 100]])
+    assert store.sum_deaths_by_chapter(1) == 6
+    assert store.sum_deaths_by_chapter(9) == 7
+    assert store.sum_deaths_by_chapter(14) == 9
+    assert store.sum_deaths_by_chapter(2) == 0
+    assert store.sum_deaths_by_chapter(0) == 0
+    assert store.chapter_codes[1] == ['B99.1', 'A01']
+
+
+def test_store_sum_deaths_by_prefix():
+    """Test MortalityStore prefix and block sums"""
+    store = MortalityStore([['I25.1', 5], ['I25', 2], ['I21.0', 4],
+                            ['I10', 1]])
+    assert store.sum_deaths_by_prefix('I25') == 7
+    assert store.sum_deaths_by_prefix('I2') == 11
+    assert store.sum_deaths_by_prefix('J') == 0
+    assert store.sum_deaths_by_block('I20-I25') == 11
+    assert store.sum_deaths_by_block('I26-I28') == 0
+    assert store.tree.children(9) == [['I10-I15', 1], ['I20-I25', 11]]
+
+
+def test_store_sum_deaths_in_range():
+    """Test MortalityStore.sum_deaths_in_range() method"""
+    store = MortalityStore([['I25.1', 5], ['I25', 2], ['I21.0', 4],
+                            ['I10', 1], ['J18.9', 3]])
+    assert store.sum_deaths_in_range('I00', 'I99') == 12
+    assert store.sum_deaths_in_range('I21', 'I25') == 11
+    assert store.sum_deaths_in_range('I21.1', 'I25') == 7
+    assert store.sum_deaths_in_range('I10', 'I10') == 1
+    assert store.sum_deaths_in_range('I25.1', 'J18.9') == 8
+    assert store.sum_deaths_in_range('J', 'I') == 0
+    assert MortalityStore().sum_deaths_in_range('A00', 'Z99') == 0
+
+
+def test_store_updates():
+    """Test MortalityStore incremental updates against rebuilt indexes"""
+    store = MortalityStore([['I25.1', 5], ['I25', 2], ['I21.0', 4],
+                            ['I10', 1], ['J18.9', 3], ['A01', 5]])
+    assert store.tree.total(9) == 12
+    assert store.distribution.quantile(1) == 5
+    store.add_deaths('I10', 6)
+    assert store.version == 1
+    assert store.most_deaths() == ['I10', 7]
+    assert store.codes_above(5) == ['A01', 'I25.1', 'I10']
+    store.set_deaths('I25.1', 0)
+    store.add_deaths('K35.8', 8)
+    store.apply_batch([['J18.9', -3], ['A01', 1], ['I25', 4], ['A01', 1]])
+    assert store.deaths_by_code('A01') == 7
+    assert store.sum_deaths_by_chapter(9) == 17
+    assert store.sum_deaths_in_range('I00', 'J99') == 17
+    assert store.sum_deaths_by_block('I20-I25') == 10
+    assert store.top_k(2, chapter=9) == [['I10', 7], ['I25', 6]]
+    assert store.top_k(1) == [['K35.8', 8]]
+    version = store.version
+    store.apply_batch([['I10', 0], ['A01', 0]])
+    store.set_deaths('I10', 7)
+    assert store.version == version
+    try:
+        store.apply_batch([['K35.8', 1], ['I10', -8]])
+    except ValueError:
+        pass
+    else:
+        assert False, 'negative deaths accepted'
+    assert store.deaths_by_code('K35.8') == 8
+    rebuilt = MortalityStore(store)
+    for name in ('deaths', 'ranked_codes', 'ranked_deaths', 'chapter_codes',
+                 'chapter_totals', 'ordered_codes', 'cumulative'):
+        assert getattr(store, name) == getattr(rebuilt, name), name
+    assert store.tree.children(9) == rebuilt.tree.children(9)
+    assert store.distribution.deaths == rebuilt.ranked_deaths
+
+
+def test_store_updates_cdc():
+    """Test MortalityStore random updates on the CDC data"""
+    import random
+    from cdc import db
+    store = MortalityStore(db)
+    store.tree
+    generator = random.Random(17)
+    codes = [code for code, deaths in db] + ['U07.1', 'Z99.9']
+    for step in range(200):
+        code = generator.choice(codes)
+        store.add_deaths(code, generator.randint(-store.deaths.get(code, 0),
+                                                 1000))
+    rebuilt = MortalityStore(store)
+    for name in ('ranked_codes', 'ranked_deaths', 'chapter_codes',
+                 'chapter_totals', 'ordered_codes', 'cumulative'):
+        assert getattr(store, name) == getattr(rebuilt, name), name
+    for chapter in range(1, 23):
+        assert (store.tree.sum_deaths_by_chapter(chapter) ==
+                rebuilt.tree.sum_deaths_by_chapter(chapter))
+
+
+if __name__ == '__main__':
+    import sys
+    import traceback
+
+    for test in (test_fenwick_tree,
+                 test_store_deaths_by_code,
+                 test_store_thresholds,
+                 test_store_top_k,
+                 test_store_sum_deaths_by_codes,
+                 test_store_sum_deaths_by_query,
+                 test_store_lazy_names,
+                 test_store_description_names,
+                 test_store_sum_deaths_by_chapter,
+                 test_store_sum_deaths_by_prefix,
+                 test_store_sum_deaths_in_range,
+                 test_store_updates,
+                 test_store_updates_cdc):
+        try:
+            print(test.__doc__, '... ', end='', flush=True)
+            test()
+            print('PASSED')
+        except:
+            print('FAILED')
+            exc_info = sys.exc_info()
+            traceback.print_exception(*exc_info)
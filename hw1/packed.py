@@ -0,0 +1,277 @@
+"""Compact array storage for the CDC Mortality Database
+
+Every row of cdc.db is a list holding a str and an int, well over a hundred
+bytes of object overhead per code. The PackedStore keeps the same data in a
+few typed arrays instead: the codes packed into 32-bit integers (see
+icd.encode_code) in array('I'), and the deaths in array('q'). The integer
+codes sort like the strings, so chapters, blocks, prefixes and code ranges
+are integer ranges over the sorted codes, summed with a cumulative array.
+
+The query methods take and return the usual string codes, the conversion
+happens at this boundary only.
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+
+from distribution import DeathDistribution
+from icd import CHAPTERS, block_of, decode_code, encode_code, prefix_range
+from textindex import NamedStore, query_totals, rank_matches
+
+
+class PackedStore(NamedStore):
+    """Typed array backed view of a list of [code, deaths] pairs"""
+
+    def __init__(self, rows=(), names=None):
+        """Build the arrays from [code, deaths] pairs
+
+        Parameters:
+            rows (iterable of pairs), e.g.: [['D35.2', 50], ['Y17', 3]]
+            names (dict): optional ICD-10 category names by code, or a
+                function returning them, which is called on first use
+
+        Repeated codes are aggregated, i.e. their deaths are summed up.
+        Raises a ValueError exception for malformed ICD-10 codes.
+        """
+        totals = {}
+        for code, deaths in rows:
+            value = encode_code(code)
+            totals[value] = totals.get(value, 0) + deaths
+        self.codes = array('I', sorted(totals))
+        self.deaths = array('q', [totals[value] for value in self.codes])
+        self.cumulative = array('q', [0])
+        for deaths in self.deaths:
+            self.cumulative.append(self.cumulative[-1] + deaths)
+        ranked = sorted(range(len(self.codes)),
+                        key=lambda x: (self.deaths[x], self.codes[x]))
+        self.ranked = array('I', ranked)
+        self.ranked_deaths = array('q', [self.deaths[x] for x in ranked])
+        self._set_names(names)
+        self._distribution = None
+
+    @property
+    def distribution(self):
+        """Quantiles and shares of the deaths per code, built on first use"""
+        if self._distribution is None:
+            self._distribution = DeathDistribution(self.ranked_deaths,
+                                                   presorted=True)
+        return self._distribution
+
+    def __len__(self):
+        """Get the number of distinct ICD-10 codes in the store"""
+        return len(self.codes)
+
+    def __contains__(self, code):
+        """Test if the ICD-10 code has an entry in the store"""
+        return self._position(code) is not None
+
+    def __iter__(self):
+        """Iterate over the [code, deaths] pairs of the store"""
+        for value, deaths in zip(self.codes, self.deaths):
+            yield [decode_code(value), deaths]
+
+    def _position(self, code):
+        """Return the index of code in the arrays, or None"""
+        try:
+            value = encode_code(code)
+        except ValueError:
+            return None
+        index = bisect_left(self.codes, value)
+        if index < len(self.codes) and self.codes[index] == value:
+            return index
+        return None
+
+    def _span(self, low, high):
+        """Return the slice of the codes encoded between low and high"""
+        begin = bisect_left(self.codes, low)
+        return begin, max(begin, bisect_right(self.codes, high))
+
+    def _sum_span(self, begin, end):
+        """Return the aggregated deaths of the codes[begin:end] slice"""
+        return self.cumulative[end] - self.cumulative[begin]
+
+    def _ranked_codes(self, begin, end):
+        """Return the codes of ranked[begin:end] as strings"""
+        return [decode_code(self.codes[index])
+                for index in self.ranked[begin:end]]
+
+    def deaths_by_code(self, code):
+        """Return number of deaths by ICD-10 code, or None if not found."""
+        index = self._position(code)
+        return None if index is None else self.deaths[index]
+
+    def most_deaths(self):
+        """Return [code, number_of_deaths] for the deadliest category, or None."""
+        if not self.ranked:
+            return None
+        return [decode_code(self.codes[self.ranked[-1]]), self.ranked_deaths[-1]]
+
+    def top_k(self, n, chapter=None):
+        """Return the n deadliest ICD-10 categories.
+
+        Parameters:
+            n: (int) maximum number of categories to return
+            chapter: (int) optional chapter number to restrict the list to
+
+        Returns a list of [code, number_of_deaths] pairs in descending order
+        of deaths, e.g. [['I25.1', 161745], ['C34.9', 154723]]
+        """
+        if n <= 0:
+            return []
+        if chapter is None:
+            indexes = self.ranked[-n:]
+        elif chapter in CHAPTERS:
+            first, last = CHAPTERS[chapter]
+            begin, end = self._span(prefix_range(first)[0],
+                                    prefix_range(last)[1])
+            indexes = sorted(range(begin, end),
+                             key=lambda x: (self.deaths[x], self.codes[x]))[-n:]
+        else:
+            return []
+        return [[decode_code(self.codes[index]), self.deaths[index]]
+                for index in reversed(indexes)]
+
+    def codes_above(self, threshold):
+        """Return a list of ICD-10 codes with at least threshold deaths."""
+        return self._ranked_codes(bisect_left(self.ranked_deaths, threshold),
+                                  len(self.ranked))
+
+    def codes_below(self, threshold):
+        """Return a list of ICD-10 codes with deaths below threshold."""
+        return self._ranked_codes(0, bisect_left(self.ranked_deaths, threshold))
+
+    def codes_between(self, low, high):
+        """Return a list of ICD-10 codes with low <= deaths < high."""
+        begin = bisect_left(self.ranked_deaths, low)
+        end = bisect_left(self.ranked_deaths, high)
+        return self._ranked_codes(begin, max(begin, end))
+
+    def sum_deaths_by_codes(self, codes):
+        """Return the aggregated number of deaths by multiple ICD-10 codes."""
+        return sum(self.deaths_by_code(code) or 0 for code in set(codes))
+
+    def sum_deaths_by_codes_batch(self, groups):
+        """Return the aggregated number of deaths for many groups of codes."""
+        return [self.sum_deaths_by_codes(codes) for codes in groups]
+
+    def sum_deaths_by_query(self, query):
+        """Return the aggregated number of deaths by a query string."""
+        return self.sum_deaths_by_codes(self.text_index.search(query))
+
+    def sum_deaths_by_queries(self, queries):
+        """Return the aggregated number of deaths for each of many queries."""
+        return query_totals(queries, self.names, self.deaths_by_code)
+
+    def search_codes(self, query, mode='fuzzy', n=None):
+        """Return the ICD-10 codes whose name matches a query, best first."""
+        return rank_matches(self.search_index.match(query, mode),
+                            self.deaths_by_code, n)
+
+    def sum_deaths_by_chapter(self, chapter):
+        """Return the aggregated number of deaths in an ICD-10 chapter."""
+        if chapter not in CHAPTERS:
+            return 0
+        return self.sum_deaths_in_range(*CHAPTERS[chapter])
+
+    def sum_deaths_by_prefix(self, prefix):
+        """Return the aggregated number of deaths by an ICD-10 code prefix."""
+        bounds = prefix_range(prefix)
+        if bounds is None:
+            return 0
+        return self._sum_span(*self._span(*bounds))
+
+    def sum_deaths_in_range(self, first, last):
+        """Return the aggregated number of deaths in a range of ICD-10 codes.
+
+        Parameters:
+            first (string): the first code of the range, e.g.: 'C00'
+            last (string): the last code of the range, e.g.: 'D48'
+
+        Returns an integer, the sum of deaths of the codes from first up to
+        and including every code starting with last, e.g. 'D48.9'.
+        """
+        low = prefix_range(first)
+        high = prefix_range(last)
+        if low is None or high is None:
+            return 0
+        return self._sum_span(*self._span(low[0], high[1]))
+
+    def sum_deaths_by_block(self, block):
+        """Return the aggregated number of deaths in an ICD-10 block.
+
+        Parameters:
+            block (string): the block name, e.g.: 'I20-I25'
+        """
+        if block_of(block.partition('-')[0]) != block:
+            return 0
+        return self.sum_deaths_in_range(*block.split('-'))
+
+
+###############################################################################
+# TEST functions
+
+def test_packed_store():
+    """Test PackedStore queries"""
+    store = PackedStore([['I25.1', 5], ['I25', 2], ['I21.0', 4], ['I10', 1],
+                         ['J18.9', 3], ['I25.1', 1]],
+                        lambda: {'I25.1': 'Atherosclerotic heart disease',
+                                 'J18.9': 'Pneumonia, unspecified'})
+    assert len(store) == 5
+    assert 'I25' in store and 'I26' not in store and 'x' not in store
+    assert list(store) == [['I10', 1], ['I21.0', 4], ['I25', 2],
+                           ['I25.1', 6], ['J18.9', 3]]
+    assert store.deaths_by_code('I25.1') == 6
+    assert store.deaths_by_code('does not exist') is None
+    assert store.most_deaths() == ['I25.1', 6]
+    assert store.top_k(2) == [['I25.1', 6], ['I21.0', 4]]
+    assert store.top_k(9, chapter=10) == [['J18.9', 3]]
+    assert store.top_k(9, chapter=99) == []
+    assert store.codes_above(4) == ['I21.0', 'I25.1']
+    assert store.codes_below(3) == ['I10', 'I25']
+    assert store.codes_between(2, 5) == ['I25', 'J18.9', 'I21.0']
+    assert store.sum_deaths_by_codes(['I10', 'I10', 'K00', '']) == 1
+    assert store.sum_deaths_by_codes_batch([['I10'], []]) == [1, 0]
+    assert store.sum_deaths_by_query('HEART') == 6
+    assert store.search_codes('hearth') == [['I25.1', 6]]
+    assert store.sum_deaths_by_queries(['HEART', 'pneumonia', 'x']) == [6, 3, 0]
+    assert store.sum_deaths_by_chapter(9) == 13
+    assert store.sum_deaths_by_prefix('I25') == 8
+    assert store.sum_deaths_by_prefix('I25.') == 6
+    assert store.sum_deaths_by_prefix('bad') == 0
+    assert store.sum_deaths_in_range('I21', 'I25') == 12
+    assert store.sum_deaths_in_range('I25.1', 'J') == 9
+    assert store.sum_deaths_by_block('I20-I25') == 12
+    assert PackedStore().most_deaths() is None
+
+
+def test_packed_store_cdc():
+    """Test PackedStore against MortalityStore on the CDC data"""
+    from cdc import db
+    from mortality import MortalityStore
+    reference = MortalityStore(db)
+    store = PackedStore(db)
+    assert sorted(store) == sorted(reference)
+    assert store.most_deaths() == reference.most_deaths()
+    assert store.top_k(25) == reference.top_k(25)
+    for chapter in range(0, 24):
+        assert (store.sum_deaths_by_chapter(chapter) ==
+                reference.sum_deaths_by_chapter(chapter))
+        assert store.top_k(5, chapter) == reference.top_k(5, chapter)
+    for threshold in (0, 10, 1000, 10 ** 6):
+        assert store.codes_above(threshold) == reference.codes_above(threshold)
+        assert store.codes_below(threshold) == reference.codes_below(threshold)
+
+
+if __name__ == '__main__':
+    import sys
+    import traceback
+
+    for test in (test_packed_store,
+                 test_packed_store_cdc):
+        try:
+            print(test.__doc__, '... ', end='', flush=True)
+            test()
+            print('PASSED')
+        except:
+            print('FAILED')
+            exc_info = sys.exc_info()
+            traceback.print_exception(*exc_info)
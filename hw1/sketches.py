@@ -0,0 +1,380 @@
+"""Approximate death counts in fixed memory
+
+Exact counters need one entry per distinct code. The summaries here use a
+fixed amount of memory, no matter how many codes or deaths they see, and
+can be merged, e.g. the summaries of several processes or edge nodes into
+one, with the same error bounds as a single summary of all their deaths.
+
+CountMinSketch: estimates the deaths of any code. For a sketch of width w
+and depth d over N deaths in total, an estimate is never below the true
+count, and exceeds it by more than e / w * N with probability of at most
+exp(-d) only.
+
+SpaceSaving: keeps the k codes which look deadliest, with an upper and a
+lower bound of their deaths. Over N deaths in total, every code with more
+than N / k deaths is kept, and every count is at most N / k too high.
+
+Both are fed [code, deaths] pairs, like the other stores, and answer
+deaths_by_code; SpaceSaving also answers top_k and most_deaths. They do not
+answer the other store queries, so hw1.use_store does not accept them.
+"""
+import math
+from array import array
+from hashlib import blake2b
+from heapq import heapify, heappop, heappush, nlargest
+
+from icd import chapter_of
+
+
+class CountMinSketch:
+    """Count-min sketch of the deaths by ICD-10 code"""
+
+    def __init__(self, width=2048, depth=5, seed=0):
+        """Create an empty sketch
+
+        Parameters:
+            width (int): the number of counters per row, the error bound is
+                e / width of all deaths
+            depth (int): the number of rows, the error bound fails with
+                probability exp(-depth)
+            seed (int): selects the hash functions, sketches can only be
+                merged with sketches of the same shape and seed
+        """
+        if width <= 0 or depth <= 0:
+            raise ValueError('sketch width and depth must be positive')
+        self.width = width
+        self.depth = depth
+        self.seed = seed
+        self.total = 0
+        self.rows = [array('q', bytes(8 * width)) for row in range(depth)]
+
+    @classmethod
+    def from_error(cls, epsilon, delta, seed=0):
+        """Create a sketch for an error bound
+
+        Parameters:
+            epsilon (float): the error as a fraction of all deaths, e.g.: 0.001
+            delta (float): the probability of exceeding it, e.g.: 0.01
+
+        E.g.: CountMinSketch.from_error(0.001, 0.01) has 2719 x 5 counters.
+        """
+        return cls(math.ceil(math.e / epsilon),
+                   math.ceil(math.log(1 / delta)), seed)
+
+    def _columns(self, code):
+        """Return the counter of code in every row
+
+        The hash does not depend on the process (unlike hash()), so sketches
+        built apart can be merged. Two halves of one digest are combined to
+        depth hashes, as in Kirsch and Mitzenmacher, 2006.
+        """
+        digest = blake2b(code.encode('utf-8'), digest_size=16,
+                         salt=self.seed.to_bytes(16, 'little')).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return [(first + row * second) % self.width
+                for row in range(self.depth)]
+
+    def add(self, code, deaths=1):
+        """Count deaths of an ICD-10 code
+
+        Parameters:
+            code (string), e.g.: 'I25.1'
+            deaths (int): the number of deaths to add, not negative
+        """
+        if deaths < 0:
+            raise ValueError('negative number of deaths: {}'.format(deaths))
+        for row, column in zip(self.rows, self._columns(code)):
+            row[column] += deaths
+        self.total += deaths
+
+    def update(self, rows):
+        """Count [code, deaths] pairs, e.g. cdc.db or a store"""
+        for code, deaths in rows:
+            self.add(code, deaths)
+
+    def deaths_by_code(self, code):
+        """Return the estimated number of deaths by ICD-10 code.
+
+        Parameters:
+            code (string), e.g.: 'D35.2'
+
+        Returns an integer, at least the true number of deaths, 0 for codes
+        never counted (unless all their counters collided).
+        """
+        return min(row[column]
+                   for row, column in zip(self.rows, self._columns(code)))
+
+    def sum_deaths_by_codes(self, codes):
+        """Return the estimated aggregated number of deaths of codes."""
+        return sum(self.deaths_by_code(code) for code in set(codes))
+
+    def error_bound(self):
+        """Return the bound of the overestimate, e / width of all deaths"""
+        return math.e / self.width * self.total
+
+    def merge(self, other):
+        """Add the counts of another sketch to this one
+
+        Raises a ValueError exception if the sketches differ in shape or
+        seed.
+        """
+        if (self.width, self.depth, self.seed) != (
+                other.width, other.depth, other.seed):
+            raise ValueError('can not merge sketches of different shapes')
+        for row, counts in zip(self.rows, other.rows):
+            for column, deaths in enumerate(counts):
+                if deaths:
+                    row[column] += deaths
+        self.total += other.total
+        return self
+
+
+class SpaceSaving:
+    """Space-Saving summary of the deadliest ICD-10 codes"""
+
+    def __init__(self, capacity=100):
+        """Create an empty summary
+
+        Parameters:
+            capacity (int): the number k of codes kept, every code with more
+                than 1 / k of all deaths is found
+        """
+        if capacity <= 0:
+            raise ValueError('capacity must be positive')
+        self.capacity = capacity
+        self.total = 0
+        self.counts = {}
+        self.errors = {}
+        # (count, code) of every kept code, a count may be outdated (lower)
+        self._heap = []
+
+    def __len__(self):
+        """Get the number of codes kept"""
+        return len(self.counts)
+
+    def __contains__(self, code):
+        """Test if the ICD-10 code is kept in the summary"""
+        return code in self.counts
+
+    def __iter__(self):
+        """Iterate over the [code, deaths] pairs, deaths being upper bounds"""
+        for code, deaths in self.counts.items():
+            yield [code, deaths]
+
+    def _smallest(self):
+        """Return the code with the smallest count, fixing outdated entries
+
+        Counts only grow, so an outdated heap entry is below the real count.
+        Such entries are pushed back with their count until the top of the
+        heap is current, O(log k) amortized.
+        """
+        while True:
+            count, code = self._heap[0]
+            if self.counts[code] == count:
+                return code
+            heappush(self._heap, (self.counts[code], code))
+            heappop(self._heap)
+
+    def _minimum(self):
+        """Return the smallest count kept, 0 if the summary is not full"""
+        if len(self.counts) < self.capacity:
+            return 0
+        return self.counts[self._smallest()]
+
+    def add(self, code, deaths=1):
+        """Count deaths of an ICD-10 code
+
+        Parameters:
+            code (string), e.g.: 'I25.1'
+            deaths (int): the number of deaths to add, not negative
+
+        A new code in a full summary replaces the code with the smallest
+        count, and inherits that count as its possible error. The smallest
+        count is found with a heap, O(log k) amortized, O(1) otherwise.
+        """
+        if deaths < 0:
+            raise ValueError('negative number of deaths: {}'.format(deaths))
+        self.total += deaths
+        if code in self.counts:
+            self.counts[code] += deaths
+            return
+        error = 0
+        if len(self.counts) >= self.capacity:
+            victim = self._smallest()
+            heappop(self._heap)
+            error = self.counts.pop(victim)
+            del self.errors[victim]
+        self.counts[code] = error + deaths
+        self.errors[code] = error
+        heappush(self._heap, (error + deaths, code))
+
+    def update(self, rows):
+        """Count [code, deaths] pairs, e.g. cdc.db or a store"""
+        for code, deaths in rows:
+            self.add(code, deaths)
+
+    def deaths_by_code(self, code):
+        """Return the estimated number of deaths by ICD-10 code.
+
+        Parameters:
+            code (string), e.g.: 'D35.2'
+
+        Returns an integer, an upper bound of the deaths which exceeds them
+        by at most the code's error (see bounds), or None for codes not
+        kept, which have at most as many deaths as the smallest count.
+        """
+        return self.counts.get(code)
+
+    def bounds(self, code):
+        """Return the (lower, upper) bounds of the deaths of an ICD-10 code"""
+        if code not in self.counts:
+            return 0, self._minimum()
+        return self.counts[code] - self.errors[code], self.counts[code]
+
+    def error_bound(self):
+        """Return the bound of every overestimate, all deaths / capacity"""
+        return self.total / self.capacity
+
+    def most_deaths(self):
+        """Return [code, number_of_deaths] of the deadliest code, or None."""
+        top = self.top_k(1)
+        return top[0] if top else None
+
+    def top_k(self, n, chapter=None):
+        """Return the n deadliest ICD-10 codes kept.
+
+        Parameters:
+            n: (int) maximum number of codes to return
+            chapter: (int) optional chapter number to restrict the list to
+
+        Returns a list of [code, number_of_deaths] pairs in descending order
+        of (estimated) deaths, e.g. [['I25.1', 161745], ['C34.9', 154723]]
+        A code is certainly among the n deadliest if its lower bound is not
+        below the estimate of the code ranked n + 1.
+        """
+        counts = self.counts.items()
+        if chapter is not None:
+            counts = [(code, deaths) for code, deaths in counts
+                      if chapter_of(code) == chapter]
+        return [[code, deaths] for code, deaths in
+                nlargest(n, counts, key=lambda x: (x[1], x[0]))]
+
+    def merge(self, other):
+        """Add the counts of another summary to this one
+
+        A code missing from one of the summaries may have had up to its
+        smallest count there, which is added to its count and error, so the
+        counts stay upper bounds. The capacity largest merged counts are
+        kept (Agarwal et al., Mergeable Summaries, 2012).
+        """
+        minimums = self._minimum(), other._minimum()
+        counts = {}
+        errors = {}
+        for code in set(self.counts) | set(other.counts):
+            count = error = 0
+            for summary, minimum in zip((self, other), minimums):
+                if code in summary.counts:
+                    count += summary.counts[code]
+                    error += summary.errors[code]
+                else:
+                    count += minimum
+                    error += minimum
+            counts[code] = count
+            errors[code] = error
+        kept = nlargest(self.capacity, counts, key=lambda x: (counts[x], x))
+        self.counts = {code: counts[code] for code in kept}
+        self.errors = {code: errors[code] for code in kept}
+        self._heap = [(count, code) for code, count in self.counts.items()]
+        heapify(self._heap)
+        self.total += other.total
+        return self
+
+
+###############################################################################
+# TEST functions
+
+def test_count_min_sketch():
+    """Test CountMinSketch estimates, error bound and merging"""
+    from cdc import db
+    sketch = CountMinSketch.from_error(0.001, 0.01)
+    assert (sketch.width, sketch.depth) == (2719, 5)
+    sketch.update(db)
+    total = sum(deaths for code, deaths in db)
+    assert sketch.total == total
+    errors = [sketch.deaths_by_code(code) - deaths for code, deaths in db]
+    assert min(errors) >= 0
+    assert sum(error > sketch.error_bound() for error in errors) < len(db) / 50
+    assert sketch.deaths_by_code('I25.1') >= 161745
+    assert sketch.sum_deaths_by_codes(['I25.1', 'I25.1']) == (
+        sketch.deaths_by_code('I25.1'))
+    halves = [CountMinSketch(2719, 5), CountMinSketch(2719, 5)]
+    for index, (code, deaths) in enumerate(db):
+        halves[index % 2].add(code, deaths)
+    merged = halves[0].merge(halves[1])
+    assert merged.rows == sketch.rows and merged.total == total
+    try:
+        merged.merge(CountMinSketch(2719, 5, seed=1))
+    except ValueError:
+        pass
+    else:
+        assert False, 'different seeds merged'
+
+
+def test_space_saving():
+    """Test SpaceSaving heavy hitters, bounds and merging"""
+    import random
+    from cdc import db
+    rows = list(db)
+    random.Random(19).shuffle(rows)
+    exact = dict(rows)
+    summary = SpaceSaving(200)
+    summary.update(rows)
+    assert len(summary) == 200
+    assert summary.most_deaths() == ['I25.1', 161745 + summary.errors['I25.1']]
+    for code, deaths in exact.items():
+        lower, upper = summary.bounds(code)
+        assert lower <= deaths <= upper
+        if deaths > summary.error_bound():
+            assert code in summary
+    assert summary.deaths_by_code('does not exist') is None
+    top = sorted(code for code, deaths in summary.top_k(10))
+    assert top == sorted(code for code, deaths in
+                         sorted(rows, key=lambda x: x[1])[-10:])
+    halves = [SpaceSaving(200), SpaceSaving(200)]
+    halves[0].update(rows[:len(rows) // 2])
+    halves[1].update(rows[len(rows) // 2:])
+    merged = halves[0].merge(halves[1])
+    assert merged.total == summary.total
+    for code, deaths in exact.items():
+        lower, upper = merged.bounds(code)
+        assert lower <= deaths <= upper
+    assert sorted(code for code, deaths in merged.top_k(10)) == top
+    small = SpaceSaving(2)
+    small.update([['A', 5], ['B', 1], ['C', 2]])
+    assert small.top_k(5) == [['A', 5], ['C', 3]]
+    assert small.bounds('C') == (2, 3)
+    assert small.bounds('B') == (0, 3)
+    assert small.top_k(5, chapter=9) == []
+    heart = summary.top_k(3, chapter=9)
+    assert heart[0][0] == 'I25.1'
+    assert all(chapter_of(code) == 9 for code, deaths in heart)
+    for code, deaths in rows[:50]:
+        merged.add(code, deaths)
+    assert merged.counts[merged._smallest()] == min(merged.counts.values())
+
+
+if __name__ == '__main__':
+    import sys
+    import traceback
+
+    for test in (test_count_min_sketch,
+                 test_space_saving):
+        try:
+            print(test.__doc__, '... ', end='', flush=True)
+            test()
+            print('PASSED')
+        except:
+            print('FAILED')
+            exc_info = sys.exc_info()
+            traceback.print_exception(*exc_info)
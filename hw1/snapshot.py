@@ -0,0 +1,275 @@
+"""Binary snapshot files of the CDC Mortality Database
+
+Importing cdc.py makes Python parse and compile a list literal with a few
+thousand rows and a dict literal with their names. A snapshot holds the
+same data in a compact binary layout which can be memory-mapped instead:
+
+    header        magic, version, code width, number of rows, number of
+                  names and size of the name blob (see HEADER)
+    codes         rows * width bytes, NUL padded, sorted
+    deaths        rows * int64
+    name codes    names * width bytes, NUL padded, sorted
+    name offsets  (names + 1) * uint32, into the name blob
+    name blob     UTF-8 encoded names
+
+All numbers are little endian. Usage:
+
+    python snapshot.py cdc.snapshot    # convert cdc.py
+"""
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+
+from mortality import MortalityStore
+
+MAGIC = b'CDCM'
+VERSION = 1
+HEADER = struct.Struct('<4sHHIII')
+
+
+def _pack_codes(codes, width):
+    """Return the codes as one NUL padded fixed-width bytes object"""
+    return b''.join(code.encode('utf-8').ljust(width, b'\0') for code in codes)
+
+
+def _little_endian(values):
+    """Return an array converted between native and little endian order"""
+    if sys.byteorder != 'little':
+        values.byteswap()
+    return values
+
+
+def write_snapshot(path, rows, names=None):
+    """Write [code, deaths] pairs and category names to a snapshot file
+
+    Parameters:
+        path (string): the file to create, e.g.: 'cdc.snapshot'
+        rows (iterable of pairs), e.g.: [['D35.2', 50], ['Y17', 3]]
+        names (dict): optional ICD-10 category names by code
+
+    Repeated codes are aggregated, i.e. their deaths are summed up.
+    """
+    totals = {}
+    for code, deaths in rows:
+        totals[code] = totals.get(code, 0) + deaths
+    names = names if names is not None else {}
+    codes = sorted(totals)
+    name_codes = sorted(names)
+    width = max([len(code.encode('utf-8')) for code in codes + name_codes],
+                default=1)
+    offsets = array('I', [0])
+    blob = bytearray()
+    for code in name_codes:
+        blob += names[code].encode('utf-8')
+        offsets.append(len(blob))
+    with open(path, 'wb') as snapshot:
+        snapshot.write(HEADER.pack(MAGIC, VERSION, width, len(codes),
+                                   len(name_codes), len(blob)))
+        snapshot.write(_pack_codes(codes, width))
+        snapshot.write(_little_endian(
+            array('q', [totals[code] for code in codes])).tobytes())
+        snapshot.write(_pack_codes(name_codes, width))
+        snapshot.write(_little_endian(offsets).tobytes())
+        snapshot.write(blob)
+
+
+def convert(path, module='cdc'):
+    """Write the db and code_names of a data module to a snapshot file
+
+    Parameters:
+        path (string): the file to create, e.g.: 'cdc.snapshot'
+        module (string): the name of the module to import, e.g.: 'cdc'
+    """
+    data = __import__(module)
+    write_snapshot(path, data.db, data.code_names)
+
+
+class CodeColumn:
+    """Read-only sequence view of the fixed-width codes of a snapshot"""
+
+    def __init__(self, buffer, offset, width, size):
+        self.buffer = buffer
+        self.offset = offset
+        self.width = width
+        self.size = size
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.size:
+            raise IndexError('code index out of range')
+        begin = self.offset + index * self.width
+        code = self.buffer[begin:begin + self.width]
+        return bytes(code).rstrip(b'\0').decode('utf-8')
+
+
+class Snapshot:
+    """Memory-mapped snapshot file
+
+    Single lookups are answered straight from the mapped file with a binary
+    search over the sorted codes. The category names and a MortalityStore
+    with all the indexes are only built when they are first accessed.
+    """
+
+    def __init__(self, path):
+        """Map a snapshot file into memory
+
+        Parameters:
+            path (string): the file to open, e.g.: 'cdc.snapshot'
+
+        Raises a ValueError exception if the file is not a snapshot of a
+        supported version.
+        """
+        with open(path, 'rb') as snapshot:
+            self.buffer = mmap.mmap(snapshot.fileno(), 0,
+                                    access=mmap.ACCESS_READ)
+        if len(self.buffer) < HEADER.size:
+            self.close()
+            raise ValueError('not a snapshot file: {}'.format(path))
+        (magic, version, width, rows, name_count,
+         blob_size) = HEADER.unpack_from(self.buffer)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError('not a snapshot file: {}'.format(path))
+        offset = HEADER.size
+        self.codes = CodeColumn(self.buffer, offset, width, rows)
+        offset += rows * width
+        self._deaths_offset = offset
+        offset += rows * 8
+        self.name_codes = CodeColumn(self.buffer, offset, width, name_count)
+        offset += name_count * width
+        self._offsets_offset = offset
+        offset += (name_count + 1) * 4
+        self._blob_offset = offset
+        if len(self.buffer) != offset + blob_size:
+            self.close()
+            raise ValueError('truncated snapshot file: {}'.format(path))
+        self._names = None
+        self._store = None
+
+    def close(self):
+        """Release the memory map"""
+        self.buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        """Get the number of distinct ICD-10 codes in the snapshot"""
+        return len(self.codes)
+
+    def __iter__(self):
+        """Iterate over the [code, deaths] pairs of the snapshot"""
+        for index in range(len(self.codes)):
+            yield [self.codes[index], self.deaths(index)]
+
+    def deaths(self, index):
+        """Return the number of deaths of the code at index"""
+        return struct.unpack_from('<q', self.buffer,
+                                  self._deaths_offset + index * 8)[0]
+
+    def deaths_by_code(self, code):
+        """Return number of deaths by ICD-10 code, or None if not found."""
+        index = bisect_left(self.codes, code)
+        if index < len(self.codes) and self.codes[index] == code:
+            return self.deaths(index)
+        return None
+
+    @property
+    def names(self):
+        """Category names by code, decoded on first use"""
+        if self._names is None:
+            count = len(self.name_codes)
+            offsets = _little_endian(array('I', self.buffer[
+                self._offsets_offset:self._offsets_offset + (count + 1) * 4]))
+            blob = self.buffer[self._blob_offset:]
+            self._names = {
+                self.name_codes[index]:
+                    blob[offsets[index]:offsets[index + 1]].decode('utf-8')
+                for index in range(count)}
+        return self._names
+
+    @property
+    def store(self):
+        """MortalityStore of the snapshot, built on first use"""
+        if self._store is None:
+            self._store = MortalityStore(self, lambda: self.names)
+        return self._store
+
+
+###############################################################################
+# TEST functions
+
+def test_snapshot_roundtrip():
+    """Test write_snapshot() and Snapshot on a small database"""
+    import os
+    import tempfile
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'test.snapshot')
+        write_snapshot(path, [['Y17', 3], ['D35.2', 50], ['Y17', 1]],
+                       {'D35.2': 'Pituitary gland - Benign neoplasms',
+                        'I10': 'Essential (primary) hypertension é'})
+        with Snapshot(path) as snapshot:
+            assert len(snapshot) == 2
+            assert list(snapshot) == [['D35.2', 50], ['Y17', 4]]
+            assert snapshot.deaths_by_code('Y17') == 4
+            assert snapshot.deaths_by_code('Y1') is None
+            assert snapshot.deaths_by_code('Z99') is None
+            assert snapshot.names['I10'].endswith('é')
+            assert len(snapshot.names) == 2
+            assert snapshot.store.sum_deaths_by_query('gland') == 50
+        empty = os.path.join(directory, 'empty.snapshot')
+        write_snapshot(empty, [])
+        with Snapshot(empty) as snapshot:
+            assert list(snapshot) == []
+            assert snapshot.deaths_by_code('Y17') is None
+            assert snapshot.names == {}
+        with open(empty, 'ab') as damaged:
+            damaged.write(b'\0')
+        try:
+            Snapshot(empty)
+        except ValueError:
+            pass
+        else:
+            assert False, 'damaged snapshot accepted'
+
+
+def test_convert():
+    """Test convert() on the CDC data"""
+    import os
+    import tempfile
+    from cdc import db, code_names
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'cdc.snapshot')
+        convert(path)
+        with Snapshot(path) as snapshot:
+            assert sorted(snapshot) == sorted(db)
+            assert snapshot.names == code_names
+            assert snapshot.deaths_by_code('I82.3') == 3
+            assert snapshot.deaths_by_code('W17') == 481
+            assert snapshot.store.most_deaths() == ['I25.1', 161745]
+
+
+if __name__ == '__main__':
+    import traceback
+
+    if len(sys.argv) == 2:
+        convert(sys.argv[1])
+        sys.exit()
+
+    for test in (test_snapshot_roundtrip,
+                 test_convert):
+        try:
+            print(test.__doc__, '... ', end='', flush=True)
+            test()
+            print('PASSED')
+        except:
+            print('FAILED')
+            exc_info = sys.exc_info()
+            traceback.print_exception(*exc_info)
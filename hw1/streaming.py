@@ -0,0 +1,280 @@
+"""Windowed death counts over a stream of death records
+
+Instead of yearly totals, deaths may arrive one record at a time as
+(timestamp, code) events. The WindowCounter keeps the counts per code and
+per chapter of the most recent time window only: the window is split into
+panes of one step each, every pane holds the counts of its own events, and
+a pane leaving the window is subtracted from the running totals. Memory
+thus depends on the number of panes and the codes seen within the window,
+not on the length of the stream.
+
+A window with a single pane (step equal to width) is a tumbling window,
+it is emptied whenever the stream enters the next window. With more panes
+it is a sliding window, moving forward one step at a time.
+"""
+from collections import deque
+from heapq import nlargest
+
+from icd import chapter_of
+from mortality import MortalityStore
+
+
+class WindowCounter:
+    """Death counts per code and chapter over a sliding time window"""
+
+    def __init__(self, width, step=None):
+        """Create an empty window
+
+        Parameters:
+            width (number): the length of the window, in the unit of the
+                timestamps, e.g.: 3600 for an hour of Unix timestamps
+            step (number): the length of a pane, the window moves forward
+                in these steps, the width by default (a tumbling window)
+
+        Raises a ValueError exception if the width is not a positive
+        multiple of the step.
+        """
+        step = width if step is None else step
+        if step <= 0 or width <= 0:
+            raise ValueError('window width {} and step {} must be positive'
+                             .format(width, step))
+        panes = round(width / step)
+        # float steps, e.g. 0.1, rarely divide the width exactly
+        if panes < 1 or abs(panes * step - width) > 1e-9 * width:
+            raise ValueError('window width {} is not a multiple of step {}'
+                             .format(width, step))
+        self.width = width
+        self.step = step
+        self.panes = panes
+        self.buckets = deque()  # [pane number, {code: deaths}], oldest first
+        self.counts = {}
+        self.chapter_counts = {}
+        self.current = None  # number of the newest pane
+        self.late = 0  # deaths of events older than the window
+
+    def __len__(self):
+        """Get the number of distinct ICD-10 codes in the window"""
+        return len(self.counts)
+
+    def __contains__(self, code):
+        """Test if the ICD-10 code has deaths in the window"""
+        return code in self.counts
+
+    def __iter__(self):
+        """Iterate over the [code, deaths] pairs of the window"""
+        for code, deaths in self.counts.items():
+            yield [code, deaths]
+
+    @property
+    def start(self):
+        """The first timestamp in the window, None before the first event"""
+        if self.current is None:
+            return None
+        return (self.current - self.panes + 1) * self.step
+
+    @property
+    def end(self):
+        """The timestamp after the window, None before the first event"""
+        if self.current is None:
+            return None
+        return (self.current + 1) * self.step
+
+    def _pane(self, timestamp):
+        """Return the number of the pane of a timestamp"""
+        return int(timestamp // self.step)
+
+    def _count(self, code, deaths):
+        """Add deaths to the running totals of a code and its chapter"""
+        total = self.counts.get(code, 0) + deaths
+        if total:
+            self.counts[code] = total
+        else:
+            self.counts.pop(code, None)
+        chapter = chapter_of(code)
+        if chapter is not None:
+            total = self.chapter_counts.get(chapter, 0) + deaths
+            if total:
+                self.chapter_counts[chapter] = total
+            else:
+                self.chapter_counts.pop(chapter, None)
+
+    def advance(self, timestamp):
+        """Move the window forward to end after timestamp
+
+        Panes which fall out of the window are subtracted from the totals.
+        Timestamps before the end of the window are ignored.
+        """
+        pane = self._pane(timestamp)
+        if self.current is not None and pane <= self.current:
+            return
+        self.current = pane
+        while self.buckets and self.buckets[0][0] <= pane - self.panes:
+            for code, deaths in self.buckets.popleft()[1].items():
+                self._count(code, -deaths)
+
+    def add(self, timestamp, code, deaths=1):
+        """Count the deaths of an event, moving the window if needed
+
+        Parameters:
+            timestamp (number), e.g.: 1420070400
+            code (string), e.g.: 'I25.1'
+            deaths (int): the number of deaths the event stands for
+
+        Events up to a window width late are counted in their own pane.
+        Returns False for events older than the window, which are only
+        added up in the late attribute, True otherwise.
+        """
+        pane = self._pane(timestamp)
+        self.advance(timestamp)
+        if pane <= self.current - self.panes:
+            self.late += deaths
+            return False
+        index = len(self.buckets)
+        while index and self.buckets[index - 1][0] > pane:
+            index -= 1
+        if index and self.buckets[index - 1][0] == pane:
+            bucket = self.buckets[index - 1][1]
+        else:
+            bucket = {}
+            self.buckets.insert(index, [pane, bucket])
+        bucket[code] = bucket.get(code, 0) + deaths
+        self._count(code, deaths)
+        return True
+
+    def deaths_by_code(self, code):
+        """Return number of deaths by ICD-10 code in the window.
+
+        Parameters:
+            code (string), e.g.: 'D35.2'
+
+        Returns an integer, e.g.: 50. If the code has no deaths in the
+        window, returns None.
+        """
+        return self.counts.get(code)
+
+    def sum_deaths_by_chapter(self, chapter):
+        """Return the aggregated number of deaths in an ICD-10 chapter.
+
+        Parameters:
+            chapter: (int) the chapter number, e.g.: 9
+
+        Returns an integer, the deaths of the window in the chapter, 0 for
+        unknown chapters.
+        """
+        return self.chapter_counts.get(chapter, 0)
+
+    def top_k(self, n):
+        """Return the n deadliest ICD-10 codes of the window.
+
+        Returns a list of [code, number_of_deaths] pairs in descending order
+        of deaths, e.g. [['I25.1', 161], ['C34.9', 150]]
+        """
+        return [[code, deaths] for code, deaths in
+                nlargest(n, self.counts.items(), key=lambda x: (x[1], x[0]))]
+
+    def snapshot(self):
+        """Return a MortalityStore of the counts in the window
+
+        The store has the full query interface, e.g. codes_above or
+        sum_deaths_in_range, and does not change with the window.
+        """
+        return MortalityStore.from_totals(dict(self.counts))
+
+
+def windowed_counts(events, width, step=None):
+    """Generate the death counts of every window of an event stream
+
+    Parameters:
+        events (iterable of pairs): (timestamp, code) death records ordered
+            by time, e.g.: [(1420070400, 'I25.1'), (1420070460, 'C34.9')]
+        width (number): the length of the windows
+        step (number): the distance of consecutive windows, the width by
+            default (tumbling windows)
+
+    Generates (start, end, store) tuples, a MortalityStore snapshot of the
+    deaths in the [start, end) time window, for every window which closed
+    with deaths in it, and finally for the window of the last event.
+    """
+    counter = WindowCounter(width, step)
+    for timestamp, code in events:
+        pane = counter._pane(timestamp)
+        while counter and pane > counter.current:
+            yield counter.start, counter.end, counter.snapshot()
+            counter.advance(counter.end)
+        counter.add(timestamp, code)
+    if counter:
+        yield counter.start, counter.end, counter.snapshot()
+
+
+###############################################################################
+# TEST functions
+
+EVENTS = [(0, 'I25.1'), (5, 'I25.1'), (9, 'C34.9'), (12, 'I10'),
+          (14, 'I25.1'), (8, 'J18.9'), (25, 'C34.9'), (61, 'I10')]
+
+
+def test_window_counter():
+    """Test WindowCounter sliding window counts"""
+    counter = WindowCounter(20, 10)
+    for timestamp, code in EVENTS[:6]:
+        assert counter.add(timestamp, code)
+    assert (counter.start, counter.end) == (0, 20)
+    assert counter.deaths_by_code('I25.1') == 3
+    assert counter.deaths_by_code('K35.8') is None
+    assert counter.sum_deaths_by_chapter(9) == 4
+    assert counter.sum_deaths_by_chapter(2) == 1
+    assert counter.top_k(2) == [['I25.1', 3], ['J18.9', 1]]
+    counter.add(25, 'C34.9')
+    assert (counter.start, counter.end) == (10, 30)
+    assert sorted(counter) == [['C34.9', 1], ['I10', 1], ['I25.1', 1]]
+    assert counter.sum_deaths_by_chapter(10) == 0
+    assert not counter.add(3, 'I25.1')
+    assert counter.late == 1
+    assert counter.add(25, 'K35.8', 0)
+    assert counter.deaths_by_code('K35.8') is None
+    assert counter.sum_deaths_by_chapter(11) == 0
+    assert counter.snapshot().most_deaths() == ['I25.1', 1]
+    counter.advance(61)
+    assert len(counter) == 0 and counter.chapter_counts == {}
+    assert len(counter.buckets) == 0
+    for width, step in ((20, 15), (1.0, 0.3), (1, 0), (5, 10)):
+        try:
+            WindowCounter(width, step)
+        except ValueError:
+            pass
+        else:
+            assert False, 'uneven step accepted'
+    assert WindowCounter(1.0, 0.1).panes == 10
+    assert WindowCounter(0.3, 0.1).panes == 3
+
+
+def test_windowed_counts():
+    """Test windowed_counts() with tumbling and sliding windows"""
+    tumbling = [(start, end, sorted(store)) for start, end, store in
+                windowed_counts(iter(EVENTS), 10)]
+    assert tumbling == [
+        (0, 10, [['C34.9', 1], ['I25.1', 2]]),
+        (10, 20, [['I10', 1], ['I25.1', 1]]),
+        (20, 30, [['C34.9', 1]]),
+        (60, 70, [['I10', 1]])]
+    sliding = [(start, end, store.sum_deaths_by_chapter(9)) for
+               start, end, store in windowed_counts(EVENTS, 20, 10)]
+    assert sliding == [(-10, 10, 2), (0, 20, 4), (10, 30, 2), (20, 40, 0),
+                       (50, 70, 1)]
+    assert list(windowed_counts([], 10)) == []
+
+
+if __name__ == '__main__':
+    import sys
+    import traceback
+
+    for test in (test_window_counter,
+                 test_windowed_counts):
+        try:
+            print(test.__doc__, '... ', end='', flush=True)
+            test()
+            print('PASSED')
+        except:
+            print('FAILED')
+            exc_info = sys.exc_info()
+            traceback.print_exception(*exc_info)
@@ -0,0 +1,671 @@
+"""Substring search over ICD-10 category names
+
+The TrigramIndex maps every three character substring (trigram) of the
+lowercased category names to the set of codes containing it. A query is
+answered by intersecting the posting sets of its own trigrams and then
+verifying the few remaining candidates with a plain substring test, so the
+result is the same as testing every name.
+
+The same index narrows down the names to test for misspelled words (fuzzy
+search, verified by an edit distance) and for regular expressions (by the
+literal strings every match has to contain), and keeps the words of the
+names for whole word (token) search.
+
+Many queries at once are better answered by the AhoCorasick automaton,
+which finds all of them in a single scan of every name.
+"""
+import re
+from collections import deque
+from heapq import nsmallest
+
+# the words of a name: runs of letters and digits
+WORD = re.compile(r'[^\W_]+')
+
+
+def trigrams(text):
+    """Return the set of three character substrings of text"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def words(text):
+    """Return the list of words (letters and digits) of text"""
+    return WORD.findall(text)
+
+
+def edit_distance(first, second, limit):
+    """Return the edit distance of two strings, at most limit + 1
+
+    Parameters:
+        first, second (strings), e.g.: 'pnuemonia', 'pneumonia'
+        limit (int): the largest distance of interest, e.g.: 2
+
+    Insertions, deletions, substitutions and swaps of adjacent characters
+    cost one edit each (optimal string alignment). The computation stops as
+    soon as the distance is known to exceed the limit.
+    """
+    if abs(len(first) - len(second)) > limit:
+        return limit + 1
+    before = None
+    previous = list(range(len(second) + 1))
+    for i in range(1, len(first) + 1):
+        current = [i]
+        for j in range(1, len(second) + 1):
+            cost = first[i - 1] != second[j - 1]
+            distance = min(previous[j] + 1, current[j - 1] + 1,
+                           previous[j - 1] + cost)
+            if (cost and i > 1 and j > 1 and first[i - 1] == second[j - 2]
+                    and first[i - 2] == second[j - 1]):
+                distance = min(distance, before[j - 2] + 1)
+            current.append(distance)
+        if min(current) > limit:
+            return limit + 1
+        before, previous = previous, current
+    return min(previous[-1], limit + 1)
+
+
+# ASCII letters which re.IGNORECASE also matches to non-ASCII ones, e.g. the
+# Kelvin sign, whose lowercase is not in the lowercased names
+FOLDED = frozenset('IKSiks')
+
+
+def _literal(char):
+    """Return a character of a pattern as a required literal, or None
+
+    Non-ASCII characters and those of FOLDED match other characters than
+    their lowercase under re.IGNORECASE, so are not required as such.
+    """
+    if not char.isascii() or char in FOLDED:
+        return None
+    return char
+
+
+def _class_end(pattern, index):
+    """Return the index after the character class starting at index"""
+    index += 1
+    if pattern[index:index + 1] == '^':
+        index += 1
+    if pattern[index:index + 1] == ']':
+        index += 1
+    while index < len(pattern) and pattern[index] != ']':
+        index += 2 if pattern[index] == '\\' else 1
+    return index + 1
+
+
+def _escape_end(pattern, index):
+    """Return the index after the escape sequence starting at index
+
+    Covers the escapes spanning more than one character after the
+    backslash: \\xhh, \\uXXXX, \\UXXXXXXXX, \\N{name}, octal escapes and
+    group references.
+    """
+    escaped = pattern[index + 1:index + 2]
+    index += 2
+    if escaped in ('x', 'u', 'U'):
+        return index + {'x': 2, 'u': 4, 'U': 8}[escaped]
+    if escaped == 'N' and pattern[index:index + 1] == '{':
+        return pattern.find('}', index) + 1 or len(pattern)
+    if escaped == '0':
+        octal = re.match(r'[0-7]{0,2}', pattern[index:])
+        return index + len(octal.group())
+    if escaped.isdigit():
+        if re.match(r'[0-7]{2}', pattern[index:]) and escaped in '01234567':
+            return index + 2
+        return index + (1 if pattern[index:index + 1].isdigit() else 0)
+    return index
+
+
+def required_literals(pattern):
+    """Return strings which every match of a regular expression contains
+
+    Parameters:
+        pattern (string), e.g.: r'heart (disease|failure)'
+
+    Returns a list of lowercased strings, e.g.: ['heart '], taken from
+    the runs of plain ASCII characters outside of groups, character classes
+    and optional repetitions, split at the letters of FOLDED. Patterns with
+    alternatives outside of groups, or verbose ones, may match without any
+    fixed string, [] is returned.
+    """
+    if re.compile(pattern).flags & re.VERBOSE:
+        return []
+    atoms = []  # literal characters, None for anything else
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == '\\':
+            escaped = pattern[index + 1:index + 2]
+            atoms.append(_literal(escaped) if escaped and
+                         not escaped.isalnum() else None)
+            index = _escape_end(pattern, index)
+            continue
+        if char == '|':
+            return []
+        if char == '[':
+            index = _class_end(pattern, index)
+            atoms.append(None)
+            continue
+        if char == '(':
+            depth = 0
+            while index < len(pattern):
+                if pattern[index] == '\\':
+                    index = _escape_end(pattern, index)
+                    continue
+                if pattern[index] == '[':
+                    index = _class_end(pattern, index)
+                    continue
+                depth += {'(': 1, ')': -1}.get(pattern[index], 0)
+                index += 1
+                if not depth:
+                    break
+            atoms.append(None)
+            continue
+        quantifier = re.match(r'\{\d*(,\d*)?\}', pattern[index:])
+        if char in '*?+' or quantifier:
+            if char == '+':
+                # the previous atom is there, but may be repeated
+                atoms.append(None)
+            elif atoms:
+                # the previous atom may be missing
+                atoms[-1] = None
+            index += len(quantifier.group()) if quantifier else 1
+            if pattern[index:index + 1] in ('?', '+'):
+                # lazy or possessive quantifier
+                index += 1
+            continue
+        atoms.append(None if char in '.^$' else _literal(char))
+        index += 1
+    literals = []
+    current = ''
+    for atom in atoms + [None]:
+        if atom is None:
+            if current:
+                literals.append(current.lower())
+            current = ''
+        else:
+            current += atom
+    return literals
+
+
+class TrigramIndex:
+    """Case insensitive substring index over ICD-10 category names"""
+
+    def __init__(self, names):
+        """Build the index from a code -> name mapping
+
+        Parameters:
+            names (dict), e.g.: {'D35.2': 'Pituitary gland - Benign neoplasms'}
+        """
+        self.text = {}
+        self.postings = {}
+        for code, name in names.items():
+            text = name.lower()
+            self.text[code] = text
+            for gram in trigrams(text):
+                self.postings.setdefault(gram, set()).add(code)
+        self.word_postings = None
+        self.word_grams = None
+
+    def candidates(self, text):
+        """Return the codes which may contain the lowercased text
+
+        Queries shorter than a trigram can not be narrowed down, all codes
+        are returned for them.
+        """
+        grams = trigrams(text)
+        if not grams:
+            return self.text.keys()
+        postings = []
+        for gram in grams:
+            if gram not in self.postings:
+                return set()
+            postings.append(self.postings[gram])
+        postings.sort(key=len)
+        return set.intersection(*postings)
+
+    def search(self, query):
+        """Return the codes whose name contains the query string.
+
+        Parameters:
+            query: (string) search string, matched case insensitive
+
+        Returns a list of codes, e.g. ['I25.1', 'I50.0']
+        """
+        text = query.lower()
+        return [code for code in self.candidates(text)
+                if text in self.text[code]]
+
+    def _index_words(self):
+        """Build the word -> codes and trigram -> words postings on first use
+
+        The trigrams of a word are taken with '$' marking both ends, so short
+        words have some and the first and last letters count twice.
+        """
+        if self.word_postings is not None:
+            return
+        self.word_postings = {}
+        self.word_grams = {}
+        for code, text in self.text.items():
+            for word in words(text):
+                if word not in self.word_postings:
+                    self.word_postings[word] = set()
+                    for gram in trigrams('$' + word + '$'):
+                        self.word_grams.setdefault(gram, set()).add(word)
+                self.word_postings[word].add(code)
+
+    def similar_words(self, word, limit):
+        """Return the words of the names within an edit distance of word
+
+        Parameters:
+            word (string): a lowercased word, e.g.: 'diabetis'
+            limit (int): the largest edit distance, e.g.: 1
+
+        An edit changes at most 4 trigrams of a word, so only the words
+        sharing enough trigrams with it (and of a similar length) are
+        compared. Returns a word -> distance dict, e.g.: {'diabetes': 1}
+        """
+        self._index_words()
+        grams = trigrams('$' + word + '$')
+        needed = len(grams) - 4 * limit
+        if needed > 0:
+            shared = {}
+            for gram in grams:
+                for other in self.word_grams.get(gram, ()):
+                    shared[other] = shared.get(other, 0) + 1
+            candidates = [other for other, count in shared.items()
+                          if count >= needed]
+        else:
+            candidates = self.word_postings
+        found = {}
+        for other in candidates:
+            distance = edit_distance(word, other, limit)
+            if distance <= limit:
+                found[other] = distance
+        return found
+
+    def fuzzy_search(self, query, limit=None):
+        """Return the codes whose name has a similar word for every query word
+
+        Parameters:
+            query: (string) search words, e.g.: 'pnuemonia unspecifed'
+            limit: (int) the largest edit distance per word, by default 0
+                for words up to 4 letters, 1 up to 8 and 2 for longer ones
+
+        Returns a code -> distance dict, the distance being the sum of the
+        edit distances of the query words to their best matching words of
+        the name, e.g.: {'J18.9': 2}
+        """
+        distances = None
+        for word in set(words(query.lower())):
+            if limit is not None:
+                bound = limit
+            else:
+                bound = 0 if len(word) <= 4 else 1 if len(word) <= 8 else 2
+            found = {}
+            for other, distance in self.similar_words(word, bound).items():
+                for code in self.word_postings[other]:
+                    if distance < found.get(code, bound + 1):
+                        found[code] = distance
+            if distances is None:
+                distances = found
+            else:
+                distances = {code: distance + found[code]
+                             for code, distance in distances.items()
+                             if code in found}
+            if not distances:
+                return {}
+        return distances or {}
+
+    def regex_search(self, pattern):
+        """Return the codes whose name matches a regular expression.
+
+        Parameters:
+            pattern: (string) regular expression, searched case insensitive
+                anywhere in the names, e.g.: r'diabet.*(coma|ketoacidosis)'
+
+        Only the names containing all required literal strings of the
+        pattern (see required_literals) are tried. Returns a list of codes.
+        Raises a re.error exception for invalid patterns.
+        """
+        expression = re.compile(pattern, re.IGNORECASE)
+        candidates = None
+        for literal in required_literals(pattern):
+            if len(literal) < 3:
+                continue
+            found = self.candidates(literal)
+            candidates = found if candidates is None else candidates & found
+        if candidates is None:
+            candidates = self.text
+        return [code for code in candidates
+                if expression.search(self.text[code])]
+
+    def token_search(self, query):
+        """Return the codes whose name contains every query word as a word.
+
+        Parameters:
+            query: (string) search words, matched case insensitive,
+                e.g.: 'heart failure'
+
+        Returns a list of codes, e.g. ['I50.0', 'I50.9']
+        """
+        self._index_words()
+        postings = [self.word_postings.get(word, set())
+                    for word in set(words(query.lower()))]
+        if not postings:
+            return []
+        postings.sort(key=len)
+        return list(set.intersection(*postings))
+
+    def match(self, query, mode='fuzzy'):
+        """Return the codes matching a query with their distances
+
+        Parameters:
+            query (string), e.g.: 'diabetis'
+            mode (string): 'fuzzy', 'regex' or 'token', see fuzzy_search,
+                regex_search and token_search
+
+        Returns a code -> distance dict, the distance is 0 for regex and
+        token matches. Raises a ValueError exception for unknown modes.
+        """
+        if mode == 'fuzzy':
+            return self.fuzzy_search(query)
+        if mode == 'regex':
+            return dict.fromkeys(self.regex_search(query), 0)
+        if mode == 'token':
+            return dict.fromkeys(self.token_search(query), 0)
+        raise ValueError('unknown search mode: {}'.format(mode))
+
+
+class AhoCorasick:
+    """Automaton finding many strings in a text in a single pass"""
+
+    def __init__(self, patterns):
+        """Build the automaton of the patterns
+
+        Parameters:
+            patterns (iterable of strings), e.g.: ['heart', 'lung']
+
+        The patterns form a trie, each node has a fallback (failure) link
+        to the node of the longest proper suffix of its string that is in
+        the trie too, and the numbers of the patterns ending there or at any
+        of its fallbacks (Aho and Corasick, 1975). Repeated patterns keep
+        all of their numbers.
+        """
+        self.goto = [{}]
+        self.output = [[]]
+        for number, pattern in enumerate(patterns):
+            node = 0
+            for char in pattern:
+                child = self.goto[node].get(char)
+                if child is None:
+                    child = len(self.goto)
+                    self.goto[node][char] = child
+                    self.goto.append({})
+                    self.output.append([])
+                node = child
+            self.output[node].append(number)
+        self.fail = [0] * len(self.goto)
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self.goto[node].items():
+                queue.append(child)
+                fallback = self.fail[node]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                self.output[child] = (self.output[child] +
+                                      self.output[self.fail[child]])
+        # the trie edges, later also the remembered fallback transitions
+        self.delta = [dict(edges) for edges in self.goto]
+
+    def _next(self, node, char):
+        """Return the node after reading char, remembering the transition"""
+        state = node
+        while state and char not in self.goto[state]:
+            state = self.fail[state]
+        target = self.goto[state].get(char, 0)
+        self.delta[node][char] = target
+        return target
+
+    def matches(self, text):
+        """Return the set of numbers of the patterns found in text
+
+        Parameters:
+            text (string), e.g.: 'congestive heart failure'
+        """
+        found = set(self.output[0])
+        node = 0
+        delta = self.delta
+        for char in text:
+            target = delta[node].get(char)
+            node = self._next(node, char) if target is None else target
+            if self.output[node]:
+                found.update(self.output[node])
+        return found
+
+
+def rank_matches(matches, deaths_by_code, n=None):
+    """Return matching codes with their deaths, best matches first
+
+    Parameters:
+        matches (dict): code -> distance, e.g.: TrigramIndex.match(query)
+        deaths_by_code (function): the deaths of a code, or None
+        n (int): optional maximum number of codes to return
+
+    Returns a list of [code, number_of_deaths] pairs ordered by distance,
+    then by deaths descending, e.g. [['E14.9', 30053], ['E14.2', 14495]]
+    """
+    ranked = ([code, deaths_by_code(code) or 0] for code in matches)
+    key = lambda x: (matches[x[0]], -x[1], x[0])
+    if n is None:
+        return sorted(ranked, key=key)
+    return nsmallest(n, ranked, key=key)
+
+
+def query_totals(queries, names, deaths_by_code):
+    """Return the aggregated number of deaths for each of many queries
+
+    Parameters:
+        queries (list of strings), e.g.: ['heart', 'lung']
+        names: the code -> name mapping, anything with items()
+        deaths_by_code (function): the deaths of a code, or None
+
+    Every name is lowercased and scanned once by an AhoCorasick automaton
+    of all the lowercased queries. Returns a list of integers in the order
+    of the queries, each the same as summing the deaths of the codes whose
+    name contains the query as a case insensitive substring.
+    """
+    automaton = AhoCorasick(query.lower() for query in queries)
+    totals = [0] * len(queries)
+    for code, name in names.items():
+        deaths = deaths_by_code(code)
+        if not deaths:
+            continue
+        for number in automaton.matches(name.lower()):
+            totals[number] += deaths
+    return totals
+
+
+class NamedStore:
+    """Lazily loaded category names and their search indexes
+
+    Shared by the stores, which call _set_names from their constructor.
+    """
+
+    def _set_names(self, names):
+        """Keep the names, or a function returning them, for first use"""
+        self._names = names if names is not None else {}
+        self._text_index = None
+        self._search_index = None
+
+    @property
+    def names(self):
+        """Category names by code, loaded on first use"""
+        if callable(self._names):
+            self._names = self._names()
+        return self._names
+
+    @property
+    def text_index(self):
+        """Substring index over the category names, built on first use
+
+        Names which can search themselves, e.g. a DescriptionStore, are used
+        as the index directly.
+        """
+        if self._text_index is None:
+            if hasattr(self.names, 'search'):
+                self._text_index = self.names
+            else:
+                self._text_index = TrigramIndex(self.names)
+        return self._text_index
+
+    @property
+    def search_index(self):
+        """Trigram index for fuzzy, regex and token search, built on first use
+
+        The text index is used if it is a TrigramIndex already.
+        """
+        if self._search_index is None:
+            if isinstance(self.text_index, TrigramIndex):
+                self._search_index = self.text_index
+            else:
+                self._search_index = TrigramIndex(self.names)
+        return self._search_index
+
+
+###############################################################################
+# TEST functions
+
+def test_trigram_search():
+    """Test TrigramIndex.search() method"""
+    index = TrigramIndex({'I50.0': 'Congestive heart failure',
+                          'I51.7': 'Cardiomegaly',
+                          'I42.9': 'Cardiomyopathy, unspecified',
+                          'J18.9': 'Pneumonia, unspecified'})
+    assert index.search('HEART') == ['I50.0']
+    assert sorted(index.search('cardiom')) == ['I42.9', 'I51.7']
+    assert sorted(index.search('Y, UN')) == ['I42.9']
+    assert sorted(index.search('ia')) == ['J18.9']
+    assert len(index.search('')) == 4
+    assert index.search('broccoli') == []
+    assert index.search('heart failures') == []
+
+
+def test_aho_corasick():
+    """Test AhoCorasick.matches() method"""
+    automaton = AhoCorasick(['he', 'she', 'his', 'hers', 'he', 'ushe'])
+    assert automaton.matches('ushers') == {0, 1, 3, 4, 5}
+    assert automaton.matches('this') == {2}
+    assert automaton.matches('ahishe') == {0, 1, 2, 4}
+    assert automaton.matches('') == set()
+    assert automaton.matches('xyz') == set()
+    assert AhoCorasick(['', 'a']).matches('b') == {0}
+    assert AhoCorasick([]).matches('abc') == set()
+
+
+def test_query_totals():
+    """Test query_totals() against single substring queries"""
+    from cdc import code_names, db
+    deaths = dict(db)
+    queries = ['heart', 'LUNG', 'diabetes', 'broccoli', 'heart', '',
+               'heart failure', ' - malignant', 'y, un', 'a', 'ar']
+    assert query_totals(queries, code_names, deaths.get) == [
+        sum(deaths.get(code, 0) for code, name in code_names.items()
+            if query.lower() in name.lower()) for query in queries]
+    assert query_totals([], code_names, deaths.get) == []
+
+
+def test_named_store():
+    """Test NamedStore lazy names and shared search indexes"""
+    calls = []
+
+    def load_names():
+        calls.append(1)
+        return {'I50.0': 'Congestive heart failure'}
+
+    store = NamedStore()
+    store._set_names(load_names)
+    assert calls == []
+    assert store.names == {'I50.0': 'Congestive heart failure'}
+    assert store.search_index is store.text_index
+    assert store.text_index.search('HEART') == ['I50.0']
+    assert calls == [1]
+    empty = NamedStore()
+    empty._set_names(None)
+    assert empty.names == {} and empty.search_index.search('heart') == []
+
+
+def test_edit_distance():
+    """Test edit_distance() and required_literals() functions"""
+    assert edit_distance('diabetis', 'diabetes', 2) == 1
+    assert edit_distance('pnuemonia', 'pneumonia', 2) == 1
+    assert edit_distance('heart', 'hearth', 1) == 1
+    assert edit_distance('kitten', 'sitting', 5) == 3
+    assert edit_distance('kitten', 'sitting', 1) == 2
+    assert edit_distance('', 'abc', 3) == 3
+    assert edit_distance('abc', 'abc', 0) == 0
+    assert required_literals(r'heart (disease|failure)') == ['heart ']
+    assert required_literals(r'ab+c?d{2}e\.f[xy]gh*') == ['ab', 'e.f', 'g']
+    assert required_literals(r'a[]x]bcd(x(y)z)efg') == ['a', 'bcd', 'efg']
+    assert required_literals(r'Lung\b') == ['lung']
+    assert required_literals(r'lung|bronchus') == []
+    assert required_literals(r'(?x) l u n g') == []
+    assert required_literals(r'\x68eart') == ['eart']
+    assert required_literals(r'\u0068eart \U00000066ail') == [
+        'eart ', 'a', 'l']
+    assert required_literals(r'\N{LATIN SMALL LETTER H}eart') == ['eart']
+    assert required_literals(r'\101cute \0101') == ['cute ', '1']
+    assert required_literals(r'(a)b\1c\1018') == ['b', 'c', '8']
+    assert required_literals(r'\x20-\x20Malignant') == ['-', 'mal', 'gnant']
+    assert required_literals(r'Kidney stones') == ['dney ', 'tone']
+    assert required_literals(r'caf\xe9 Ménière') == ['caf', ' m', 'n', 're']
+    index = TrigramIndex({'A': 'Aſthma', 'B': 'KIDNEY', 'C': 'Asthma',
+                          'D': 'Ménière disease'})
+    assert sorted(index.regex_search('asthma')) == ['A', 'C']
+    assert index.regex_search('kidney') == ['B']
+    assert index.regex_search('méni') == ['D']
+
+
+def test_fuzzy_search():
+    """Test TrigramIndex fuzzy, regex and token search"""
+    index = TrigramIndex({'I50.0': 'Congestive heart failure',
+                          'I50.9': 'Heart failure, unspecified',
+                          'I42.9': 'Cardiomyopathy, unspecified',
+                          'J18.9': 'Pneumonia, unspecified'})
+    assert index.similar_words('unspecifed', 1) == {'unspecified': 1}
+    assert index.fuzzy_search('hearth failyre') == {'I50.0': 2, 'I50.9': 2}
+    assert index.fuzzy_search('pnuemonia unspecified') == {'J18.9': 1}
+    assert index.fuzzy_search('hart') == {}
+    assert index.fuzzy_search('hart', limit=1) == {'I50.0': 1, 'I50.9': 1}
+    assert index.fuzzy_search(' ') == {}
+    assert sorted(index.regex_search(r'^(heart|cardio)')) == ['I42.9', 'I50.9']
+    assert index.regex_search(r'fail\w+,') == ['I50.9']
+    assert sorted(index.token_search('Unspecified')) == ['I42.9', 'I50.9',
+                                                         'J18.9']
+    assert index.token_search('heart fail') == []
+    assert index.match('cardio.*', 'regex') == {'I42.9': 0}
+    assert rank_matches({'I50.0': 1, 'I50.9': 0, 'J18.9': 1},
+                        {'I50.0': 5, 'J18.9': 7}.get) == [
+        ['I50.9', 0], ['J18.9', 7], ['I50.0', 5]]
+    assert rank_matches({'I50.0': 1, 'J18.9': 1}, {}.get, n=1) == [
+        ['I50.0', 0]]
+
+
+if __name__ == '__main__':
+    import sys
+    import traceback
+
+    for test in (test_trigram_search,
+                 test_aho_corasick,
+                 test_query_totals,
+                 test_named_store,
+                 test_edit_distance,
+                 test_fuzzy_search):
+        try:
+            print(test.__doc__, '... ', end='', flush=True)
+            test()
+            print('PASSED')
+        except:
+            print('FAILED')
+            exc_info = sys.exc_info()
+            traceback.print_exception(*exc_info)
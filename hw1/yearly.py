@@ -0,0 +1,242 @@
+"""Multi-year CDC Mortality Database
+
+cdc.py holds the statistics of a single year. The YearlyStore keeps any
+number of years side by side: all years share one sorted code dictionary,
+and every year is one row of a (years x codes) int64 NumPy matrix. Cross
+year questions like trends or year range sums are a single slice and
+reduction over that matrix instead of a loop over per-year lists.
+
+NumPy is an optional dependency, it is only needed when a YearlyStore is
+created.
+"""
+from columnar import code_span, np
+from icd import CHAPTERS
+
+
+class YearlyStore:
+    """Year partitioned, NumPy array backed mortality statistics"""
+
+    def __init__(self, partitions):
+        """Build the matrix from per-year [code, deaths] pairs
+
+        Parameters:
+            partitions (dict): the [code, deaths] pairs (or any store
+                iterating over them) by year, e.g.:
+                {2013: [['I25.1', 160000]], 2014: cdc.db}
+
+        Repeated codes are aggregated, i.e. their deaths are summed up.
+        Raises an ImportError exception if NumPy is not installed.
+        """
+        if np is None:
+            raise ImportError('NumPy is required for YearlyStore')
+        self.years = sorted(partitions)
+        columns = []
+        for year in self.years:
+            rows = list(partitions[year])
+            columns.append((np.array([code for code, deaths in rows],
+                                     dtype=str),
+                            np.array([deaths for code, deaths in rows],
+                                     dtype=np.int64)))
+        if columns:
+            self.codes = np.unique(np.concatenate(
+                [codes for codes, deaths in columns]))
+        else:
+            self.codes = np.array([], dtype=str)
+        self.deaths = np.zeros((len(self.years), len(self.codes)),
+                               dtype=np.int64)
+        for row, (codes, deaths) in enumerate(columns):
+            np.add.at(self.deaths[row], np.searchsorted(self.codes, codes),
+                      deaths)
+
+    def __len__(self):
+        """Get the number of distinct ICD-10 codes over all years"""
+        return len(self.codes)
+
+    def _column(self, code):
+        """Return the matrix column of code, or None"""
+        index = int(np.searchsorted(self.codes, code))
+        if index < len(self.codes) and self.codes[index] == code:
+            return index
+        return None
+
+    def _rows(self, years):
+        """Return the matrix rows of the given years
+
+        Raises a ValueError exception for years not in the store.
+        """
+        if years is None:
+            return np.arange(len(self.years))
+        rows = []
+        for year in years:
+            if year not in self.years:
+                raise ValueError('no data for year {}'.format(year))
+            rows.append(self.years.index(year))
+        return np.array(rows, dtype=np.intp)
+
+    def _year_span(self, first, last):
+        """Return the slice of rows for the years first to last (inclusive)"""
+        begin = int(np.searchsorted(self.years, first, side='left'))
+        end = int(np.searchsorted(self.years, last, side='right'))
+        return slice(begin, max(begin, end))
+
+    def deaths_by_code(self, code, year=None):
+        """Return number of deaths by ICD-10 code in a year.
+
+        Parameters:
+            code (string), e.g.: 'D35.2'
+            year (int): the year, the latest year by default, e.g.: 2014
+
+        Returns an integer, the number of deaths in a single ICD-10
+        category, e.g.: 50. Codes not reported in the year, but in other
+        years, count 0 deaths. If the code or year is not found, returns None.
+        """
+        column = self._column(code)
+        if column is None or not self.years:
+            return None
+        if year is None:
+            year = self.years[-1]
+        if year not in self.years:
+            return None
+        return int(self.deaths[self.years.index(year), column])
+
+    def trend(self, code, years=None):
+        """Return the number of deaths of an ICD-10 code over the years.
+
+        Parameters:
+            code (string), e.g.: 'I25.1'
+            years (iterable of ints): the years, all years by default
+
+        Returns a list of [year, number_of_deaths] pairs in the order of the
+        years, e.g.: [[2013, 160000], [2014, 161745]]
+        Raises a ValueError exception for years not in the store.
+        """
+        rows = self._rows(years)
+        column = self._column(code)
+        if column is None:
+            counts = np.zeros(len(rows), dtype=np.int64)
+        else:
+            counts = self.deaths[rows, column]
+        return [[self.years[row], int(count)]
+                for row, count in zip(rows.tolist(), counts.tolist())]
+
+    def sum_deaths_by_years(self, first, last, codes=None):
+        """Return the aggregated number of deaths over a range of years.
+
+        Parameters:
+            first (int): the first year of the range, e.g.: 2000
+            last (int): the last year of the range (inclusive), e.g.: 2014
+            codes (iterable of strings): optional ICD-10 codes to restrict
+                the sum to, all codes by default
+
+        Returns an integer, the sum of deaths in the years of the range
+        found in the store.
+        """
+        years = self._year_span(first, last)
+        if codes is None:
+            return int(self.deaths[years].sum())
+        columns = [self._column(code) for code in set(codes)]
+        columns = [column for column in columns if column is not None]
+        return int(self.deaths[years][:, columns].sum())
+
+    def sum_deaths_by_chapter(self, chapter, years=None):
+        """Return the aggregated number of deaths in an ICD-10 chapter by year.
+
+        Parameters:
+            chapter: (int) the chapter number, e.g.: 9
+            years (iterable of ints): the years, all years by default
+
+        Returns a list of [year, number_of_deaths] pairs in the order of the
+        years, e.g.: [[2013, 600000], [2014, 610000]]
+        Raises a ValueError exception for years not in the store.
+        """
+        rows = self._rows(years)
+        if chapter not in CHAPTERS:
+            counts = np.zeros(len(rows), dtype=np.int64)
+        else:
+            begin, end = code_span(self.codes, *CHAPTERS[chapter])
+            counts = self.deaths[rows, begin:end].sum(axis=1)
+        return [[self.years[row], int(count)]
+                for row, count in zip(rows.tolist(), counts.tolist())]
+
+    def totals_by_year(self):
+        """Return the total number of deaths for each year.
+
+        Returns a list of [year, number_of_deaths] pairs, e.g.:
+        [[2013, 2596993], [2014, 2626418]]
+        """
+        return [[year, int(count)] for year, count in
+                zip(self.years, self.deaths.sum(axis=1).tolist())]
+
+
+###############################################################################
+# TEST functions
+
+def test_yearly_store():
+    """Test YearlyStore queries"""
+    if np is None:
+        # optional dependency, nothing to test
+        return
+    store = YearlyStore({2014: [['I25.1', 10], ['A02.0', 1], ['I10', 3]],
+                         2012: [['I25.1', 7], ['I25.1', 1]],
+                         2013: [['I25.1', 9], ['J18.9', 4]]})
+    assert len(store) == 4
+    assert store.years == [2012, 2013, 2014]
+    assert store.deaths_by_code('I25.1') == 10
+    assert store.deaths_by_code('I25.1', year=2012) == 8
+    assert store.deaths_by_code('J18.9') == 0
+    assert store.deaths_by_code('J18.9', year=2011) is None
+    assert store.deaths_by_code('K00') is None
+    assert store.trend('I25.1') == [[2012, 8], [2013, 9], [2014, 10]]
+    assert store.trend('I25.1', [2014, 2012]) == [[2014, 10], [2012, 8]]
+    assert store.trend('K00', [2013]) == [[2013, 0]]
+    try:
+        store.trend('I25.1', [2015])
+    except ValueError:
+        pass
+    else:
+        assert False, 'unknown year accepted'
+    assert store.sum_deaths_by_years(2013, 2014) == 27
+    assert store.sum_deaths_by_years(1999, 2050) == 35
+    assert store.sum_deaths_by_years(2015, 2020) == 0
+    assert store.sum_deaths_by_years(2012, 2013, ['I25.1', 'K00']) == 17
+    assert store.sum_deaths_by_chapter(9) == [[2012, 8], [2013, 9],
+                                              [2014, 13]]
+    assert store.sum_deaths_by_chapter(10, [2013]) == [[2013, 4]]
+    assert store.sum_deaths_by_chapter(99, [2013]) == [[2013, 0]]
+    assert store.totals_by_year() == [[2012, 8], [2013, 13], [2014, 14]]
+    empty = YearlyStore({})
+    assert empty.deaths_by_code('I25.1') is None
+    assert empty.totals_by_year() == []
+
+
+def test_yearly_store_cdc():
+    """Test YearlyStore on the CDC data"""
+    if np is None:
+        # optional dependency, nothing to test
+        return
+    from cdc import db
+    from mortality import MortalityStore
+    reference = MortalityStore(db)
+    store = YearlyStore({2014: db})
+    assert store.deaths_by_code('W17', 2014) == 481
+    assert store.sum_deaths_by_years(2014, 2014) == sum(
+        deaths for code, deaths in db)
+    for chapter in range(1, 23):
+        assert store.sum_deaths_by_chapter(chapter) == [
+            [2014, reference.sum_deaths_by_chapter(chapter)]]
+
+
+if __name__ == '__main__':
+    import sys
+    import traceback
+
+    for test in (test_yearly_store,
+                 test_yearly_store_cdc):
+        try:
+            print(test.__doc__, '... ', end='', flush=True)
+            test()
+            print('PASSED')
+        except:
+            print('FAILED')
+            exc_info = sys.exc_info()
+            traceback.print_exception(*exc_info)